@@ -0,0 +1,71 @@
+"""A minimal HTTP/1.1 keep-alive client, cheap enough not to be the bottleneck of the benchmarks."""
+
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class HttpResponse:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class HttpConnection:
+    """A persistent HTTP/1.1 connection sending one request at a time.
+
+    Args:
+        host (str): The server host.
+        port (int): The server port.
+        tls (bool): Whether to speak HTTPS, verifying the server certificate.
+
+    """
+
+    def __init__(self, host: str, port: int, tls: bool = False) -> None:
+        self.host = host
+        self.port = port
+        self.tls = tls
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def _connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        if self._reader is None or self._writer is None or self._writer.is_closing():
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port, ssl=self.tls or None)
+        return self._reader, self._writer
+
+    async def request(
+        self, method: str, path: str, headers: dict[str, str] | None = None, body: bytes = b""
+    ) -> HttpResponse:
+        reader, writer = await self._connect()
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}", f"Content-Length: {len(body)}"]
+        lines.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, ConnectionError):
+            await self.close()
+            raise
+        status_line, *header_lines = head.decode("latin-1").split("\r\n")
+        response_headers = {}
+        for line in header_lines:
+            if line:
+                name, _, value = line.partition(":")
+                response_headers[name.strip().lower()] = value.strip()
+        payload = await reader.readexactly(int(response_headers.get("content-length", "0")))
+        if response_headers.get("connection") == "close":
+            await self.close()
+        return HttpResponse(int(status_line.split(" ", 2)[1]), response_headers, payload)
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+        self._reader = self._writer = None
@@ -0,0 +1,89 @@
+"""Throughput of the CPF validation, one value at a time and column-wise, with the share of invalid CPFs of an import.
+
+Usage:
+    python -m benchmarks.cpf_validation [--sizes 1,16,1000,100000] [--invalid 0.05] [--min-time 0.5] [--seed 1]
+
+Every column mixes bare and formatted valid CPFs with a share of invalid ones (wrong check digit, wrong length,
+repeated digits, letters). Both paths must agree on every value; the command fails otherwise.
+
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from functools import partial
+from typing import Callable
+
+from domain_account.types.cpf import complete_cpf, normalise_cpf, normalise_cpfs
+
+
+def column(size: int, invalid: float, generator: random.Random) -> list[str]:
+    values = []
+    for _ in range(size):
+        cpf = complete_cpf(f"{generator.randrange(10**9):09d}")
+        if generator.random() < invalid:
+            cpf = generator.choice(
+                [
+                    cpf[:10] + str((int(cpf[10]) + 1) % 10),
+                    cpf[:10],
+                    cpf + cpf[10],
+                    cpf[0] * 11,
+                    "A" + cpf[1:],
+                ]
+            )
+        elif generator.random() < 0.3:
+            cpf = f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}"
+        values.append(cpf)
+    return values
+
+
+def one_by_one(values: list[str]) -> list[str | None]:
+    return [normalise_cpf(value) for value in values]
+
+
+def throughput(validate: Callable[[], object], size: int, min_time: float) -> float:
+    """CPFs validated per second, the best of 5 rounds lasting at least `min_time` each."""
+    iterations = max(1, int(100_000 / size))
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        rounds = 0
+        while (elapsed := time.perf_counter() - start) < min_time or not rounds:
+            for _ in range(iterations):
+                validate()
+            rounds += iterations
+        best = min(best, elapsed / rounds)
+    return size / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1,16,1000,100000", type=lambda value: [int(v) for v in value.split(",")])
+    parser.add_argument("--invalid", type=float, default=0.05, help="share of invalid CPFs in every column")
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds per round")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    generator = random.Random(args.seed)
+    results = []
+    for size in args.sizes:
+        values = column(size, args.invalid, generator)
+        if normalise_cpfs(values) != one_by_one(values):
+            sys.exit(f"The column-wise validation disagrees with the single value one on a column of {size}")
+        single = throughput(partial(one_by_one, values), size, args.min_time)
+        batch = throughput(partial(normalise_cpfs, values), size, args.min_time)
+        results.append(
+            {
+                "size": size,
+                "single_cpf_per_s": single,
+                "batch_cpf_per_s": batch,
+                "speedup": batch / single,
+            }
+        )
+    print(json.dumps({"invalid": args.invalid, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
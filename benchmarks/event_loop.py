@@ -0,0 +1,72 @@
+"""Throughput comparison of the asyncio + h11 and uvloop + httptools worker engines.
+
+Usage:
+    python -m benchmarks.event_loop [--duration 10] [--connections 32] [--workers 1]
+
+Each engine serves the stand-in application through `gunicorn.conf.py`, then a closed loop of keep-alive
+connections hammers `GET /retrieve-user` for a fixed duration. The report is printed as JSON.
+
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from benchmarks.client import HttpConnection
+from benchmarks.server import standin_server
+from benchmarks.standins import standin_uid
+from domain_account.frameworks.gunicorn.workers import EVENT_LOOP_WORKERS
+
+
+async def closed_loop(port: int, duration: float, connections: int, users: int) -> dict[str, float]:
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        connection = HttpConnection("127.0.0.1", port)
+        deadline = time.perf_counter() + duration
+        while (start := time.perf_counter()) < deadline:
+            token = standin_uid(random.randrange(users))
+            response = await connection.request("GET", "/retrieve-user", {"Authorization": f"Bearer {token}"})
+            latencies.append(time.perf_counter() - start)
+            errors += response.status != 200
+        await connection.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(connections)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "requests_per_second": len(latencies) / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--users", type=int, default=1000)
+    args = parser.parse_args()
+
+    report: dict[str, dict[str, float]] = {}
+    for event_loop in EVENT_LOOP_WORKERS:
+        env = {"STANDIN_USERS": str(args.users)}
+        with standin_server(event_loop=event_loop, workers=args.workers, env=env) as port:
+            asyncio.run(closed_loop(port, 1.0, args.connections, args.users))  # warm up
+            report[event_loop] = asyncio.run(closed_loop(port, args.duration, args.connections, args.users))
+    baseline = report["asyncio"]["requests_per_second"]
+    for result in report.values():
+        result["speedup"] = result["requests_per_second"] / baseline
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
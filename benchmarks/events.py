@@ -0,0 +1,152 @@
+"""Time the address updates emitting their events through the outbox, against a slow broker, on in-memory stand-ins.
+
+Usage:
+    python -m benchmarks.events [--updates 5000] [--clients 50] [--latency-ms 0.5] [--broker-ms 50]
+
+`--clients` tasks update the address of the stand-in users through `UpdateAddressUseCase`, with `--latency-ms` for
+each round trip to the stand-in database, and the same updates run:
+
+- `off`: without events.
+- `outbox`: emitting an `AddressUpdated` per update through the outbox, published by its background task to a broker
+  taking `--broker-ms` to receive each batch.
+- `inline`: sending each event to that same broker before the update returns, what the outbox avoids.
+
+The stand-in database has no transactions, so the outbox insert runs as a second write, as on a standalone server.
+
+The report is printed as JSON:
+
+- `update_ms`: the median and 99th percentile latency of the updates.
+- `updates_per_s`: the throughput of the clients.
+- `batches`, `events_per_batch`, `bytes_per_event` and `compression_ratio`: the batches the broker received, and the
+  size of an event once compressed against its JSON line.
+- `publish_lag_ms`: the median and maximum time between an event and the reception of its batch by the broker.
+- `published` and `duplicates`: the events the broker received once the outbox drained, every one exactly once.
+
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+from benchmarks.mongo_drivers import repository
+from benchmarks.standins import InMemoryDatabaseService, standin_document, standin_uid
+from domain_account.adapters.repositories import EventRepository
+from domain_account.business.ports import UpdateAddressInputPort
+from domain_account.business.services import EventService
+from domain_account.business.use_case import UpdateAddressUseCase
+from domain_account.frameworks.events import EventBatch, InMemoryBroker, Outbox, decode_batch, encode_batch
+from domain_account.frameworks.metrics import MetricsRegistry
+from domain_account.models import AccountEvent
+
+
+def summary(samples: list[float]) -> dict[str, float]:
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "p99_ms": round(statistics.quantiles(samples, n=100)[98], 3),
+    }
+
+
+class SlowBroker(InMemoryBroker):
+    """An in-memory broker taking a while to receive each batch, and noting when it did."""
+
+    def __init__(self, latency: float) -> None:
+        super().__init__()
+        self.latency = latency
+        self.received: list[float] = []
+
+    async def send(self, batch: EventBatch) -> None:
+        await asyncio.sleep(self.latency)
+        await super().send(batch)
+        self.received.append(time.time())
+
+
+class InlineEvents(EventService):
+    """Send every event to the broker before the write returns, without an outbox."""
+
+    def __init__(self, broker: SlowBroker) -> None:
+        self.__broker = broker
+
+    async def emit(self, events: list[AccountEvent]) -> None:
+        await self.__broker.send(encode_batch([event.model_dump(mode="json", exclude_none=True) for event in events]))
+
+
+async def update(use_case: UpdateAddressUseCase, args: argparse.Namespace) -> dict[str, Any]:
+    samples: list[float] = []
+
+    async def client(index: int) -> None:
+        for step in range(index, args.updates, args.clients):
+            port = UpdateAddressInputPort(uid=standin_uid(step % args.users), number=str(step))
+            start = time.perf_counter()
+            await use_case(port)
+            samples.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(index) for index in range(args.clients)))
+    return {"update_ms": summary(samples), "updates_per_s": round(args.updates / (time.perf_counter() - start))}
+
+
+def database(args: argparse.Namespace) -> InMemoryDatabaseService:
+    service = InMemoryDatabaseService(args.latency_ms / 1000)
+    service.database["users"].ensure_index("uid")
+    service.database["users"].seed(standin_document(index) for index in range(args.users))
+    return service
+
+
+def delivery(broker: SlowBroker) -> dict[str, Any]:
+    """What the broker received: the batches, their compression and how long after the events they arrived."""
+    events, lags, raw = [], [], 0
+    for batch, received in zip(broker.batches, broker.received):
+        for body in decode_batch(batch):
+            events.append(body["event_id"])
+            raw += len(json.dumps(body, separators=(",", ":"))) + 1
+            occurred_at = datetime.fromisoformat(body["occurred_at"].replace("Z", "+00:00"))
+            lags.append((received - occurred_at.astimezone(timezone.utc).timestamp()) * 1000)
+    compressed = sum(len(batch.body) for batch in broker.batches)
+    return {
+        "batches": len(broker.batches),
+        "events_per_batch": round(len(events) / len(broker.batches), 1),
+        "bytes_per_event": round(compressed / len(events), 1),
+        "compression_ratio": round(raw / compressed, 2),
+        "publish_lag_ms": {"median_ms": round(statistics.median(lags), 1), "max_ms": round(max(lags), 1)},
+        "published": len(events),
+        "duplicates": len(events) - len(set(events)),
+    }
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    broker_latency = args.broker_ms / 1000
+    off = await update(UpdateAddressUseCase(repository(database(args))), args)
+
+    service = database(args)
+    broker = SlowBroker(broker_latency)
+    outbox = Outbox(service, broker, MetricsRegistry(), batch_size=args.batch_size, interval=args.interval)
+    await outbox.open()
+    with_outbox = await update(UpdateAddressUseCase(repository(service), events=EventRepository(outbox)), args)
+    while service.database["account_events"]._documents:  # pylint: disable=W0212
+        await asyncio.sleep(args.interval)
+    await outbox.close()
+
+    inline_broker = SlowBroker(broker_latency)
+    inline = await update(UpdateAddressUseCase(repository(database(args)), events=InlineEvents(inline_broker)), args)
+    return {"off": off, "outbox": {**with_outbox, **delivery(broker)}, "inline": inline}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--updates", type=int, default=5000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=0.5)
+    parser.add_argument("--broker-ms", type=float, default=50)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--interval", type=float, default=1.0)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""Open loop load generator driving a mix of the account routes, reporting throughput, latency and errors as JSON.
+
+Usage:
+    python -m benchmarks.load [--rate 200,400,800] [--duration 30] [--mix retrieve_user=70,update_address=20,...]
+        [--workers 2] [--event-loop uvloop] [--users 10000] [--latency-ms 2]
+    python -m benchmarks.load --url https://staging.example.com --tokens-file tokens.txt [--rate 50]
+
+Without `--url` the stand-in application is started under the production gunicorn configuration, with
+`--workers`, `--event-loop`, `--users` and `--latency-ms` (simulated database round trip). With `--url` the load is
+sent to a running deployment, authenticated with the bearer tokens of `--tokens-file` (one per line).
+
+Requests are scheduled at the target rate whether or not the previous ones completed, and their latency is
+measured from the moment they were due: a saturated server shows up as growing latency instead of as a lower
+request rate. `--connections` caps the concurrent connections; requests waiting for one are still timed from
+their due time. Every rate is reported on its own, so a sweep shows where the latency knee is.
+
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import random
+import time
+import urllib.parse
+import zlib
+from collections import Counter
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+from benchmarks.client import HttpConnection
+from benchmarks.server import standin_server
+from benchmarks.standins import standin_uid, standin_user
+from domain_account.types.cpf import complete_cpf
+
+ADDRESS = {**standin_user(0)["address"], "street_name": "Rua Fulano de Tal"}
+
+DEFAULT_MIX = "retrieve_user=70,update_address=15,update_cpf=10,register_account=5"
+
+# Below the keep-alive timeout of uvicorn (5s), connections idle for longer may be closed under the request
+IDLE_TIMEOUT = 2.0
+
+PERCENTILES = {"p50_ms": 0.5, "p95_ms": 0.95, "p99_ms": 0.99, "p999_ms": 0.999}
+
+
+def cpf_of(uid: str) -> str:
+    # A valid CPF per user: CPFs are unique, two users registering or updating to the same one would conflict
+    return complete_cpf(f"{zlib.crc32(uid.encode()) % 10**9:09d}")
+
+
+@dataclass(frozen=True)
+class Route:
+    method: str
+    path: str
+    body: Callable[[str], dict[str, Any] | None]
+
+
+ROUTES = {
+    "retrieve_user": Route("GET", "/retrieve-user", lambda _: None),
+    "update_address": Route("PATCH", "/update-address", lambda _: ADDRESS),
+    "update_cpf": Route("PATCH", "/update-cpf", lambda uid: {"cpf": cpf_of(uid)}),
+    "register_account": Route("POST", "/register-account", lambda uid: {"cpf": cpf_of(uid), "address": ADDRESS}),
+    "update_profile": Route(
+        "PATCH",
+        "/update-profile",
+        lambda uid: {"cpf": cpf_of(uid), "address": {"street_name": "Rua Fulano"}},
+    ),
+    # The profile editing screen: both updates and the refreshed user, in one round trip
+    "batch": Route(
+        "POST",
+        "/batch",
+        lambda uid: {
+            "operations": [
+                {"op": "update_address", "body": ADDRESS},
+                {"op": "update_cpf", "body": {"cpf": cpf_of(uid)}},
+                {"op": "retrieve_user"},
+            ]
+        },
+    ),
+}
+
+
+@dataclass
+class Outcomes:
+    latencies: list[float] = field(default_factory=list)
+    statuses: Counter[str] = field(default_factory=Counter)
+    errors: int = 0
+
+
+def merge(outcomes: Iterable[Outcomes]) -> Outcomes:
+    total = Outcomes()
+    for outcome in outcomes:
+        total.latencies.extend(outcome.latencies)
+        total.statuses.update(outcome.statuses)
+        total.errors += outcome.errors
+    return total
+
+
+class ConnectionPool:
+    """Keep-alive connections handed out one request at a time, at most `size` of them."""
+
+    def __init__(self, host: str, port: int, tls: bool, size: int) -> None:
+        self.host = host
+        self.port = port
+        self.tls = tls
+        self.idle: list[tuple[float, HttpConnection]] = []
+        self.slots = asyncio.Semaphore(size)
+
+    async def request(self, method: str, path: str, headers: dict[str, str], body: bytes) -> int:
+        async with self.slots:
+            connection = await self.__acquire()
+            try:
+                response = await connection.request(method, path, headers, body)
+            except BaseException:
+                await connection.close()
+                raise
+            self.idle.append((time.monotonic(), connection))
+            return response.status
+
+    async def close(self) -> None:
+        for _, connection in self.idle:
+            await connection.close()
+        self.idle.clear()
+
+    async def __acquire(self) -> HttpConnection:
+        while self.idle:
+            released, connection = self.idle.pop()
+            if time.monotonic() - released < IDLE_TIMEOUT:
+                return connection
+            await connection.close()
+        return HttpConnection(self.host, self.port, self.tls)
+
+
+def parse_mix(mix: str) -> dict[str, float]:
+    weights = {}
+    for item in mix.split(","):
+        name, _, weight = item.partition("=")
+        if name not in ROUTES:
+            raise SystemExit(f"Unknown route [{name}] in the mix, expected one of {sorted(ROUTES)}")
+        weights[name] = float(weight or 1)
+    return weights
+
+
+def percentile(values: list[float], quantile: float) -> float:
+    """Nearest rank percentile of sorted values."""
+    return values[min(len(values) - 1, max(math.ceil(quantile * len(values)) - 1, 0))]
+
+
+def summarize(outcomes: Outcomes, duration: float) -> dict[str, Any]:
+    latencies = sorted(outcomes.latencies)
+    completed = len(latencies)
+    summary: dict[str, Any] = {
+        "requests": completed + outcomes.errors,
+        "completed": completed,
+        "throughput_rps": completed / duration,
+        "errors": outcomes.errors + sum(count for status, count in outcomes.statuses.items() if status >= "500"),
+        "statuses": dict(sorted(outcomes.statuses.items())),
+    }
+    summary["error_rate"] = summary["errors"] / summary["requests"] if summary["requests"] else 0.0
+    if latencies:
+        summary.update({name: percentile(latencies, quantile) * 1000 for name, quantile in PERCENTILES.items()})
+        summary["mean_ms"] = sum(latencies) / completed * 1000
+        summary["max_ms"] = latencies[-1] * 1000
+    return summary
+
+
+class LoadGenerator:
+    """Schedule requests at a fixed rate for a duration, and record the outcome of each route.
+
+    Args:
+        pool (ConnectionPool): The connections to the target.
+        mix (dict[str, float]): The relative weight of each route.
+        tokens (Callable[[random.Random], str]): Picks the bearer token of an existing user.
+        seed (int): Seed of the route and user choices, the same seed replays the same sequence.
+        timeout (float): Seconds after which a request counts as an error.
+
+    """
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        mix: dict[str, float],
+        tokens: Callable[[random.Random], str],
+        seed: int,
+        timeout: float,
+    ) -> None:
+        self.pool = pool
+        self.names = list(mix)
+        self.weights = list(mix.values())
+        self.tokens = tokens
+        self.random = random.Random(seed)
+        self.timeout = timeout
+        self.registrations = (f"load-{seed}-{index:08d}" for index in itertools.count())
+
+    async def run(self, rate: float, duration: float) -> dict[str, Any]:
+        outcomes = {name: Outcomes() for name in self.names}
+        lag: list[float] = []
+        tasks = set()
+        start = time.perf_counter()
+        for index in itertools.count():
+            due = start + index / rate
+            if due >= start + duration:
+                break
+            delay = due - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            lag.append(time.perf_counter() - due)
+            name = self.random.choices(self.names, self.weights)[0]
+            task = asyncio.create_task(self.__send(name, due, outcomes[name]))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.wait(tasks)
+        elapsed = time.perf_counter() - start
+        lag.sort()
+        return {
+            "target_rps": rate,
+            "duration_s": elapsed,
+            **summarize(merge(outcomes.values()), elapsed),
+            # When the generator itself cannot keep up, the requests leave late and the report is not trustworthy
+            "scheduling_lag_p99_ms": percentile(lag, 0.99) * 1000 if lag else 0.0,
+            "routes": {name: summarize(outcome, elapsed) for name, outcome in outcomes.items()},
+        }
+
+    async def __send(self, name: str, due: float, outcome: Outcomes) -> None:
+        route = ROUTES[name]
+        uid = next(self.registrations) if name == "register_account" else self.tokens(self.random)
+        payload = route.body(uid)
+        body = json.dumps(payload).encode() if payload is not None else b""
+        headers = {"Authorization": f"Bearer {uid}"}
+        if payload is not None:
+            headers["Content-Type"] = "application/json"
+        try:
+            status = await asyncio.wait_for(self.pool.request(route.method, route.path, headers, body), self.timeout)
+        except (asyncio.TimeoutError, OSError, asyncio.IncompleteReadError):
+            outcome.errors += 1
+            return
+        outcome.latencies.append(time.perf_counter() - due)
+        outcome.statuses[str(status)] += 1
+
+
+def token_picker(args: argparse.Namespace) -> Callable[[random.Random], str]:
+    if args.tokens_file:
+        with open(args.tokens_file, encoding="utf-8") as file:
+            tokens = [line.strip() for line in file if line.strip()]
+        return lambda generator: generator.choice(tokens)
+    # The stand-in authentication takes the bearer token as the user UID
+    return lambda generator: standin_uid(generator.randrange(args.users))
+
+
+async def drive(args: argparse.Namespace, host: str, port: int, tls: bool) -> list[dict[str, Any]]:
+    pool = ConnectionPool(host, port, tls, args.connections)
+    generator = LoadGenerator(pool, parse_mix(args.mix), token_picker(args), args.seed, args.timeout)
+    try:
+        if args.warmup > 0:
+            await generator.run(min(args.rates), args.warmup)
+        return [await generator.run(rate, args.duration) for rate in args.rates]
+    finally:
+        await pool.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="target deployment, the stand-in application is started otherwise")
+    parser.add_argument("--tokens-file", help="bearer tokens of existing users, required with --url")
+    parser.add_argument(
+        "--rate", dest="rates", default="200", type=lambda value: [float(v) for v in value.split(",")], help="req/s"
+    )
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds per rate")
+    parser.add_argument("--warmup", type=float, default=5.0, help="seconds at the lowest rate before measuring")
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--connections", type=int, default=256)
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--event-loop", default="asyncio")
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    config = {key: value for key, value in vars(args).items() if value is not None}
+    with ExitStack() as stack:
+        if args.url:
+            if not args.tokens_file:
+                parser.error("--tokens-file is required with --url")
+            target = urllib.parse.urlsplit(args.url)
+            tls = target.scheme == "https"
+            host, port = target.hostname or "localhost", target.port or (443 if tls else 80)
+        else:
+            env = {"STANDIN_USERS": str(args.users), "STANDIN_LATENCY_MS": str(args.latency_ms)}
+            port = stack.enter_context(standin_server(args.event_loop, args.workers, env))
+            host, tls = "127.0.0.1", False
+        results = asyncio.run(drive(args, host, port, tls))
+    print(json.dumps({"config": config, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Latency, throughput and threads of the account repository on Motor and on the asyncio client of PyMongo.
+
+Usage:
+    python -m benchmarks.mongo_drivers [--requests 5000] [--concurrency 50] [--write-ratio 0.1] [--latency-ms 0]
+        [--uri mongodb://...]
+
+Each driver serves `--requests` repository operations, `--concurrency` at a time: user reads (`get_user`) and, for
+`--write-ratio` of them, address updates moving the user to another city, which also update the user counts. Both
+drivers run the same `AccountRepository`, only the manager handed to it changes.
+
+Without `--uri` the operations go over TCP to `benchmarks.wire_standin`, a server stand-in answering from memory in
+a child process after `--latency-ms`, so the measure is the cost of the driver: Motor running each operation on its
+thread pool against PyMongo running it on the event loop. With `--uri` they go to a real MongoDB, whose
+`domain_account_benchmark` database is dropped and seeded with the stand-in users first.
+
+Every driver runs in a fresh process, so the threads started by one are not counted against the other. The report is
+printed as JSON: the median and 99th percentile latency in milliseconds, the operations per second, and the threads
+of the process before connecting and at their peak while serving.
+
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from multiprocessing import get_context
+from typing import Any
+
+from pymongo import MongoClient
+
+from benchmarks.standins import STANDIN_CONFIG, standin_document, standin_uid
+from benchmarks.wire_standin import wire_standin_server
+from domain_account.adapters.repositories import AccountRepository, UserStatsRepository
+from domain_account.business.ports import RetrieveUserInputPort, UpdateAddressInputPort
+from domain_account.frameworks.anonymisation import CpfHasher
+from domain_account.frameworks.caching import NegativeCache
+from domain_account.frameworks.metrics import MetricsRegistry
+from domain_account.frameworks.mongodb import DATABASE_DRIVERS, WriteDurabilityPolicy, database_manager
+
+DATABASE = "domain_account_benchmark"
+CITIES = (("Curitiba", "80010000"), ("Recife", "50010000"))
+_THREAD_SAMPLE_S = 0.005
+
+
+def repository(manager: Any) -> AccountRepository:
+    policy = WriteDurabilityPolicy(STANDIN_CONFIG["write_durability"])
+    return AccountRepository(
+        manager,
+        CpfHasher(STANDIN_CONFIG["cpf_hash_key"]),
+        UserStatsRepository(manager, policy),
+        NegativeCache(MetricsRegistry(), "unknown_uids", max_size=0, ttl=0),
+        policy,
+    )
+
+
+async def sample_threads(peak: list[int], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        peak[0] = max(peak[0], threading.active_count())
+        await asyncio.sleep(_THREAD_SAMPLE_S)
+
+
+async def serve(accounts: AccountRepository, args: argparse.Namespace, latencies: list[float]) -> None:
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for index in range(args.requests):
+        queue.put_nowait(index)
+    writes_every = round(1 / args.write_ratio) if args.write_ratio > 0 else 0
+
+    async def client() -> None:
+        while not queue.empty():
+            index = queue.get_nowait()
+            uid = standin_uid(index % args.users)
+            start = time.perf_counter()
+            if writes_every and index % writes_every == 0:
+                city, cep = CITIES[index // writes_every % 2]
+                await accounts.update_address(UpdateAddressInputPort(uid=uid, city=city, cep=cep))
+            else:
+                await accounts.get_user(RetrieveUserInputPort(uid=uid))
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(client() for _ in range(args.concurrency)))
+
+
+async def run(driver: str, uri: str, args: argparse.Namespace) -> dict[str, Any]:
+    threads_before = threading.active_count()
+    manager = database_manager(driver)(service_name="benchmark", database_name=DATABASE, database_uri=uri, tls=False)
+    await manager.connect()
+    accounts = repository(manager)
+    warmup = argparse.Namespace(**{**vars(args), "requests": args.concurrency * 10})
+    await serve(accounts, warmup, [])
+
+    latencies: list[float] = []
+    peak, stop = [threading.active_count()], asyncio.Event()
+    sampler = asyncio.create_task(sample_threads(peak, stop))
+    start = time.perf_counter()
+    await serve(accounts, args, latencies)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await sampler
+    await manager.disconnect()
+    return {
+        "median_ms": round(statistics.median(latencies), 3),
+        "p99_ms": round(statistics.quantiles(latencies, n=100)[98], 3),
+        "ops_per_s": round(len(latencies) / elapsed, 1),
+        "threads_before": threads_before,
+        "threads_peak": peak[0],
+    }
+
+
+def run_in_process(driver: str, uri: str, args: argparse.Namespace) -> dict[str, Any]:
+    return asyncio.run(run(driver, uri, args))
+
+
+def seed(uri: str, users: int) -> None:
+    client: MongoClient = MongoClient(uri)
+    try:
+        client.drop_database(DATABASE)
+        client[DATABASE]["users"].insert_many(standin_document(index) for index in range(users))
+        client[DATABASE]["users"].create_index("uid")
+    finally:
+        client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--write-ratio", type=float, default=0.1)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--uri", help="MongoDB to run against instead of the wire protocol stand-in")
+    args = parser.parse_args()
+
+    with ExitStack() as stack:
+        if args.uri:
+            uri = args.uri
+            seed(uri, args.users)
+        else:
+            uri = stack.enter_context(wire_standin_server(args.users, args.latency_ms))
+        report = {}
+        for driver in DATABASE_DRIVERS:
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+                report[driver] = executor.submit(run_in_process, driver, uri, args).result()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
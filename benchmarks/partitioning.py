@@ -0,0 +1,170 @@
+"""Rebalance the users across partitions while the repository serves them, against in-memory stand-in databases.
+
+Usage:
+    python -m benchmarks.partitioning [--users 5000] [--partitions 4] [--clients 20] [--latency-ms 0.5]
+
+The users start on a single stand-in database, as before the collection was partitioned. The repository is moved to
+`--partitions` stand-ins, listing the first one as the previous partition, and `PartitionMover` moves the users while
+`--clients` tasks read users and update their address, each task writing its own users so the last write of each
+one is known. Then a partition is added and the users are rebalanced again.
+
+The report is printed as JSON:
+
+- `moved`: the users moved by each rebalance, and their share of the users; adding a partition to N moves about
+  1/(N+1) of them.
+- `per_partition`: the users on each partition once balanced.
+- `lost_writes` and `duplicates`: address updates missing from the final users, and users found on two partitions,
+  both must be 0.
+- `get_user_ms`: the median and 99th percentile latency of the reads during the rebalance, when the moving users
+  are read from both partitions, and after it.
+- `find_users_by_cpf_ms`: looking 50 CPFs up, on the single database and on the partitions, read concurrently.
+- `cpf_claimed_across_partitions`: whether registering a CPF held by a user of another partition is rejected.
+
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any
+
+from benchmarks.mongo_drivers import repository
+from benchmarks.standins import InMemoryDatabaseService, standin_document, standin_uid
+from domain_account.adapters.repositories import AccountRepository
+from domain_account.adapters.repositories.exceptions import CpfAlreadyRegistered
+from domain_account.business.ports import (
+    FindUsersByCpfInputPort,
+    RegisterInputPort,
+    RetrieveUserInputPort,
+    UpdateAddressInputPort,
+)
+from domain_account.frameworks.partitioning import PartitionedDatabaseService, PartitionMover
+from domain_account.models import Address
+
+LOOKUP_CPFS = 50
+
+
+def summary(samples: list[float]) -> dict[str, float]:
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "p99_ms": round(statistics.quantiles(samples, n=100)[98], 3),
+    }
+
+
+def partitioned(databases: dict[str, InMemoryDatabaseService], previous: list[str]) -> PartitionedDatabaseService:
+    return PartitionedDatabaseService(databases, previous)  # type: ignore[arg-type]
+
+
+async def serve(
+    accounts: AccountRepository, client: int, args: argparse.Namespace, done: asyncio.Event, state: dict[str, Any]
+) -> None:
+    """Read random users and update the address of the users of this client, until the rebalance is done."""
+    step = 0
+    while not done.is_set():
+        step += 1
+        uid = standin_uid((client + step * args.clients) % args.users)
+        start = time.perf_counter()
+        await accounts.get_user(RetrieveUserInputPort(uid=uid))
+        state["reads"].append((time.perf_counter() - start) * 1000)
+        await accounts.update_address(UpdateAddressInputPort(uid=uid, number=str(step)))
+        state["writes"][uid] = str(step)
+
+
+async def rebalance(
+    databases: dict[str, InMemoryDatabaseService], previous: list[str], args: argparse.Namespace
+) -> dict[str, Any]:
+    service = partitioned(databases, previous)
+    accounts = repository(service)
+    await accounts.create_indexes()
+    mover = PartitionMover(service, "users", batch_size=100)
+    state: dict[str, Any] = {"reads": [], "writes": {}}
+    done = asyncio.Event()
+    clients = [asyncio.create_task(serve(accounts, client, args, done, state)) for client in range(args.clients)]
+    await mover.claim_unique()
+    moved = await mover.rebalance()
+    done.set()
+    await asyncio.gather(*clients)
+    after: list[float] = []
+    for index in range(0, args.users, max(args.users // 1000, 1)):
+        start = time.perf_counter()
+        await accounts.get_user(RetrieveUserInputPort(uid=standin_uid(index)))
+        after.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "moved": moved,
+        "moved_share": round(moved / args.users, 3),
+        **placed(databases, state["writes"]),
+        "get_user_ms": {"during": summary(state["reads"]), "after": summary(after)},
+        "accounts": accounts,
+    }
+
+
+def placed(databases: dict[str, InMemoryDatabaseService], writes: dict[str, str]) -> dict[str, Any]:
+    """Where the users ended, and whether they hold the last address update written to them."""
+    users = {name: list(database.database["users"].scan({}, None, None)) for name, database in databases.items()}
+    located = [user["uid"] for documents in users.values() for user in documents]
+    final = {user["uid"]: user["address"]["number"] for documents in users.values() for user in documents}
+    return {
+        "per_partition": {name: len(documents) for name, documents in users.items()},
+        "lost_writes": sum(final.get(uid) != number for uid, number in writes.items()),
+        "duplicates": len(located) - len(set(located)),
+    }
+
+
+async def find_by_cpf_ms(accounts: AccountRepository, users: int) -> dict[str, float]:
+    cpfs = [standin_document(index)["cpf"] for index in range(0, users, max(users // LOOKUP_CPFS, 1))][:LOOKUP_CPFS]
+    samples = []
+    for _ in range(50):
+        start = time.perf_counter()
+        found = await accounts.find_users_by_cpf(FindUsersByCpfInputPort(cpfs=cpfs))
+        samples.append((time.perf_counter() - start) * 1000)
+        assert len(found) == len(cpfs), "a user looked up by CPF was not found"
+    return summary(samples)
+
+
+async def cpf_claimed(accounts: AccountRepository) -> bool:
+    address = Address(city="Curitiba", cep="80010000", street_name="Rua XV", number="1", complement="")
+    # A UID landing on any partition, taking the CPF of a stand-in user
+    port = RegisterInputPort(uid="partitioning-duplicate", cpf=standin_document(1)["cpf"], address=address)
+    try:
+        await accounts.register(port)
+    except CpfAlreadyRegistered:
+        return True
+    return False
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    latency = args.latency_ms / 1000
+    names = [f"p{index}" for index in range(args.partitions + 1)]
+    databases = {name: InMemoryDatabaseService(latency) for name in names}
+    single = databases[names[0]]
+    single.database["users"].seed(standin_document(index) for index in range(args.users))
+    baseline = repository(single)
+    await baseline.create_indexes()
+    single_lookup = await find_by_cpf_ms(baseline, args.users)
+
+    split = await rebalance({name: databases[name] for name in names[:-1]}, names[:1], args)
+    grown = await rebalance(databases, names[:-1], args)
+    accounts: AccountRepository = grown.pop("accounts")
+    split.pop("accounts")
+    return {
+        f"1_to_{args.partitions}": split,
+        f"{args.partitions}_to_{args.partitions + 1}": grown,
+        "find_users_by_cpf_ms": {"single": single_lookup, "partitioned": await find_by_cpf_ms(accounts, args.users)},
+        "cpf_claimed_across_partitions": await cpf_claimed(accounts),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--partitions", type=int, default=4)
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=0.5)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""Replay a recorded traffic trace against the stand-in application, and compare the latencies of two builds.
+
+Usage:
+    python -m benchmarks.replay trace.jsonl [--speed 2] [--build ../baseline] [--output report.json]
+        [--workers 2] [--event-loop uvloop] [--latency-ms 2] [--limit 100000] [--warmup 200]
+
+The trace is the file written by the service when TRAFFIC_CAPTURE_PATH is set. Every request is sent at its
+original offset from the start of the trace, divided by `--speed`, and timed from that moment like
+`benchmarks.load` does. Each anonymised user is mapped to a stand-in user, so the hot users of the trace stay hot,
+and bodies are rebuilt from their recorded shape.
+
+With `--build`, the trace is replayed against that checkout first (for instance `git worktree add ../baseline
+main`) and then against this one, and the report holds the latency deltas per route. The stand-in application must
+exist in both builds.
+
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import re
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from benchmarks.load import ConnectionPool, Outcomes, merge, summarize
+from benchmarks.server import ROOT, standin_server
+from benchmarks.standins import standin_uid
+from domain_account.types.cpf import CPF_LENGTH, complete_cpf
+
+REGISTER_ROUTE = "/register-account"
+DIGITS = "0123456789"
+COMPARED = ("p50_ms", "p95_ms", "p99_ms", "p999_ms", "mean_ms")
+
+
+@dataclass(frozen=True)
+class Replayed:
+    offset: float
+    method: str
+    route: str
+    headers: dict[str, str]
+    body: bytes
+    status: int
+
+
+def synthesize(shape: Any, serial: int = 0) -> Any:
+    """Build a JSON value of the given `body_shape`, strings are digits so they pass numeric validations too.
+
+    Strings are made of the `serial` of the request when long enough, so values that must be unique (the CPFs of
+    two registrations) differ from one request to the next. They start with a 9, unlike the stand-in CPFs, and a
+    `cpf` of the length of a CPF gets valid check digits.
+    """
+    if isinstance(shape, dict):
+        value = {key: synthesize(item, serial) for key, item in shape.items()}
+        if isinstance(value.get("cpf"), str) and len(value["cpf"]) == CPF_LENGTH:
+            value["cpf"] = complete_cpf(value["cpf"][: CPF_LENGTH - 2])
+        return value
+    if isinstance(shape, list):
+        return [synthesize(shape[1], serial) for _ in range(shape[0])] if shape[0] else []
+    kind, _, length = shape.partition(":")
+    if kind == "str":
+        size = int(length)
+        if size > len(str(serial)):
+            return "9" + str(serial).zfill(size - 1)
+        return (DIGITS * (size // len(DIGITS) + 1))[:size]
+    return {"int": 0, "float": 0.0, "bool": False}.get(kind)
+
+
+def load_trace(path: str, limit: int | None) -> tuple[list[Replayed], int]:
+    """Read a trace, in start order, and map its anonymised users to stand-in users.
+
+    Returns:
+        tuple[list[Replayed], int]: The requests to replay and the amount of stand-in users they need.
+
+    """
+    with open(path, encoding="utf-8") as file:
+        entries = sorted((json.loads(line) for line in file if line.strip()), key=lambda entry: entry["t"])
+    entries = [entry for entry in entries if entry["r"] != "unmatched"][:limit]
+    users: dict[str, str] = {}
+    seeded = itertools.count()
+    registered = itertools.count()
+    requests = []
+    for serial, entry in enumerate(entries):
+        headers = {}
+        if entry["u"] is not None:
+            if entry["u"] not in users:
+                # A user first seen registering did not exist yet, every other one is seeded beforehand
+                fresh = entry["r"] == REGISTER_ROUTE and entry["m"] == "POST"
+                users[entry["u"]] = f"replay-{next(registered):08d}" if fresh else standin_uid(next(seeded))
+            headers["Authorization"] = f"Bearer {users[entry['u']]}"
+        shape = entry["b"]
+        if shape is None:
+            body = b""
+        elif isinstance(shape, str) and shape.startswith("bytes:"):
+            body = b"0" * int(shape.partition(":")[2])
+        else:
+            body = json.dumps(synthesize(shape, serial)).encode()
+            headers["Content-Type"] = "application/json"
+        route = re.sub(r"\{[^}]*\}", "0", entry["r"])
+        requests.append(Replayed(entry["t"] - entries[0]["t"], entry["m"], route, headers, body, entry["s"]))
+    return requests, next(seeded)
+
+
+async def warm_up(pool: ConnectionPool, requests: int) -> None:
+    # The first requests of a fresh worker are slow, they would end up in the tail of whichever build runs them
+    headers = {"Authorization": f"Bearer {standin_uid(0)}"}
+    for _ in range(requests):
+        await pool.request("GET", "/retrieve-user", headers, b"")
+
+
+async def replay(requests: list[Replayed], port: int, speed: float, connections: int, warmup: int) -> dict[str, Any]:
+    pool = ConnectionPool("127.0.0.1", port, False, connections)
+    await warm_up(pool, warmup)
+    outcomes: dict[str, Outcomes] = {}
+    mismatches = 0
+
+    async def send(request: Replayed, due: float, outcome: Outcomes) -> None:
+        nonlocal mismatches
+        try:
+            status = await pool.request(request.method, request.route, request.headers, request.body)
+        except (OSError, asyncio.IncompleteReadError):
+            outcome.errors += 1
+            return
+        outcome.latencies.append(time.perf_counter() - due)
+        outcome.statuses[str(status)] += 1
+        mismatches += status != request.status
+
+    tasks = set()
+    start = time.perf_counter()
+    try:
+        for request in requests:
+            due = start + request.offset / speed
+            await asyncio.sleep(max(due - time.perf_counter(), 0))
+            task = asyncio.create_task(
+                send(request, due, outcomes.setdefault(f"{request.method} {request.route}", Outcomes()))
+            )
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.wait(tasks)
+    finally:
+        await pool.close()
+    elapsed = time.perf_counter() - start
+    return {
+        **summarize(merge(outcomes.values()), elapsed),
+        # Replayed against stand-in data, some answers differ from production: a large share hints at a bad mapping
+        "status_mismatches": mismatches,
+        "routes": {name: summarize(outcome, elapsed) for name, outcome in sorted(outcomes.items())},
+    }
+
+
+def deltas(baseline: dict[str, Any], current: dict[str, Any]) -> dict[str, Any]:
+    """Latency differences, in milliseconds, from the baseline build to the current one, overall and per route."""
+
+    def delta(before: dict[str, Any], after: dict[str, Any]) -> dict[str, float]:
+        return {stat: after[stat] - before[stat] for stat in COMPARED if stat in before and stat in after}
+
+    routes = {
+        name: delta(summary, current["routes"][name])
+        for name, summary in baseline["routes"].items()
+        if name in current["routes"]
+    }
+    return {**delta(baseline, current), "routes": routes}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("trace")
+    parser.add_argument("--speed", type=float, default=1.0, help="2 replays twice as fast as recorded")
+    parser.add_argument("--build", help="checkout of the baseline build, replayed before this one")
+    parser.add_argument("--output", help="where to store the report, printed otherwise")
+    parser.add_argument("--limit", type=int, help="replay the first requests of the trace only")
+    parser.add_argument("--warmup", type=int, default=200, help="unmeasured requests before the replay")
+    parser.add_argument("--connections", type=int, default=256)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--event-loop", default="asyncio")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    requests, users = load_trace(args.trace, args.limit)
+    env = {"STANDIN_USERS": str(max(users, 1)), "STANDIN_LATENCY_MS": str(args.latency_ms)}
+    builds = {"baseline": args.build, "current": ROOT} if args.build else {"current": ROOT}
+    results = {}
+    for name, root in builds.items():
+        with standin_server(args.event_loop, args.workers, env, root=root) as port:
+            results[name] = asyncio.run(replay(requests, port, args.speed, args.connections, args.warmup))
+    report: dict[str, Any] = {
+        "trace": {
+            "path": args.trace,
+            "requests": len(requests),
+            "users": users,
+            "duration_s": requests[-1].offset if requests else 0.0,
+            "speed": args.speed,
+        },
+        "builds": results,
+    }
+    if args.build:
+        report["deltas"] = deltas(results["baseline"], results["current"])
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
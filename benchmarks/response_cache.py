@@ -0,0 +1,54 @@
+"""Throughput of `GET /retrieve-user` on a hot user workload, with and without the user response cache.
+
+Usage:
+    python -m benchmarks.response_cache [--duration 10] [--connections 32] [--hot-users 16] [--latency-ms 1]
+
+A closed loop of keep-alive connections reads the same few users over and over, as clients polling their account
+do. The stand-in application is served through `gunicorn.conf.py` in three configurations:
+
+- `database`: every read goes to the database stand-in, answering after `--latency-ms`.
+- `documents`: the database stand-in answers at once, what a cache of the user documents would at best achieve:
+  the request still builds the output port and DTO and encodes them.
+- `responses`: the database stand-in answers at once and the user response cache is enabled, the encoded body of
+  a hot user is served as is.
+
+The report is printed as JSON, each speedup is relative to `documents`.
+
+"""
+
+import argparse
+import asyncio
+import json
+
+from benchmarks.event_loop import closed_loop
+from benchmarks.server import standin_server
+
+CONFIGURATIONS = {
+    "database": {"USER_RESPONSE_CACHE_BYTES": "0"},
+    "documents": {"USER_RESPONSE_CACHE_BYTES": "0", "STANDIN_LATENCY_MS": "0"},
+    "responses": {"USER_RESPONSE_CACHE_BYTES": str(64 * 1024 * 1024), "STANDIN_LATENCY_MS": "0"},
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--hot-users", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    report: dict[str, dict[str, float]] = {}
+    for name, configuration in CONFIGURATIONS.items():
+        env = {"STANDIN_USERS": "1000", "STANDIN_LATENCY_MS": str(args.latency_ms), **configuration}
+        with standin_server(env=env) as port:
+            asyncio.run(closed_loop(port, 1.0, args.connections, args.hot_users))  # warm up
+            report[name] = asyncio.run(closed_loop(port, args.duration, args.connections, args.hot_users))
+    baseline = report["documents"]["requests_per_second"]
+    for result in report.values():
+        result["speedup"] = result["requests_per_second"] / baseline
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
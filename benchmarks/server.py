@@ -0,0 +1,72 @@
+"""Run the stand-in application under the production gunicorn configuration, in a child process."""
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def wait_for_port(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise TimeoutError(f"Server on port {port} did not start in {timeout}s")
+
+
+@contextmanager
+def standin_server(
+    event_loop: str = "asyncio",
+    workers: int = 1,
+    env: dict[str, str] | None = None,
+    app: str = "benchmarks.standins:create_standin_app()",
+    root: str = ROOT,
+) -> Iterator[int]:
+    """Start gunicorn with `gunicorn.conf.py` serving the stand-in application and yield its port.
+
+    Args:
+        event_loop (str): The EVENT_LOOP engine, "asyncio" or "uvloop".
+        workers (int): Amount of gunicorn workers.
+        env (dict[str, str] | None): Extra environment variables for the server.
+        app (str): The application (or factory call) to serve.
+        root (str): The checkout serving it, another build of the service (a `git worktree`) can be given.
+
+    """
+    port = free_port()
+    command = [
+        sys.executable,
+        "-m",
+        "gunicorn",
+        "--config",
+        "gunicorn.conf.py",
+        "--workers",
+        str(workers),
+        "--preload",
+        "--bind",
+        f"127.0.0.1:{port}",
+        "--log-level",
+        "warning",
+        app,
+    ]
+    server_env = {**os.environ, "EVENT_LOOP": event_loop, "PYTHONPATH": root, **(env or {})}
+    with subprocess.Popen(command, cwd=root, env=server_env) as process:
+        try:
+            wait_for_port(port)
+            yield port
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
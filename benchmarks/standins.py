@@ -0,0 +1,675 @@
+"""In-process stand-ins for the external backends, so the real application can be benchmarked on one box.
+
+The database stand-in mimics the subset of the Motor collection API used by the repositories, including the
+asynchronous hop (every operation yields to the event loop, optionally after a simulated round trip), and optionally
+the acknowledgement of the writes by a replica set, per their write concern. The authentication stand-in accepts
+any bearer token and uses it as the user UID, tokens starting with `admin` also pass as administrators.
+
+"""
+
+import asyncio
+import bisect
+import copy
+import os
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, cast
+
+import bson
+from fastapi import FastAPI, status
+from fastapi.exceptions import HTTPException
+from pymongo import ReplaceOne, ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError
+from pymongo.write_concern import WriteConcern
+
+from domain_account.adapters.interfaces import DocumentDatabaseService
+from domain_account.adapters.interfaces.authentication_service import AuthenticationService, BearerToken, UserUid
+from domain_account.frameworks.__factory__ import FrameworksConfig, FrameworksFactory
+from domain_account.frameworks.anonymisation import CpfHasher
+from domain_account.frameworks.mongodb import DEFAULT_WRITE_DURABILITY
+from domain_account.main import AppBinding, create_app
+from domain_account.types.cep import cep_region
+from domain_account.types.cpf import complete_cpf
+
+Document = dict[str, Any]
+
+STANDIN_CONFIG = FrameworksConfig(
+    database_name="standin",
+    database_uri="mongodb://standin",
+    database_driver="motor",
+    database_tls=True,
+    database_partitions={},
+    database_previous_partitions=[],
+    service_name="domain-account-standin",
+    credentials=None,
+    auth_app_options={},
+    database_slow_command_ms=100,
+    profile_slow_request_ms=None,
+    profile_capture_interval=60,
+    loop_blocked_ms=100,
+    # Recording the stand-in traffic is how a trace for `benchmarks.replay` can be made without production
+    traffic_capture_path=os.environ.get("TRAFFIC_CAPTURE_PATH"),
+    traffic_capture_sample_rate=1.0,
+    uid_hash_salt="standin",
+    cpf_hash_key="standin",
+    # Without an index the addresses are stored as sent, `benchmarks.suite` times the lookups on a generated one
+    cep_index_path=os.environ.get("CEP_INDEX_PATH"),
+    unknown_uid_cache_size=10_000,
+    unknown_uid_cache_ttl=5,
+    # Off like in production by default, `benchmarks.suite` times the hot user workload with and without it
+    user_response_cache_bytes=int(os.environ.get("USER_RESPONSE_CACHE_BYTES", "0")),
+    user_response_cache_ttl=5,
+    # Off like in production by default, a load test with the limits on measures the rejected requests
+    rate_limit_rps=float(os.environ.get("RATE_LIMIT_RPS", "0")),
+    rate_limit_burst=20,
+    rate_limit_route_rps=float(os.environ.get("RATE_LIMIT_ROUTE_RPS", "0")),
+    rate_limit_route_burst=200,
+    rate_limit_max_keys=100_000,
+    write_durability=DEFAULT_WRITE_DURABILITY,
+    # Off like in production by default, `memory` or `file:<path>` publishes the account events of a load test
+    event_broker=os.environ.get("EVENT_BROKER"),
+    event_batch_size=500,
+    event_publish_interval=1.0,
+    # One JSON line per request on the terminal of a load test is noise, LOG_LEVEL=INFO measures its cost
+    log_level=os.environ.get("LOG_LEVEL", "WARNING"),
+    log_queue_size=10_000,
+)
+
+_CPF_HASHER = CpfHasher(STANDIN_CONFIG["cpf_hash_key"])
+
+
+@dataclass
+class InsertOneResult:
+    inserted_id: Any
+
+
+@dataclass
+class InsertManyResult:
+    inserted_ids: list[Any]
+
+
+@dataclass
+class UpdateResult:
+    matched_count: int
+    modified_count: int
+    upserted_id: Any = None
+
+
+@dataclass
+class DeleteResult:
+    deleted_count: int
+
+
+@dataclass
+class BulkWriteResult:
+    matched_count: int
+    upserted_count: int
+
+
+_MISSING = object()
+
+
+def _get_path(document: Document, path: str) -> Any:
+    value: Any = document
+    for key in path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return _MISSING
+        value = value[key]
+    return value
+
+
+def _set_path(document: Document, path: str, value: Any) -> None:
+    *parents, leaf = path.split(".")
+    for key in parents:
+        document = document.setdefault(key, {})
+    document[leaf] = value
+
+
+def _unset_path(document: Document, path: str) -> None:
+    *parents, leaf = path.split(".")
+    for key in parents:
+        document = document.get(key, {})
+    document.pop(leaf, None)
+
+
+_OPERATORS = {
+    "$eq": lambda value, operand: value == operand,
+    "$ne": lambda value, operand: value != operand,
+    "$gt": lambda value, operand: value is not _MISSING and value > operand,
+    "$gte": lambda value, operand: value is not _MISSING and value >= operand,
+    "$lt": lambda value, operand: value is not _MISSING and value < operand,
+    "$lte": lambda value, operand: value is not _MISSING and value <= operand,
+    "$in": lambda value, operand: value in operand,
+    "$nin": lambda value, operand: value not in operand,
+    "$exists": lambda value, operand: (value is not _MISSING) == operand,
+}
+
+
+def matches(document: Document, query: Document) -> bool:
+    """Evaluate a MongoDB filter (equality, comparison, `$in`, `$exists`, `$and`, `$or`) against a document."""
+    for key, condition in query.items():
+        if key == "$and":
+            if not all(matches(document, sub_query) for sub_query in condition):
+                return False
+            continue
+        if key == "$or":
+            if not any(matches(document, sub_query) for sub_query in condition):
+                return False
+            continue
+        value = _get_path(document, key)
+        if isinstance(condition, dict) and condition and next(iter(condition)).startswith("$"):
+            if not all(_OPERATORS[operator](value, operand) for operator, operand in condition.items()):
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+def project(document: Document, projection: Document | Iterable[str] | None) -> Document:
+    """Apply an inclusion or exclusion projection to a copy of the document."""
+    if projection is None:
+        return copy.deepcopy(document)
+    if not isinstance(projection, dict):
+        projection = {field: 1 for field in projection}
+    include_id = bool(projection.get("_id", 1))
+    fields = {field: flag for field, flag in projection.items() if field != "_id"}
+    if fields and all(fields.values()):
+        projected: Document = {}
+        for field in fields:
+            value = _get_path(document, field)
+            if value is not _MISSING:
+                _set_path(projected, field, copy.deepcopy(value))
+    else:
+        projected = copy.deepcopy(document)
+        for field in fields:
+            _unset_path(projected, field)
+    if include_id and "_id" in document:
+        projected["_id"] = document["_id"]
+    else:
+        projected.pop("_id", None)
+    return projected
+
+
+class InMemoryCursor:
+    """A Motor cursor stand-in, the documents are found, sorted and projected when the cursor is read."""
+
+    def __init__(self, collection: "InMemoryCollection", query: Document, projection: Any) -> None:
+        self._collection = collection
+        self._query = query
+        self._projection = projection
+        self._sort: tuple[str, int] | None = None
+        self._limit = 0
+
+    def sort(self, key: str, direction: int = 1) -> "InMemoryCursor":
+        self._sort = (key, direction)
+        return self
+
+    def limit(self, limit: int) -> "InMemoryCursor":
+        self._limit = limit
+        return self
+
+    async def to_list(self, length: int | None = None) -> list[Document]:
+        await asyncio.sleep(self._collection.latency)
+        limit = min(filter(None, (self._limit, length)), default=None)
+        documents = self._collection.scan(self._query, self._sort, limit)
+        return [project(document, self._projection) for document in documents]
+
+    async def __aiter__(self) -> AsyncIterator[Document]:
+        for document in await self.to_list():
+            yield document
+
+
+@dataclass(frozen=True)
+class ReplicaSetLatency:
+    """Simulated acknowledgement of the writes by a replica set, awaited after their round trip.
+
+    Attributes:
+        replication (float): Seconds until a majority of the members applied and journaled a write, secondaries
+            journal before acknowledging (`writeConcernMajorityJournalDefault`), so `j` adds nothing to it.
+        journal (float): Seconds until the primary flushed its journal, for `w:1` writes asking for `j`.
+
+    """
+
+    replication: float
+    journal: float
+
+    def acknowledgement(self, write_concern: WriteConcern | None) -> float:
+        """The seconds a write waits for its acknowledgement, a missing write concern being `w:majority`."""
+        document = write_concern.document if write_concern is not None else {}
+        if document.get("w", "majority") == "majority":
+            return self.replication
+        return self.journal if document.get("j") else 0.0
+
+
+class InMemoryCollection:
+    """A MongoDB collection stand-in implementing the Motor methods used by the repositories.
+
+    Filters are evaluated by scanning the documents, unless they test `_id` or an indexed field for equality with a
+    scalar or membership in a list of scalars. Unique indexes are sparse: documents missing the field do not collide.
+
+    Indexes created with `create_index` are also ordered, on their whole key: a query sorted on the last field of
+    one, testing its other fields for equality, walks it from where the range of the sort field starts, and stops
+    once the limit is reached, like a bounded index scan.
+
+    Args:
+        latency (float): Simulated round trip, in seconds, awaited by every operation.
+        replica_set (ReplicaSetLatency | None): Simulated acknowledgement of the writes, none by default.
+
+    """
+
+    def __init__(self, latency: float = 0.0, replica_set: ReplicaSetLatency | None = None) -> None:
+        self._latency = latency
+        self._replica_set = replica_set
+        self._write_latency = latency + (replica_set.acknowledgement(None) if replica_set is not None else 0.0)
+        self._documents: dict[Any, Document] = {}
+        self._indexes: dict[str, dict[Any, set[Any]]] = {}
+        self._ordered: dict[tuple[str, ...], list[tuple[tuple[Any, ...], Any]]] = {}
+        self._unique: set[str] = set()
+
+    @property
+    def latency(self) -> float:
+        return self._latency
+
+    def ensure_index(self, field: str, unique: bool = False) -> None:
+        """Synchronously index a field for equality lookups."""
+        if unique:
+            self._unique.add(field)
+        if field in self._indexes:
+            return
+        self._indexes[field] = {}
+        for document in self._documents.values():
+            self._index(document, (field,))
+
+    async def create_index(self, keys: str | list[tuple[str, Any]], unique: bool = False, **_: Any) -> str:
+        await asyncio.sleep(self._latency)
+        fields = [keys] if isinstance(keys, str) else [field for field, _ in keys]
+        for field in fields:
+            self.ensure_index(field, unique and len(fields) == 1)
+        self.ensure_ordered_index(tuple(fields))
+        return "_".join(fields)
+
+    def ensure_ordered_index(self, fields: tuple[str, ...]) -> None:
+        """Synchronously index documents in the order of their values of some fields, for sorted range scans."""
+        if fields in self._ordered:
+            return
+        entries = (self._ordered_entry(fields, document) for document in self._documents.values())
+        self._ordered[fields] = sorted(entry for entry in entries if entry is not None)
+
+    @staticmethod
+    def _ordered_entry(fields: tuple[str, ...], document: Document) -> tuple[tuple[Any, ...], Any] | None:
+        values = tuple(_get_path(document, field) for field in fields)
+        if any(value is _MISSING or isinstance(value, (dict, list)) for value in values):
+            return None
+        return values, document["_id"]
+
+    def seed(self, documents: Iterable[Document]) -> None:
+        """Synchronously load documents, bypassing the simulated round trip."""
+        for document in documents:
+            document = copy.deepcopy(document)
+            document.setdefault("_id", bson.ObjectId())
+            self._documents[document["_id"]] = document
+            self._index(document)
+
+    def _index(self, document: Document, fields: Iterable[str] | None = None) -> None:
+        for field in self._indexes if fields is None else fields:
+            value = _get_path(document, field)
+            if value is not _MISSING and not isinstance(value, (dict, list)):
+                self._indexes[field].setdefault(value, set()).add(document["_id"])
+        if fields is not None:
+            return
+        for ordered_fields, ordered in self._ordered.items():
+            if (entry := self._ordered_entry(ordered_fields, document)) is not None:
+                bisect.insort(ordered, entry)
+
+    def _unindex(self, document: Document) -> None:
+        for field, entries in self._indexes.items():
+            value = _get_path(document, field)
+            if value is not _MISSING and not isinstance(value, (dict, list)):
+                entries.get(value, set()).discard(document["_id"])
+        for ordered_fields, ordered in self._ordered.items():
+            if (entry := self._ordered_entry(ordered_fields, document)) is not None:
+                position = bisect.bisect_left(ordered, entry)
+                if position < len(ordered) and ordered[position] == entry:
+                    del ordered[position]
+
+    def _check_unique(self, _id: Any, fields: Document) -> None:
+        for field in self._unique:
+            value = fields[field] if field in fields else _get_path(fields, field)
+            if value is not _MISSING and self._indexes[field].get(value, set()) - {_id}:
+                raise DuplicateKeyError(
+                    f"E11000 duplicate key error index: {field}_1", 11000, {"keyPattern": {field: 1}}
+                )
+
+    def _find(self, query: Document) -> Iterable[Document]:
+        candidates: Iterable[Document] = self._documents.values()
+        _id = query.get("_id", _MISSING)
+        if _id is not _MISSING and self._is_scalar(_id):
+            # The implicit unique index of every collection
+            candidates = [self._documents[_id]] if _id in self._documents else []
+            return (document for document in candidates if matches(document, query))
+        for field, entries in self._indexes.items():
+            condition = query.get(field, _MISSING)
+            if isinstance(condition, dict) and list(condition) == ["$in"]:
+                ids = set().union(*(entries.get(value, set()) for value in condition["$in"]))
+                candidates = [self._documents[_id] for _id in ids]
+                break
+            if condition is not _MISSING and not isinstance(condition, (dict, list)):
+                candidates = [self._documents[_id] for _id in entries.get(condition, ())]
+                break
+        return (document for document in candidates if matches(document, query))
+
+    def scan(self, query: Document, sort: tuple[str, int] | None, limit: int | None) -> list[Document]:
+        """The documents matching a query, sorted and limited, through an ordered index when one fits."""
+        if sort is not None and sort[1] == 1:
+            # Like the query planner, the index testing the most fields for equality wins
+            fitting = [
+                fields
+                for fields in self._ordered
+                if fields[-1] == sort[0] and all(self._is_scalar(query.get(field, _MISSING)) for field in fields[:-1])
+            ]
+            if fitting:
+                return self._walk(max(fitting, key=len), query, limit)
+        documents = list(self._find(query))
+        if sort is not None:
+            documents.sort(key=lambda document: _get_path(document, sort[0]), reverse=sort[1] < 0)
+        return documents[:limit]
+
+    @staticmethod
+    def _is_scalar(value: Any) -> bool:
+        return value is not _MISSING and not isinstance(value, (dict, list))
+
+    def _walk(self, fields: tuple[str, ...], query: Document, limit: int | None) -> list[Document]:
+        entries = self._ordered[fields]
+        prefix = tuple(query[field] for field in fields[:-1])
+        # The range of the sort field starts after its $gt (or at its $gte) bound, at the prefix otherwise
+        condition = query.get(fields[-1], {})
+        lower = condition.get("$gt", condition.get("$gte", _MISSING)) if isinstance(condition, dict) else _MISSING
+        if lower is _MISSING:
+            position = bisect.bisect_left(entries, prefix, key=lambda entry: entry[0][: len(prefix)])
+        elif "$gt" in condition:
+            position = bisect.bisect_right(entries, (*prefix, lower), key=lambda entry: entry[0])
+        else:
+            position = bisect.bisect_left(entries, (*prefix, lower), key=lambda entry: entry[0])
+        documents: list[Document] = []
+        for index in range(position, len(entries)):
+            values, _id = entries[index]
+            if values[: len(prefix)] != prefix or (limit is not None and len(documents) >= limit):
+                break
+            if matches(self._documents[_id], query):
+                documents.append(self._documents[_id])
+        return documents
+
+    async def insert_one(self, document: Document) -> InsertOneResult:
+        await asyncio.sleep(self._write_latency)
+        self._check_unique(None, document)
+        document.setdefault("_id", bson.ObjectId())
+        if document["_id"] in self._documents:
+            raise DuplicateKeyError("E11000 duplicate key error index: _id_", 11000, {"keyPattern": {"_id": 1}})
+        self._documents[document["_id"]] = copy.deepcopy(document)
+        self._index(document)
+        return InsertOneResult(document["_id"])
+
+    async def insert_many(self, documents: list[Document], **_: Any) -> InsertManyResult:
+        # A single round trip, stopping at the first duplicate like an ordered insert
+        await asyncio.sleep(self._write_latency)
+        inserted = []
+        for document in documents:
+            self._check_unique(None, document)
+            document.setdefault("_id", bson.ObjectId())
+            if document["_id"] in self._documents:
+                raise DuplicateKeyError("E11000 duplicate key error index: _id_", 11000, {"keyPattern": {"_id": 1}})
+            self._documents[document["_id"]] = copy.deepcopy(document)
+            self._index(document)
+            inserted.append(document["_id"])
+        return InsertManyResult(inserted)
+
+    async def find_one(self, query: Document | None = None, projection: Any = None) -> Document | None:
+        await asyncio.sleep(self._latency)
+        for document in self._find(query or {}):
+            return project(document, projection)
+        return None
+
+    def find(self, query: Document | None = None, projection: Any = None) -> InMemoryCursor:
+        return InMemoryCursor(self, query or {}, projection)
+
+    def with_options(self, write_concern: WriteConcern | None = None, **_: Any) -> "InMemoryCollection":
+        # Read preferences mean nothing to a single in-process copy, write concerns only change how long writes wait
+        if write_concern is None or self._replica_set is None:
+            return self
+        view = copy.copy(self)
+        view._write_latency = self._latency + self._replica_set.acknowledgement(write_concern)  # pylint: disable=W0212
+        return view
+
+    async def update_one(self, query: Document, update: Document, upsert: bool = False) -> UpdateResult:
+        await asyncio.sleep(self._write_latency)
+        if not update or not all(operator.startswith("$") for operator in update):
+            raise ValueError("update only works with $ operators")
+        result = self._update(query, update, upsert)
+        return result
+
+    async def find_one_and_update(
+        self,
+        query: Document,
+        update: Document,
+        projection: Any = None,
+        upsert: bool = False,
+        return_document: bool = ReturnDocument.BEFORE,
+    ) -> Document | None:
+        await asyncio.sleep(self._write_latency)
+        for document in self._find(query):
+            before = project(document, projection)
+            self._update(query, update, upsert)
+            return project(document, projection) if return_document == ReturnDocument.AFTER else before
+        result = self._update(query, update, upsert)
+        if result.upserted_id is not None and return_document == ReturnDocument.AFTER:
+            return project(self._documents[result.upserted_id], projection)
+        return None
+
+    async def bulk_write(self, operations: list[UpdateOne | ReplaceOne], **_: Any) -> BulkWriteResult:
+        await asyncio.sleep(self._write_latency)
+        matched = upserted = 0
+        for operation in operations:
+            # pylint: disable=protected-access
+            query, update, upsert = dict(operation._filter), cast(Document, operation._doc), bool(operation._upsert)
+            if isinstance(operation, ReplaceOne):
+                result = self._replace(query, update, upsert)
+            else:
+                result = self._update(query, update, upsert)
+            matched += result.matched_count
+            upserted += result.upserted_id is not None
+        return BulkWriteResult(matched_count=matched, upserted_count=upserted)
+
+    async def replace_one(self, query: Document, replacement: Document, upsert: bool = False) -> UpdateResult:
+        await asyncio.sleep(self._write_latency)
+        return self._replace(query, replacement, upsert)
+
+    def _update(self, query: Document, update: Document, upsert: bool) -> UpdateResult:
+        for document in self._find(query):
+            self._check_unique(document["_id"], update.get("$set", {}))
+            self._unindex(document)
+            self._apply(document, update)
+            self._index(document)
+            return UpdateResult(matched_count=1, modified_count=1)
+        if upsert:
+            document = {key: value for key, value in query.items() if not key.startswith("$")}
+            document.setdefault("_id", bson.ObjectId())
+            self._apply(document, {**update, "$set": {**update.get("$setOnInsert", {}), **update.get("$set", {})}})
+            self._documents[document["_id"]] = document
+            self._index(document)
+            return UpdateResult(matched_count=0, modified_count=0, upserted_id=document["_id"])
+        return UpdateResult(matched_count=0, modified_count=0)
+
+    def _replace(self, query: Document, replacement: Document, upsert: bool) -> UpdateResult:
+        for document in self._find(query):
+            self._check_unique(document["_id"], replacement)
+            self._unindex(document)
+            _id = document["_id"]
+            document.clear()
+            document.update(copy.deepcopy(replacement), _id=_id)
+            self._index(document)
+            return UpdateResult(matched_count=1, modified_count=1)
+        if upsert:
+            document = {key: value for key, value in query.items() if not key.startswith("$")}
+            document.setdefault("_id", bson.ObjectId())
+            document.update(copy.deepcopy(replacement))
+            self._check_unique(None, document)
+            self._documents[document["_id"]] = document
+            self._index(document)
+            return UpdateResult(matched_count=0, modified_count=0, upserted_id=document["_id"])
+        return UpdateResult(matched_count=0, modified_count=0)
+
+    async def delete_one(self, query: Document) -> DeleteResult:
+        await asyncio.sleep(self._write_latency)
+        for document in self._find(query):
+            self._unindex(document)
+            del self._documents[document["_id"]]
+            return DeleteResult(deleted_count=1)
+        return DeleteResult(deleted_count=0)
+
+    async def delete_many(self, query: Document) -> DeleteResult:
+        await asyncio.sleep(self._write_latency)
+        documents = list(self._find(query))
+        for document in documents:
+            self._unindex(document)
+            del self._documents[document["_id"]]
+        return DeleteResult(deleted_count=len(documents))
+
+    async def count_documents(self, query: Document) -> int:
+        await asyncio.sleep(self._latency)
+        return sum(1 for _ in self._find(query))
+
+    @staticmethod
+    def _apply(document: Document, update: Document) -> None:
+        for path, value in update.get("$set", {}).items():
+            _set_path(document, path, copy.deepcopy(value))
+        for path in update.get("$unset", {}):
+            _unset_path(document, path)
+        for path, amount in update.get("$inc", {}).items():
+            current = _get_path(document, path)
+            _set_path(document, path, (0 if current is _MISSING else current) + amount)
+
+
+class InMemoryDatabase(dict[str, InMemoryCollection]):
+    """A database stand-in creating collections on first access."""
+
+    def __init__(self, latency: float = 0.0, replica_set: ReplicaSetLatency | None = None) -> None:
+        super().__init__()
+        self._latency = latency
+        self._replica_set = replica_set
+
+    def __missing__(self, name: str) -> InMemoryCollection:
+        collection = self[name] = InMemoryCollection(self._latency, self._replica_set)
+        return collection
+
+
+class InMemoryDatabaseService(DocumentDatabaseService[None, InMemoryDatabase]):
+    """A `DocumentDatabaseService` backed by an `InMemoryDatabase`."""
+
+    def __init__(self, latency: float = 0.0, replica_set: ReplicaSetLatency | None = None) -> None:
+        self._database = InMemoryDatabase(latency, replica_set)
+
+    @property
+    def client(self) -> None:
+        return None
+
+    @property
+    def database(self) -> InMemoryDatabase:
+        return self._database
+
+
+class StaticAuthenticationService(AuthenticationService):
+    """An `AuthenticationService` trusting the bearer token as the user UID."""
+
+    def authenticate_by_token(self, token: BearerToken) -> UserUid:
+        return UserUid(token)
+
+    def authenticate_admin_by_token(self, token: BearerToken) -> UserUid:
+        if not token.startswith("admin"):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Administrator privileges are needed")
+        return UserUid(token)
+
+
+class StandInFrameworksFactory(FrameworksFactory):
+    """The production frameworks factory with the database and authentication backends swapped by stand-ins."""
+
+    def __init__(self, database: InMemoryDatabaseService) -> None:
+        super().__init__(STANDIN_CONFIG)
+        self.__in_memory = database
+
+    async def connect(self) -> None:
+        """Nothing to connect to, only the worker logging, publishing of the events, profiling and recording start."""
+        self.log_pipeline().start()
+        await self.open_event_outbox()
+        self.profiling_framework().open()
+        self.traffic_recording_framework().open()
+
+    def database_framework(self) -> InMemoryDatabaseService:  # type: ignore[override]
+        return self.__in_memory
+
+    def authentication_framework(self) -> StaticAuthenticationService:  # type: ignore[override]
+        return StaticAuthenticationService()
+
+
+class StandInAppBinding(AppBinding):
+    """Bind the application against the stand-in frameworks."""
+
+    def __init__(self, database: InMemoryDatabaseService) -> None:
+        super().__init__(STANDIN_CONFIG)
+        self.database = database
+
+    def bind_frameworks(self) -> None:
+        self.frameworks = StandInFrameworksFactory(self.database)
+
+
+def standin_uid(index: int) -> str:
+    return f"standin-user-{index:08d}"
+
+
+def standin_user(index: int) -> Document:
+    return {
+        "uid": standin_uid(index),
+        "cpf": complete_cpf(f"{index:09d}"),
+        "address": {
+            "city": "Curitiba",
+            "cep": f"{80000000 + index % 100000:08d}",
+            "street_name": "Rua Beltrano do Ciclano",
+            "number": str(index % 1000),
+            "complement": "Apto 7",
+        },
+    }
+
+
+def standin_document(index: int, user: Callable[[int], Document] = standin_user) -> Document:
+    """The stored document of a stand-in user, with the CPF hash the repository maintains."""
+    document = user(index)
+    return {**document, "cpf_hash": _CPF_HASHER.digest(document["cpf"])}
+
+
+def standin_stats(users: int, user: Callable[[int], Document] = standin_user) -> Iterator[Document]:
+    """The stored user counts per city and CEP region of the stand-in users, as `UserStatsRepository` keeps them."""
+    counts: Counter[tuple[str, str]] = Counter()
+    for index in range(users):
+        address = user(index)["address"]
+        counts.update([("city", address["city"]), ("cep_region", cep_region(address["cep"]) or "")])
+    for (by, key), count in counts.items():
+        yield {"_id": f"{by}:{key}", "by": by, "key": key, "users": count}
+
+
+def create_standin_app(users: int | None = None, latency: float | None = None) -> FastAPI:
+    """Create the application against the stand-in backends, seeded with registered users.
+
+    Args:
+        users (int | None): Amount of registered users, defaults to the STANDIN_USERS env var or 1000.
+        latency (float | None): Simulated database round trip in seconds, defaults to STANDIN_LATENCY_MS or 0.
+
+    Returns:
+        FastAPI: The application, with every route, middleware and dependency of production.
+
+    """
+    users = int(os.environ.get("STANDIN_USERS", "1000")) if users is None else users
+    latency = float(os.environ.get("STANDIN_LATENCY_MS", "0")) / 1000 if latency is None else latency
+    database = InMemoryDatabaseService(latency)
+    database.database["users"].ensure_index("uid")
+    database.database["users"].seed(standin_document(index) for index in range(users))
+    database.database["user_stats"].seed(standin_stats(users))
+    return create_app(StandInAppBinding(database))
@@ -0,0 +1,94 @@
+"""Microbenchmark suite of the use cases, the repository, the routes and the token verification.
+
+Usage:
+    python -m benchmarks.suite run [-k "controller.*"] [--output results.json] [--save-baseline]
+    python -m benchmarks.suite compare [-k "use_case.*"] [--current results.json] [--threshold 0.15]
+
+`run` times every selected benchmark and optionally stores the report as the baseline. `compare` times them again
+(or reads a stored report) and fails when one is slower than its baseline by more than the threshold, in every
+confirmation rerun. Baselines are only comparable on the machine, and with the Python version, that recorded them:
+record one on the box running the comparison before relying on it.
+
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Any
+
+from benchmarks.suite import cases  # noqa: F401  # pylint: disable=W0611
+from benchmarks.suite.harness import best_of, compare, run, select
+
+BASELINE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "baselines", "suite.json")
+
+
+def _load(path: str) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as file:
+        report: dict[str, Any] = json.load(file)
+    return report
+
+
+def _dump(report: dict[str, Any], path: str) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=("run", "compare", "list"))
+    parser.add_argument("-k", dest="patterns", action="append", help="glob of the benchmarks to run, repeatable")
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per round")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--output", help="where to store the report of `run`")
+    parser.add_argument("--save-baseline", action="store_true", help="store the report of `run` as the baseline")
+    parser.add_argument("--current", help="report compared by `compare`, instead of running the benchmarks")
+    parser.add_argument("--threshold", type=float, default=0.15, help="tolerated slowdown, 0.15 is 15%%")
+    parser.add_argument("--stat", choices=("min_us", "median_us"), default="min_us")
+    parser.add_argument("--confirmations", type=int, default=2, help="reruns of the regressed benchmarks")
+    args = parser.parse_args()
+
+    names = select(args.patterns)
+    if args.command == "list":
+        print("\n".join(names))
+        return
+    if args.command == "run":
+        report = run(names, args.rounds, args.min_time)
+        if args.output:
+            _dump(report, args.output)
+        if args.save_baseline:
+            if os.path.exists(args.baseline):
+                # Keep the baselines of the benchmarks that were not selected this time
+                stored = _load(args.baseline)
+                report["results"] = {**stored["results"], **report["results"]}
+            _dump(report, args.baseline)
+        return
+
+    baseline = _load(args.baseline)
+    current = _load(args.current) if args.current else run(names, args.rounds, args.min_time)
+    if baseline["machine"] != current["machine"]:
+        print(f"WARNING: the baseline was recorded on {baseline['machine']}, not on {current['machine']}")
+    regressions = compare(baseline, current, args.threshold, args.stat)
+    # A noisy neighbour can slow any single run down, a regression has to show up in every rerun as well
+    for _ in range(args.confirmations if not args.current else 0):
+        if not regressions:
+            break
+        print(f"Confirming {len(regressions)} regression(s)...")
+        current = best_of(current, run(sorted(regressions), args.rounds, args.min_time))
+        regressions = compare(
+            baseline,
+            {**current, "results": {name: current["results"][name] for name in regressions}},
+            args.threshold,
+            args.stat,
+        )
+    for name, ratio in regressions.items():
+        print(f"FAIL: {name} is {ratio:.2f}x slower than its baseline")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,551 @@
+"""The benchmarks of the suite, one per use case, repository operation, route and token verification.
+
+- `use_case.*`: the use cases alone, against an `AccountService` answering instantly.
+- `repository.*`: `AccountRepository` against the in-memory database stand-in, seeded and indexed like production.
+  `repository.list_users.*` fetch the first and the last page, which should take the same time.
+  `repository.count_users` reads a materialised user count, `repository.update_address.move` updates the counts too.
+- `controller.*`: every route through an ASGI client, with the production middlewares, dependencies and stand-ins.
+- `auth.*`: `firebase_admin.auth.verify_id_token` on a token signed locally, certificates served from memory.
+- `cpf.*`: the CPF validation of one value, and of a column of them.
+- `postal_code.*`: CEP lookups in a memory-mapped index the size of a national dataset.
+
+"""
+
+import itertools
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Iterator
+
+import httpx
+from fastapi import FastAPI
+
+from benchmarks.standins import (
+    STANDIN_CONFIG,
+    InMemoryDatabaseService,
+    create_standin_app,
+    standin_document,
+    standin_stats,
+    standin_uid,
+    standin_user,
+)
+from benchmarks.suite.harness import Operation, benchmark
+from benchmarks.suite.tokens import LocalTokenIssuer
+from domain_account.adapters.repositories.account_repository import AccountRepository
+from domain_account.adapters.repositories.exceptions import UserNotFound
+from domain_account.adapters.repositories.postal_code_repository import PostalCodeRepository
+from domain_account.adapters.repositories.user_stats_repository import UserStatsRepository
+from domain_account.business.ports import (
+    BatchInputPort,
+    FindUsersByCpfInputPort,
+    ListUsersInputPort,
+    RegisterInputPort,
+    RetrieveUserInputPort,
+    UpdateAccountInputPort,
+    UpdateAddressInputPort,
+    UpdateCpfInputPort,
+    UserStatsInputPort,
+)
+from domain_account.business.services import AccountService
+from domain_account.business.use_case import (
+    BatchUseCase,
+    FindUsersByCpfUseCase,
+    ListUsersUseCase,
+    RegisterUseCase,
+    RetrieveUserUseCase,
+    UpdateAddressUseCase,
+    UpdateCpfUseCase,
+)
+from domain_account.frameworks.anonymisation import CpfHasher
+from domain_account.frameworks.caching import NegativeCache
+from domain_account.frameworks.metrics import MetricsRegistry
+from domain_account.frameworks.mongodb import WriteDurabilityPolicy
+from domain_account.frameworks.postal_codes import CepIndex, write_index
+from domain_account.models import RegisteredUser, User
+from domain_account.types.cpf import complete_cpf, normalise_cpf, normalise_cpfs
+from domain_account.types.page_cursor import encode_cursor
+
+USERS = 10_000
+USER = standin_user(7)
+ADDRESS = {**USER["address"], "street_name": "Rua Fulano de Tal"}
+
+
+class _InstantAccountService(AccountService):
+    """An `AccountService` doing nothing, so only the use case itself is timed."""
+
+    def __init__(self) -> None:
+        self.user = User(**USER)
+        self.users = [RegisteredUser(**standin_user(index)) for index in range(ListUsersInputPort().limit + 1)]
+
+    async def register(self, port: RegisterInputPort) -> None:
+        return None
+
+    async def get_user(self, port: RetrieveUserInputPort) -> User:
+        return self.user
+
+    async def update_address(self, port: UpdateAddressInputPort) -> bool:
+        return True
+
+    async def update_cpf(self, port: UpdateCpfInputPort) -> bool:
+        return True
+
+    async def update_account(self, port: UpdateAccountInputPort) -> bool:
+        return True
+
+    async def find_users_by_cpf(self, port: FindUsersByCpfInputPort) -> list[RegisteredUser]:
+        return [RegisteredUser(**USER)]
+
+    async def list_users(self, port: ListUsersInputPort) -> list[RegisteredUser]:
+        return self.users[: port.limit]
+
+
+def _seeded_database(user: Callable[[int], dict[str, Any]] = standin_user) -> InMemoryDatabaseService:
+    database = InMemoryDatabaseService()
+    database.database["users"].ensure_index("uid")
+    database.database["users"].ensure_index("cpf_hash", unique=True)
+    database.database["users"].seed(standin_document(index, user) for index in range(USERS))
+    database.database["user_stats"].seed(standin_stats(USERS, user))
+    return database
+
+
+_DURABILITY = WriteDurabilityPolicy(STANDIN_CONFIG["write_durability"])
+
+
+def _seeded_repository(user: Callable[[int], dict[str, Any]] = standin_user) -> AccountRepository:
+    database = _seeded_database(user)
+    return AccountRepository(
+        database,  # type: ignore[arg-type]
+        CpfHasher(STANDIN_CONFIG["cpf_hash_key"]),
+        UserStatsRepository(database, _DURABILITY),  # type: ignore[arg-type]
+        NegativeCache(MetricsRegistry(), "unknown_uids", max_size=10_000, ttl=60),
+        _DURABILITY,
+    )
+
+
+# Registering the same CPF twice is a conflict, even across reruns on the shared application: the CPFs of the
+# stand-in users never start with a 9
+_FRESH_CPFS = (complete_cpf(f"9{index:08d}") for index in itertools.count())
+
+
+def _large_address_user(index: int) -> dict[str, Any]:
+    # Addresses with long free text fields, where loading the whole document dominates a CPF lookup
+    user = standin_user(index)
+    user["address"] = {**user["address"], "street_name": "Rua " + "Beltrano " * 200, "complement": "Bloco 7 " * 2000}
+    return user
+
+
+@benchmark("use_case.register")
+@asynccontextmanager
+async def register_use_case() -> AsyncIterator[Operation]:
+    use_case = RegisterUseCase(_InstantAccountService())
+    port = RegisterInputPort(**USER)
+    yield lambda: use_case(port)
+
+
+@benchmark("use_case.retrieve_user")
+@asynccontextmanager
+async def retrieve_user_use_case() -> AsyncIterator[Operation]:
+    use_case = RetrieveUserUseCase(_InstantAccountService())
+    port = RetrieveUserInputPort(uid=USER["uid"])
+    yield lambda: use_case(port)
+
+
+@benchmark("use_case.update_address")
+@asynccontextmanager
+async def update_address_use_case() -> AsyncIterator[Operation]:
+    use_case = UpdateAddressUseCase(_InstantAccountService())
+    port = UpdateAddressInputPort(**ADDRESS, uid=USER["uid"])
+    yield lambda: use_case(port)
+
+
+@benchmark("use_case.update_cpf")
+@asynccontextmanager
+async def update_cpf_use_case() -> AsyncIterator[Operation]:
+    use_case = UpdateCpfUseCase(_InstantAccountService())
+    port = UpdateCpfInputPort(uid=USER["uid"], cpf="12345678909")
+    yield lambda: use_case(port)
+
+
+@benchmark("use_case.batch")
+@asynccontextmanager
+async def batch_use_case() -> AsyncIterator[Operation]:
+    use_case = BatchUseCase(_InstantAccountService())
+    operations = [
+        UpdateAddressInputPort(**ADDRESS, uid=USER["uid"]),
+        UpdateCpfInputPort(uid=USER["uid"], cpf="12345678909"),
+        RetrieveUserInputPort(uid=USER["uid"]),
+    ]
+    port = BatchInputPort(uid=USER["uid"], operations=operations)
+    yield lambda: use_case(port)
+
+
+@benchmark("repository.register")
+@asynccontextmanager
+async def repository_register() -> AsyncIterator[Operation]:
+    repository = _seeded_repository()
+    uids = (f"registered-{index}" for index in itertools.count())
+    yield lambda: repository.register(RegisterInputPort(cpf=next(_FRESH_CPFS), address=USER["address"], uid=next(uids)))
+
+
+@benchmark("repository.get_user")
+@asynccontextmanager
+async def repository_get_user() -> AsyncIterator[Operation]:
+    repository = _seeded_repository()
+    port = RetrieveUserInputPort(uid=standin_uid(USERS // 2))
+    yield lambda: repository.get_user(port)
+
+
+@benchmark("repository.get_user.unknown")
+@asynccontextmanager
+async def repository_get_unknown_user() -> AsyncIterator[Operation]:
+    # A signed up user probing its account before registering it, answered by the negative cache after the first
+    repository = _seeded_repository()
+    port = RetrieveUserInputPort(uid="signed-up-not-registered")
+
+    async def get_unknown_user() -> None:
+        try:
+            await repository.get_user(port)
+        except UserNotFound:
+            pass
+
+    yield get_unknown_user
+
+
+@benchmark("repository.get_user.large_address")
+@asynccontextmanager
+async def repository_get_large_user() -> AsyncIterator[Operation]:
+    repository = _seeded_repository(_large_address_user)
+    port = RetrieveUserInputPort(uid=standin_uid(USERS // 2))
+    yield lambda: repository.get_user(port)
+
+
+@benchmark("repository.get_user.large_address.cpf")
+@asynccontextmanager
+async def repository_get_large_user_cpf() -> AsyncIterator[Operation]:
+    repository = _seeded_repository(_large_address_user)
+    port = RetrieveUserInputPort(uid=standin_uid(USERS // 2), fields=["cpf"])
+    yield lambda: repository.get_user(port)
+
+
+@benchmark("repository.update_address")
+@asynccontextmanager
+async def repository_update_address() -> AsyncIterator[Operation]:
+    repository = _seeded_repository()
+    port = UpdateAddressInputPort(**ADDRESS, uid=standin_uid(USERS // 2))
+    yield lambda: repository.update_address(port)
+
+
+@benchmark("repository.update_cpf")
+@asynccontextmanager
+async def repository_update_cpf() -> AsyncIterator[Operation]:
+    repository = _seeded_repository()
+    port = UpdateCpfInputPort(uid=standin_uid(USERS // 2), cpf="12345678909")
+    yield lambda: repository.update_cpf(port)
+
+
+_app: FastAPI | None = None
+
+
+@asynccontextmanager
+async def _client() -> AsyncIterator[httpx.AsyncClient]:
+    # The controller dependencies are a process wide singleton, every controller benchmark shares one application
+    global _app  # pylint: disable=W0603
+    if _app is None:
+        _app = create_standin_app(users=USERS)
+    async with _app.router.lifespan_context(_app):
+        transport = httpx.ASGITransport(app=_app)  # type: ignore[arg-type]
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            yield client
+
+
+def _bearer(uid: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {uid}"}
+
+
+async def _succeeding(operation: Operation) -> Operation:
+    # Timing an error path by mistake would make a broken route look fast
+    response = await operation()
+    if response.status_code >= 400:
+        raise RuntimeError(f"The benchmarked route failed with {response.status_code}: {response.text}")
+    return operation
+
+
+async def _answering(status_code: int, operation: Operation) -> Operation:
+    # The error paths timed on purpose must answer their own status, not a crash
+    response = await operation()
+    if response.status_code != status_code:
+        raise RuntimeError(f"The benchmarked route answered {response.status_code} instead of {status_code}")
+    return operation
+
+
+@benchmark("controller.register_account")
+@asynccontextmanager
+async def register_account_route() -> AsyncIterator[Operation]:
+    uids = (f"registered-{index}" for index in itertools.count())
+
+    def register() -> Any:
+        body = {"cpf": next(_FRESH_CPFS), "address": USER["address"]}
+        return client.post("/register-account", json=body, headers=_bearer(next(uids)))
+
+    async with _client() as client:
+        yield await _succeeding(register)
+
+
+@benchmark("controller.register_account.replay")
+@asynccontextmanager
+async def register_account_replay_route() -> AsyncIterator[Operation]:
+    # A mobile client retrying its registration, answered from the stored response without registering again
+    headers = {**_bearer("registered-retrying"), "Idempotency-Key": "retried-registration"}
+    body = {"cpf": next(_FRESH_CPFS), "address": USER["address"]}
+    async with _client() as client:
+        await _answering(201, lambda: client.post("/register-account", json=body, headers=headers))
+        yield await _answering(201, lambda: client.post("/register-account", json=body, headers=headers))
+
+
+@benchmark("controller.retrieve_user")
+@asynccontextmanager
+async def retrieve_user_route() -> AsyncIterator[Operation]:
+    headers = _bearer(standin_uid(USERS // 2))
+    async with _client() as client:
+        yield await _succeeding(lambda: client.get("/retrieve-user", headers=headers))
+
+
+@benchmark("controller.retrieve_user.unknown")
+@asynccontextmanager
+async def retrieve_unknown_user_route() -> AsyncIterator[Operation]:
+    headers = _bearer("signed-up-not-registered")
+    async with _client() as client:
+        yield await _answering(404, lambda: client.get("/retrieve-user", headers=headers))
+
+
+@benchmark("controller.retrieve_user.fields")
+@asynccontextmanager
+async def retrieve_user_fields_route() -> AsyncIterator[Operation]:
+    headers = _bearer(standin_uid(USERS // 2))
+    async with _client() as client:
+        yield await _succeeding(lambda: client.get("/retrieve-user?fields=cpf,address.cep", headers=headers))
+
+
+@benchmark("controller.update_address")
+@asynccontextmanager
+async def update_address_route() -> AsyncIterator[Operation]:
+    headers = _bearer(standin_uid(USERS // 2))
+    async with _client() as client:
+        yield await _succeeding(lambda: client.patch("/update-address", json=ADDRESS, headers=headers))
+
+
+@benchmark("controller.update_cpf")
+@asynccontextmanager
+async def update_cpf_route() -> AsyncIterator[Operation]:
+    headers = _bearer(standin_uid(USERS // 2))
+    async with _client() as client:
+        yield await _succeeding(lambda: client.patch("/update-cpf", json={"cpf": "12345678909"}, headers=headers))
+
+
+_issuer: LocalTokenIssuer | None = None
+
+
+@benchmark("auth.verify_id_token")
+@asynccontextmanager
+async def verify_id_token() -> AsyncIterator[Operation]:
+    global _issuer  # pylint: disable=W0603
+    if _issuer is None:
+        _issuer = LocalTokenIssuer()
+    issuer = _issuer
+    token = issuer.token(USER["uid"])
+
+    async def verify() -> None:
+        issuer.verify(token)
+
+    yield verify
+
+
+@benchmark("controller.batch")
+@asynccontextmanager
+async def batch_route() -> AsyncIterator[Operation]:
+    headers = _bearer(standin_uid(USERS // 2))
+    body = {
+        "operations": [
+            {"op": "update_address", "body": ADDRESS},
+            {"op": "update_cpf", "body": {"cpf": "12345678909"}},
+            {"op": "retrieve_user"},
+        ]
+    }
+    async with _client() as client:
+        yield await _succeeding(lambda: client.post("/batch", json=body, headers=headers))
+
+
+@benchmark("controller.update_profile")
+@asynccontextmanager
+async def update_profile_route() -> AsyncIterator[Operation]:
+    headers = _bearer(standin_uid(USERS // 2))
+    body = {"cpf": "12345678909", "address": {"street_name": ADDRESS["street_name"]}}
+    async with _client() as client:
+        yield await _succeeding(lambda: client.patch("/update-profile", json=body, headers=headers))
+
+
+@benchmark("use_case.find_users_by_cpf")
+@asynccontextmanager
+async def find_users_by_cpf_use_case() -> AsyncIterator[Operation]:
+    use_case = FindUsersByCpfUseCase(_InstantAccountService())
+    port = FindUsersByCpfInputPort(cpfs=[USER["cpf"]])
+    yield lambda: use_case(port)
+
+
+@benchmark("repository.find_users_by_cpf")
+@asynccontextmanager
+async def repository_find_users_by_cpf() -> AsyncIterator[Operation]:
+    repository = _seeded_repository()
+    port = FindUsersByCpfInputPort(cpfs=[standin_user(USERS // 2)["cpf"]])
+    yield lambda: repository.find_users_by_cpf(port)
+
+
+@benchmark("repository.find_users_by_cpf.bulk")
+@asynccontextmanager
+async def repository_find_users_by_cpf_bulk() -> AsyncIterator[Operation]:
+    repository = _seeded_repository()
+    port = FindUsersByCpfInputPort(cpfs=[standin_user(index)["cpf"] for index in range(0, USERS, USERS // 100)])
+    yield lambda: repository.find_users_by_cpf(port)
+
+
+@benchmark("controller.find_users_by_cpf")
+@asynccontextmanager
+async def find_users_by_cpf_route() -> AsyncIterator[Operation]:
+    headers = _bearer("admin-lookup")
+    body = {"cpfs": [standin_user(USERS // 2)["cpf"]]}
+    async with _client() as client:
+        yield await _succeeding(lambda: client.post("/admin/users/by-cpf", json=body, headers=headers))
+
+
+@benchmark("cpf.normalise")
+@asynccontextmanager
+async def normalise_one_cpf() -> AsyncIterator[Operation]:
+    cpf = USER["cpf"]
+
+    async def normalise() -> None:
+        normalise_cpf(cpf)
+
+    yield normalise
+
+
+@benchmark("cpf.normalise.column")
+@asynccontextmanager
+async def normalise_cpf_column() -> AsyncIterator[Operation]:
+    # 10000 CPFs of a bulk import, the time per CPF is the result divided by the column size
+    cpfs = [standin_user(index)["cpf"] for index in range(USERS)]
+
+    async def normalise() -> None:
+        normalise_cpfs(cpfs)
+
+    yield normalise
+
+
+@asynccontextmanager
+async def _postal_codes() -> AsyncIterator[PostalCodeRepository]:
+    # 2000 cities of 20000 CEPs, each with 50 streets of their own: about 200000 ranges once flattened
+    def ranges() -> Iterator[tuple[int, int, str, str, str]]:
+        for city in range(2000):
+            first = 10_000_000 + city * 20_000
+            for street in range(50):
+                cep = first + street * 400
+                yield cep, cep + 199, f"Cidade {city}", "PR", f"Rua {street}"
+                yield cep + 200, cep + 399, f"Cidade {city}", "PR", ""
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "cep.idx")
+        write_index(path, ranges())
+        yield PostalCodeRepository(CepIndex(path))
+
+
+@benchmark("postal_code.locate")
+@asynccontextmanager
+async def locate_postal_code() -> AsyncIterator[Operation]:
+    async with _postal_codes() as postal_codes:
+
+        async def locate() -> None:
+            postal_codes.locate("20010-100")
+
+        yield locate
+
+
+@benchmark("use_case.update_address.cep")
+@asynccontextmanager
+async def update_address_cep_use_case() -> AsyncIterator[Operation]:
+    async with _postal_codes() as postal_codes:
+        use_case = UpdateAddressUseCase(_InstantAccountService(), postal_codes)
+        port = UpdateAddressInputPort(uid=USER["uid"], cep="20010100", street_name="R. 25")
+        yield lambda: use_case(port)
+
+
+@benchmark("use_case.list_users")
+@asynccontextmanager
+async def list_users_use_case() -> AsyncIterator[Operation]:
+    use_case = ListUsersUseCase(_InstantAccountService())
+    port = ListUsersInputPort(limit=50)
+    yield lambda: use_case(port)
+
+
+async def _listing_repository() -> AccountRepository:
+    repository = _seeded_repository()
+    await repository.create_indexes()
+    return repository
+
+
+@benchmark("repository.list_users.first_page")
+@asynccontextmanager
+async def repository_list_users_first_page() -> AsyncIterator[Operation]:
+    repository = await _listing_repository()
+    port = ListUsersInputPort(limit=50)
+    yield lambda: repository.list_users(port)
+
+
+@benchmark("repository.list_users.last_page")
+@asynccontextmanager
+async def repository_list_users_last_page() -> AsyncIterator[Operation]:
+    repository = await _listing_repository()
+    port = ListUsersInputPort(after=encode_cursor(standin_uid(USERS - 51)), limit=50)
+    yield lambda: repository.list_users(port)
+
+
+@benchmark("repository.list_users.last_page.cep")
+@asynccontextmanager
+async def repository_list_users_last_page_cep() -> AsyncIterator[Operation]:
+    # The stand-in users share a CEP every 100000 users, 10000 of them have a CEP each: a single user matches
+    repository = await _listing_repository()
+    port = ListUsersInputPort(after=encode_cursor(standin_uid(0)), limit=50, cep=USER["address"]["cep"])
+    yield lambda: repository.list_users(port)
+
+
+@benchmark("controller.list_users")
+@asynccontextmanager
+async def list_users_route() -> AsyncIterator[Operation]:
+    headers = _bearer("admin-support")
+    params = {"cursor": encode_cursor(standin_uid(USERS // 2)), "limit": "50"}
+    async with _client() as client:
+        yield await _succeeding(lambda: client.get("/admin/users", params=params, headers=headers))
+
+
+@benchmark("repository.count_users")
+@asynccontextmanager
+async def repository_count_users() -> AsyncIterator[Operation]:
+    repository = UserStatsRepository(_seeded_database(), _DURABILITY)  # type: ignore[arg-type]
+    port = UserStatsInputPort(by="cep_region", key=USER["address"]["cep"])
+    yield lambda: repository.count_users(port)
+
+
+@benchmark("repository.update_address.move")
+@asynccontextmanager
+async def repository_update_address_move() -> AsyncIterator[Operation]:
+    # Moving back and forth between two cities, every update moves the user in the counts
+    repository = _seeded_repository()
+    cities = itertools.cycle(["Recife", "Curitiba"])
+    uid = standin_uid(USERS // 2)
+    yield lambda: repository.update_address(UpdateAddressInputPort(uid=uid, city=next(cities)))
+
+
+@benchmark("controller.user_stats")
+@asynccontextmanager
+async def user_stats_route() -> AsyncIterator[Operation]:
+    headers = _bearer("admin-dashboard")
+    async with _client() as client:
+        yield await _succeeding(lambda: client.get("/admin/stats/users/city/Curitiba", headers=headers))
@@ -0,0 +1,145 @@
+"""A small microbenchmark harness: registration, calibration, timing rounds and baseline comparison."""
+
+import asyncio
+import fnmatch
+import gc
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncContextManager, Awaitable, Callable
+
+Operation = Callable[[], Awaitable[Any]]
+Setup = Callable[[], AsyncContextManager[Operation]]
+
+REGISTRY: dict[str, Setup] = {}
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    """Register a benchmark under a dotted name, `layer.subject`.
+
+    The decorated function is an async context manager factory: it builds the subject, yields the awaitable operation
+    to time, and tears the subject down once every round ran.
+
+    """
+
+    def register(setup: Setup) -> Setup:
+        if name in REGISTRY:
+            raise ValueError(f"Benchmark [{name}] is registered twice.")
+        REGISTRY[name] = setup
+        return setup
+
+    return register
+
+
+@dataclass
+class Result:
+    """Timings of one benchmark, in microseconds per operation."""
+
+    name: str
+    iterations: int
+    rounds: int
+    min_us: float
+    median_us: float
+    stdev_us: float
+
+
+async def _time(operation: Operation, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await operation()
+    return time.perf_counter() - start
+
+
+async def measure(name: str, setup: Setup, rounds: int, min_time: float) -> Result:
+    """Time a benchmark: calibrate the iterations so a round lasts `min_time`, then time `rounds` rounds."""
+    async with setup() as operation:
+        iterations = 1
+        while (elapsed := await _time(operation, iterations)) < min_time:
+            iterations = max(iterations * 2, int(iterations * min_time / max(elapsed, 1e-9)))
+        gc_enabled = gc.isenabled()
+        gc.collect()
+        gc.disable()
+        try:
+            timings = [await _time(operation, iterations) / iterations * 1e6 for _ in range(rounds)]
+        finally:
+            if gc_enabled:
+                gc.enable()
+    return Result(
+        name=name,
+        iterations=iterations,
+        rounds=rounds,
+        min_us=min(timings),
+        median_us=statistics.median(timings),
+        stdev_us=statistics.stdev(timings) if rounds > 1 else 0.0,
+    )
+
+
+def select(patterns: list[str] | None) -> list[str]:
+    """Return the registered benchmark names matching any of the glob patterns, all of them by default."""
+    names = sorted(REGISTRY)
+    if not patterns:
+        return names
+    return [name for name in names if any(fnmatch.fnmatch(name, pattern) for pattern in patterns)]
+
+
+def run(names: list[str], rounds: int, min_time: float) -> dict[str, Any]:
+    """Run the benchmarks, one event loop each, and return a report that can be stored as a baseline."""
+    results = {}
+    for name in names:
+        result = asyncio.run(measure(name, REGISTRY[name], rounds, min_time))
+        results[name] = asdict(result)
+        print(f"{name:<40} {result.median_us:>12.2f} us  (min {result.min_us:.2f}, +-{result.stdev_us:.2f})")
+    return {
+        "machine": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "processor": platform.processor() or platform.machine(),
+            "system": platform.system(),
+        },
+        "results": results,
+    }
+
+
+def best_of(first: dict[str, Any], second: dict[str, Any]) -> dict[str, Any]:
+    """Merge two reports of the same machine, keeping the fastest statistics of each benchmark."""
+    results = dict(first["results"])
+    for name, result in second["results"].items():
+        previous = results.get(name)
+        if previous is None:
+            results[name] = result
+            continue
+        results[name] = {
+            **previous,
+            "min_us": min(previous["min_us"], result["min_us"]),
+            "median_us": min(previous["median_us"], result["median_us"]),
+        }
+    return {**first, "results": results}
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold: float, stat: str) -> dict[str, float]:
+    """Compare two reports and return the benchmarks slower than the baseline by more than the threshold.
+
+    Args:
+        baseline (dict[str, Any]): The stored report.
+        current (dict[str, Any]): The fresh report.
+        threshold (float): Tolerated slowdown, 0.1 tolerates 10%.
+        stat (str): The statistic compared, "min_us" or "median_us".
+
+    Returns:
+        dict[str, float]: The slowdown ratio of each regressed benchmark, empty when none.
+
+    """
+    regressions = {}
+    for name, result in sorted(current["results"].items()):
+        reference = baseline["results"].get(name)
+        if reference is None:
+            print(f"{name:<40} {result[stat]:>12.2f} us  (no baseline)")
+            continue
+        ratio = result[stat] / reference[stat]
+        verdict = "REGRESSION" if ratio > 1 + threshold else "ok"
+        print(f"{name:<40} {reference[stat]:>12.2f} -> {result[stat]:>12.2f} us  {ratio:>6.2f}x  {verdict}")
+        if verdict != "ok":
+            regressions[name] = ratio
+    return regressions
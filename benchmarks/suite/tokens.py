@@ -0,0 +1,94 @@
+"""Firebase ID tokens signed locally, verified by the real `firebase_admin` code path without any network access.
+
+`LocalTokenIssuer` plays the part of Google's token service: it owns an RSA key, publishes the matching X.509
+certificate as the certificate endpoint would, and signs RS256 ID tokens with the claims Firebase checks. The
+Firebase app it initializes fetches its certificates from the issuer instead of Google.
+
+"""
+
+import datetime
+import json
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import firebase_admin
+import firebase_admin.auth
+import google.auth.credentials
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+from firebase_admin import credentials
+from google.auth import crypt, jwt
+
+PROJECT_ID = "domain-account-bench"
+KEY_ID = "bench-key"
+
+
+@dataclass
+class _CertificatesResponse:
+    status: int
+    headers: dict[str, str]
+    data: bytes
+
+
+class _AnonymousCredential(credentials.Base):
+    def get_credential(self) -> google.auth.credentials.Credentials:
+        return google.auth.credentials.AnonymousCredentials()
+
+
+class LocalTokenIssuer:
+    """Sign Firebase ID tokens with a local key and verify them with `firebase_admin.auth.verify_id_token`."""
+
+    def __init__(self, project_id: str = PROJECT_ID) -> None:
+        self.project_id = project_id
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        subject = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "securetoken.bench")])
+        now = datetime.datetime.now(datetime.timezone.utc)
+        certificate = (
+            x509.CertificateBuilder()
+            .subject_name(subject)
+            .issuer_name(subject)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now - datetime.timedelta(days=1))
+            .not_valid_after(now + datetime.timedelta(days=1))
+            .sign(key, hashes.SHA256())
+        )
+        pem = key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        )
+        self.__signer = crypt.RSASigner.from_string(pem, KEY_ID)
+        self.__certificates = json.dumps(
+            {KEY_ID: certificate.public_bytes(serialization.Encoding.PEM).decode()}
+        ).encode()
+        self.app = firebase_admin.initialize_app(
+            _AnonymousCredential(), options={"projectId": project_id}, name=f"local-issuer-{id(self)}"
+        )
+        # The verifier fetches the certificates through its `request` transport, answered locally from now on
+        client = firebase_admin.auth._get_client(self.app)  # pylint: disable=W0212
+        client._token_verifier.request = self.__certificates_request  # pylint: disable=W0212
+
+    def token(self, uid: str, **claims: Any) -> str:
+        """Sign an ID token for a user, valid for an hour, with optional custom claims."""
+        now = int(time.time())
+        payload = {
+            "iss": f"https://securetoken.google.com/{self.project_id}",
+            "aud": self.project_id,
+            "auth_time": now,
+            "user_id": uid,
+            "sub": uid,
+            "iat": now,
+            "exp": now + 3600,
+            **claims,
+        }
+        return jwt.encode(self.__signer, payload).decode()
+
+    def verify(self, token: str) -> dict[str, Any]:
+        """Verify a token exactly like `FirebaseManager` does."""
+        claims: dict[str, Any] = firebase_admin.auth.verify_id_token(token, self.app)
+        return claims
+
+    def __certificates_request(self, *_: Any, **__: Any) -> _CertificatesResponse:
+        return _CertificatesResponse(200, {"content-type": "application/json"}, self.__certificates)
@@ -0,0 +1,273 @@
+"""A MongoDB server stand-in speaking the wire protocol, backed by the in-memory collections of `benchmarks.standins`.
+
+Usage:
+    python -m benchmarks.wire_standin [--port 27017] [--users 1000] [--latency-ms 0]
+
+The in-memory database is handed to the repositories in place of a driver, so it measures nothing of the drivers.
+This server lets real clients, Motor and the asyncio client of PyMongo, connect over TCP without a `mongod`: it
+answers the handshake as a standalone MongoDB 7.0 and serves the commands the repositories and the partition mover
+send (`find`, `insert`, `update`, replacements included, `delete`, `findAndModify`, `createIndexes`) from the
+collections of an `InMemoryDatabase`, seeded with the stand-in users. Cursors fit in their first batch, there are no
+sessions, transactions nor authentication.
+
+"""
+
+import argparse
+import asyncio
+import os
+import struct
+import subprocess
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Coroutine, Iterator
+
+import bson
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from benchmarks.server import ROOT, free_port, wait_for_port
+from benchmarks.standins import InMemoryDatabase, InMemoryDatabaseService, project, standin_document
+
+Document = dict[str, Any]
+
+OP_REPLY = 1
+OP_QUERY = 2004
+OP_MSG = 2013
+# The length, request id, id of the request answered and opcode of a message
+HEADER = struct.Struct("<iiii")
+_INT32 = struct.Struct("<i")
+_MORE_TO_COME = 1 << 1
+_MAX_BSON_SIZE = 16 * 1024 * 1024
+
+HELLO = {
+    "isWritablePrimary": True,
+    "ismaster": True,
+    "helloOk": True,
+    "maxBsonObjectSize": _MAX_BSON_SIZE,
+    "maxMessageSizeBytes": 48_000_000,
+    "maxWriteBatchSize": 100_000,
+    "logicalSessionTimeoutMinutes": 30,
+    "minWireVersion": 0,
+    "maxWireVersion": 21,
+    "readOnly": False,
+    "ok": 1.0,
+}
+
+Command = Callable[[InMemoryDatabase, Document], Coroutine[Any, Any, Document]]
+
+
+def _cstring(data: bytes, offset: int) -> tuple[str, int]:
+    end = data.index(b"\x00", offset)
+    return data[offset:end].decode(), end + 1
+
+
+def parse_msg(body: bytes) -> tuple[int, Document]:
+    """The flags and the command of an OP_MSG body, with its document sequences set as fields of the command."""
+    (flags,) = _INT32.unpack_from(body)
+    offset, command, sequences = 4, {}, {}
+    while offset < len(body) - (4 if flags & 1 else 0):
+        kind, offset = body[offset], offset + 1
+        (size,) = _INT32.unpack_from(body, offset)
+        if kind == 0:
+            command = bson.decode(body[offset : offset + size])
+        else:
+            identifier, start = _cstring(body, offset + 4)
+            sequences[identifier] = bson.decode_all(body[start : offset + size])
+        offset += size
+    return flags, {**command, **sequences}
+
+
+def parse_query(body: bytes) -> Document:
+    """The command of an OP_QUERY body, only sent by the drivers for the handshake."""
+    _, offset = _cstring(body, 4)
+    return bson.decode(body[offset + 8 :])
+
+
+def reply_msg(request_id: int, document: Document) -> bytes:
+    payload = _INT32.pack(0) + b"\x00" + bson.encode(document)
+    return HEADER.pack(HEADER.size + len(payload), 0, request_id, OP_MSG) + payload
+
+
+def reply_query(request_id: int, document: Document) -> bytes:
+    payload = struct.pack("<iqii", 0, 0, 0, 1) + bson.encode(document)
+    return HEADER.pack(HEADER.size + len(payload), 0, request_id, OP_REPLY) + payload
+
+
+def _error(message: str, code: int) -> Document:
+    return {"ok": 0.0, "errmsg": message, "code": code}
+
+
+async def _hello(_: InMemoryDatabase, __: Document) -> Document:
+    return {**HELLO, "localTime": datetime.now(timezone.utc), "connectionId": 1}
+
+
+async def _ok(_: InMemoryDatabase, __: Document) -> Document:
+    return {"ok": 1.0}
+
+
+async def _build_info(_: InMemoryDatabase, __: Document) -> Document:
+    return {"version": "7.0.0", "versionArray": [7, 0, 0, 0], "ok": 1.0}
+
+
+async def _find(database: InMemoryDatabase, command: Document) -> Document:
+    collection = database[command["find"]]
+    sort = next(iter(command.get("sort", {}).items()), None)
+    await asyncio.sleep(collection.latency)
+    documents = collection.scan(command.get("filter", {}), sort, abs(command.get("limit", 0)) or None)
+    batch = [project(document, command.get("projection")) for document in documents]
+    namespace = f"{command['$db']}.{command['find']}"
+    return {"cursor": {"firstBatch": batch, "id": 0, "ns": namespace}, "ok": 1.0}
+
+
+async def _insert(database: InMemoryDatabase, command: Document) -> Document:
+    collection, errors = database[command["insert"]], []
+    for index, document in enumerate(command["documents"]):
+        try:
+            await collection.insert_one(document)
+        except DuplicateKeyError as error:
+            errors.append({"index": index, "code": error.code, "errmsg": str(error)})
+    return {"n": len(command["documents"]) - len(errors), "ok": 1.0, **({"writeErrors": errors} if errors else {})}
+
+
+async def _update(database: InMemoryDatabase, command: Document) -> Document:
+    collection, matched, upserted, errors = database[command["update"]], 0, [], []
+    for index, statement in enumerate(command["updates"]):
+        try:
+            replacement = not any(field.startswith("$") for field in statement["u"])
+            write = collection.replace_one if replacement else collection.update_one
+            result = await write(statement["q"], statement["u"], upsert=statement.get("upsert", False))
+        except DuplicateKeyError as error:
+            errors.append({"index": index, "code": error.code, "errmsg": str(error)})
+            continue
+        matched += result.matched_count
+        if result.upserted_id is not None:
+            upserted.append({"index": index, "_id": result.upserted_id})
+    reply = {"n": matched + len(upserted), "nModified": matched, "ok": 1.0}
+    return {**reply, **({"upserted": upserted} if upserted else {}), **({"writeErrors": errors} if errors else {})}
+
+
+async def _delete(database: InMemoryDatabase, command: Document) -> Document:
+    collection, deleted = database[command["delete"]], 0
+    for statement in command["deletes"]:
+        delete = collection.delete_one if statement.get("limit") == 1 else collection.delete_many
+        deleted += (await delete(statement["q"])).deleted_count
+    return {"n": deleted, "ok": 1.0}
+
+
+async def _find_and_modify(database: InMemoryDatabase, command: Document) -> Document:
+    try:
+        value = await database[command["findAndModify"]].find_one_and_update(
+            command["query"],
+            command["update"],
+            command.get("fields"),
+            upsert=command.get("upsert", False),
+            return_document=ReturnDocument.AFTER if command.get("new") else ReturnDocument.BEFORE,
+        )
+    except DuplicateKeyError as error:
+        return _error(str(error), 11000)
+    return {"value": value, "ok": 1.0}
+
+
+async def _create_indexes(database: InMemoryDatabase, command: Document) -> Document:
+    collection = database[command["createIndexes"]]
+    for index in command["indexes"]:
+        await collection.create_index(list(index["key"].items()), unique=index.get("unique", False))
+    return {"numIndexesBefore": 1, "numIndexesAfter": 1 + len(command["indexes"]), "ok": 1.0}
+
+
+COMMANDS: dict[str, Command] = {
+    "hello": _hello,
+    "ismaster": _hello,
+    "ping": _ok,
+    "endsessions": _ok,
+    "killcursors": _ok,
+    "buildinfo": _build_info,
+    "find": _find,
+    "insert": _insert,
+    "update": _update,
+    "delete": _delete,
+    "findandmodify": _find_and_modify,
+    "createindexes": _create_indexes,
+}
+
+
+async def execute(database: InMemoryDatabase, command: Document) -> Document:
+    """Run a command, its name is the first field of the document, in any case."""
+    name = next(iter(command), "")
+    handler = COMMANDS.get(name.lower())
+    if handler is None:
+        return _error(f"no such command: '{name}'", 59)
+    return await handler(database, command)
+
+
+async def serve_connection(
+    database: InMemoryDatabase, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    """Answer the messages of a connection in order, until the client closes it."""
+    try:
+        while True:
+            length, request_id, _, opcode = HEADER.unpack(await reader.readexactly(HEADER.size))
+            body = await reader.readexactly(length - HEADER.size)
+            if opcode == OP_QUERY:
+                writer.write(reply_query(request_id, await execute(database, parse_query(body))))
+            elif opcode == OP_MSG:
+                flags, command = parse_msg(body)
+                reply = await execute(database, command)
+                if not flags & _MORE_TO_COME:
+                    writer.write(reply_msg(request_id, reply))
+            else:
+                break
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(port: int, users: int, latency: float) -> None:
+    service = InMemoryDatabaseService(latency)
+    service.database["users"].ensure_index("uid")
+    service.database["users"].seed(standin_document(index) for index in range(users))
+    server = await asyncio.start_server(
+        lambda reader, writer: serve_connection(service.database, reader, writer), "127.0.0.1", port
+    )
+    async with server:
+        await server.serve_forever()
+
+
+@contextmanager
+def wire_standin_server(users: int = 1000, latency_ms: float = 0.0) -> Iterator[str]:
+    """Start the wire protocol stand-in in a child process and yield its URI.
+
+    The server runs in its own process, so its work is not counted against the threads and the event loop of the
+    client measured.
+
+    """
+    port = free_port()
+    command = [sys.executable, "-m", "benchmarks.wire_standin", "--port", str(port), "--users", str(users)]
+    command += ["--latency-ms", str(latency_ms)]
+    env = {**os.environ, "PYTHONPATH": ROOT}
+    with subprocess.Popen(command, cwd=ROOT, env=env) as process:
+        try:
+            wait_for_port(port)
+            yield f"mongodb://127.0.0.1:{port}/?directConnection=true"
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=27017)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.port, args.users, args.latency_ms / 1000))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Latency of the account writes under the write durability policies, against a replica set stand-in.
+
+Usage:
+    python -m benchmarks.write_durability [--writes 200] [--latency-ms 0.5] [--replication-ms 2] [--journal-ms 5]
+
+The repositories write to the database stand-in, which answers each operation after `--latency-ms` and then
+acknowledges the writes as a replica set would for their write concern: `w:majority` after `--replication-ms`, the
+time for a majority of the members to apply and journal the write, `w:1` at once, or after `--journal-ms` with `j`.
+Measure the two delays of the real replica set (the replication lag of its nearest secondary and its journal commit
+time) and pass them, the stand-in only adds them up.
+
+Each policy registers `--writes` users and moves each of them to another city, which also updates the user counts.
+The report is printed as JSON: the median and 99th percentile latency of each write, in milliseconds.
+
+- `client_default`: no policy, every write waits for `w:majority`, the default of the client since MongoDB 5.0.
+- `all_journaled`: every write waits for `w:majority, j:true`.
+- `tiered`: the default policy, registrations journaled by a majority and address updates acknowledged by the
+  primary alone.
+
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any, Awaitable
+
+from benchmarks.standins import STANDIN_CONFIG, InMemoryDatabaseService, ReplicaSetLatency
+from domain_account.adapters.interfaces.write_durability_service import WRITE_OPERATIONS
+from domain_account.adapters.repositories import AccountRepository, UserStatsRepository
+from domain_account.business.ports import RegisterInputPort, UpdateAddressInputPort
+from domain_account.frameworks.anonymisation import CpfHasher
+from domain_account.frameworks.caching import NegativeCache
+from domain_account.frameworks.metrics import MetricsRegistry
+from domain_account.frameworks.mongodb import DEFAULT_WRITE_DURABILITY, WriteDurabilityPolicy
+from domain_account.models import Address
+from domain_account.types.cpf import complete_cpf
+
+POLICIES = {
+    "client_default": {},
+    "all_journaled": {operation: "majority_journaled" for operation in WRITE_OPERATIONS},
+    "tiered": DEFAULT_WRITE_DURABILITY,
+}
+
+ADDRESS = Address(city="Curitiba", cep="80010000", street_name="Rua XV", number="1", complement="")
+
+
+def repository(database: InMemoryDatabaseService, policy: WriteDurabilityPolicy) -> AccountRepository:
+    return AccountRepository(
+        database,  # type: ignore[arg-type]
+        CpfHasher(STANDIN_CONFIG["cpf_hash_key"]),
+        UserStatsRepository(database, policy),  # type: ignore[arg-type]
+        NegativeCache(MetricsRegistry(), "unknown_uids", max_size=0, ttl=0),
+        policy,
+    )
+
+
+async def timed(samples: list[float], write: Awaitable[Any]) -> None:
+    start = time.perf_counter()
+    await write
+    samples.append((time.perf_counter() - start) * 1000)
+
+
+def summary(samples: list[float]) -> dict[str, float]:
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "p99_ms": round(statistics.quantiles(samples, n=100)[98], 3),
+    }
+
+
+async def run(
+    policy: WriteDurabilityPolicy, writes: int, latency: float, replica_set: ReplicaSetLatency
+) -> dict[str, Any]:
+    accounts = repository(InMemoryDatabaseService(latency, replica_set), policy)
+    await accounts.create_indexes()
+    registrations: list[float] = []
+    updates: list[float] = []
+    for index in range(writes):
+        uid = f"durability-{index}"
+        port = RegisterInputPort(uid=uid, cpf=complete_cpf(f"1{index:08d}"), address=ADDRESS)
+        await timed(registrations, accounts.register(port))
+        update = UpdateAddressInputPort(uid=uid, city="Recife", cep="50010000")
+        await timed(updates, accounts.update_address(update))
+    return {"register": summary(registrations), "update_address": summary(updates)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writes", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=0.5)
+    parser.add_argument("--replication-ms", type=float, default=2.0)
+    parser.add_argument("--journal-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    replica_set = ReplicaSetLatency(replication=args.replication_ms / 1000, journal=args.journal_ms / 1000)
+    report = {
+        name: asyncio.run(run(WriteDurabilityPolicy(tiers), args.writes, args.latency_ms / 1000, replica_set))
+        for name, tiers in POLICIES.items()
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
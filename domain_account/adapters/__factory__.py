@@ -6,7 +6,29 @@ from fastapi import FastAPI
 from domain_account.adapters.controllers.__binding__ import Binding
 from domain_account.adapters.interfaces.authentication_service import AuthenticationService
 from domain_account.adapters.interfaces.document_database_service import DocumentDatabaseService
+from domain_account.adapters.interfaces.event_outbox_service import EventOutboxService
+from domain_account.adapters.interfaces.keyed_hash_service import KeyedHashService
+from domain_account.adapters.interfaces.metrics_service import MetricsService
+from domain_account.adapters.interfaces.negative_cache_service import NegativeCacheService
+from domain_account.adapters.interfaces.postal_code_index_service import PostalCodeIndexService
+from domain_account.adapters.interfaces.profiling_service import ProfilingService
+from domain_account.adapters.interfaces.rate_limit_service import RateLimitService
+from domain_account.adapters.interfaces.response_cache_service import ResponseCacheService
+from domain_account.adapters.interfaces.traffic_recording_service import TrafficRecordingService
+from domain_account.adapters.interfaces.write_durability_service import WriteDurabilityService
+from domain_account.adapters.middlewares import (
+    MetricsMiddleware,
+    ProfilingMiddleware,
+    RateLimitingMiddleware,
+    RequestLoggingMiddleware,
+    TrafficRecordingMiddleware,
+)
 from domain_account.adapters.repositories.account_repository import AccountRepository
+from domain_account.adapters.repositories.event_repository import EventRepository
+from domain_account.adapters.repositories.idempotency_repository import IdempotencyRepository
+from domain_account.adapters.repositories.postal_code_repository import PostalCodeRepository
+from domain_account.adapters.repositories.user_cache_repository import UserCacheRepository
+from domain_account.adapters.repositories.user_stats_repository import UserStatsRepository
 from domain_account.business.__factory__ import AdaptersFactoryInterface
 
 T_provider_co = TypeVar("T_provider_co", bound=DocumentDatabaseService, covariant=True)
@@ -28,6 +50,46 @@ class FrameworksFactoryInterface(Generic[T_provider_co], metaclass=ABCMeta):
     def authentication_framework(self) -> AuthenticationService:
         """Abstract method to retrieve the authentication framework instance."""
 
+    @abstractmethod
+    def metrics_framework(self) -> MetricsService:
+        """Abstract method to retrieve the metrics framework instance."""
+
+    @abstractmethod
+    def profiling_framework(self) -> ProfilingService:
+        """Abstract method to retrieve the profiling framework instance."""
+
+    @abstractmethod
+    def cpf_hash_framework(self) -> KeyedHashService:
+        """Abstract method to retrieve the keyed hash framework instance hashing the stored CPFs."""
+
+    @abstractmethod
+    def traffic_recording_framework(self) -> TrafficRecordingService:
+        """Abstract method to retrieve the traffic recording framework instance."""
+
+    @abstractmethod
+    def postal_code_framework(self) -> PostalCodeIndexService | None:
+        """Abstract method to retrieve the postal code index instance, None when no index is configured."""
+
+    @abstractmethod
+    def unknown_uid_cache_framework(self) -> NegativeCacheService:
+        """Abstract method to retrieve the negative cache instance of the UIDs not registered."""
+
+    @abstractmethod
+    def user_response_cache_framework(self) -> ResponseCacheService:
+        """Abstract method to retrieve the cache instance of the responses read about the users."""
+
+    @abstractmethod
+    def rate_limit_framework(self) -> RateLimitService:
+        """Abstract method to retrieve the rate limiter instance of the clients and routes."""
+
+    @abstractmethod
+    def write_durability_framework(self) -> WriteDurabilityService:
+        """Abstract method to retrieve the durability policy instance of the database writes."""
+
+    @abstractmethod
+    def event_outbox_framework(self) -> EventOutboxService | None:
+        """Abstract method to retrieve the outbox instance of the events, None when the events are not published."""
+
 
 class AdaptersFactory(AdaptersFactoryInterface[AccountRepository]):
     """Responsible for instantiating the Adapters classes with their linked dependencies.
@@ -58,7 +120,69 @@ class AdaptersFactory(AdaptersFactoryInterface[AccountRepository]):
             AccountRepository: An instance of AccountRepository with the configured database framework.
 
         """
-        return AccountRepository(self.__factory.database_framework())
+        return AccountRepository(
+            self.__factory.database_framework(),
+            self.__factory.cpf_hash_framework(),
+            self.user_stats_service(),
+            self.__factory.unknown_uid_cache_framework(),
+            self.__factory.write_durability_framework(),
+        )
+
+    def postal_code_service(self) -> PostalCodeRepository | None:
+        """Instantiate and return a PostalCodeRepository with the configured postal code index.
+
+        Returns:
+            PostalCodeRepository | None: An instance of PostalCodeRepository with the configured postal code index,
+                None when no index is configured.
+
+        """
+        index = self.__factory.postal_code_framework()
+        return PostalCodeRepository(index) if index is not None else None
+
+    def user_stats_service(self) -> UserStatsRepository:
+        """Instantiate and return a UserStatsRepository with the configured database framework.
+
+        Returns:
+            UserStatsRepository: An instance of UserStatsRepository with the configured database framework.
+
+        """
+        return UserStatsRepository(self.__factory.database_framework(), self.__factory.write_durability_framework())
+
+    def user_cache_service(self) -> UserCacheRepository:
+        """Instantiate and return a UserCacheRepository with the configured response cache.
+
+        Returns:
+            UserCacheRepository: An instance of UserCacheRepository with the configured response cache.
+
+        """
+        return UserCacheRepository(self.__factory.user_response_cache_framework())
+
+    def event_service(self) -> EventRepository | None:
+        """Instantiate and return an EventRepository with the configured event outbox.
+
+        Returns:
+            EventRepository | None: An instance of EventRepository with the configured event outbox, None when the
+                events are not published.
+
+        """
+        outbox = self.__factory.event_outbox_framework()
+        return EventRepository(outbox) if outbox is not None else None
+
+    def idempotency_service(self) -> IdempotencyRepository:
+        """Instantiate and return an IdempotencyRepository with the configured database framework.
+
+        The requests waiting for one another are tracked by the instance, a single one is shared by the controllers.
+
+        Returns:
+            IdempotencyRepository: An instance of IdempotencyRepository with the configured database framework.
+
+        """
+        return IdempotencyRepository(self.__factory.database_framework())
+
+    async def create_indexes(self) -> None:
+        """Create the database indexes the repositories rely on, nothing is done for the ones existing already."""
+        await self.account_service().create_indexes()
+        await self.idempotency_service().create_indexes()
 
     def register_routes(self, app: FastAPI) -> None:
         """Register routes for all controllers in the application.
@@ -70,3 +194,29 @@ class AdaptersFactory(AdaptersFactoryInterface[AccountRepository]):
 
         """
         Binding().register_all(app)
+
+    def register_exception_handlers(self, app: FastAPI) -> None:
+        """Register the handlers answering the business and repository errors with their status.
+
+        Args:
+            app (FastAPI): The FastAPI instance to which the handlers will be registered.
+
+        """
+        Binding().register_exception_handlers(app)
+
+    def register_middlewares(self, app: FastAPI) -> None:
+        """Register the ASGI middlewares wrapping every route of the application.
+
+        Args:
+            app (FastAPI): The FastAPI instance to which middlewares will be added.
+
+        """
+        limiter = self.__factory.rate_limit_framework()
+        if limiter.enabled:
+            app.add_middleware(RateLimitingMiddleware, limiter=limiter, metrics=self.__factory.metrics_framework())
+        recording = self.__factory.traffic_recording_framework()
+        if recording.enabled:
+            app.add_middleware(TrafficRecordingMiddleware, recording=recording)
+        app.add_middleware(RequestLoggingMiddleware)
+        app.add_middleware(ProfilingMiddleware, profiling=self.__factory.profiling_framework())
+        app.add_middleware(MetricsMiddleware, metrics=self.__factory.metrics_framework())
@@ -1,6 +1,12 @@
 from fastapi.applications import FastAPI
 
 from .account_controller import account_controller
+from .batch_controller import batch_controller
+from .exception_handlers import register_exception_handlers
+from .lookup_controller import lookup_controller
+from .metrics_controller import metrics_controller
+from .profiling_controller import profiling_controller
+from .stats_controller import stats_controller
 
 
 class Binding:
@@ -8,3 +14,11 @@ class Binding:
 
     def register_all(self, app: FastAPI) -> None:
         app.include_router(account_controller)
+        app.include_router(batch_controller)
+        app.include_router(lookup_controller)
+        app.include_router(metrics_controller)
+        app.include_router(profiling_controller)
+        app.include_router(stats_controller)
+
+    def register_exception_handlers(self, app: FastAPI) -> None:
+        register_exception_handlers(app)
@@ -5,29 +5,55 @@ from fastapi import Depends, status
 from fastapi.exceptions import HTTPException
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from domain_account.adapters.instrumentation import Stage, identify, stage
 from domain_account.adapters.interfaces.authentication_service import AuthenticationService, BearerToken
+from domain_account.adapters.interfaces.idempotency_service import IdempotencyService
+from domain_account.adapters.interfaces.metrics_service import MetricsService
+from domain_account.adapters.interfaces.profiling_service import ProfilingService
+from domain_account.adapters.interfaces.response_cache_service import ResponseCacheService
 from domain_account.business.__factory__ import BusinessFactory
 from domain_account.business.use_case import (
+    BatchUseCase,
+    FindUsersByCpfUseCase,
+    ListUsersUseCase,
     RegisterUseCase,
     RetrieveUserUseCase,
+    UpdateAccountUseCase,
     UpdateAddressUseCase,
     UpdateCpfUseCase,
+    UserStatsUseCase,
 )
 
 
 def bind_controller_dependencies(
-    business_factory: BusinessFactory, authentication_service: AuthenticationService
+    business_factory: BusinessFactory,
+    authentication_service: AuthenticationService,
+    metrics_service: MetricsService,
+    profiling_service: ProfilingService,
+    user_response_cache: ResponseCacheService,
+    idempotency_service: IdempotencyService,
 ) -> None:
-    """Bind controller dependencies to the provided business factory and authentication service.
+    """Bind controller dependencies to the provided business factory, services and user response cache.
 
-    This function binds the provided business factory and authentication service to the controller dependencies.
+    This function binds the provided business factory and services to the controller dependencies.
 
     Args:
         business_factory (BusinessFactory): An instance of the BusinessFactory class providing business use cases.
         authentication_service (AuthenticationService): An instance of the AuthenticationService class for authentication.
+        metrics_service (MetricsService): An instance of the MetricsService class exposing the service metrics.
+        profiling_service (ProfilingService): An instance of the ProfilingService class profiling the worker.
+        user_response_cache (ResponseCacheService): The cache of the encoded responses read about the users.
+        idempotency_service (IdempotencyService): The idempotency keys of the requests and their responses.
 
     """  # noqa: E501
-    _ControllerDependencyManager(business_factory, authentication_service)
+    _ControllerDependencyManager(
+        business_factory,
+        authentication_service,
+        metrics_service,
+        profiling_service,
+        user_response_cache,
+        idempotency_service,
+    )
 
 
 class ControllerDependencyManagerIsNotInitializedException(RuntimeError):
@@ -63,6 +89,10 @@ class _ControllerDependencyManager(metaclass=_Singleton):
     Args:
         business_factory (BusinessFactory | None): An instance of the BusinessFactory class providing business use cases.
         authentication_service (AuthenticationService | None): An instance of the AuthenticationService class for authentication.
+        metrics_service (MetricsService | None): An instance of the MetricsService class exposing the service metrics.
+        profiling_service (ProfilingService | None): An instance of the ProfilingService class profiling the worker.
+        user_response_cache (ResponseCacheService | None): The cache of the encoded responses read about the users.
+        idempotency_service (IdempotencyService | None): The idempotency keys of the requests and their responses.
 
     """  # noqa: E501
 
@@ -70,12 +100,24 @@ class _ControllerDependencyManager(metaclass=_Singleton):
         self,
         business_factory: BusinessFactory | None = None,
         authentication_service: AuthenticationService | None = None,
+        metrics_service: MetricsService | None = None,
+        profiling_service: ProfilingService | None = None,
+        user_response_cache: ResponseCacheService | None = None,
+        idempotency_service: IdempotencyService | None = None,
     ) -> None:
-        """Initialize the ControllerDependencyManager with the provided factory and service."""
+        """Initialize the ControllerDependencyManager with the provided factory and services."""
         if business_factory:
             self.__factory = business_factory
         if authentication_service:
             self.__auth = authentication_service
+        if metrics_service:
+            self.__metrics = metrics_service
+        if profiling_service:
+            self.__profiling = profiling_service
+        if user_response_cache is not None:
+            self.__user_responses = user_response_cache
+        if idempotency_service:
+            self.__idempotency = idempotency_service
 
     def auth_service(self) -> AuthenticationService:
         """Retrieve the authentication service.
@@ -92,6 +134,62 @@ class _ControllerDependencyManager(metaclass=_Singleton):
             return self.__auth
         raise ControllerDependencyManagerIsNotInitializedException()
 
+    def metrics_service(self) -> MetricsService:
+        """Retrieve the metrics service.
+
+        Returns:
+            MetricsService: An instance of the MetricsService.
+
+        Raises:
+            ControllerDependencyManagerIsNotInitializedException: If the metrics service is not initialized.
+
+        """
+        if self.__metrics:
+            return self.__metrics
+        raise ControllerDependencyManagerIsNotInitializedException()
+
+    def profiling_service(self) -> ProfilingService:
+        """Retrieve the profiling service.
+
+        Returns:
+            ProfilingService: An instance of the ProfilingService.
+
+        Raises:
+            ControllerDependencyManagerIsNotInitializedException: If the profiling service is not initialized.
+
+        """
+        if self.__profiling:
+            return self.__profiling
+        raise ControllerDependencyManagerIsNotInitializedException()
+
+    def user_response_cache(self) -> ResponseCacheService:
+        """Retrieve the cache of the encoded responses read about the users.
+
+        Returns:
+            ResponseCacheService: An instance of the ResponseCacheService.
+
+        Raises:
+            ControllerDependencyManagerIsNotInitializedException: If the response cache is not initialized.
+
+        """
+        if self.__user_responses is not None:
+            return self.__user_responses
+        raise ControllerDependencyManagerIsNotInitializedException()
+
+    def idempotency_service(self) -> IdempotencyService:
+        """Retrieve the idempotency keys of the requests and their responses.
+
+        Returns:
+            IdempotencyService: An instance of the IdempotencyService.
+
+        Raises:
+            ControllerDependencyManagerIsNotInitializedException: If the idempotency service is not initialized.
+
+        """
+        if self.__idempotency:
+            return self.__idempotency
+        raise ControllerDependencyManagerIsNotInitializedException()
+
     def register_use_case(self) -> RegisterUseCase:
         """Instantiate and return a RegisterUseCase with the configured account service.
 
@@ -134,6 +232,76 @@ class _ControllerDependencyManager(metaclass=_Singleton):
             return self.__factory.update_address_use_case()
         raise ControllerDependencyManagerIsNotInitializedException()
 
+    def batch_use_case(self) -> BatchUseCase:
+        """Instantiate and return a BatchUseCase with the configured account service.
+
+        Returns:
+            BatchUseCase: An instance of BatchUseCase with the configured account service.
+
+        Raises:
+            ControllerDependencyManagerIsNotInitializedException: If the factory is not initialized.
+
+        """
+        if self.__factory:
+            return self.__factory.batch_use_case()
+        raise ControllerDependencyManagerIsNotInitializedException()
+
+    def update_account_use_case(self) -> UpdateAccountUseCase:
+        """Instantiate and return an UpdateAccountUseCase with the configured account service.
+
+        Returns:
+            UpdateAccountUseCase: An instance of UpdateAccountUseCase with the configured account service.
+
+        Raises:
+            ControllerDependencyManagerIsNotInitializedException: If the factory is not initialized.
+
+        """
+        if self.__factory:
+            return self.__factory.update_account_use_case()
+        raise ControllerDependencyManagerIsNotInitializedException()
+
+    def find_users_by_cpf_use_case(self) -> FindUsersByCpfUseCase:
+        """Instantiate and return a FindUsersByCpfUseCase with the configured account service.
+
+        Returns:
+            FindUsersByCpfUseCase: An instance of FindUsersByCpfUseCase with the configured account service.
+
+        Raises:
+            ControllerDependencyManagerIsNotInitializedException: If the factory is not initialized.
+
+        """
+        if self.__factory:
+            return self.__factory.find_users_by_cpf_use_case()
+        raise ControllerDependencyManagerIsNotInitializedException()
+
+    def list_users_use_case(self) -> ListUsersUseCase:
+        """Instantiate and return a ListUsersUseCase with the configured account service.
+
+        Returns:
+            ListUsersUseCase: An instance of ListUsersUseCase with the configured account service.
+
+        Raises:
+            ControllerDependencyManagerIsNotInitializedException: If the factory is not initialized.
+
+        """
+        if self.__factory:
+            return self.__factory.list_users_use_case()
+        raise ControllerDependencyManagerIsNotInitializedException()
+
+    def user_stats_use_case(self) -> UserStatsUseCase:
+        """Instantiate and return a UserStatsUseCase with the configured user stats service.
+
+        Returns:
+            UserStatsUseCase: An instance of UserStatsUseCase with the configured user stats service.
+
+        Raises:
+            ControllerDependencyManagerIsNotInitializedException: If the factory is not initialized.
+
+        """
+        if self.__factory:
+            return self.__factory.user_stats_use_case()
+        raise ControllerDependencyManagerIsNotInitializedException()
+
     def update_cpf_use_case(self) -> UpdateCpfUseCase:
         """Instantiate and return an UpdateCpfUseCase with the configured account service.
 
@@ -155,8 +323,13 @@ class _ControllerDependency(metaclass=ABCMeta):
     Args:
         credential (HTTPAuthorizationCredentials): An instance of HTTPAuthorizationCredentials.
 
+    Attributes:
+        admin_only (bool): Whether the bearer must belong to an administrator.
+
     """
 
+    admin_only = False
+
     def __init__(self, credential: HTTPAuthorizationCredentials = Depends(HTTPBearer(auto_error=False))) -> None:
         """Initialize the ControllerDependency with the provided credential.
 
@@ -176,7 +349,12 @@ class _ControllerDependency(metaclass=ABCMeta):
                 headers={"WWW-Authenticate": 'Bearer realm="auth_required"'},
             )
         bearer_token = BearerToken(credential.credentials)
-        self.uid = auth.authenticate_by_token(bearer_token)
+        with stage(Stage.AUTHENTICATION):
+            if self.admin_only:
+                self.uid = auth.authenticate_admin_by_token(bearer_token)
+            else:
+                self.uid = auth.authenticate_by_token(bearer_token)
+        identify(self.uid)
 
 
 class RegisterControllerDependencies(_ControllerDependency):
@@ -190,10 +368,12 @@ class RegisterControllerDependencies(_ControllerDependency):
 
         Attributes:
             register_use_case (RegisterUseCase): An instance of RegisterUseCase configured with the provided dependencies.
+            idempotency (IdempotencyService): The idempotency keys of the requests and their responses.
 
         """  # noqa: E501
         super().__init__(credential)
         self.register_use_case: RegisterUseCase = self._dependency_manager.register_use_case()
+        self.idempotency: IdempotencyService = self._dependency_manager.idempotency_service()
 
 
 class RetrieveUserControllerDependencies(_ControllerDependency):
@@ -207,10 +387,12 @@ class RetrieveUserControllerDependencies(_ControllerDependency):
 
         Attributes:
             retrieve_user_use_case (RetrieveUserUseCase): An instance of RetrieveUserUseCase configured with the provided dependencies.
+            user_responses (ResponseCacheService): The cache of the encoded responses read about the users.
 
         """  # noqa: E501
         super().__init__(credential)
         self.retrieve_user_use_case: RetrieveUserUseCase = self._dependency_manager.retrieve_user_use_case()
+        self.user_responses: ResponseCacheService = self._dependency_manager.user_response_cache()
 
 
 class UpdateAddressControllerDependencies(_ControllerDependency):
@@ -245,3 +427,132 @@ class UpdateCpfControllerDependencies(_ControllerDependency):
         """  # noqa: E501
         super().__init__(credential)
         self.update_cpf_use_case: UpdateCpfUseCase = self._dependency_manager.update_cpf_use_case()
+
+
+class UpdateProfileControllerDependencies(_ControllerDependency):
+    """Brings the Update Account Use Case to the Update Profile Controller through the Fast API 'Depends'"""
+
+    def __init__(self, credential: HTTPAuthorizationCredentials = Depends(HTTPBearer(auto_error=False))) -> None:
+        """Initialize the UpdateProfileControllerDependencies with the provided credential.
+
+        Args:
+            credential (HTTPAuthorizationCredentials, optional): An instance of HTTPAuthorizationCredentials. Defaults to Depends(HTTPBearer(auto_error=False)).
+
+        Attributes:
+            update_account_use_case (UpdateAccountUseCase): An instance of UpdateAccountUseCase configured with the provided dependencies.
+
+        """  # noqa: E501
+        super().__init__(credential)
+        self.update_account_use_case: UpdateAccountUseCase = self._dependency_manager.update_account_use_case()
+
+
+class BatchControllerDependencies(_ControllerDependency):
+    """Brings the Batch Use Case to the Batch Controller through the Fast API 'Depends'"""
+
+    def __init__(self, credential: HTTPAuthorizationCredentials = Depends(HTTPBearer(auto_error=False))) -> None:
+        """Initialize the BatchControllerDependencies with the provided credential.
+
+        Args:
+            credential (HTTPAuthorizationCredentials, optional): An instance of HTTPAuthorizationCredentials. Defaults to Depends(HTTPBearer(auto_error=False)).
+
+        Attributes:
+            batch_use_case (BatchUseCase): An instance of BatchUseCase configured with the provided dependencies.
+
+        """  # noqa: E501
+        super().__init__(credential)
+        self.batch_use_case: BatchUseCase = self._dependency_manager.batch_use_case()
+
+
+class FindUsersByCpfControllerDependencies(_ControllerDependency):
+    """Brings the Find Users By CPF Use Case to the Lookup Controller through the Fast API 'Depends', for admins only"""
+
+    admin_only = True
+
+    def __init__(self, credential: HTTPAuthorizationCredentials = Depends(HTTPBearer(auto_error=False))) -> None:
+        """Initialize the FindUsersByCpfControllerDependencies with the provided credential.
+
+        Args:
+            credential (HTTPAuthorizationCredentials, optional): An instance of HTTPAuthorizationCredentials. Defaults to Depends(HTTPBearer(auto_error=False)).
+
+        Attributes:
+            find_users_by_cpf_use_case (FindUsersByCpfUseCase): An instance of FindUsersByCpfUseCase configured with the provided dependencies.
+
+        """  # noqa: E501
+        super().__init__(credential)
+        self.find_users_by_cpf_use_case: FindUsersByCpfUseCase = self._dependency_manager.find_users_by_cpf_use_case()
+
+
+class MetricsControllerDependencies(_ControllerDependency):
+    """Brings the Metrics service to the Metrics Controller through the Fast API 'Depends', for admins only"""
+
+    admin_only = True
+
+    def __init__(self, credential: HTTPAuthorizationCredentials = Depends(HTTPBearer(auto_error=False))) -> None:
+        """Initialize the MetricsControllerDependencies with the provided credential.
+
+        Args:
+            credential (HTTPAuthorizationCredentials, optional): An instance of HTTPAuthorizationCredentials. Defaults to Depends(HTTPBearer(auto_error=False)).
+
+        Attributes:
+            metrics_service (MetricsService): The metrics service of the current worker.
+
+        """  # noqa: E501
+        super().__init__(credential)
+        self.metrics_service: MetricsService = self._dependency_manager.metrics_service()
+
+
+class ProfilingControllerDependencies(_ControllerDependency):
+    """Brings the Profiling service to the Profiling Controller through the Fast API 'Depends', for admins only"""
+
+    admin_only = True
+
+    def __init__(self, credential: HTTPAuthorizationCredentials = Depends(HTTPBearer(auto_error=False))) -> None:
+        """Initialize the ProfilingControllerDependencies with the provided credential.
+
+        Args:
+            credential (HTTPAuthorizationCredentials, optional): An instance of HTTPAuthorizationCredentials. Defaults to Depends(HTTPBearer(auto_error=False)).
+
+        Attributes:
+            profiling_service (ProfilingService): The profiling service of the current worker.
+
+        """  # noqa: E501
+        super().__init__(credential)
+        self.profiling_service: ProfilingService = self._dependency_manager.profiling_service()
+
+
+class ListUsersControllerDependencies(_ControllerDependency):
+    """Brings the List Users Use Case to the Lookup Controller through the Fast API 'Depends', for admins only"""
+
+    admin_only = True
+
+    def __init__(self, credential: HTTPAuthorizationCredentials = Depends(HTTPBearer(auto_error=False))) -> None:
+        """Initialize the ListUsersControllerDependencies with the provided credential.
+
+        Args:
+            credential (HTTPAuthorizationCredentials, optional): An instance of HTTPAuthorizationCredentials. Defaults to Depends(HTTPBearer(auto_error=False)).
+
+        Attributes:
+            list_users_use_case (ListUsersUseCase): An instance of ListUsersUseCase configured with the provided dependencies.
+
+        """  # noqa: E501
+        super().__init__(credential)
+        self.list_users_use_case: ListUsersUseCase = self._dependency_manager.list_users_use_case()
+
+
+class UserStatsControllerDependencies(_ControllerDependency):
+    """Brings the User Stats Use Case to the Stats Controller through the Fast API 'Depends', for admins only"""
+
+    admin_only = True
+
+    def __init__(self, credential: HTTPAuthorizationCredentials = Depends(HTTPBearer(auto_error=False))) -> None:
+        """Initialize the UserStatsControllerDependencies with the provided credential.
+
+        Args:
+            credential (HTTPAuthorizationCredentials, optional): An instance of HTTPAuthorizationCredentials. Defaults to Depends(HTTPBearer(auto_error=False)).
+
+        Attributes:
+            user_stats_use_case (UserStatsUseCase): An instance of UserStatsUseCase configured with the provided dependencies.
+
+        """  # noqa: E501
+        super().__init__(credential)
+        self.user_stats_use_case: UserStatsUseCase = self._dependency_manager.user_stats_use_case()
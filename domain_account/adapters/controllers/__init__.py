@@ -1,3 +1,15 @@
 from .account_controller import account_controller
+from .batch_controller import batch_controller
+from .lookup_controller import lookup_controller
+from .metrics_controller import metrics_controller
+from .profiling_controller import profiling_controller
+from .stats_controller import stats_controller
 
-__all__ = ["account_controller"]
+__all__ = [
+    "account_controller",
+    "batch_controller",
+    "lookup_controller",
+    "metrics_controller",
+    "profiling_controller",
+    "stats_controller",
+]
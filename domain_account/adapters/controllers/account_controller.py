@@ -1,8 +1,8 @@
 import logging
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Header, Query, status
+from fastapi.responses import JSONResponse, Response
 from pydantic_core import ValidationError
 
 from domain_account.adapters.controllers.__dependencies__ import (
@@ -10,10 +10,13 @@ from domain_account.adapters.controllers.__dependencies__ import (
     RetrieveUserControllerDependencies,
     UpdateAddressControllerDependencies,
     UpdateCpfControllerDependencies,
+    UpdateProfileControllerDependencies,
 )
+from domain_account.adapters.instrumentation import Stage, stage
 from domain_account.business.ports import (
     RegisterInputPort,
     RetrieveUserInputPort,
+    UpdateAccountInputPort,
     UpdateAddressInputPort,
     UpdateCpfInputPort,
 )
@@ -26,67 +29,127 @@ from .dtos import (
     UpdateAddressOutputDTO,
     UpdateCpfInputDTO,
     UpdateCpfOutputDTO,
+    UpdateProfileInputDTO,
+    UpdateProfileOutputDTO,
 )
+from .idempotency import fingerprint, idempotent
 
 account_controller = APIRouter()
 
+_logger = logging.getLogger("AccountController")
+
 
 @account_controller.post(
     "/register-account",
     response_model=RegisterAccountOutputDTO,
     status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_409_CONFLICT: {"description": "A request with the same `Idempotency-Key` is still in progress."},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"description": "The `Idempotency-Key` was used for another request."},
+    },
 )
 async def register_account(
     dto: RegisterAccountInputDTO,
     dependencies: Annotated[RegisterControllerDependencies, Depends()],
-) -> JSONResponse | RegisterAccountOutputDTO:
+    idempotency_key: Annotated[
+        str | None,
+        Header(max_length=255, description="A key unique to the request, so its retries do not register it again."),
+    ] = None,
+) -> Response:
     """Register a new account.
 
+    A request sent with an `Idempotency-Key` is run once: its retries with the same key are answered with its
+    response, flagged by the `Idempotent-Replayed` header, and a retry sent while the request is still running waits
+    for its response.
+
     Args:
         dto (RegisterAccountInputDTO): The input DTO containing account information.
         dependencies (RegisterControllerDependencies): Dependencies for registering the account.
+        idempotency_key (str | None): The key of the request, chosen by the client and sent again with its retries.
 
     Returns:
-        JSONResponse | RegisterAccountOutputDTO: Response containing account registration details.
+        Response: Response containing account registration details.
     """
     try:
-        input_port = RegisterInputPort(**dto.model_dump(), uid=dependencies.uid)
-        output_port = await dependencies.register_use_case(input_port)
-        return RegisterAccountOutputDTO(msg=output_port.msg)
+        with stage(Stage.VALIDATION):
+            input_port = RegisterInputPort(**dto.model_dump(), uid=dependencies.uid)
+        if idempotency_key is None:
+            return await _register(dependencies, input_port)
+        return await idempotent(
+            dependencies.idempotency,
+            "/register-account",
+            f"register-account:{dependencies.uid}:{idempotency_key}",
+            fingerprint(dto),
+            lambda: _register(dependencies, input_port),
+        )
     except ValidationError as errors:
         output_errors = {}
         for error in errors.errors():
             output_errors[error["type"]] = error["msg"]
-            logging.info(f"Warning [Register Account] | {error['type']} - {error['msg']}")
+            _logger.info("Warning [Register Account] | %s - %s", error["type"], error["msg"])
         content = {"msg": "error", "errors": output_errors}
         return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=content)
 
 
+async def _register(dependencies: RegisterControllerDependencies, input_port: RegisterInputPort) -> JSONResponse:
+    with stage(Stage.USE_CASE):
+        output_port = await dependencies.register_use_case(input_port)
+    with stage(Stage.SERIALIZATION):
+        output_dto = RegisterAccountOutputDTO(msg=output_port.msg)
+        return JSONResponse(status_code=status.HTTP_201_CREATED, content=output_dto.model_dump())
+
+
 @account_controller.get(
     "/retrieve-user",
     response_model=RetrieveUserOutputDTO,
+    response_model_exclude_unset=True,
     status_code=status.HTTP_200_OK,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "The user did not change since its `ETag`."}},
 )
 async def retrieve_user(
     dependencies: Annotated[RetrieveUserControllerDependencies, Depends()],
-) -> JSONResponse | RetrieveUserOutputDTO:
+    fields: Annotated[
+        str | None,
+        Query(description="Comma separated fields to return, such as `cpf,address.cep`. Every field by default."),
+    ] = None,
+    if_none_match: Annotated[str | None, Header(description="The `ETag` of the user the client holds.")] = None,
+) -> Response:
     """Retrieve user registration information.
 
+    The encoded body is cached per user and selection of fields when the user response cache is enabled, a cached
+    user is answered without reading or serializing it again. The `ETag` of the body lets clients revalidate the
+    user they hold, answered 304 when it did not change.
+
     Args:
         dependencies (RetrieveUserControllerDependencies): Dependencies for retrieving user information.
+        fields (str | None): Comma separated fields to return, the other ones are neither loaded nor returned.
+        if_none_match (str | None): The entity tag of the user the client holds.
 
     Returns:
-        JSONResponse | RetrieveUserOutputDTO: Response containing user registration details.
+        Response: Response containing user registration details, or no body when the client holds them already.
     """
     try:
-        input_port = RetrieveUserInputPort(uid=dependencies.uid)
-        output_port = await dependencies.retrieve_user_use_case(input_port)
-        return RetrieveUserOutputDTO(**output_port.model_dump())
+        with stage(Stage.VALIDATION):
+            selected = [field.strip() for field in fields.split(",")] if fields is not None else None
+            input_port = RetrieveUserInputPort(uid=dependencies.uid, fields=selected)
+        variant = ",".join(input_port.fields) if input_port.fields is not None else ""
+        cached = dependencies.user_responses.get(input_port.uid, variant)
+        if cached is None:
+            epoch = dependencies.user_responses.epoch()
+            with stage(Stage.USE_CASE):
+                output_port = await dependencies.retrieve_user_use_case(input_port)
+            with stage(Stage.SERIALIZATION):
+                output_dto = RetrieveUserOutputDTO(**output_port.model_dump(exclude_unset=True))
+                body = output_dto.model_dump_json(exclude_unset=True).encode()
+                cached = dependencies.user_responses.put(input_port.uid, variant, body, epoch)
+        if if_none_match == cached.etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": cached.etag})
+        return Response(cached.body, media_type="application/json", headers={"ETag": cached.etag})
     except ValidationError as errors:
         output_errors = {}
         for error in errors.errors():
             output_errors[error["type"]] = error["msg"]
-            logging.info(f"Warning [Retrieve User] | {error['type']} - {error['msg']}")
+            _logger.info("Warning [Retrieve User] | %s - %s", error["type"], error["msg"])
         content = {"msg": "error", "errors": output_errors}
         return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=content)
 
@@ -110,14 +173,17 @@ async def update_address(
         JSONResponse | UpdateAddressOutputDTO: Response containing a message of the request result details.
     """
     try:
-        input_port = UpdateAddressInputPort(**dto.model_dump(), uid=dependencies.uid)
-        output_port = await dependencies.update_address_use_case(input_port)
-        return UpdateAddressOutputDTO(**output_port.model_dump())
+        with stage(Stage.VALIDATION):
+            input_port = UpdateAddressInputPort(**dto.model_dump(), uid=dependencies.uid)
+        with stage(Stage.USE_CASE):
+            output_port = await dependencies.update_address_use_case(input_port)
+        with stage(Stage.SERIALIZATION):
+            return UpdateAddressOutputDTO(**output_port.model_dump())
     except ValidationError as errors:
         output_errors = {}
         for error in errors.errors():
             output_errors[error["type"]] = error["msg"]
-            logging.info(f"Warning [Update Address] | {error['type']} - {error['msg']}")
+            _logger.info("Warning [Update Address] | %s - %s", error["type"], error["msg"])
         content = {"msg": "error", "errors": output_errors}
         return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=content)
 
@@ -141,13 +207,50 @@ async def update_cpf(
         JSONResponse | UpdateCpfOutputDTO: Response containing a message of the request result details.
     """
     try:
-        input_port = UpdateCpfInputPort(**dto.model_dump(), uid=dependencies.uid)
-        output_port = await dependencies.update_cpf_use_case(input_port)
-        return UpdateCpfOutputDTO(**output_port.model_dump())
+        with stage(Stage.VALIDATION):
+            input_port = UpdateCpfInputPort(**dto.model_dump(), uid=dependencies.uid)
+        with stage(Stage.USE_CASE):
+            output_port = await dependencies.update_cpf_use_case(input_port)
+        with stage(Stage.SERIALIZATION):
+            return UpdateCpfOutputDTO(**output_port.model_dump())
+    except ValidationError as errors:
+        output_errors = {}
+        for error in errors.errors():
+            output_errors[error["type"]] = error["msg"]
+            _logger.info("Warning [Update CPF] | %s - %s", error["type"], error["msg"])
+        content = {"msg": "error", "errors": output_errors}
+        return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=content)
+
+
+@account_controller.patch(
+    "/update-profile",
+    response_model=UpdateProfileOutputDTO,
+    status_code=status.HTTP_200_OK,
+)
+async def update_profile(
+    dto: UpdateProfileInputDTO,
+    dependencies: Annotated[UpdateProfileControllerDependencies, Depends()],
+) -> JSONResponse | UpdateProfileOutputDTO:
+    """Update user CPF and address in a single write, only the provided fields change.
+
+    Args:
+        dto (UpdateProfileInputDTO): The input DTO containing the updated CPF and address fields.
+        dependencies (UpdateProfileControllerDependencies): Dependencies for updating the user profile.
+
+    Returns:
+        JSONResponse | UpdateProfileOutputDTO: Response containing a message of the request result details.
+    """
+    try:
+        with stage(Stage.VALIDATION):
+            input_port = UpdateAccountInputPort(**dto.model_dump(), uid=dependencies.uid)
+        with stage(Stage.USE_CASE):
+            output_port = await dependencies.update_account_use_case(input_port)
+        with stage(Stage.SERIALIZATION):
+            return UpdateProfileOutputDTO(**output_port.model_dump())
     except ValidationError as errors:
         output_errors = {}
         for error in errors.errors():
             output_errors[error["type"]] = error["msg"]
-            logging.info(f"Warning [Update CPF] | {error['type']} - {error['msg']}")
+            _logger.info("Warning [Update Profile] | %s - %s", error["type"], error["msg"])
         content = {"msg": "error", "errors": output_errors}
         return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=content)
@@ -0,0 +1,93 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, status
+from pydantic_core import ValidationError
+
+from domain_account.adapters.controllers.__dependencies__ import BatchControllerDependencies
+from domain_account.adapters.instrumentation import Stage, stage
+from domain_account.business.interfaces import InputPort
+from domain_account.business.ports import (
+    BatchInputPort,
+    BatchResult,
+    RegisterInputPort,
+    RetrieveUserInputPort,
+    UpdateAddressInputPort,
+    UpdateCpfInputPort,
+)
+
+from .dtos import (
+    BatchInputDTO,
+    BatchOutputDTO,
+    BatchResultDTO,
+    RegisterAccountOutputDTO,
+    RetrieveUserOutputDTO,
+    UpdateAddressOutputDTO,
+    UpdateCpfOutputDTO,
+)
+from .exception_handlers import error_content, error_status
+from .interfaces import OutputDTO
+
+batch_controller = APIRouter()
+
+# The input port, output DTO and success status of each operation, as its own route answers
+OPERATIONS: dict[str, tuple[type[InputPort], type[OutputDTO], int]] = {
+    "register_account": (RegisterInputPort, RegisterAccountOutputDTO, status.HTTP_201_CREATED),
+    "retrieve_user": (RetrieveUserInputPort, RetrieveUserOutputDTO, status.HTTP_200_OK),
+    "update_address": (UpdateAddressInputPort, UpdateAddressOutputDTO, status.HTTP_200_OK),
+    "update_cpf": (UpdateCpfInputPort, UpdateCpfOutputDTO, status.HTTP_200_OK),
+}
+
+
+def _result(op: str, result: BatchResult) -> BatchResultDTO:
+    _, output_dto, success = OPERATIONS[op]
+    if result.output is None:
+        error_type = result.error_type or "Error"
+        body = error_content({error_type: result.error_msg or ""})
+        return BatchResultDTO(op=op, status=error_status(error_type), body=body)
+    return BatchResultDTO(op=op, status=success, body=output_dto(**result.output.model_dump()).model_dump())
+
+
+@batch_controller.post(
+    "/batch",
+    response_model=BatchOutputDTO,
+    status_code=status.HTTP_200_OK,
+)
+async def batch(
+    dto: BatchInputDTO,
+    dependencies: Annotated[BatchControllerDependencies, Depends()],
+) -> BatchOutputDTO:
+    """Run several account operations of the authenticated user, in order, in one round trip.
+
+    The token is verified once for the whole batch. Consecutive reads run concurrently and consecutive updates are
+    merged into one write, with the same outcome as sending the operations one by one. Every operation gets the
+    status and body its own route would have answered, an operation failing does not stop the next ones.
+
+    Args:
+        dto (BatchInputDTO): The input DTO containing the operations, in order.
+        dependencies (BatchControllerDependencies): Dependencies for running the operations.
+
+    Returns:
+        BatchOutputDTO: Response containing the result of every operation, in the same order.
+    """
+    results: list[BatchResultDTO | None] = [None] * len(dto.operations)
+    ports: list[InputPort] = []
+    positions: list[int] = []
+    with stage(Stage.VALIDATION):
+        for position, operation in enumerate(dto.operations):
+            port_type, _, _ = OPERATIONS[operation.op]
+            body = operation.body.model_dump() if hasattr(operation, "body") else {}
+            try:
+                ports.append(port_type.model_validate({**body, "uid": dependencies.uid}))
+                positions.append(position)
+            except ValidationError as errors:
+                errors_by_type = {error["type"]: error["msg"] for error in errors.errors()}
+                results[position] = BatchResultDTO(
+                    op=operation.op, status=status.HTTP_400_BAD_REQUEST, body=error_content(errors_by_type)
+                )
+        input_port = BatchInputPort(uid=dependencies.uid, operations=ports)
+    with stage(Stage.USE_CASE):
+        output_port = await dependencies.batch_use_case(input_port)
+    with stage(Stage.SERIALIZATION):
+        for position, result in zip(positions, output_port.results):
+            results[position] = _result(dto.operations[position].op, result)
+        return BatchOutputDTO(msg="ok", results=[result for result in results if result is not None])
@@ -1,4 +1,8 @@
-from domain_account.models import Address, User
+from typing import Annotated, Any, Literal, Union
+
+from pydantic import Field
+
+from domain_account.models import PartialAddress, PartialUser, RegisteredUser, User
 
 from .interfaces import InputDTO, OutputDTO
 
@@ -13,8 +17,8 @@ class RegisterAccountOutputDTO(OutputDTO):
     msg: str
 
 
-class UpdateAddressInputDTO(Address, InputDTO):
-    """Input DTO for update address"""
+class UpdateAddressInputDTO(PartialAddress, InputDTO):
+    """Input DTO for update address, only the provided fields change"""
 
 
 class UpdateAddressOutputDTO(OutputDTO):
@@ -35,5 +39,108 @@ class UpdateCpfOutputDTO(OutputDTO):
     msg: str
 
 
-class RetrieveUserOutputDTO(User, OutputDTO):
-    """Output DTO for retrieve an user"""
+class UpdateProfileInputDTO(InputDTO):
+    """Input DTO for update the cpf and the address at once, only the provided fields change"""
+
+    cpf: str | None = None
+    address: PartialAddress | None = None
+
+
+class UpdateProfileOutputDTO(OutputDTO):
+    """Output DTO for update the cpf and the address at once"""
+
+    msg: str
+
+
+class RetrieveUserOutputDTO(PartialUser, OutputDTO):
+    """Output DTO for retrieve an user, holding the selected fields only"""
+
+
+MAX_CPF_LOOKUP = 100
+
+
+class FindUsersByCpfInputDTO(InputDTO):
+    """Input DTO for find registered users by CPF, formatted or not"""
+
+    cpfs: list[str] = Field(min_length=1, max_length=MAX_CPF_LOOKUP, examples=[["777.777.777-77", "12345678901"]])
+
+
+class FindUsersByCpfOutputDTO(OutputDTO):
+    """Output DTO for find registered users by CPF, the CPFs not registered are left out"""
+
+    msg: str
+    users: list[RegisteredUser]
+
+
+class ListUsersOutputDTO(OutputDTO):
+    """Output DTO for list registered users, `next_cursor` fetches the next page and is null on the last one"""
+
+    msg: str
+    users: list[RegisteredUser]
+    next_cursor: str | None = Field(examples=["MTpzdGFuZGluLXVzZXItMDAwMDAwNDk"])
+
+
+class UserStatsOutputDTO(OutputDTO):
+    """Output DTO for count the registered users of a city or of a CEP region"""
+
+    msg: str
+    by: str = Field(examples=["cep_region"])
+    key: str = Field(examples=["80010"])
+    users: int
+
+
+MAX_BATCH_OPERATIONS = 20
+
+
+class RegisterAccountOperationDTO(InputDTO):
+    """Register account operation of a batch"""
+
+    op: Literal["register_account"]
+    body: RegisterAccountInputDTO
+
+
+class RetrieveUserOperationDTO(InputDTO):
+    """Retrieve user operation of a batch"""
+
+    op: Literal["retrieve_user"]
+
+
+class UpdateAddressOperationDTO(InputDTO):
+    """Update address operation of a batch"""
+
+    op: Literal["update_address"]
+    body: UpdateAddressInputDTO
+
+
+class UpdateCpfOperationDTO(InputDTO):
+    """Update cpf operation of a batch"""
+
+    op: Literal["update_cpf"]
+    body: UpdateCpfInputDTO
+
+
+BatchOperationDTO = Annotated[
+    Union[RegisterAccountOperationDTO, RetrieveUserOperationDTO, UpdateAddressOperationDTO, UpdateCpfOperationDTO],
+    Field(discriminator="op"),
+]
+
+
+class BatchInputDTO(InputDTO):
+    """Input DTO for run account operations in order"""
+
+    operations: list[BatchOperationDTO] = Field(min_length=1, max_length=MAX_BATCH_OPERATIONS)
+
+
+class BatchResultDTO(OutputDTO):
+    """The status and body the operation would have answered as a request of its own"""
+
+    op: str
+    status: int
+    body: dict[str, Any]
+
+
+class BatchOutputDTO(OutputDTO):
+    """Output DTO for run account operations in order, one result per operation"""
+
+    msg: str
+    results: list[BatchResultDTO]
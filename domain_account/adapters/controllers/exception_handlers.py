@@ -0,0 +1,58 @@
+import logging
+from typing import Any
+
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+
+from domain_account.adapters.repositories.exceptions import RepositoriesException
+from domain_account.business.use_case.exceptions import BusinessException
+
+# The status answering each business and repository error, the ones missing are internal errors
+ERROR_STATUS = {
+    "UserNotFound": status.HTTP_404_NOT_FOUND,
+    "UserAlreadyRegistered": status.HTTP_409_CONFLICT,
+    "CpfAlreadyRegistered": status.HTTP_409_CONFLICT,
+    "UnknownCep": status.HTTP_422_UNPROCESSABLE_ENTITY,
+    "IdempotencyKeyReused": status.HTTP_422_UNPROCESSABLE_ENTITY,
+    "IdempotencyKeyInProgress": status.HTTP_409_CONFLICT,
+}
+
+_logger = logging.getLogger("ExceptionHandlers")
+
+
+def error_content(errors: dict[str, str]) -> dict[str, Any]:
+    """The body of an error response, the message of each error by its type."""
+    return {"msg": "error", "errors": errors}
+
+
+def error_status(error_type: str) -> int:
+    """The status of the response to a business or repository error."""
+    return ERROR_STATUS.get(error_type, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+def error_response(path: str, error: Exception) -> JSONResponse:
+    """The response to a business or repository error raised by a route, logged with the path of the route."""
+    error_type = getattr(error, "type", error.__class__.__name__)
+    message = getattr(error, "msg", str(error))
+    status_code = error_status(error_type)
+    if status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR:
+        _logger.error("Error [%s] | %s - %s", path, error_type, message)
+    else:
+        _logger.info("Warning [%s] | %s - %s", path, error_type, message)
+    return JSONResponse(status_code=status_code, content=error_content({error_type: message}))
+
+
+async def _known_error(request: Request, error: Exception) -> JSONResponse:
+    # Expected outcomes of a request, answered without going through the traceback of an unhandled exception
+    return error_response(request.url.path, error)
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """Answer the business and repository errors raised by the routes with the status of their type.
+
+    Args:
+        app (FastAPI): The FastAPI instance to which the handlers will be added.
+
+    """
+    app.add_exception_handler(BusinessException, _known_error)
+    app.add_exception_handler(RepositoriesException, _known_error)
@@ -0,0 +1,65 @@
+import hashlib
+from typing import Awaitable, Callable
+
+from fastapi import status
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from domain_account.adapters.interfaces.idempotency_service import IdempotencyService, StoredResponse
+from domain_account.adapters.repositories.exceptions import RepositoriesException
+from domain_account.business.use_case.exceptions import BusinessException
+
+from .exception_handlers import error_response
+
+# The header flagging the responses replayed from an earlier request with the same idempotency key
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+def fingerprint(dto: BaseModel) -> str:
+    """A digest of the body of a request, telling its retries from another request reusing its idempotency key."""
+    return hashlib.sha256(dto.model_dump_json().encode()).hexdigest()
+
+
+async def idempotent(
+    store: IdempotencyService, path: str, key: str, request_fingerprint: str, respond: Callable[[], Awaitable[Response]]
+) -> Response:
+    """Answer a request once per idempotency key, replaying its response to its retries.
+
+    The business and repository errors are answered here rather than by the exception handlers, so they are stored
+    and replayed like any other response: a retry of a request answered 409 is answered 409 again. A request failing
+    otherwise, or answered with an internal error, releases its key, so a retry runs it again.
+
+    Args:
+        store (IdempotencyService): The idempotency keys and their responses.
+        path (str): The path of the route, for the logs.
+        key (str): The idempotency key, scoped to the route and the user.
+        request_fingerprint (str): A digest of the request, so a key is not reused for another request.
+        respond (Callable[[], Awaitable[Response]]): Runs the request and answers it.
+
+    Returns:
+        Response: The response of the request, run now or replayed.
+
+    Raises:
+        IdempotencyKeyReused: If the key was used for another request.
+        IdempotencyKeyInProgress: If the request holding the key did not complete in time.
+    """
+    stored = await store.claim(key, request_fingerprint)
+    if stored is not None:
+        return Response(
+            stored.body,
+            status_code=stored.status_code,
+            media_type="application/json",
+            headers={REPLAYED_HEADER: "true"},
+        )
+    try:
+        response = await respond()
+    except (BusinessException, RepositoriesException) as error:
+        response = error_response(path, error)
+    except BaseException:
+        await store.release(key)
+        raise
+    if response.status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR:
+        await store.release(key)
+    else:
+        await store.complete(key, StoredResponse(response.status_code, bytes(response.body)))
+    return response
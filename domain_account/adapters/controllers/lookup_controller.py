@@ -0,0 +1,101 @@
+import logging
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import JSONResponse
+from pydantic_core import ValidationError
+
+from domain_account.adapters.controllers.__dependencies__ import (
+    FindUsersByCpfControllerDependencies,
+    ListUsersControllerDependencies,
+)
+from domain_account.adapters.instrumentation import Stage, stage
+from domain_account.business.ports import FindUsersByCpfInputPort, ListUsersInputPort
+
+from .dtos import FindUsersByCpfInputDTO, FindUsersByCpfOutputDTO, ListUsersOutputDTO
+
+lookup_controller = APIRouter(prefix="/admin")
+
+_logger = logging.getLogger("LookupController")
+
+
+@lookup_controller.post(
+    "/users/by-cpf",
+    response_model=FindUsersByCpfOutputDTO,
+    status_code=status.HTTP_200_OK,
+)
+async def find_users_by_cpf(
+    dto: FindUsersByCpfInputDTO,
+    dependencies: Annotated[FindUsersByCpfControllerDependencies, Depends()],
+) -> JSONResponse | FindUsersByCpfOutputDTO:
+    """Find the users registered with one or several CPFs, for the other services, with an administrator token.
+
+    The CPFs are sent in the body so they do not end up in access logs, formatted or not.
+
+    Args:
+        dto (FindUsersByCpfInputDTO): The input DTO containing the CPFs to look up.
+        dependencies (FindUsersByCpfControllerDependencies): Dependencies for finding the users.
+
+    Returns:
+        JSONResponse | FindUsersByCpfOutputDTO: Response containing the users found, the CPFs not registered are
+            left out.
+    """
+    try:
+        with stage(Stage.VALIDATION):
+            input_port = FindUsersByCpfInputPort(**dto.model_dump())
+        with stage(Stage.USE_CASE):
+            output_port = await dependencies.find_users_by_cpf_use_case(input_port)
+        with stage(Stage.SERIALIZATION):
+            return FindUsersByCpfOutputDTO(**output_port.model_dump())
+    except ValidationError as errors:
+        output_errors = {}
+        for error in errors.errors():
+            output_errors[error["type"]] = error["msg"]
+            _logger.info("Warning [Find Users By CPF] | %s - %s", error["type"], error["msg"])
+        content = {"msg": "error", "errors": output_errors}
+        return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=content)
+
+
+@lookup_controller.get(
+    "/users",
+    response_model=ListUsersOutputDTO,
+    status_code=status.HTTP_200_OK,
+)
+async def list_users(
+    dependencies: Annotated[ListUsersControllerDependencies, Depends()],
+    cursor: Annotated[
+        str | None, Query(description="The `next_cursor` of the previous page, none for the first.")
+    ] = None,
+    limit: Annotated[int, Query(description="Users per page, up to 100.")] = 50,
+    city: Annotated[str | None, Query(description="Only list the users of this city.")] = None,
+    cep: Annotated[str | None, Query(description="Only list the users of this CEP.")] = None,
+) -> JSONResponse | ListUsersOutputDTO:
+    """List the registered users in UID order, a page at a time, for the support tooling, with an administrator token.
+
+    Pages are fetched with the `next_cursor` of the previous one and the same filters, and take the same time at
+    any depth.
+
+    Args:
+        dependencies (ListUsersControllerDependencies): Dependencies for listing the users.
+        cursor (str | None): The continuation of the previous page, the first page without it.
+        limit (int): The amount of users per page.
+        city (str | None): Only list the users of this city.
+        cep (str | None): Only list the users of this CEP.
+
+    Returns:
+        JSONResponse | ListUsersOutputDTO: Response containing the users of the page and the cursor of the next one.
+    """
+    try:
+        with stage(Stage.VALIDATION):
+            input_port = ListUsersInputPort(after=cursor, limit=limit, city=city, cep=cep)
+        with stage(Stage.USE_CASE):
+            output_port = await dependencies.list_users_use_case(input_port)
+        with stage(Stage.SERIALIZATION):
+            return ListUsersOutputDTO(**output_port.model_dump())
+    except ValidationError as errors:
+        output_errors = {}
+        for error in errors.errors():
+            output_errors[error["type"]] = error["msg"]
+            _logger.info("Warning [List Users] | %s - %s", error["type"], error["msg"])
+        content = {"msg": "error", "errors": output_errors}
+        return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=content)
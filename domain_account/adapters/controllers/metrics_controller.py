@@ -0,0 +1,29 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import PlainTextResponse
+
+from domain_account.adapters.controllers.__dependencies__ import MetricsControllerDependencies
+from domain_account.adapters.interfaces.metrics_service import EXPOSITION_CONTENT_TYPE
+
+metrics_controller = APIRouter()
+
+
+@metrics_controller.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    status_code=status.HTTP_200_OK,
+    include_in_schema=False,
+)
+async def metrics(
+    dependencies: Annotated[MetricsControllerDependencies, Depends()],
+) -> PlainTextResponse:
+    """Expose the metrics of the current worker in the Prometheus text format, with an administrator token.
+
+    Args:
+        dependencies (MetricsControllerDependencies): Dependencies for exposing the metrics.
+
+    Returns:
+        PlainTextResponse: The rendered metrics.
+    """
+    return PlainTextResponse(dependencies.metrics_service.exposition(), media_type=EXPOSITION_CONTENT_TYPE)
@@ -0,0 +1,104 @@
+import asyncio
+import os
+from dataclasses import asdict
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import JSONResponse, Response
+
+from domain_account.adapters.controllers.__dependencies__ import ProfilingControllerDependencies
+from domain_account.adapters.interfaces.profiling_service import Profile, ProfilerIsBusyException
+
+MAX_SESSION_SECONDS = 120.0
+POLL_INTERVAL = 0.05
+
+profiling_controller = APIRouter(prefix="/admin")
+
+
+def _download(profile: Profile) -> Response:
+    headers = {
+        "Content-Disposition": f'attachment; filename="{profile.filename}"',
+        "X-Worker-Pid": str(os.getpid()),
+    }
+    return Response(profile.content, media_type=profile.media_type, headers=headers)
+
+
+@profiling_controller.post(
+    "/profile",
+    status_code=status.HTTP_200_OK,
+    include_in_schema=False,
+)
+async def profile_worker(
+    dependencies: Annotated[ProfilingControllerDependencies, Depends()],
+    profile_format: Annotated[Literal["collapsed", "pstats", "allocations"], Query(alias="format")] = "collapsed",
+    requests: Annotated[int | None, Query(ge=1, le=100_000)] = None,
+    seconds: Annotated[float, Query(gt=0, le=MAX_SESSION_SECONDS)] = 10.0,
+) -> Response:
+    """Profile the next requests served by the worker handling this one, and download the profile.
+
+    The session ends after `requests` requests or `seconds` seconds, whichever comes first.
+
+    Args:
+        dependencies (ProfilingControllerDependencies): Dependencies for profiling the worker.
+        profile_format (str): `collapsed` stack samples, `pstats` cProfile statistics or `allocations` growth.
+        requests (int | None): The amount of requests to profile.
+        seconds (float): The maximum duration of the session.
+
+    Returns:
+        Response: The profile file, or a conflict when the worker is being profiled already.
+    """
+    profiling = dependencies.profiling_service
+    try:
+        profiling.start_session(profile_format, requests, seconds)
+    except ProfilerIsBusyException as error:
+        return JSONResponse(status_code=status.HTTP_409_CONFLICT, content={"msg": error.msg})
+    try:
+        while not profiling.session_finished():
+            await asyncio.sleep(POLL_INTERVAL)
+    finally:
+        result = profiling.stop_session()
+    return _download(result)
+
+
+@profiling_controller.get(
+    "/slow-request-profiles",
+    status_code=status.HTTP_200_OK,
+    include_in_schema=False,
+)
+async def slow_request_profiles(
+    dependencies: Annotated[ProfilingControllerDependencies, Depends()],
+) -> JSONResponse:
+    """List the slow request profiles captured by the worker handling this request.
+
+    Args:
+        dependencies (ProfilingControllerDependencies): Dependencies for profiling the worker.
+
+    Returns:
+        JSONResponse: The summaries of the profiles, most recent last.
+    """
+    summaries = [asdict(summary) for summary in dependencies.profiling_service.slow_request_profiles()]
+    return JSONResponse(content={"pid": os.getpid(), "profiles": summaries})
+
+
+@profiling_controller.get(
+    "/slow-request-profiles/{profile_id}",
+    status_code=status.HTTP_200_OK,
+    include_in_schema=False,
+)
+async def slow_request_profile(
+    profile_id: str,
+    dependencies: Annotated[ProfilingControllerDependencies, Depends()],
+) -> Response:
+    """Download a slow request profile captured by the worker handling this request.
+
+    Args:
+        profile_id (str): The identifier of the profile.
+        dependencies (ProfilingControllerDependencies): Dependencies for profiling the worker.
+
+    Returns:
+        Response: The profile in the collapsed stack format, or not found when another worker captured it.
+    """
+    captured = dependencies.profiling_service.slow_request_profile(profile_id)
+    if captured is None:
+        return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content={"msg": "Unknown profile in this worker"})
+    return _download(captured)
@@ -0,0 +1,55 @@
+import logging
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Path, status
+from fastapi.responses import JSONResponse
+from pydantic_core import ValidationError
+
+from domain_account.adapters.controllers.__dependencies__ import UserStatsControllerDependencies
+from domain_account.adapters.instrumentation import Stage, stage
+from domain_account.business.ports import UserStatsInputPort
+
+from .dtos import UserStatsOutputDTO
+
+stats_controller = APIRouter(prefix="/admin/stats")
+
+_logger = logging.getLogger("StatsController")
+
+
+@stats_controller.get(
+    "/users/{by}/{key}",
+    response_model=UserStatsOutputDTO,
+    status_code=status.HTTP_200_OK,
+)
+async def user_stats(
+    by: Annotated[str, Path(description="`city` or `cep_region`, count the users of a city or of a CEP region.")],
+    key: Annotated[str, Path(description="The city, or the CEP region as its first 5 digits or a whole CEP.")],
+    dependencies: Annotated[UserStatsControllerDependencies, Depends()],
+) -> JSONResponse | UserStatsOutputDTO:
+    """Count the registered users of a city or of a CEP region, for the dashboards, with an administrator token.
+
+    The counts are kept up to date as the users register and move, reading one takes the same time whatever the
+    amount of users.
+
+    Args:
+        by (str): Whether the key is a city or a CEP region.
+        key (str): The city or the CEP region.
+        dependencies (UserStatsControllerDependencies): Dependencies for counting the users.
+
+    Returns:
+        JSONResponse | UserStatsOutputDTO: Response containing the amount of registered users.
+    """
+    try:
+        with stage(Stage.VALIDATION):
+            input_port = UserStatsInputPort.model_validate({"by": by, "key": key})
+        with stage(Stage.USE_CASE):
+            output_port = await dependencies.user_stats_use_case(input_port)
+        with stage(Stage.SERIALIZATION):
+            return UserStatsOutputDTO(**output_port.model_dump())
+    except ValidationError as errors:
+        output_errors = {}
+        for error in errors.errors():
+            output_errors[error["type"]] = error["msg"]
+            _logger.info("Warning [User Stats] | %s - %s", error["type"], error["msg"])
+        content = {"msg": "error", "errors": output_errors}
+        return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=content)
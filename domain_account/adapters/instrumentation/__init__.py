@@ -0,0 +1,15 @@
+from .correlation import correlation_id_from, current_correlation_id
+from .identity import RequestIdentity, current_identity, identify
+from .timings import RequestTimings, Stage, current_timings, stage
+
+__all__ = [
+    "RequestIdentity",
+    "RequestTimings",
+    "Stage",
+    "correlation_id_from",
+    "current_correlation_id",
+    "current_identity",
+    "current_timings",
+    "identify",
+    "stage",
+]
@@ -0,0 +1,25 @@
+import uuid
+from contextvars import ContextVar
+
+TRACE_CONTEXT_HEADER = b"x-cloud-trace-context"
+
+current_correlation_id: ContextVar[str | None] = ContextVar("current_correlation_id", default=None)
+
+
+def correlation_id_from(headers: list[tuple[bytes, bytes]]) -> str:
+    """Take the trace ID of the `X-Cloud-Trace-Context` header (`TRACE_ID/SPAN_ID;o=1`), or generate one.
+
+    Args:
+        headers (list[tuple[bytes, bytes]]): The raw ASGI request headers.
+
+    Returns:
+        str: The trace ID set by the Google front end, or a random one formatted the same way.
+
+    """
+    for name, value in headers:
+        if name == TRACE_CONTEXT_HEADER:
+            trace_id = value.split(b"/", 1)[0].split(b";", 1)[0].decode("latin-1").strip()
+            if trace_id:
+                return trace_id
+            break
+    return uuid.uuid4().hex
@@ -0,0 +1,31 @@
+from contextvars import ContextVar
+
+
+class RequestIdentity:
+    """Holds the user the current request was authenticated as, once the authentication ran.
+
+    Attributes:
+        uid (str | None): The authenticated user UID, None until the bearer token was verified.
+
+    """
+
+    __slots__ = ("uid",)
+
+    def __init__(self) -> None:
+        """Initialize the RequestIdentity of a request not authenticated yet."""
+        self.uid: str | None = None
+
+
+current_identity: ContextVar[RequestIdentity | None] = ContextVar("current_identity", default=None)
+
+
+def identify(uid: str) -> None:
+    """Tell the middlewares which user the current request belongs to, if one of them is listening.
+
+    Args:
+        uid (str): The authenticated user UID.
+
+    """
+    identity = current_identity.get()
+    if identity is not None:
+        identity.uid = uid
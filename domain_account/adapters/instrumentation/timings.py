@@ -0,0 +1,85 @@
+from contextvars import ContextVar
+from time import perf_counter
+from types import TracebackType
+
+
+class Stage:
+    """The stages a request goes through, used as the `stage` label of the stage latency histogram.
+
+    `database` is nested in `use_case`, and `framework` is derived: the request time not covered by the top level
+    stages (routing, body parsing and validation by FastAPI, response encoding, middlewares and thread pool waits).
+    Plain strings rather than an enum, since they are hashed on every measurement.
+
+    """
+
+    AUTHENTICATION = "authentication"
+    VALIDATION = "validation"
+    USE_CASE = "use_case"
+    DATABASE = "database"
+    SERIALIZATION = "serialization"
+    FRAMEWORK = "framework"
+
+
+class RequestTimings:
+    """Accumulates the time spent by the current request in each stage.
+
+    Attributes:
+        stages (dict[str, float]): Seconds spent per stage, summed when a stage runs more than once.
+        accounted (float): Seconds covered by top level stages.
+
+    """
+
+    __slots__ = ("stages", "accounted", "depth")
+
+    def __init__(self) -> None:
+        """Initialize the RequestTimings without any stage."""
+        self.stages: dict[str, float] = {}
+        self.accounted = 0.0
+        self.depth = 0
+
+
+current_timings: ContextVar[RequestTimings | None] = ContextVar("current_timings", default=None)
+
+
+class StageTimer:
+    """Context manager adding its wall clock duration to a stage of the current request, if there is one.
+
+    Args:
+        name (str): The measured stage, one of `Stage`.
+
+    """
+
+    __slots__ = ("_name", "_timings", "_start")
+
+    def __init__(self, name: str) -> None:
+        """Initialize the StageTimer for the request bound to the current context."""
+        self._name = name
+        self._timings = current_timings.get()
+        self._start = 0.0
+
+    def __enter__(self) -> "StageTimer":
+        # Outside of a request, such as in the background tasks, nothing is measured
+        if self._timings is not None:
+            self._timings.depth += 1
+            self._start = perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        timings = self._timings
+        if timings is None:
+            return
+        elapsed = perf_counter() - self._start
+        timings.depth -= 1
+        stages = timings.stages
+        stages[self._name] = stages.get(self._name, 0.0) + elapsed
+        if timings.depth == 0:
+            timings.accounted += elapsed
+
+
+# `with stage(Stage.DATABASE): ...` measures a block of code as a stage of the current request
+stage = StageTimer
@@ -25,3 +25,17 @@ class AuthenticationService(metaclass=ABCMeta):
         Raises:
             NotImplementedError: If the method is not implemented in a subclass.
         """
+
+    @abstractmethod
+    def authenticate_admin_by_token(self, token: BearerToken) -> UserUid:
+        """Authenticate an administrator by bearer token.
+
+        Args:
+            token (BearerToken): The bearer token for authentication.
+
+        Returns:
+            UserUid: The unique identifier of the authenticated administrator.
+
+        Raises:
+            NotImplementedError: If the method is not implemented in a subclass.
+        """
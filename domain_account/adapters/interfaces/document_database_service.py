@@ -1,8 +1,46 @@
 from abc import ABCMeta, abstractmethod
-from typing import Generic, TypeVar
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Generic, TypeVar
 
 ClientT = TypeVar("ClientT")
 DatabaseT = TypeVar("DatabaseT")
+T = TypeVar("T")
+
+# The session of the transaction the current task writes in, None outside of one
+current_session: ContextVar[Any] = ContextVar("current_session", default=None)
+# The writes deferred until that transaction committed, None outside of one
+current_deferred_writes: ContextVar[list[Callable[[], Awaitable[Any]]] | None] = ContextVar(
+    "current_deferred_writes", default=None
+)
+
+
+def session_options() -> dict[str, Any]:
+    """The options binding a write to the transaction of the current task, none outside of one.
+
+    Returns:
+        dict[str, Any]: The `session` of the transaction, to pass to the write, empty outside of a transaction.
+
+    """
+    session = current_session.get()
+    return {} if session is None else {"session": session}
+
+
+async def after_commit(write: Callable[[], Awaitable[Any]]) -> None:
+    """Run a write once the transaction of the current task committed, at once outside of one.
+
+    The write is left out of the transaction: it is not rolled back with it, and runs once however many times the
+    transaction is retried, but is lost when the worker dies before the commit is done. It suits the writes many
+    transactions would otherwise conflict on, such as the counters of a popular value.
+
+    Args:
+        write (Callable[[], Awaitable[Any]]): The write, dropped when the transaction fails.
+
+    """
+    deferred = current_deferred_writes.get()
+    if deferred is None:
+        await write()
+    else:
+        deferred.append(write)
 
 
 class DocumentDatabaseService(Generic[ClientT, DatabaseT], metaclass=ABCMeta):
@@ -17,3 +55,18 @@ class DocumentDatabaseService(Generic[ClientT, DatabaseT], metaclass=ABCMeta):
     @abstractmethod
     def database(self) -> DatabaseT:
         """Return the current instance of a Database client."""
+
+    async def transaction(self, write: Callable[[], Awaitable[T]]) -> T:
+        """Run writes in a single transaction, when the database has transactions.
+
+        The writes pass `session_options()` to join the transaction, or defer themselves to its commit with
+        `after_commit`. By default the database has none, and the writes simply run one after the other.
+
+        Args:
+            write (Callable[[], Awaitable[T]]): The writes, run again from the start when the transaction is retried.
+
+        Returns:
+            T: What the writes returned.
+
+        """
+        return await write()
@@ -0,0 +1,46 @@
+from abc import ABCMeta, abstractmethod
+from datetime import datetime
+from typing import Any, Awaitable, Callable, NamedTuple, TypeVar
+
+T = TypeVar("T")
+
+
+class OutboxMessage(NamedTuple):
+    """A message to publish: its unique ID, the key ordering it, when it happened and its JSON body."""
+
+    id: str
+    key: str
+    occurred_at: datetime
+    body: dict[str, Any]
+
+
+class EventOutboxService(metaclass=ABCMeta):
+    """Abstract base class for event outboxes, storing the messages to publish until a broker received them.
+
+    Appending only stores the messages, they are published in the background: the caller never waits for the
+    broker. A message is published at least once, in the order it happened, and stays in the outbox until the
+    broker acknowledged it, so a broker unreachable for a while delays the messages without losing them.
+
+    """
+
+    @abstractmethod
+    async def append(self, messages: list[OutboxMessage]) -> None:
+        """Store messages to publish, in order.
+
+        Args:
+            messages (list[OutboxMessage]): The messages, stored once the call returns.
+        """
+
+    async def transaction(self, write: Callable[[], Awaitable[T]]) -> T:
+        """Run a write and the appends of its messages in a single transaction, when the outbox allows it.
+
+        By default the messages are appended by a second write, a failure between the two loses them.
+
+        Args:
+            write (Callable[[], Awaitable[T]]): The write and its appends, run again from the start when the
+                transaction is retried.
+
+        Returns:
+            T: What the write returned.
+        """
+        return await write()
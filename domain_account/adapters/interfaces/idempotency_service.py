@@ -0,0 +1,53 @@
+from abc import ABCMeta, abstractmethod
+from typing import NamedTuple
+
+
+class StoredResponse(NamedTuple):
+    """The status and encoded body of the response to a request, replayed to its retries."""
+
+    status_code: int
+    body: bytes
+
+
+class IdempotencyService(metaclass=ABCMeta):
+    """Abstract base class for idempotency stores, running a request once per idempotency key.
+
+    The request holding a key claims it, then either completes it with its response, replayed to the retries of the
+    request, or releases it when it failed in a way a retry may fix. A retry arriving while the key is claimed waits
+    for the outcome of the request holding it.
+
+    """
+
+    @abstractmethod
+    async def claim(self, key: str, fingerprint: str) -> StoredResponse | None:
+        """Claim a key for a request, or wait for the response of the request holding it.
+
+        Args:
+            key (str): The idempotency key, scoped to the route and the user.
+            fingerprint (str): A digest of the request, so a key is not reused for another request.
+
+        Returns:
+            StoredResponse | None: The response of the request that held the key, to replay, None when the key was
+                claimed and the request must run.
+
+        Raises:
+            IdempotencyKeyReused: If the key was used for another request.
+            IdempotencyKeyInProgress: If the request holding the key did not complete in time.
+        """
+
+    @abstractmethod
+    async def complete(self, key: str, response: StoredResponse) -> None:
+        """Store the response of the request holding a key, for its retries.
+
+        Args:
+            key (str): The idempotency key claimed.
+            response (StoredResponse): The response to replay.
+        """
+
+    @abstractmethod
+    async def release(self, key: str) -> None:
+        """Release a key claimed by a request that failed, so a retry runs it again.
+
+        Args:
+            key (str): The idempotency key claimed.
+        """
@@ -0,0 +1,21 @@
+from abc import ABCMeta, abstractmethod
+
+
+class KeyedHashService(metaclass=ABCMeta):
+    """Abstract base class for keyed hash services.
+
+    A keyed hash service turns a value into a digest that is stable for the key, so the digest can be stored and
+    indexed in place of the value, but cannot be reversed or recomputed by whoever does not hold the key.
+
+    """
+
+    @abstractmethod
+    def digest(self, value: str) -> str:
+        """Hash a value with the key of the service.
+
+        Args:
+            value (str): The value to hash.
+
+        Returns:
+            str: The hexadecimal digest of the value.
+        """
@@ -0,0 +1,107 @@
+from abc import ABCMeta, abstractmethod
+from typing import Callable, Iterable
+
+Collector = Callable[[], None]
+
+EXPOSITION_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsService(metaclass=ABCMeta):
+    """Abstract base class for metrics services.
+
+    Metrics are declared once by name, with their label names, and then updated by passing the label values
+    positionally, in the declared order.
+
+    """
+
+    @abstractmethod
+    def counter(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> None:
+        """Declare a monotonic counter, declaring an existing metric again is a no-op.
+
+        Args:
+            name (str): The metric name.
+            documentation (str): The help text of the metric.
+            label_names (tuple[str, ...]): The names of the labels of the metric.
+        """
+
+    @abstractmethod
+    def gauge(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> None:
+        """Declare a gauge, declaring an existing metric again is a no-op.
+
+        Args:
+            name (str): The metric name.
+            documentation (str): The help text of the metric.
+            label_names (tuple[str, ...]): The names of the labels of the metric.
+        """
+
+    @abstractmethod
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] | None = None,
+    ) -> None:
+        """Declare a histogram, declaring an existing metric again is a no-op.
+
+        Args:
+            name (str): The metric name.
+            documentation (str): The help text of the metric.
+            label_names (tuple[str, ...]): The names of the labels of the metric.
+            buckets (tuple[float, ...] | None): The upper bounds of the buckets, a default latency layout if None.
+        """
+
+    @abstractmethod
+    def increment(self, name: str, *labels: str, amount: float = 1.0) -> None:
+        """Add an amount to a counter or a gauge.
+
+        Args:
+            name (str): The metric name.
+            *labels (str): The label values, in the declared order.
+            amount (float): The amount to add, gauges also accept negative amounts.
+        """
+
+    @abstractmethod
+    def set_gauge(self, name: str, value: float, *labels: str) -> None:
+        """Set the value of a gauge.
+
+        Args:
+            name (str): The metric name.
+            value (float): The new value.
+            *labels (str): The label values, in the declared order.
+        """
+
+    @abstractmethod
+    def observe(self, name: str, value: float, *labels: str) -> None:
+        """Record an observation in a histogram.
+
+        Args:
+            name (str): The metric name.
+            value (float): The observed value.
+            *labels (str): The label values, in the declared order.
+        """
+
+    @abstractmethod
+    def observe_many(self, name: str, observations: Iterable[tuple[float, tuple[str, ...]]]) -> None:
+        """Record several observations in a histogram at once, cheaper than as many `observe` calls.
+
+        Args:
+            name (str): The metric name.
+            observations (Iterable[tuple[float, tuple[str, ...]]]): Pairs of observed value and label values.
+        """
+
+    @abstractmethod
+    def add_collector(self, collector: Collector) -> None:
+        """Register a callback refreshing metrics (usually gauges) right before each exposition.
+
+        Args:
+            collector (Collector): The callback, executed on the thread requesting the exposition.
+        """
+
+    @abstractmethod
+    def exposition(self) -> str:
+        """Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: The rendered metrics.
+        """
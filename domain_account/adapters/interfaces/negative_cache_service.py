@@ -0,0 +1,39 @@
+from abc import ABCMeta, abstractmethod
+
+
+class NegativeCacheService(metaclass=ABCMeta):
+    """Abstract base class for negative caches, remembering for a while the keys a lookup found nothing for.
+
+    A lookup racing with the write creating its key must not cache it as missing once the write is done: the epoch
+    is taken before the lookup and handed to `add`, which ignores the key when an invalidation happened meanwhile.
+
+    """
+
+    @abstractmethod
+    def __contains__(self, key: str) -> bool:
+        """Whether a key is known to be missing."""
+
+    @abstractmethod
+    def epoch(self) -> int:
+        """The current epoch, to take before looking a key up.
+
+        Returns:
+            int: An opaque value, changing with every invalidation.
+        """
+
+    @abstractmethod
+    def add(self, key: str, epoch: int) -> None:
+        """Remember that a key is missing, unless a key was invalidated since the epoch.
+
+        Args:
+            key (str): The key the lookup found nothing for.
+            epoch (int): The epoch taken before the lookup.
+        """
+
+    @abstractmethod
+    def discard(self, key: str) -> None:
+        """Invalidate a key, once it is created.
+
+        Args:
+            key (str): The key created.
+        """
@@ -0,0 +1,24 @@
+from abc import ABCMeta, abstractmethod
+
+PostalCodeRecord = tuple[str, str, str]
+"""The city, the state and the street of a postal code, the street is empty for a postal code of a whole city."""
+
+
+class PostalCodeIndexService(metaclass=ABCMeta):
+    """Abstract base class for postal code indexes.
+
+    A postal code index answers which locality a Brazilian postal code (CEP) belongs to, locally: a lookup is a
+    memory access, not a network call, so it can run on the event loop.
+
+    """
+
+    @abstractmethod
+    def lookup(self, cep: int) -> PostalCodeRecord | None:
+        """Find the locality of a postal code.
+
+        Args:
+            cep (int): The 8 digits of the postal code, as a number.
+
+        Returns:
+            PostalCodeRecord | None: The city, state and street of the postal code, None when it does not exist.
+        """
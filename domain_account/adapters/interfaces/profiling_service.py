@@ -0,0 +1,125 @@
+from abc import ABCMeta, abstractmethod
+from dataclasses import dataclass
+
+COLLAPSED = "collapsed"
+PSTATS = "pstats"
+ALLOCATIONS = "allocations"
+
+PROFILE_FORMATS = (COLLAPSED, PSTATS, ALLOCATIONS)
+
+
+class ProfilerIsBusyException(RuntimeError):
+    """Raised when a profiling session is requested while another one is running in the same worker.
+
+    Attributes:
+        type (str): The type of the exception.
+        msg (str): The message describing the exception.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the exception with a default message."""
+        self.type = "Profiler"
+        self.msg = "There is a profiling session running in this worker already"
+        super().__init__(self.msg)
+
+
+@dataclass(frozen=True)
+class Profile:
+    """A rendered profile, ready to be downloaded.
+
+    Attributes:
+        content (bytes): The profile file content.
+        media_type (str): The media type of the content.
+        filename (str): A suggested file name, its extension tells the format.
+    """
+
+    content: bytes
+    media_type: str
+    filename: str
+
+
+@dataclass(frozen=True)
+class SlowRequestProfile:
+    """Summary of a profile captured automatically because a request exceeded the latency threshold.
+
+    Attributes:
+        profile_id (str): The identifier used to download the profile.
+        route (str): The route template of the slow request.
+        method (str): The HTTP method of the slow request.
+        duration (float): The latency of the slow request, in seconds.
+        captured_at (float): When the profile was captured, as a Unix timestamp.
+    """
+
+    profile_id: str
+    route: str
+    method: str
+    duration: float
+    captured_at: float
+
+
+class ProfilingService(metaclass=ABCMeta):
+    """Abstract base class for profiling services.
+
+    A profiling service runs at most one on demand session at a time, in the current worker only. It is told about
+    every finished request, which ends the sessions bounded by a request count and captures the slow requests.
+
+    """
+
+    @abstractmethod
+    def start_session(self, profile_format: str, requests: int | None, seconds: float) -> None:
+        """Start profiling the current worker.
+
+        Args:
+            profile_format (str): One of `PROFILE_FORMATS`.
+            requests (int | None): The session ends once this amount of requests has finished, if provided.
+            seconds (float): The session ends after this amount of seconds, whichever comes first.
+
+        Raises:
+            ProfilerIsBusyException: If another session is running.
+        """
+
+    @abstractmethod
+    def session_finished(self) -> bool:
+        """Tell whether the running session reached its request count or duration.
+
+        Returns:
+            bool: True when the session should be stopped.
+        """
+
+    @abstractmethod
+    def stop_session(self) -> Profile:
+        """Stop the running session and render its profile.
+
+        Returns:
+            Profile: The profile of the session.
+        """
+
+    @abstractmethod
+    def request_finished(self, route: str, method: str, started: float, elapsed: float) -> None:
+        """Account a finished request, it must be cheap since it runs for every request.
+
+        Args:
+            route (str): The route template of the request.
+            method (str): The HTTP method of the request.
+            started (float): When the request started, as a `time.perf_counter` value.
+            elapsed (float): The latency of the request, in seconds.
+        """
+
+    @abstractmethod
+    def slow_request_profiles(self) -> list[SlowRequestProfile]:
+        """List the slow request profiles kept by the current worker, most recent last.
+
+        Returns:
+            list[SlowRequestProfile]: The summaries of the kept profiles.
+        """
+
+    @abstractmethod
+    def slow_request_profile(self, profile_id: str) -> Profile | None:
+        """Render a slow request profile kept by the current worker.
+
+        Args:
+            profile_id (str): The identifier of the profile.
+
+        Returns:
+            Profile | None: The rendered profile, None if it is unknown or was discarded.
+        """
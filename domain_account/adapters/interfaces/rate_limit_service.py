@@ -0,0 +1,46 @@
+from abc import ABCMeta, abstractmethod
+from typing import NamedTuple
+
+
+class RateLimit(NamedTuple):
+    """A token bucket limit: `rate` tokens per second refill a bucket holding up to `burst` tokens."""
+
+    rate: float
+    burst: float
+
+
+class RateLimitService(metaclass=ABCMeta):
+    """Abstract base class for rate limiters, taking the tokens of the requests from per key token buckets.
+
+    The limits are the ones of each client on each route, and the one of each route whoever calls it. The buckets
+    may be kept by each worker, or by a backend shared by all of them so the limits hold across the workers: the
+    tokens are taken asynchronously for that reason.
+
+    """
+
+    @property
+    @abstractmethod
+    def client_limit(self) -> RateLimit | None:
+        """The limit of each client on each route, None when the clients are not limited."""
+
+    @property
+    @abstractmethod
+    def route_limit(self) -> RateLimit | None:
+        """The limit of each route over all its clients, None when the routes are not limited."""
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any limit is set, the rate limiting middleware is not installed otherwise."""
+        return self.client_limit is not None or self.route_limit is not None
+
+    @abstractmethod
+    async def acquire(self, key: str, limit: RateLimit) -> float:
+        """Take a token from the bucket of a key, a bucket missing is full.
+
+        Args:
+            key (str): The key of the bucket.
+            limit (RateLimit): The limit of the bucket.
+
+        Returns:
+            float: 0 when a token was taken, otherwise the seconds until one is available.
+        """
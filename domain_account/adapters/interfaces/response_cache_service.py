@@ -0,0 +1,62 @@
+from abc import ABCMeta, abstractmethod
+from typing import NamedTuple
+
+
+class CachedResponse(NamedTuple):
+    """The encoded body of a response and its entity tag."""
+
+    body: bytes
+    etag: str
+
+
+class ResponseCacheService(metaclass=ABCMeta):
+    """Abstract base class for response caches, keeping the encoded bodies of the responses about a key.
+
+    A key, such as a user, has a response per variant, such as the fields selected, and invalidating the key drops
+    all of them. A lookup racing with the write invalidating its key must not cache the response read before the
+    write: the epoch is taken before the lookup and handed to `put`, which does not keep the body when an
+    invalidation happened meanwhile.
+
+    """
+
+    @abstractmethod
+    def get(self, key: str, variant: str) -> CachedResponse | None:
+        """Get the cached response of a variant of a key.
+
+        Args:
+            key (str): The key the response is about.
+            variant (str): The variant of the response.
+
+        Returns:
+            CachedResponse | None: The cached response, None when it is not cached.
+        """
+
+    @abstractmethod
+    def epoch(self) -> int:
+        """The current epoch, to take before reading what the response is made of.
+
+        Returns:
+            int: An opaque value, changing with every invalidation.
+        """
+
+    @abstractmethod
+    def put(self, key: str, variant: str, body: bytes, epoch: int) -> CachedResponse:
+        """Tag the encoded body of a response, and cache it unless a key was invalidated since the epoch.
+
+        Args:
+            key (str): The key the response is about.
+            variant (str): The variant of the response.
+            body (bytes): The encoded body.
+            epoch (int): The epoch taken before reading what the response is made of.
+
+        Returns:
+            CachedResponse: The body and its entity tag, cached or not.
+        """
+
+    @abstractmethod
+    def invalidate(self, key: str) -> None:
+        """Drop the cached responses of every variant of a key.
+
+        Args:
+            key (str): The key written.
+        """
@@ -0,0 +1,39 @@
+from abc import ABCMeta, abstractmethod
+
+
+class TrafficRecordingService(metaclass=ABCMeta):
+    """Abstract base class for traffic recording services.
+
+    A traffic recording service keeps a trace of the served requests, to replay them later against another build.
+    The recorded trace must not contain personal data: implementations anonymise the user UID and the body before
+    anything leaves the memory of the worker.
+
+    """
+
+    @property
+    @abstractmethod
+    def enabled(self) -> bool:
+        """Whether requests are being recorded, the recording middleware is not installed otherwise."""
+
+    @abstractmethod
+    def record(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        started: float,
+        elapsed: float,
+        uid: str | None,
+        body: bytes,
+    ) -> None:
+        """Record a finished request, it must be cheap since it runs on the event loop for every request.
+
+        Args:
+            method (str): The HTTP method of the request.
+            route (str): The route template of the request.
+            status (int): The response status code.
+            started (float): When the request started, as a Unix timestamp.
+            elapsed (float): The latency of the request, in seconds.
+            uid (str | None): The authenticated user UID, None when the request was not authenticated.
+            body (bytes): The raw request body, possibly truncated.
+        """
@@ -0,0 +1,27 @@
+from abc import ABCMeta, abstractmethod
+
+from pymongo.write_concern import WriteConcern
+
+# The write operations whose durability is configured, by the name the repositories ask for it
+WRITE_OPERATIONS = ("register", "update_address", "update_cpf", "update_account", "user_stats")
+
+
+class WriteDurabilityService(metaclass=ABCMeta):
+    """Abstract base class for write durability policies, telling how durable each write must be once acknowledged.
+
+    A write acknowledged by the primary alone is faster, but is rolled back if the primary fails before a majority
+    of the replica set replicated it. The policy lets the writes that can be retried or rebuilt trade durability for
+    latency, while the others wait for a majority.
+
+    """
+
+    @abstractmethod
+    def write_concern(self, operation: str) -> WriteConcern | None:
+        """The write concern of a write operation.
+
+        Args:
+            operation (str): One of `WRITE_OPERATIONS`.
+
+        Returns:
+            WriteConcern | None: The write concern of the operation, None for the default one of the client.
+        """
@@ -0,0 +1,13 @@
+from .metrics_middleware import MetricsMiddleware
+from .profiling_middleware import ProfilingMiddleware
+from .rate_limiting_middleware import RateLimitingMiddleware
+from .request_logging_middleware import RequestLoggingMiddleware
+from .traffic_recording_middleware import TrafficRecordingMiddleware
+
+__all__ = [
+    "MetricsMiddleware",
+    "ProfilingMiddleware",
+    "RateLimitingMiddleware",
+    "RequestLoggingMiddleware",
+    "TrafficRecordingMiddleware",
+]
@@ -0,0 +1,74 @@
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from domain_account.adapters.instrumentation import RequestTimings, Stage, current_timings
+from domain_account.adapters.interfaces.metrics_service import MetricsService
+
+IN_FLIGHT = "http_requests_in_flight"
+REQUEST_DURATION = "http_request_duration_seconds"
+STAGE_DURATION = "http_request_stage_duration_seconds"
+
+
+class MetricsMiddleware:
+    """ASGI middleware measuring every HTTP request.
+
+    It tracks the in-flight requests, binds a `RequestTimings` to the request context so the lower layers can
+    report their stages, and records the request and stage latency histograms per route once the response is sent.
+
+    Args:
+        app (ASGIApp): The wrapped ASGI application.
+        metrics (MetricsService): The metrics service receiving the measurements.
+
+    """
+
+    def __init__(self, app: ASGIApp, metrics: MetricsService) -> None:
+        """Initialize the MetricsMiddleware and declare its metrics."""
+        self.app = app
+        self.metrics = metrics
+        self.in_flight = 0
+        metrics.gauge(IN_FLIGHT, "Amount of HTTP requests being served.")
+        metrics.add_collector(self.__collect)
+        metrics.histogram(REQUEST_DURATION, "HTTP request latency.", ("route", "method", "status"))
+        metrics.histogram(STAGE_DURATION, "Time spent per request stage.", ("route", "stage"))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        timings = RequestTimings()
+        token = current_timings.set(timings)
+        self.in_flight += 1
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = perf_counter() - start
+            self.in_flight -= 1
+            current_timings.reset(token)
+            self.__record(scope, str(status_code), elapsed, timings)
+
+    def __collect(self) -> None:
+        # Counted on the event loop thread without the metrics service, the gauge is only refreshed when exposed
+        self.metrics.set_gauge(IN_FLIGHT, self.in_flight)
+
+    def __record(self, scope: Scope, status_code: str, elapsed: float, timings: RequestTimings) -> None:
+        route = getattr(scope.get("route"), "path", "unmatched")
+        self.metrics.observe(REQUEST_DURATION, elapsed, route, scope["method"], status_code)
+        framework = (max(elapsed - timings.accounted, 0.0), (route, Stage.FRAMEWORK))
+        if not timings.stages:
+            # Such as the health checks and the metrics, the whole request is framework time
+            self.metrics.observe_many(STAGE_DURATION, (framework,))
+            return
+        stages = [(seconds, (route, name)) for name, seconds in timings.stages.items()]
+        stages.append(framework)
+        self.metrics.observe_many(STAGE_DURATION, stages)
@@ -0,0 +1,36 @@
+from time import perf_counter
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from domain_account.adapters.interfaces.profiling_service import ProfilingService
+
+ADMIN_PREFIX = "/admin/"
+
+
+class ProfilingMiddleware:
+    """ASGI middleware telling the profiling service about every finished HTTP request.
+
+    The administration routes are left out, a profiling request lasts as long as the session it runs.
+
+    Args:
+        app (ASGIApp): The wrapped ASGI application.
+        profiling (ProfilingService): The profiling service of the current worker.
+
+    """
+
+    def __init__(self, app: ASGIApp, profiling: ProfilingService) -> None:
+        """Initialize the ProfilingMiddleware."""
+        self.app = app
+        self.profiling = profiling
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(ADMIN_PREFIX):
+            await self.app(scope, receive, send)
+            return
+
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            route = getattr(scope.get("route"), "path", "unmatched")
+            self.profiling.request_finished(route, scope["method"], start, perf_counter() - start)
@@ -0,0 +1,110 @@
+import hashlib
+import math
+from collections import OrderedDict
+
+from starlette import status
+from starlette.responses import JSONResponse
+from starlette.routing import Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from domain_account.adapters.instrumentation import RequestIdentity, current_identity
+from domain_account.adapters.interfaces.metrics_service import MetricsService
+from domain_account.adapters.interfaces.rate_limit_service import RateLimitService
+
+from .traffic_recording_middleware import METRICS_PATH
+
+RATE_LIMITED = "rate_limited_requests_total"
+# The bearer tokens whose user is known, so the clients are limited per user rather than per token
+MAX_KNOWN_TOKENS = 10_000
+
+
+class RateLimitingMiddleware:
+    """ASGI middleware rejecting the requests over the rate limits with 429, before they are authenticated.
+
+    A client is identified without verifying its bearer token: by the user the token was authenticated as, when a
+    previous request with the token was, by a digest of the token otherwise, and by its IP address without a token.
+    Each client has a token bucket on each route, and each route one for all its clients. A limited request is
+    answered at once with a `Retry-After` header, without verifying the token or reading the database. The metrics
+    route is left out, it is not client traffic.
+
+    Args:
+        app (ASGIApp): The wrapped ASGI application.
+        limiter (RateLimitService): The token buckets of the clients and routes.
+        metrics (MetricsService): The metrics service counting the limited requests.
+
+    """
+
+    def __init__(self, app: ASGIApp, limiter: RateLimitService, metrics: MetricsService) -> None:
+        """Initialize the RateLimitingMiddleware and declare its metrics."""
+        self.app = app
+        self.limiter = limiter
+        self.metrics = metrics
+        self.__token_users: OrderedDict[str, str] = OrderedDict()
+        metrics.counter(RATE_LIMITED, "HTTP requests rejected by a rate limit.", ("route", "limit"))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] == METRICS_PATH:
+            await self.app(scope, receive, send)
+            return
+
+        route = self.__route(scope)
+        token = self.__token_digest(scope)
+        client = self.__client(scope, token)
+        for limit_name, key, limit in (
+            ("client", f"{route}|{client}", self.limiter.client_limit),
+            ("route", route, self.limiter.route_limit),
+        ):
+            wait = await self.limiter.acquire(key, limit) if limit is not None else 0
+            if wait:
+                self.metrics.increment(RATE_LIMITED, route, limit_name)
+                await self.__reject(wait)(scope, receive, send)
+                return
+
+        # Shared with the other middlewares listening for the identity, whichever of them binds it first
+        identity = current_identity.get() or RequestIdentity()
+        identity_token = current_identity.set(identity)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_identity.reset(identity_token)
+            if token is not None and identity.uid is not None:
+                self.__remember(token, identity.uid)
+
+    @staticmethod
+    def __route(scope: Scope) -> str:
+        # Routed here, so the limited requests are labelled with their route by the middlewares around this one
+        app = scope.get("app")
+        for route in getattr(getattr(app, "router", None), "routes", ()):
+            match, _ = route.matches(scope)
+            if match != Match.NONE:
+                scope["route"] = route
+                return str(route.path)
+        return "unmatched"
+
+    @staticmethod
+    def __token_digest(scope: Scope) -> str | None:
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                return hashlib.blake2b(value, digest_size=16).hexdigest()
+        return None
+
+    def __client(self, scope: Scope, token: str | None) -> str:
+        if token is None:
+            client = scope.get("client")
+            return f"ip:{client[0] if client else 'unknown'}"
+        uid = self.__token_users.get(token)
+        return f"uid:{uid}" if uid is not None else f"token:{token}"
+
+    def __remember(self, token: str, uid: str) -> None:
+        self.__token_users.pop(token, None)
+        self.__token_users[token] = uid
+        if len(self.__token_users) > MAX_KNOWN_TOKENS:
+            self.__token_users.popitem(last=False)
+
+    @staticmethod
+    def __reject(wait: float) -> JSONResponse:
+        retry_after = max(1, math.ceil(wait))
+        content = {"msg": "error", "errors": {"RateLimited": f"Too many requests, retry in {retry_after} seconds"}}
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS, content=content, headers={"Retry-After": str(retry_after)}
+        )
@@ -0,0 +1,67 @@
+import logging
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from domain_account.adapters.instrumentation import (
+    RequestIdentity,
+    correlation_id_from,
+    current_correlation_id,
+    current_identity,
+    current_timings,
+)
+
+
+class RequestLoggingMiddleware:
+    """ASGI middleware logging one structured record per HTTP request.
+
+    It binds the correlation ID of the request, taken from `X-Cloud-Trace-Context` or generated, so every record
+    logged while serving the request carries it, and binds a `RequestIdentity` so the authenticated user is known.
+    Once the response is sent, it logs the route, status, latency, stage timings and user in the `request` extra;
+    turning them into JSON, and hashing the user UID, is left to the logging handlers, off the event loop.
+
+    Args:
+        app (ASGIApp): The wrapped ASGI application.
+
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the RequestLoggingMiddleware."""
+        self._logger = logging.getLogger(f"{self.__class__.__name__}")
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        identity = current_identity.get() or RequestIdentity()
+        identity_token = current_identity.set(identity)
+        correlation_token = current_correlation_id.set(correlation_id_from(scope["headers"]))
+        timings = current_timings.get()
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = perf_counter() - start
+            if self._logger.isEnabledFor(logging.INFO):
+                route = getattr(scope.get("route"), "path", "unmatched")
+                request = {
+                    "method": scope["method"],
+                    "route": route,
+                    "status": status_code,
+                    "duration_ms": round(elapsed * 1000, 3),
+                    "stages_ms": {} if timings is None else {k: round(v * 1000, 3) for k, v in timings.stages.items()},
+                    "uid": identity.uid,
+                }
+                self._logger.info("%s %s %s", scope["method"], route, status_code, extra={"request": request})
+            current_correlation_id.reset(correlation_token)
+            current_identity.reset(identity_token)
@@ -0,0 +1,75 @@
+import time
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from domain_account.adapters.instrumentation import RequestIdentity, current_identity
+from domain_account.adapters.interfaces.traffic_recording_service import TrafficRecordingService
+
+from .profiling_middleware import ADMIN_PREFIX
+
+METRICS_PATH = "/metrics"
+MAX_RECORDED_BODY = 64 * 1024
+
+
+class TrafficRecordingMiddleware:
+    """ASGI middleware handing every finished HTTP request to the traffic recording service.
+
+    It keeps a copy of the request body as the application reads it, and binds a `RequestIdentity` to the request
+    context so the authentication can tell which user the request belongs to. The administration and metrics routes
+    are left out, they are not user traffic.
+
+    Args:
+        app (ASGIApp): The wrapped ASGI application.
+        recording (TrafficRecordingService): The traffic recording service of the current worker.
+
+    """
+
+    def __init__(self, app: ASGIApp, recording: TrafficRecordingService) -> None:
+        """Initialize the TrafficRecordingMiddleware."""
+        self.app = app
+        self.recording = recording
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(ADMIN_PREFIX) or scope["path"] == METRICS_PATH:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        chunks: list[bytes] = []
+        size = 0
+
+        async def receive_wrapper() -> Message:
+            nonlocal size
+            message = await receive()
+            if message["type"] == "http.request" and size < MAX_RECORDED_BODY:
+                chunk = message.get("body", b"")
+                chunks.append(chunk[: MAX_RECORDED_BODY - size])
+                size += len(chunk)
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        # Shared with the other middlewares listening for the identity, whichever of them binds it first
+        identity = current_identity.get() or RequestIdentity()
+        token = current_identity.set(identity)
+        started = time.time()
+        start = perf_counter()
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            elapsed = perf_counter() - start
+            current_identity.reset(token)
+            self.recording.record(
+                scope["method"],
+                getattr(scope.get("route"), "path", "unmatched"),
+                status_code,
+                started,
+                elapsed,
+                identity.uid,
+                b"".join(chunks),
+            )
@@ -1,3 +1,16 @@
-from .account_repository import AccountRepository
+from .account_repository import AccountRepository, CpfCollision
+from .event_repository import EventRepository
+from .idempotency_repository import IdempotencyRepository
+from .postal_code_repository import PostalCodeRepository
+from .user_cache_repository import UserCacheRepository
+from .user_stats_repository import UserStatsRepository
 
-__all__ = ["AccountRepository"]
+__all__ = [
+    "AccountRepository",
+    "CpfCollision",
+    "EventRepository",
+    "IdempotencyRepository",
+    "PostalCodeRepository",
+    "UserCacheRepository",
+    "UserStatsRepository",
+]
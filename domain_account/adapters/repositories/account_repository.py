@@ -1,22 +1,49 @@
-from typing import Any
+import asyncio
+import re
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Iterator, NamedTuple
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
-from domain_account.adapters.interfaces.document_database_service import DocumentDatabaseService
+from domain_account.adapters.instrumentation import Stage, stage
+from domain_account.adapters.interfaces.document_database_service import (
+    DocumentDatabaseService,
+    after_commit,
+    session_options,
+)
+from domain_account.adapters.interfaces.keyed_hash_service import KeyedHashService
+from domain_account.adapters.interfaces.negative_cache_service import NegativeCacheService
+from domain_account.adapters.interfaces.write_durability_service import WriteDurabilityService
 from domain_account.business.ports import (
+    FindUsersByCpfInputPort,
+    ListUsersInputPort,
     RegisterInputPort,
     RetrieveUserInputPort,
+    UpdateAccountInputPort,
     UpdateAddressInputPort,
     UpdateCpfInputPort,
 )
 from domain_account.business.services import AccountService
-from domain_account.models import User
+from domain_account.models import PartialUser, RegisteredUser, User
 
-from .exceptions import UserNotFound
+from .exceptions import CpfAlreadyRegistered, UserAlreadyRegistered, UserNotFound
 from .interfaces import Repository
+from .user_stats_repository import Location, UserStatsRepository
 
 ProviderType = DocumentDatabaseService[AsyncIOMotorClient, AsyncIOMotorDatabase]
 
+_NOT_DIGIT = re.compile(r"\D")
+
+
+class CpfCollision(NamedTuple):
+    """A user whose CPF hash could not be set, since another user holds the same CPF."""
+
+    uid: str
+    holder: str | None
+
 
 class AccountRepository(
     Repository[DocumentDatabaseService[AsyncIOMotorClient, AsyncIOMotorDatabase]],
@@ -27,64 +54,300 @@ class AccountRepository(
     This class extends `Repository`, which defines the basic repository interface, and `AccountService`,
     which provides business logic for account-related operations.
 
+    CPFs are also stored as `cpf_hash`, the keyed hash of their digits, under a unique index: lookups by CPF and the
+    uniqueness check of the writes go through that index, and the raw CPFs are never indexed.
+
+    The writes changing where a user lives, its city or its CEP, report the move to the user statistics.
+
+    The UIDs found unregistered are remembered in a negative cache, so the signed up users probing their account
+    before registering it do not query the database again: registering a UID invalidates it.
+
+    Each write operation is acknowledged with the durability the policy sets for it, through a view of the users
+    collection with its write concern. The writes join the transaction of the current task when there is one,
+    acknowledged as a whole on commit, and report their moves to the statistics once it committed.
+
     Args:
         provider (ProviderType): An instance of `DocumentDatabaseService` providing access to the document database.
+        cpf_hasher (KeyedHashService): The keyed hash of the stored CPFs.
+        stats (UserStatsRepository): The user statistics per city and CEP region.
+        unknown_uids (NegativeCacheService): The negative cache of the UIDs not registered.
+        durability (WriteDurabilityService): The durability of each write operation.
 
     Attributes:
         _provider (ProviderType): The provider for accessing the document database.
         __users_collection: Collection in the document database where user records are stored.
+        __cpf_hasher (KeyedHashService): The keyed hash of the stored CPFs.
+        __stats (UserStatsRepository): The user statistics per city and CEP region.
+        __unknown_uids (NegativeCacheService): The negative cache of the UIDs not registered.
+        __durability (WriteDurabilityService): The durability of each write operation.
 
     Methods:
         register(port): Registers a new user account in the database.
         get_user(port): Retrieves a user from the database by UID.
         update_address(port): Updates a user's address in the database.
         update_cpf(port): Updates a user's CPF in the database.
+        update_account(port): Updates a user's address and CPF in the database at once.
+        find_users_by_cpf(port): Finds the users registered with some CPFs.
+        list_users(port): Lists the registered users a page at a time, in UID order.
+        create_indexes(): Creates the indexes the repository relies on.
+        backfill_cpf_hashes(batch_size): Sets the CPF hash of the users registered before it was stored.
     """
 
-    def __init__(self, provider: ProviderType) -> None:
-        """Initialize the AccountRepository with a document database provider."""
+    def __init__(
+        self,
+        provider: ProviderType,
+        cpf_hasher: KeyedHashService,
+        stats: UserStatsRepository,
+        unknown_uids: NegativeCacheService,
+        durability: WriteDurabilityService,
+    ) -> None:
+        """Initialize the AccountRepository with a document database provider, the keyed hash of the CPFs, the
+        user statistics, the negative cache of the UIDs and the durability of the writes."""
         super().__init__(provider)
         self.__users_collection = self._provider.database["users"]
+        self.__cpf_hasher = cpf_hasher
+        self.__stats = stats
+        self.__unknown_uids = unknown_uids
+        self.__durability = durability
+
+    async def create_indexes(self) -> None:
+        """Create the indexes the repository relies on, nothing is done for the ones existing already.
+
+        The CPF hash index is sparse, so the users registered before the hash was introduced do not collide on a
+        missing value: they are found by CPF, and checked for uniqueness, once their hash is backfilled.
+
+        The listing is sorted on the UID, and the UID ends the compound indexes of its filters, so every page, with
+        or without a filter, is a bounded scan of an index starting where the previous page stopped. The UID index is
+        unique: a page starting after a UID would skip the other users holding it.
+        """
+        await self.__users_collection.create_index("cpf_hash", unique=True, sparse=True)
+        await self.__users_collection.create_index("uid", unique=True)
+        await self.__users_collection.create_index([("address.city", ASCENDING), ("uid", ASCENDING)])
+        await self.__users_collection.create_index([("address.cep", ASCENDING), ("uid", ASCENDING)])
+
+    async def backfill_cpf_hashes(self, batch_size: int = 500) -> tuple[int, list[CpfCollision]]:
+        """Set the CPF hash of the users registered before it was stored, so they are found and checked by CPF.
+
+        The users missing a hash are read in UID order, `batch_size` at a time, and their hash set from their CPF
+        with the normalisation of the writes, unless a write set it meanwhile. A CPF already held by another user is
+        reported rather than failing the backfill: both users keep their CPF, and the one without a hash stays
+        invisible to the lookups by CPF until support resolves the duplicate and the backfill runs again.
+
+        Args:
+            batch_size (int): The amount of users read and updated concurrently.
+
+        Returns:
+            tuple[int, list[CpfCollision]]: The amount of users hashed, and the users whose CPF another one holds.
+        """
+        hashed, after = 0, ""
+        collisions: list[CpfCollision] = []
+        while True:
+            cursor = self.__users_collection.find(
+                {"uid": {"$gt": after}, "cpf": {"$exists": True}, "cpf_hash": {"$exists": False}},
+                {"_id": 0, "uid": 1, "cpf": 1},
+            )
+            users: list[dict[str, Any]] = await cursor.sort("uid", ASCENDING).limit(batch_size).to_list(batch_size)
+            if not users:
+                return hashed, collisions
+            after = users[-1]["uid"]
+            results = await asyncio.gather(*(self.__backfill_cpf_hash(user["uid"], user["cpf"]) for user in users))
+            hashed += sum(result is None for result in results)
+            collisions.extend(result for result in results if result is not None)
 
     async def register(self, port: RegisterInputPort) -> None:
         """Register a new user account in the database.
 
         Args:
             port (RegisterInputPort): The input port containing user account information.
+
+        Raises:
+            UserAlreadyRegistered: If a user is registered with the same UID.
+            CpfAlreadyRegistered: If another user is registered with the same CPF.
         """
-        await self.__users_collection.insert_one(port.model_dump())
+        with self.__unique_keys(), stage(Stage.DATABASE):
+            await self.__users("register").insert_one(
+                {**port.model_dump(exclude_none=True), "cpf_hash": self.__cpf_hash(port.cpf)}, **session_options()
+            )
+        self.__unknown_uids.discard(port.uid)
+        await after_commit(partial(self.__stats.move, None, (port.address.city, port.address.cep)))
 
-    async def get_user(self, port: RetrieveUserInputPort) -> User:
+    async def get_user(self, port: RetrieveUserInputPort) -> User | PartialUser:
         """Retrieve a user from the database by UID.
 
+        When the port selects fields, they are projected by the database and the rest is never loaded. A UID found
+        unregistered recently is not looked up again.
+
         Args:
             port (RetrieveUserInputPort): The input port containing the UID of the user to retrieve.
 
         Returns:
-            User: The user retrieved from the database.
+            User | PartialUser: The user retrieved from the database, partial when fields are selected.
 
         Raises:
             UserNotFound: If no user is found with the provided UID.
         """
-        user: dict[str, Any] | None = await self.__users_collection.find_one({"uid": port.uid})
+        if port.uid in self.__unknown_uids:
+            raise UserNotFound()
+        epoch = self.__unknown_uids.epoch()
+        projection = {"_id": 0, **{field: 1 for field in port.fields}} if port.fields is not None else None
+        with stage(Stage.DATABASE):
+            user: dict[str, Any] | None = await self.__users_collection.find_one({"uid": port.uid}, projection)
         if user:
-            return User(**user)
+            return User(**user) if port.fields is None else PartialUser(**user)
+        self.__unknown_uids.add(port.uid, epoch)
         raise UserNotFound()
 
-    async def update_address(self, port: UpdateAddressInputPort) -> None:
-        """Update a user's address in the database.
+    async def update_address(self, port: UpdateAddressInputPort) -> bool:
+        """Update the provided fields of a user's address in the database, leaving the other ones untouched.
 
         Args:
             port (UpdateAddressInputPort): The input port containing the UID and updated address information.
+
+        Returns:
+            bool: Whether a user is registered with the UID, False as well when no field is provided.
         """
-        update = port.model_dump()
-        uid = update.pop("uid")
-        await self.__users_collection.update_one({"uid": uid}, {"address": update})
+        fields = self.__address_paths(port.model_dump(exclude={"uid"}, exclude_none=True))
+        if not fields:
+            return False
+        return await self.__set("update_address", port.uid, fields)
 
-    async def update_cpf(self, port: UpdateCpfInputPort) -> None:
+    async def update_cpf(self, port: UpdateCpfInputPort) -> bool:
         """Update a user's CPF in the database.
 
         Args:
             port (UpdateCpfInputPort): The input port containing the UID and updated CPF information.
+
+        Returns:
+            bool: Whether a user is registered with the UID.
+
+        Raises:
+            CpfAlreadyRegistered: If another user is registered with the same CPF.
+        """
+        update = {"cpf": port.cpf, "cpf_hash": self.__cpf_hash(port.cpf)}
+        with self.__unique_keys(), stage(Stage.DATABASE):
+            result = await self.__users("update_cpf").update_one(
+                {"uid": port.uid}, {"$set": update}, **session_options()
+            )
+        return bool(result.matched_count)
+
+    async def update_account(self, port: UpdateAccountInputPort) -> bool:
+        """Update a user's address and CPF in the database with a single update, skipping the ones not provided.
+
+        Args:
+            port (UpdateAccountInputPort): The input port containing the UID and the updated information.
+
+        Returns:
+            bool: Whether a user is registered with the UID, False as well when no field is provided.
+
+        Raises:
+            CpfAlreadyRegistered: If another user is registered with the same CPF.
         """
-        await self.__users_collection.update_one({"uid": port.uid}, {"cpf": port.cpf})
+        fields = self.__address_paths(port.address.model_dump(exclude_none=True)) if port.address is not None else {}
+        if port.cpf is not None:
+            fields.update(cpf=port.cpf, cpf_hash=self.__cpf_hash(port.cpf))
+        if not fields:
+            return False
+        with self.__unique_keys():
+            return await self.__set("update_account", port.uid, fields)
+
+    async def find_users_by_cpf(self, port: FindUsersByCpfInputPort) -> list[RegisteredUser]:
+        """Find the users registered with the provided CPFs, through the CPF hash index.
+
+        Args:
+            port (FindUsersByCpfInputPort): The input port containing the CPFs to look up, formatted or not.
+
+        Returns:
+            list[RegisteredUser]: The users found, the CPFs not registered are left out.
+        """
+        hashes = list({self.__cpf_hash(cpf) for cpf in port.cpfs})
+        cursor = self.__users_collection.find({"cpf_hash": {"$in": hashes}}, {"_id": 0, "cpf_hash": 0})
+        with stage(Stage.DATABASE):
+            users: list[dict[str, Any]] = await cursor.to_list(length=len(hashes))
+        return [RegisteredUser(**user) for user in users]
+
+    async def list_users(self, port: ListUsersInputPort) -> list[RegisteredUser]:
+        """List the registered users in UID order, starting after the UID of the port, through the UID indexes.
+
+        Args:
+            port (ListUsersInputPort): The input port containing the UID to start after, the page size and the
+                filters.
+
+        Returns:
+            list[RegisteredUser]: At most `port.limit` users, in UID order.
+        """
+        query: dict[str, Any] = {}
+        if port.city is not None:
+            query["address.city"] = port.city
+        if port.cep is not None:
+            query["address.cep"] = port.cep
+        if port.after is not None:
+            query["uid"] = {"$gt": port.after}
+        cursor = self.__users_collection.find(query, {"_id": 0, "cpf_hash": 0}).sort("uid", ASCENDING).limit(port.limit)
+        with stage(Stage.DATABASE):
+            users: list[dict[str, Any]] = await cursor.to_list(length=port.limit)
+        return [RegisteredUser(**user) for user in users]
+
+    def __users(self, operation: str) -> Any:
+        # The users collection acknowledging the writes of an operation with the durability configured for it
+        write_concern = self.__durability.write_concern(operation)
+        if write_concern is None:
+            return self.__users_collection
+        return self.__users_collection.with_options(write_concern=write_concern)
+
+    async def __set(self, operation: str, uid: str, fields: dict[str, Any]) -> bool:
+        users = self.__users(operation)
+        if "address.city" not in fields and "address.cep" not in fields:
+            with stage(Stage.DATABASE):
+                result = await users.update_one({"uid": uid}, {"$set": fields}, **session_options())
+            return bool(result.matched_count)
+        # Moving the user: the location it moves from comes back with the update, in the same round trip
+        with stage(Stage.DATABASE):
+            user: dict[str, Any] | None = await users.find_one_and_update(
+                {"uid": uid},
+                {"$set": fields},
+                {"_id": 0, "address.city": 1, "address.cep": 1},
+                return_document=ReturnDocument.BEFORE,
+                **session_options(),
+            )
+        if user is None:
+            return False
+        address = user.get("address", {})
+        before: Location = (address.get("city"), address.get("cep"))
+        after: Location = (fields.get("address.city", before[0]), fields.get("address.cep", before[1]))
+        await after_commit(partial(self.__stats.move, before, after))
+        return True
+
+    async def __backfill_cpf_hash(self, uid: str, cpf: str) -> CpfCollision | None:
+        cpf_hash = self.__cpf_hash(cpf)
+        try:
+            await self.__users("update_cpf").update_one(
+                {"uid": uid, "cpf_hash": {"$exists": False}}, {"$set": {"cpf_hash": cpf_hash}}
+            )
+        except DuplicateKeyError as error:
+            if "cpf_hash" not in (error.details or {}).get("keyPattern", {}):
+                raise
+            holder = await self.__users_collection.find_one({"cpf_hash": cpf_hash}, {"_id": 0, "uid": 1})
+            return CpfCollision(uid, holder["uid"] if holder else None)
+        return None
+
+    def __cpf_hash(self, cpf: str) -> str:
+        # Formatted and bare CPFs ("123.456.789-01" and "12345678901") are the same CPF, so they hash the same
+        return self.__cpf_hasher.digest(_NOT_DIGIT.sub("", cpf))
+
+    @staticmethod
+    @contextmanager
+    def __unique_keys() -> Iterator[None]:
+        try:
+            yield
+        except DuplicateKeyError as error:
+            key_pattern = (error.details or {}).get("keyPattern", {})
+            if "cpf_hash" in key_pattern:
+                raise CpfAlreadyRegistered() from error
+            if "uid" in key_pattern:
+                raise UserAlreadyRegistered() from error
+            raise
+
+    @staticmethod
+    def __address_paths(address: dict[str, Any]) -> dict[str, Any]:
+        # Dotted paths set the given fields only, setting "address" would replace the whole embedded document
+        return {f"address.{field}": value for field, value in address.items()}
@@ -0,0 +1,64 @@
+from typing import Awaitable, Callable, TypeVar
+
+from domain_account.adapters.instrumentation import Stage, stage
+from domain_account.adapters.interfaces.event_outbox_service import EventOutboxService, OutboxMessage
+from domain_account.business.services import EventService
+from domain_account.models import AccountEvent
+
+T = TypeVar("T")
+
+
+class EventRepository(EventService):
+    """A repository class emitting the account events through an outbox, published to a broker in the background.
+
+    Every event becomes a message keyed by the user UID, whose body is the JSON of the event with its `type`: the
+    fields left unset, such as the address fields an update did not change, are left out.
+
+    Args:
+        outbox (EventOutboxService): The outbox storing the messages until the broker received them.
+
+    Attributes:
+        __outbox (EventOutboxService): The outbox storing the messages until the broker received them.
+
+    The writes emitting events run in the transactions of the outbox: the events are stored with the write that
+    emitted them when the outbox shares its database.
+
+    Methods:
+        emit(events): Stores the events in the outbox, to be published.
+        transaction(write): Runs a write and the storage of its events in a transaction of the outbox.
+    """
+
+    def __init__(self, outbox: EventOutboxService) -> None:
+        """Initialize the EventRepository with the outbox of the messages."""
+        self.__outbox = outbox
+
+    async def transaction(self, write: Callable[[], Awaitable[T]]) -> T:
+        """Run a write and the storage of its events in a single transaction of the outbox, when it has them.
+
+        Args:
+            write (Callable[[], Awaitable[T]]): The write, emitting its events once done.
+
+        Returns:
+            T: What the write returned.
+        """
+        return await self.__outbox.transaction(write)
+
+    async def emit(self, events: list[AccountEvent]) -> None:
+        """Store the events of a write in the outbox, in order, without waiting for the broker.
+
+        Args:
+            events (list[AccountEvent]): The events of the write.
+        """
+        if not events:
+            return
+        messages = [
+            OutboxMessage(
+                id=event.event_id,
+                key=event.uid,
+                occurred_at=event.occurred_at,
+                body=event.model_dump(mode="json", exclude_none=True),
+            )
+            for event in events
+        ]
+        with stage(Stage.DATABASE):
+            await self.__outbox.append(messages)
@@ -37,3 +37,54 @@ class UserNotFound(RepositoriesException):
     def __init__(self) -> None:
         """Initialize the UserNotFound exception."""
         super().__init__("There is no User related to the provided UID")
+
+
+class UserAlreadyRegistered(RepositoriesException):
+    """
+    Exception raised when registering a user whose UID is already registered.
+
+    A UID holds a single account: registering it again, outside of the retries of an idempotent registration,
+    does not replace nor duplicate the account.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the UserAlreadyRegistered exception."""
+        super().__init__("There is already a User registered with the provided UID")
+
+
+class CpfAlreadyRegistered(RepositoriesException):
+    """
+    Exception raised when a CPF is already registered by another user.
+
+    This exception is raised when registering a user, or updating the CPF of a user, with a CPF that another
+    user of the repository holds already.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the CpfAlreadyRegistered exception."""
+        super().__init__("The provided CPF is already registered by another User")
+
+
+class IdempotencyKeyReused(RepositoriesException):
+    """
+    Exception raised when an idempotency key is sent with another request than the one it was used for.
+
+    A key identifies a single request, whose retries must be identical: a different request with the same key is
+    most likely a client bug, and replaying the response of the first one would hide it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the IdempotencyKeyReused exception."""
+        super().__init__("The provided Idempotency-Key was already used for another request")
+
+
+class IdempotencyKeyInProgress(RepositoriesException):
+    """
+    Exception raised when the request holding an idempotency key does not complete while a retry waits for it.
+
+    The retry can be sent again later, to get the response of the request once it completed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the IdempotencyKeyInProgress exception."""
+        super().__init__("A request with the provided Idempotency-Key is still in progress")
@@ -0,0 +1,167 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo.errors import DuplicateKeyError
+
+from domain_account.adapters.instrumentation import Stage, stage
+from domain_account.adapters.interfaces.document_database_service import DocumentDatabaseService
+from domain_account.adapters.interfaces.idempotency_service import IdempotencyService, StoredResponse
+
+from .exceptions import IdempotencyKeyInProgress, IdempotencyKeyReused
+from .interfaces import Repository
+
+ProviderType = DocumentDatabaseService[AsyncIOMotorClient, AsyncIOMotorDatabase]
+
+# How long the responses are replayed, the keys are dropped by a TTL index afterwards
+RETENTION = timedelta(hours=24)
+# How long a claim holds a key before it is considered abandoned by a worker that died, and taken over
+LEASE = timedelta(seconds=30)
+# How long a retry waits for the response of the request holding the key, and how often it looks in another worker
+WAIT_S = 10.0
+POLL_INTERVAL_S = 0.05
+
+
+class IdempotencyRepository(Repository[ProviderType], IdempotencyService):
+    """A repository class running a request once per idempotency key, and replaying its response to the retries.
+
+    The keys are stored in the `idempotency_keys` collection, whose `_id` is the key: claiming a key inserts its
+    document, pending, and the unique `_id` lets a single request across all the workers claim it. The request
+    completes the document with its response, and a TTL index on `created_at` drops it after `RETENTION`.
+
+    A retry arriving while the key is claimed by a request of the same worker waits for the outcome of that request
+    without reading the database. A key claimed in another worker is read again every `POLL_INTERVAL_S`, up to
+    `WAIT_S`, and a claim older than `LEASE` is taken over, its worker having died before completing it.
+
+    Args:
+        provider (ProviderType): An instance of `DocumentDatabaseService` providing access to the document database.
+
+    Attributes:
+        _provider (ProviderType): The provider for accessing the document database.
+        __keys_collection: Collection in the document database where the idempotency keys are stored.
+        __in_flight: The fingerprint and the future outcome of the keys claimed by the requests of this worker.
+
+    Methods:
+        claim(key, fingerprint): Claims a key for a request, or waits for the response of the request holding it.
+        complete(key, response): Stores the response of the request holding a key.
+        release(key): Releases a key claimed by a request that failed.
+        create_indexes(): Creates the indexes the repository relies on.
+    """
+
+    def __init__(self, provider: ProviderType) -> None:
+        """Initialize the IdempotencyRepository with a document database provider."""
+        super().__init__(provider)
+        self.__keys_collection = self._provider.database["idempotency_keys"]
+        self.__in_flight: dict[str, tuple[str, asyncio.Future[StoredResponse | None]]] = {}
+
+    async def create_indexes(self) -> None:
+        """Create the indexes the repository relies on, nothing is done for the ones existing already."""
+        await self.__keys_collection.create_index("created_at", expireAfterSeconds=int(RETENTION.total_seconds()))
+
+    async def claim(self, key: str, fingerprint: str) -> StoredResponse | None:
+        """Claim a key for a request, or wait for the response of the request holding it.
+
+        Args:
+            key (str): The idempotency key, scoped to the route and the user.
+            fingerprint (str): A digest of the request, so a key is not reused for another request.
+
+        Returns:
+            StoredResponse | None: The response of the request that held the key, to replay, None when the key was
+                claimed and the request must run.
+
+        Raises:
+            IdempotencyKeyReused: If the key was used for another request.
+            IdempotencyKeyInProgress: If the request holding the key did not complete in time.
+        """
+        while key in self.__in_flight:
+            claimed_fingerprint, outcome = self.__in_flight[key]
+            if claimed_fingerprint != fingerprint:
+                raise IdempotencyKeyReused()
+            try:
+                # Shielded, so a retry giving up on the wait does not cancel the outcome the others wait for
+                stored = await asyncio.wait_for(asyncio.shield(outcome), WAIT_S)
+            except asyncio.TimeoutError:
+                raise IdempotencyKeyInProgress() from None
+            if stored is not None:
+                return stored
+        self.__in_flight[key] = (fingerprint, asyncio.get_running_loop().create_future())
+        try:
+            stored = await self.__claim(key, fingerprint)
+        except BaseException:
+            self.__settle(key, None)
+            raise
+        if stored is not None:
+            self.__settle(key, stored)
+        return stored
+
+    async def complete(self, key: str, response: StoredResponse) -> None:
+        """Store the response of the request holding a key, for its retries.
+
+        Args:
+            key (str): The idempotency key claimed.
+            response (StoredResponse): The response to replay.
+        """
+        try:
+            with stage(Stage.DATABASE):
+                await self.__keys_collection.update_one(
+                    {"_id": key, "state": "pending"},
+                    {"$set": {"state": "done", "status_code": response.status_code, "body": response.body}},
+                )
+        finally:
+            self.__settle(key, response)
+
+    async def release(self, key: str) -> None:
+        """Release a key claimed by a request that failed, so a retry runs it again.
+
+        Args:
+            key (str): The idempotency key claimed.
+        """
+        try:
+            with stage(Stage.DATABASE):
+                await self.__keys_collection.delete_one({"_id": key, "state": "pending"})
+        finally:
+            self.__settle(key, None)
+
+    async def __claim(self, key: str, fingerprint: str) -> StoredResponse | None:
+        deadline = time.monotonic() + WAIT_S
+        while True:
+            now = datetime.now(timezone.utc)
+            try:
+                with stage(Stage.DATABASE):
+                    await self.__keys_collection.insert_one(
+                        {
+                            "_id": key,
+                            "fingerprint": fingerprint,
+                            "state": "pending",
+                            "claimed_at": now,
+                            "created_at": now,
+                        }
+                    )
+                return None
+            except DuplicateKeyError:
+                pass
+            with stage(Stage.DATABASE):
+                record: dict[str, Any] | None = await self.__keys_collection.find_one({"_id": key})
+            if record is None:
+                # Released, or expired, since the insert: claim it again
+                continue
+            if record["fingerprint"] != fingerprint:
+                raise IdempotencyKeyReused()
+            if record["state"] == "done":
+                return StoredResponse(record["status_code"], bytes(record["body"]))
+            with stage(Stage.DATABASE):
+                taken = await self.__keys_collection.update_one(
+                    {"_id": key, "state": "pending", "claimed_at": {"$lt": now - LEASE}}, {"$set": {"claimed_at": now}}
+                )
+            if taken.modified_count:
+                return None
+            if time.monotonic() >= deadline:
+                raise IdempotencyKeyInProgress()
+            await asyncio.sleep(POLL_INTERVAL_S)
+
+    def __settle(self, key: str, stored: StoredResponse | None) -> None:
+        claimed = self.__in_flight.pop(key, None)
+        if claimed is not None:
+            claimed[1].set_result(stored)
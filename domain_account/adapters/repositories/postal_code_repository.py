@@ -0,0 +1,43 @@
+from domain_account.adapters.interfaces.postal_code_index_service import PostalCodeIndexService
+from domain_account.business.services import PostalCodeService
+from domain_account.models import PostalCodeLocation
+
+_SEPARATORS = str.maketrans("", "", ".- ")
+_CEP_LENGTH = 8
+
+
+class PostalCodeRepository(PostalCodeService):
+    """A repository class locating postal codes (CEPs) in a local postal code index.
+
+    Args:
+        index (PostalCodeIndexService): The postal code index.
+
+    Attributes:
+        __index (PostalCodeIndexService): The postal code index.
+
+    Methods:
+        locate(cep): Finds the locality of a postal code.
+    """
+
+    def __init__(self, index: PostalCodeIndexService) -> None:
+        """Initialize the PostalCodeRepository with the postal code index."""
+        self.__index = index
+
+    def locate(self, cep: str) -> PostalCodeLocation | None:
+        """Find the locality of a postal code in the index.
+
+        Args:
+            cep (str): The postal code, bare (`80010000`) or formatted (`80010-000`).
+
+        Returns:
+            PostalCodeLocation | None: The locality of the postal code, with the postal code as its 8 digits, None
+                when it is not 8 digits or does not exist.
+        """
+        digits = cep.translate(_SEPARATORS)
+        if len(digits) != _CEP_LENGTH or not digits.isascii() or not digits.isdecimal():
+            return None
+        record = self.__index.lookup(int(digits))
+        if record is None:
+            return None
+        city, state, street = record
+        return PostalCodeLocation(cep=digits, city=city, state=state, street_name=street or None)
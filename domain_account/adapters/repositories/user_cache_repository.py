@@ -0,0 +1,28 @@
+from domain_account.adapters.interfaces.response_cache_service import ResponseCacheService
+from domain_account.business.services import UserCacheService
+
+
+class UserCacheRepository(UserCacheService):
+    """A repository class invalidating what is cached about the users, the encoded responses read about them.
+
+    Args:
+        responses (ResponseCacheService): The cache of the responses read about the users, by UID.
+
+    Attributes:
+        __responses (ResponseCacheService): The cache of the responses read about the users, by UID.
+
+    Methods:
+        invalidate_user(uid): Drops the cached responses about a user.
+    """
+
+    def __init__(self, responses: ResponseCacheService) -> None:
+        """Initialize the UserCacheRepository with the cache of the responses about the users."""
+        self.__responses = responses
+
+    def invalidate_user(self, uid: str) -> None:
+        """Drop the cached responses about a user, every selection of fields.
+
+        Args:
+            uid (str): The UID of the user written.
+        """
+        self.__responses.invalidate(uid)
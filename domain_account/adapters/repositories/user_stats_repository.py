@@ -0,0 +1,126 @@
+from collections import Counter
+from typing import Any, Iterator
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import ReadPreference, ReplaceOne, UpdateOne
+
+from domain_account.adapters.instrumentation import Stage, stage
+from domain_account.adapters.interfaces.document_database_service import DocumentDatabaseService
+from domain_account.adapters.interfaces.write_durability_service import WriteDurabilityService
+from domain_account.business.ports import UserStatsInputPort
+from domain_account.business.services import UserStatsService
+from domain_account.types.cep import cep_region
+
+from .interfaces import Repository
+
+ProviderType = DocumentDatabaseService[AsyncIOMotorClient, AsyncIOMotorDatabase]
+
+# The city and the CEP of an address, either may be missing
+Location = tuple[str | None, str | None]
+
+
+class UserStatsRepository(Repository[ProviderType], UserStatsService):
+    """A repository class keeping the amount of registered users per city and per CEP region.
+
+    The counts are materialised in the `user_stats` collection, one document per city and per region, whose `_id` is
+    `<by>:<key>` (`city:Curitiba`, `cep_region:80010`). The account writes report every user moving in, out or
+    between locations to `move`, which applies the deltas with `$inc`, so reading a count is a single lookup by
+    `_id` and the users are never aggregated on the request path. `rebuild` recomputes every count from the users
+    for reconciliation, when a write died between the user update and the counts update.
+
+    Args:
+        provider (ProviderType): An instance of `DocumentDatabaseService` providing access to the document database.
+        durability (WriteDurabilityService): The durability of the writes, the counts are written as `user_stats`.
+
+    Attributes:
+        _provider (ProviderType): The provider for accessing the document database.
+        __stats_collection: Collection in the document database where the counts are stored.
+        __users_collection: Collection in the document database where user records are stored.
+
+    Methods:
+        count_users(port): Counts the registered users of a city or of a CEP region.
+        move(before, after): Moves a user from a location to another in the counts.
+        rebuild(): Recomputes every count from the registered users.
+    """
+
+    def __init__(self, provider: ProviderType, durability: WriteDurabilityService) -> None:
+        """Initialize the UserStatsRepository with a document database provider and the durability of the writes."""
+        super().__init__(provider)
+        self.__stats_collection = self._provider.database["user_stats"]
+        write_concern = durability.write_concern("user_stats")
+        if write_concern is not None:
+            self.__stats_collection = self.__stats_collection.with_options(write_concern=write_concern)
+        self.__users_collection = self._provider.database["users"]
+
+    async def count_users(self, port: UserStatsInputPort) -> int:
+        """Count the registered users of a city or of a CEP region, from their materialised count.
+
+        Args:
+            port (UserStatsInputPort): The input port containing the city or the CEP region.
+
+        Returns:
+            int: The amount of registered users, 0 for a city or region without any.
+        """
+        with stage(Stage.DATABASE):
+            stats: dict[str, Any] | None = await self.__stats_collection.find_one(
+                {"_id": f"{port.by}:{port.key}"}, {"_id": 0, "users": 1}
+            )
+        return stats["users"] if stats else 0
+
+    async def move(self, before: Location | None, after: Location | None) -> None:
+        """Move a user from a location to another in the counts, in a single round trip.
+
+        Args:
+            before (Location | None): Where the user was, None for a user registering.
+            after (Location | None): Where the user is, None for a user removed.
+        """
+        deltas: Counter[tuple[str, str]] = Counter()
+        deltas.subtract(self.__keys(before))
+        deltas.update(self.__keys(after))
+        operations = [
+            UpdateOne(
+                {"_id": f"{by}:{key}"}, {"$inc": {"users": delta}, "$setOnInsert": {"by": by, "key": key}}, upsert=True
+            )
+            for (by, key), delta in deltas.items()
+            if delta
+        ]
+        if not operations:
+            return
+        with stage(Stage.DATABASE):
+            await self.__stats_collection.bulk_write(operations, ordered=False)
+
+    async def rebuild(self) -> int:
+        """Recompute every count from the registered users, and drop the counts of the locations left empty.
+
+        The users are read from a secondary when there is one, so the rebuild does not load the primary. The writes
+        made while it runs may be counted twice or not at all: rebuild when the service is quiet.
+
+        Returns:
+            int: The amount of cities and CEP regions counted.
+        """
+        counts: Counter[tuple[str, str]] = Counter()
+        users = self.__users_collection.with_options(
+            read_preference=ReadPreference.SECONDARY_PREFERRED  # type: ignore[arg-type]
+        )
+        async for user in users.find({}, {"_id": 0, "address.city": 1, "address.cep": 1}):
+            address = user.get("address", {})
+            counts.update(self.__keys((address.get("city"), address.get("cep"))))
+        operations = [
+            ReplaceOne({"_id": f"{by}:{key}"}, {"by": by, "key": key, "users": count}, upsert=True)
+            for (by, key), count in counts.items()
+        ]
+        if operations:
+            await self.__stats_collection.bulk_write(operations, ordered=False)
+        await self.__stats_collection.delete_many({"_id": {"$nin": [f"{by}:{key}" for by, key in counts]}})
+        return len(counts)
+
+    @staticmethod
+    def __keys(location: Location | None) -> Iterator[tuple[str, str]]:
+        if location is None:
+            return
+        city, cep = location
+        if city:
+            yield "city", city
+        region = cep_region(cep) if cep else None
+        if region is not None:
+            yield "cep_region", region
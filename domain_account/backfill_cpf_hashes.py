@@ -0,0 +1,52 @@
+"""Set the CPF hash of the users registered before it was stored.
+
+Usage:
+    python -m domain_account.backfill_cpf_hashes [--batch 500]
+
+The lookups by CPF and the uniqueness check of the CPFs go through the `cpf_hash` of the users, which the writes
+maintain since it exists: the users registered before are not found by CPF until the backfill sets it, `--batch`
+users at a time. Run it once with the `CPF_HASH_KEY` of the service, while the service runs, and before partitioning
+the users. It can run again, only the users missing a hash are read. A CPF held by several users is reported by the
+UIDs involved, and left to support to resolve, the users missing its hash stay invisible to the lookups by CPF until
+the backfill runs again. The database is configured by the environment of the service.
+
+"""
+
+import argparse
+import asyncio
+
+from domain_account.adapters.repositories import CpfCollision
+from domain_account.main import AppBinding, configs
+
+
+async def backfill_cpf_hashes(app_binding: AppBinding, batch_size: int) -> tuple[int, list[CpfCollision]]:
+    """Set the CPF hash of the users of the bound database missing one.
+
+    Args:
+        app_binding (AppBinding): The binding of the service, its frameworks and adapters are bound.
+        batch_size (int): The amount of users updated concurrently.
+
+    Returns:
+        tuple[int, list[CpfCollision]]: The amount of users hashed, and the users whose CPF another one holds.
+    """
+    app_binding.bind_frameworks()
+    app_binding.bind_adapters()
+    await app_binding.frameworks.connect()
+    try:
+        return await app_binding.adapters.account_service().backfill_cpf_hashes(batch_size)
+    finally:
+        await app_binding.frameworks.disconnect()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch", type=int, default=500)
+    args = parser.parse_args()
+    hashed, collisions = asyncio.run(backfill_cpf_hashes(AppBinding(configs()), args.batch))
+    for collision in collisions:
+        print(f"CPF of user [{collision.uid}] already held by user [{collision.holder}]")
+    print(f"{hashed} users hashed, {len(collisions)} CPF collisions")
+
+
+if __name__ == "__main__":
+    main()
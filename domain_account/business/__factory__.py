@@ -4,13 +4,18 @@ from typing import Generic
 from typing_extensions import TypeVar
 
 from domain_account.business.use_case import (
+    BatchUseCase,
+    FindUsersByCpfUseCase,
+    ListUsersUseCase,
     RegisterUseCase,
     RetrieveUserUseCase,
+    UpdateAccountUseCase,
     UpdateAddressUseCase,
     UpdateCpfUseCase,
+    UserStatsUseCase,
 )
 
-from .services import AccountService
+from .services import AccountService, EventService, PostalCodeService, UserCacheService, UserStatsService
 
 T_account_service_co = TypeVar("T_account_service_co", bound=AccountService, covariant=True)
 
@@ -27,6 +32,22 @@ class AdaptersFactoryInterface(Generic[T_account_service_co], metaclass=ABCMeta)
     def account_service(self) -> T_account_service_co:
         """Abstract method to retrieve the account service instance."""
 
+    @abstractmethod
+    def postal_code_service(self) -> PostalCodeService | None:
+        """Abstract method to retrieve the postal code service instance, None when postal codes are not available."""
+
+    @abstractmethod
+    def user_stats_service(self) -> UserStatsService:
+        """Abstract method to retrieve the user stats service instance."""
+
+    @abstractmethod
+    def user_cache_service(self) -> UserCacheService:
+        """Abstract method to retrieve the user cache service instance."""
+
+    @abstractmethod
+    def event_service(self) -> EventService | None:
+        """Abstract method to retrieve the event service instance, None when the events are not published."""
+
 
 class BusinessFactory:
     """
@@ -40,10 +61,21 @@ class BusinessFactory:
             `AdaptersFactoryInterface`, providing access to the necessary adapter services.
 
     Methods:
-        register_use_case(): Instantiate and return a RegisterUseCase with the configured account service.
+        register_use_case(): Instantiate and return a RegisterUseCase with the configured account, postal code,
+            user cache and event services.
         retrieve_user_use_case(): Instantiate and return a RetrieveUserUseCase with the configured account service.
-        update_address_use_case(): Instantiate and return a UpdateAddressUseCase with the configured account service.
-        update_cpf_use_case(): Instantiate and return a UpdateCpfUseCase with the configured account service.
+        update_address_use_case(): Instantiate and return a UpdateAddressUseCase with the configured account, postal
+            code, user cache and event services.
+        update_cpf_use_case(): Instantiate and return a UpdateCpfUseCase with the configured account, user cache and
+            event services.
+        update_account_use_case(): Instantiate and return a UpdateAccountUseCase with the configured account, postal
+            code, user cache and event services.
+        batch_use_case(): Instantiate and return a BatchUseCase with the configured account, postal code, user cache
+            and event services.
+        find_users_by_cpf_use_case(): Instantiate and return a FindUsersByCpfUseCase with the configured account
+            service.
+        list_users_use_case(): Instantiate and return a ListUsersUseCase with the configured account service.
+        user_stats_use_case(): Instantiate and return a UserStatsUseCase with the configured user stats service.
     """
 
     def __init__(self, adapters_factory: AdaptersFactoryInterface) -> None:
@@ -57,13 +89,20 @@ class BusinessFactory:
         self.__factory = adapters_factory
 
     def register_use_case(self) -> RegisterUseCase:
-        """Instantiate and return a RegisterUseCase with the configured account service.
+        """Instantiate and return a RegisterUseCase with the configured account, postal code, user cache and event
+        services.
 
         Returns:
-            RegisterUseCase: An instance of RegisterUseCase with the configured account service.
+            RegisterUseCase: An instance of RegisterUseCase with the configured account, postal code, user cache and
+                event services.
 
         """
-        return RegisterUseCase(service=self.__account_service)
+        return RegisterUseCase(
+            service=self.__account_service,
+            postal_codes=self.__postal_code_service,
+            cache=self.__user_cache_service,
+            events=self.__event_service,
+        )
 
     def retrieve_user_use_case(self) -> RetrieveUserUseCase:
         """
@@ -76,21 +115,89 @@ class BusinessFactory:
 
     def update_address_use_case(self) -> UpdateAddressUseCase:
         """
-        Instantiate and return a UpdateAddressUseCase with the configured account service.
+        Instantiate and return a UpdateAddressUseCase with the configured account, postal code, user cache and event
+        services.
 
         Returns:
-            UpdateAddressUseCase: An instance of UpdateAddressUseCase with the configured account service.
+            UpdateAddressUseCase: An instance of UpdateAddressUseCase with the configured account, postal code, user
+                cache and event services.
         """
-        return UpdateAddressUseCase(service=self.__account_service)
+        return UpdateAddressUseCase(
+            service=self.__account_service,
+            postal_codes=self.__postal_code_service,
+            cache=self.__user_cache_service,
+            events=self.__event_service,
+        )
 
     def update_cpf_use_case(self) -> UpdateCpfUseCase:
         """
-        Instantiate and return a UpdateCpfUseCase with the configured account service.
+        Instantiate and return a UpdateCpfUseCase with the configured account, user cache and event services.
 
         Returns:
-            UpdateCpfUseCase: An instance of UpdateCpfUseCase with the configured account service.
+            UpdateCpfUseCase: An instance of UpdateCpfUseCase with the configured account, user cache and event
+                services.
+        """
+        return UpdateCpfUseCase(
+            service=self.__account_service, cache=self.__user_cache_service, events=self.__event_service
+        )
+
+    def update_account_use_case(self) -> UpdateAccountUseCase:
         """
-        return UpdateCpfUseCase(service=self.__account_service)
+        Instantiate and return a UpdateAccountUseCase with the configured account, postal code, user cache and event
+        services.
+
+        Returns:
+            UpdateAccountUseCase: An instance of UpdateAccountUseCase with the configured account, postal code, user
+                cache and event services.
+        """
+        return UpdateAccountUseCase(
+            service=self.__account_service,
+            postal_codes=self.__postal_code_service,
+            cache=self.__user_cache_service,
+            events=self.__event_service,
+        )
+
+    def batch_use_case(self) -> BatchUseCase:
+        """
+        Instantiate and return a BatchUseCase with the configured account, postal code, user cache and event services.
+
+        Returns:
+            BatchUseCase: An instance of BatchUseCase with the configured account, postal code, user cache and event
+                services.
+        """
+        return BatchUseCase(
+            service=self.__account_service,
+            postal_codes=self.__postal_code_service,
+            cache=self.__user_cache_service,
+            events=self.__event_service,
+        )
+
+    def find_users_by_cpf_use_case(self) -> FindUsersByCpfUseCase:
+        """
+        Instantiate and return a FindUsersByCpfUseCase with the configured account service.
+
+        Returns:
+            FindUsersByCpfUseCase: An instance of FindUsersByCpfUseCase with the configured account service.
+        """
+        return FindUsersByCpfUseCase(service=self.__account_service)
+
+    def list_users_use_case(self) -> ListUsersUseCase:
+        """
+        Instantiate and return a ListUsersUseCase with the configured account service.
+
+        Returns:
+            ListUsersUseCase: An instance of ListUsersUseCase with the configured account service.
+        """
+        return ListUsersUseCase(service=self.__account_service)
+
+    def user_stats_use_case(self) -> UserStatsUseCase:
+        """
+        Instantiate and return a UserStatsUseCase with the configured user stats service.
+
+        Returns:
+            UserStatsUseCase: An instance of UserStatsUseCase with the configured user stats service.
+        """
+        return UserStatsUseCase(service=self.__factory.user_stats_service())
 
     @property
     def __account_service(self) -> AccountService:
@@ -101,3 +208,33 @@ class BusinessFactory:
             AccountService: An instance of the account service.
         """
         return self.__factory.account_service()
+
+    @property
+    def __postal_code_service(self) -> PostalCodeService | None:
+        """
+        Retrieve the postal code service instance.
+
+        Returns:
+            PostalCodeService | None: An instance of the postal code service, None when postal codes are not available.
+        """
+        return self.__factory.postal_code_service()
+
+    @property
+    def __user_cache_service(self) -> UserCacheService:
+        """
+        Retrieve the user cache service instance.
+
+        Returns:
+            UserCacheService: An instance of the user cache service.
+        """
+        return self.__factory.user_cache_service()
+
+    @property
+    def __event_service(self) -> EventService | None:
+        """
+        Retrieve the event service instance.
+
+        Returns:
+            EventService | None: An instance of the event service, None when the events are not published.
+        """
+        return self.__factory.event_service()
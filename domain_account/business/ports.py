@@ -1,12 +1,23 @@
-from domain_account.models import Address, User
+from typing import Literal
+
+from pydantic import Field, field_validator, model_validator
+
+from domain_account.models import Address, PartialAddress, PartialUser, RegisteredUser, User
+from domain_account.types.cep import cep_region
+from domain_account.types.cpf import Cpf
+from domain_account.types.page_cursor import PageCursor
 
 from .interfaces import InputPort, OutputPort
 
+# The fields a retrieval can select: a whole user field, or a single field of the address
+USER_FIELDS = frozenset([*User.model_fields, *(f"address.{field}" for field in Address.model_fields.keys())])
+
 
 class RegisterInputPort(User, InputPort):
-    """Input Port for register account"""
+    """Input Port for register account, the CPF is validated and normalised to its digits"""
 
     uid: str
+    cpf: Cpf
 
 
 class RegisterOutputPort(OutputPort):
@@ -15,8 +26,8 @@ class RegisterOutputPort(OutputPort):
     msg: str
 
 
-class UpdateAddressInputPort(Address, InputPort):
-    """Input Port for update address"""
+class UpdateAddressInputPort(PartialAddress, InputPort):
+    """Input Port for update address, only the provided fields change"""
 
     uid: str
 
@@ -28,10 +39,10 @@ class UpdateAddressOutputPort(OutputPort):
 
 
 class UpdateCpfInputPort(InputPort):
-    """Input Port for update cpf"""
+    """Input Port for update cpf, the CPF is validated and normalised to its digits"""
 
     uid: str
-    cpf: str
+    cpf: Cpf
 
 
 class UpdateCpfOutputPort(OutputPort):
@@ -40,13 +51,122 @@ class UpdateCpfOutputPort(OutputPort):
     msg: str
 
 
+class UpdateAccountInputPort(InputPort):
+    """Input Port for update the address and the cpf at once, the missing fields are left untouched"""
+
+    uid: str
+    address: PartialAddress | None = None
+    cpf: Cpf | None = None
+
+
+class UpdateAccountOutputPort(OutputPort):
+    """Output Port for update the address and the cpf at once"""
+
+    msg: str
+
+
 class RetrieveUserInputPort(InputPort):
-    """Input Port for retrieve a registred user"""
+    """Input Port for retrieve a registred user, only the selected fields when `fields` is given"""
 
     uid: str
+    fields: list[str] | None = None
+
+    @field_validator("fields")
+    @classmethod
+    def validate_fields(cls, fields: list[str] | None) -> list[str] | None:
+        """Check the selected fields against the User schema and drop the ones already selected by their parent."""
+        if fields is None:
+            return None
+        if not fields:
+            raise ValueError("Select at least one field.")
+        unknown = sorted(set(fields) - USER_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown fields {unknown}, expected some of {sorted(USER_FIELDS)}.")
+        # MongoDB rejects a projection holding both a path and its parent
+        return sorted(field for field in set(fields) if "." not in field or field.split(".")[0] not in fields)
+
+
+class RetrieveUserOutputPort(PartialUser, OutputPort):
+    """Output Port for retrieve a registred user, the fields not selected are left unset"""
 
+    msg: str
+
+
+class FindUsersByCpfInputPort(InputPort):
+    """Input Port for find registered users by CPF"""
 
-class RetrieveUserOutputPort(User, OutputPort):
-    """Output Port for retrieve a registred user"""
+    cpfs: list[str]
 
+
+class FindUsersByCpfOutputPort(OutputPort):
+    """Output Port for find registered users by CPF, the CPFs not registered are left out"""
+
+    users: list[RegisteredUser]
     msg: str
+
+
+MAX_PAGE_SIZE = 100
+
+
+class ListUsersInputPort(InputPort):
+    """Input Port for list registered users by UID, a page at a time, optionally of a city or a CEP only"""
+
+    after: PageCursor | None = None
+    limit: int = Field(default=50, ge=1, le=MAX_PAGE_SIZE)
+    city: str | None = None
+    cep: str | None = None
+
+
+class ListUsersOutputPort(OutputPort):
+    """Output Port for list registered users, the cursor of the next page is None on the last page"""
+
+    users: list[RegisteredUser]
+    next_cursor: str | None
+    msg: str
+
+
+class UserStatsInputPort(InputPort):
+    """Input Port for count the registered users of a city, or of a CEP region given as a CEP or its first digits"""
+
+    by: Literal["city", "cep_region"]
+    key: str
+
+    @model_validator(mode="after")
+    def normalise_region(self) -> "UserStatsInputPort":
+        """Cut a CEP to its region, the counts are kept per region."""
+        if self.by == "cep_region":
+            region = cep_region(self.key)
+            if region is None:
+                raise ValueError("A CEP region is the first 5 digits of a CEP.")
+            self.key = region
+        return self
+
+
+class UserStatsOutputPort(OutputPort):
+    """Output Port for count the registered users of a city or of a CEP region"""
+
+    by: str
+    key: str
+    users: int
+    msg: str
+
+
+class BatchInputPort(InputPort):
+    """Input Port for run account operations in order, each one is the input port of its use case"""
+
+    uid: str
+    operations: list[InputPort]
+
+
+class BatchResult(OutputPort):
+    """The outcome of one operation of a batch, its output port or the error it raised"""
+
+    output: OutputPort | None = None
+    error_type: str | None = None
+    error_msg: str | None = None
+
+
+class BatchOutputPort(OutputPort):
+    """Output Port for run account operations in order, one result per operation"""
+
+    results: list[BatchResult]
@@ -1,9 +1,21 @@
 from abc import ABCMeta, abstractmethod
+from typing import Awaitable, Callable, TypeVar
 
-from domain_account.models import User
+from domain_account.models import AccountEvent, PartialUser, PostalCodeLocation, RegisteredUser, User
 
 from .interfaces import Service
-from .ports import RegisterInputPort, RetrieveUserInputPort, UpdateAddressInputPort, UpdateCpfInputPort
+from .ports import (
+    FindUsersByCpfInputPort,
+    ListUsersInputPort,
+    RegisterInputPort,
+    RetrieveUserInputPort,
+    UpdateAccountInputPort,
+    UpdateAddressInputPort,
+    UpdateCpfInputPort,
+    UserStatsInputPort,
+)
+
+T = TypeVar("T")
 
 
 class AccountService(Service, metaclass=ABCMeta):
@@ -14,6 +26,9 @@ class AccountService(Service, metaclass=ABCMeta):
         get_user(port): Retrieve user information.
         update_address(port): Update user address.
         update_cpf(port): Update user CPF.
+        update_account(port): Update user address and CPF at once.
+        find_users_by_cpf(port): Find the users registered with some CPFs.
+        list_users(port): List the registered users a page at a time.
 
     """
 
@@ -26,28 +41,162 @@ class AccountService(Service, metaclass=ABCMeta):
         """
 
     @abstractmethod
-    async def get_user(self, port: RetrieveUserInputPort) -> User:
-        """Retrieve user information.
+    async def get_user(self, port: RetrieveUserInputPort) -> User | PartialUser:
+        """Retrieve user information, loading only the selected fields when the port selects some.
 
         Args:
-            port (RetrieveUserInputPort): The input port containing the user UID.
+            port (RetrieveUserInputPort): The input port containing the user UID and the selected fields.
 
         Returns:
-            User: An instance of the User model containing user information.
+            User | PartialUser: The whole user, or a PartialUser holding only the selected fields.
         """
 
     @abstractmethod
-    async def update_address(self, port: UpdateAddressInputPort) -> None:
+    async def update_address(self, port: UpdateAddressInputPort) -> bool:
         """Update user address.
 
         Args:
             port (UpdateAddressInputPort): The input port containing the user UID and updated address information.
+
+        Returns:
+            bool: Whether the UID is of a registered user, False as well when no field is provided.
         """
 
     @abstractmethod
-    async def update_cpf(self, port: UpdateCpfInputPort) -> None:
+    async def update_cpf(self, port: UpdateCpfInputPort) -> bool:
         """Update user CPF.
 
         Args:
             port (UpdateCpfInputPort): The input port containing the user UID and updated CPF information.
+
+        Returns:
+            bool: Whether the UID is of a registered user.
+        """
+
+    @abstractmethod
+    async def update_account(self, port: UpdateAccountInputPort) -> bool:
+        """Update user address and CPF in a single write, leaving the ones not provided untouched.
+
+        Args:
+            port (UpdateAccountInputPort): The input port containing the user UID and the updated information.
+
+        Returns:
+            bool: Whether the UID is of a registered user, False as well when no field is provided.
+        """
+
+    @abstractmethod
+    async def find_users_by_cpf(self, port: FindUsersByCpfInputPort) -> list[RegisteredUser]:
+        """Find the users registered with the provided CPFs.
+
+        Args:
+            port (FindUsersByCpfInputPort): The input port containing the CPFs to look up.
+
+        Returns:
+            list[RegisteredUser]: The users found, the CPFs not registered are left out.
+        """
+
+    @abstractmethod
+    async def list_users(self, port: ListUsersInputPort) -> list[RegisteredUser]:
+        """List the registered users in UID order, starting after a UID, with the filters of the port.
+
+        Args:
+            port (ListUsersInputPort): The input port containing the UID to start after, the page size and the
+                filters.
+
+        Returns:
+            list[RegisteredUser]: At most `port.limit` users, in UID order.
+        """
+
+
+class PostalCodeService(Service, metaclass=ABCMeta):
+    """A service locating the postal codes (CEPs) outside Business Layer.
+
+    Locating is synchronous: the postal codes are looked up locally, without a network call.
+
+    Methods:
+        locate(cep): Find the locality of a postal code.
+
+    """
+
+    @abstractmethod
+    def locate(self, cep: str) -> PostalCodeLocation | None:
+        """Find the locality of a postal code.
+
+        Args:
+            cep (str): The postal code, formatted or not.
+
+        Returns:
+            PostalCodeLocation | None: The locality of the postal code, None when it does not exist.
+        """
+
+
+class UserStatsService(Service, metaclass=ABCMeta):
+    """A service providing the user statistics kept outside Business Layer.
+
+    Methods:
+        count_users(port): Count the registered users of a city or of a CEP region.
+
+    """
+
+    @abstractmethod
+    async def count_users(self, port: UserStatsInputPort) -> int:
+        """Count the registered users of a city or of a CEP region.
+
+        Args:
+            port (UserStatsInputPort): The input port containing the city or the CEP region.
+
+        Returns:
+            int: The amount of registered users, 0 for a city or region without any.
+        """
+
+
+class UserCacheService(Service, metaclass=ABCMeta):
+    """A service caching what is read about the users outside Business Layer, stale once they change.
+
+    Methods:
+        invalidate_user(uid): Drop what is cached about a user.
+
+    """
+
+    @abstractmethod
+    def invalidate_user(self, uid: str) -> None:
+        """Drop what is cached about a user, once a write to it is done.
+
+        Args:
+            uid (str): The UID of the user written.
+        """
+
+
+class EventService(Service, metaclass=ABCMeta):
+    """A service publishing the changes of the accounts to the other services outside Business Layer.
+
+    Emitting is cheap: the events are stored to be published in the background, the write does not wait for the
+    other services to receive them.
+
+    Methods:
+        emit(events): Publish the events of a write once it is done.
+        transaction(write): Run a write emitting events, stored together with it when possible.
+
+    """
+
+    @abstractmethod
+    async def emit(self, events: list[AccountEvent]) -> None:
+        """Publish the events of a write once it is done, in order.
+
+        Args:
+            events (list[AccountEvent]): The events of the write.
+        """
+
+    async def transaction(self, write: Callable[[], Awaitable[T]]) -> T:
+        """Run a write and the emission of its events, so the events are stored if and only if the write is.
+
+        The write may run again from the start when it is retried: what it does must be part of the transaction, or
+        deferred to its commit. By default the events are stored after the write, a failure in between loses them.
+
+        Args:
+            write (Callable[[], Awaitable[T]]): The write, emitting its events once done.
+
+        Returns:
+            T: What the write returned.
         """
+        return await write()
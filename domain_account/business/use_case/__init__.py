@@ -1,13 +1,23 @@
+from .batch_use_case import BatchUseCase
+from .find_users_by_cpf_use_case import FindUsersByCpfUseCase
 from .interfaces import UseCase
+from .list_users_use_case import ListUsersUseCase
 from .register_use_case import RegisterUseCase
 from .retrieve_user_use_case import RetrieveUserUseCase
+from .update_account_use_case import UpdateAccountUseCase
 from .update_address_use_case import UpdateAddressUseCase
 from .update_cpf_use_case import UpdateCpfUseCase
+from .user_stats_use_case import UserStatsUseCase
 
 __all__ = [
+    "BatchUseCase",
+    "FindUsersByCpfUseCase",
+    "ListUsersUseCase",
     "RegisterUseCase",
     "RetrieveUserUseCase",
+    "UpdateAccountUseCase",
     "UpdateAddressUseCase",
     "UpdateCpfUseCase",
+    "UserStatsUseCase",
     "UseCase",
 ]
@@ -0,0 +1,32 @@
+from typing import Awaitable, Callable
+
+from domain_account.business.services import EventService
+from domain_account.models import AccountEvent
+
+
+async def write_emitting(
+    events: EventService | None, write: Callable[[], Awaitable[bool]], changes: Callable[[], list[AccountEvent]]
+) -> bool:
+    """Run a write of a user, and emit its events when a user was written, in a transaction of the events.
+
+    The events are stored if and only if the write is, when the events share the database of the users: a write
+    matching no user, or failing, emits none.
+
+    Args:
+        events (EventService | None): The events of the account changes, None not to emit any.
+        write (Callable[[], Awaitable[bool]]): The write, returning whether a user was written.
+        changes (Callable[[], list[AccountEvent]]): The events of the write, only built once a user was written.
+
+    Returns:
+        bool: Whether a user was written.
+    """
+    if events is None:
+        return await write()
+
+    async def write_and_emit() -> bool:
+        written = await write()
+        if written:
+            await events.emit(changes())
+        return written
+
+    return await events.transaction(write_and_emit)
@@ -0,0 +1,147 @@
+import asyncio
+from typing import Awaitable
+
+from domain_account.business.interfaces import InputPort, OutputPort
+from domain_account.business.ports import (
+    BatchInputPort,
+    BatchOutputPort,
+    BatchResult,
+    RegisterInputPort,
+    RetrieveUserInputPort,
+    UpdateAccountInputPort,
+    UpdateAddressInputPort,
+    UpdateAddressOutputPort,
+    UpdateCpfInputPort,
+    UpdateCpfOutputPort,
+)
+from domain_account.business.services import AccountService, EventService, PostalCodeService, UserCacheService
+from domain_account.models import PartialAddress
+
+from .interfaces import UseCase
+from .register_use_case import RegisterUseCase
+from .retrieve_user_use_case import RetrieveUserUseCase
+from .update_account_use_case import UpdateAccountUseCase
+
+_READS = (RetrieveUserInputPort,)
+_WRITES = (UpdateAddressInputPort, UpdateCpfInputPort)
+
+
+class BatchUseCase(UseCase[BatchInputPort, BatchOutputPort, AccountService]):
+    """Use case for running several account operations in one call.
+
+    The operations run as if one after the other, in order, but with fewer round trips to the AccountService:
+
+    - Consecutive reads run concurrently, and identical reads run once.
+    - Consecutive address and CPF updates of the same user are merged into a single write, the last value of each
+      field winning, as it would have sequentially.
+    - Registrations run on their own.
+
+    An operation failing with a business or repository error does not stop the batch: its result holds the error,
+    as do the results of the operations merged with it, and the next operations still run.
+
+    Args:
+        service (AccountService): An instance of AccountService providing business logic for account-related operations.
+        postal_codes (PostalCodeService | None): The postal codes validating the addresses, None to skip it.
+        cache (UserCacheService | None): The cache of the users, invalidated once the user is written, None without one.
+        events (EventService | None): The events of the account changes, emitted once the user is written, None not to.
+
+    """
+
+    def __init__(
+        self,
+        service: AccountService,
+        postal_codes: PostalCodeService | None = None,
+        cache: UserCacheService | None = None,
+        events: EventService | None = None,
+    ) -> None:
+        """Initialize the BatchUseCase with the use cases it dispatches to."""
+        self.__register = RegisterUseCase(service, postal_codes, cache, events)
+        self.__retrieve_user = RetrieveUserUseCase(service)
+        self.__update_account = UpdateAccountUseCase(service, postal_codes, cache, events)
+
+    async def __call__(self, input_port: BatchInputPort) -> BatchOutputPort:
+        """Execute the batch use case.
+
+        Args:
+            input_port (BatchInputPort): The input port containing the operations, in order.
+
+        Returns:
+            BatchOutputPort: An output port containing the result of every operation, in the same order.
+
+        Raises:
+            ValueError: If an operation is not supported in a batch.
+
+        """
+        operations = input_port.operations
+        results: list[BatchResult] = []
+        start = 0
+        while start < len(operations):
+            end = start + 1
+            kind = self.__kind(operations[start])
+            if kind is not RegisterInputPort:
+                while end < len(operations) and self.__kind(operations[end]) is kind:
+                    end += 1
+            group = operations[start:end]
+            if kind is RegisterInputPort:
+                results.extend(await self.__run([self.__register(group[0])]))  # type: ignore[arg-type]
+            elif kind is RetrieveUserInputPort:
+                results.extend(await self.__read(group))  # type: ignore[arg-type]
+            else:
+                results.extend(await self.__write(group))  # type: ignore[arg-type]
+            start = end
+        return BatchOutputPort(results=results)
+
+    @staticmethod
+    def __kind(operation: InputPort) -> type[InputPort]:
+        if isinstance(operation, RegisterInputPort):
+            return RegisterInputPort
+        if isinstance(operation, _READS):
+            return RetrieveUserInputPort
+        if isinstance(operation, _WRITES):
+            return UpdateAccountInputPort
+        raise ValueError(f"Operation [{operation.__class__.__name__}] is not supported in a batch.")
+
+    async def __read(self, group: list[RetrieveUserInputPort]) -> list[BatchResult]:
+        distinct = list(dict.fromkeys(port.uid for port in group))
+        outcomes = dict(
+            zip(distinct, await self.__run([self.__retrieve_user(RetrieveUserInputPort(uid=uid)) for uid in distinct]))
+        )
+        return [outcomes[port.uid] for port in group]
+
+    async def __write(self, group: list[UpdateAddressInputPort | UpdateCpfInputPort]) -> list[BatchResult]:
+        updates: dict[str, UpdateAccountInputPort] = {}
+        for port in group:
+            update = updates.setdefault(port.uid, UpdateAccountInputPort(uid=port.uid))
+            if isinstance(port, UpdateCpfInputPort):
+                update.cpf = port.cpf
+            else:
+                # Partial updates merge field by field, a field provided by a later operation wins
+                previous = update.address.model_dump(exclude_none=True) if update.address is not None else {}
+                update.address = PartialAddress(**{**previous, **port.model_dump(exclude={"uid"}, exclude_none=True)})
+        outcomes = dict(zip(updates, await self.__run([self.__update_account(update) for update in updates.values()])))
+        results = []
+        for port in group:
+            outcome = outcomes[port.uid]
+            if outcome.output is not None:
+                # Each merged operation answers like its own use case would have
+                output_type = UpdateCpfOutputPort if isinstance(port, UpdateCpfInputPort) else UpdateAddressOutputPort
+                outcome = BatchResult(output=output_type(msg=outcome.output.model_dump()["msg"]))
+            results.append(outcome)
+        return results
+
+    @staticmethod
+    async def __run(calls: list[Awaitable[OutputPort]]) -> list[BatchResult]:
+        outcomes = await asyncio.gather(*calls, return_exceptions=True)
+        results = []
+        for outcome in outcomes:
+            if isinstance(outcome, RuntimeError):
+                # Business and repository errors are part of the answer, anything else fails the whole batch
+                message = getattr(outcome, "msg", str(outcome))
+                results.append(
+                    BatchResult(error_type=getattr(outcome, "type", outcome.__class__.__name__), error_msg=message)
+                )
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results.append(BatchResult(output=outcome))
+        return results
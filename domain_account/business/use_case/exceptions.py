@@ -19,3 +19,11 @@ class BusinessException(RuntimeError):
     def __str__(self) -> str:
         """Return a string representation of the exception."""
         return f"[{self.type}] {self.msg}"
+
+
+class UnknownCep(BusinessException):
+    """Exception raised when an address holds a postal code (CEP) that does not exist."""
+
+    def __init__(self, cep: str) -> None:
+        """Initialize the UnknownCep with the postal code that does not exist."""
+        super().__init__(f"The CEP [{cep}] does not exist.")
@@ -0,0 +1,34 @@
+from domain_account.business.ports import FindUsersByCpfInputPort, FindUsersByCpfOutputPort
+from domain_account.business.services import AccountService
+
+from .interfaces import UseCase
+
+
+class FindUsersByCpfUseCase(UseCase[FindUsersByCpfInputPort, FindUsersByCpfOutputPort, AccountService]):
+    """Use case for finding registered users by CPF.
+
+    This use case resolves one or several CPFs to the users registered with them. It receives the CPFs via a
+    FindUsersByCpfInputPort, looks them up via the AccountService, and returns a FindUsersByCpfOutputPort holding
+    the users found, the CPFs not registered being left out.
+
+    Args:
+        service (AccountService): An instance of AccountService providing business logic for account-related operations.
+
+    """
+
+    def __init__(self, service: AccountService) -> None:
+        """Initialize the FindUsersByCpfUseCase with the provided AccountService."""
+        self.__service = service
+
+    async def __call__(self, input_port: FindUsersByCpfInputPort) -> FindUsersByCpfOutputPort:
+        """Execute the find users by CPF use case.
+
+        Args:
+            input_port (FindUsersByCpfInputPort): The input port containing the CPFs to look up.
+
+        Returns:
+            FindUsersByCpfOutputPort: An output port containing the users registered with the provided CPFs.
+
+        """
+        users = await self.__service.find_users_by_cpf(input_port)
+        return FindUsersByCpfOutputPort(users=users, msg="ok")
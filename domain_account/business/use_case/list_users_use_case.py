@@ -0,0 +1,39 @@
+from domain_account.business.ports import ListUsersInputPort, ListUsersOutputPort
+from domain_account.business.services import AccountService
+from domain_account.types.page_cursor import encode_cursor
+
+from .interfaces import UseCase
+
+
+class ListUsersUseCase(UseCase[ListUsersInputPort, ListUsersOutputPort, AccountService]):
+    """Use case for listing the registered users, a page at a time.
+
+    Pages are keyset paginated on the UID: a page starts after the last UID of the previous one instead of skipping
+    the users of the previous pages, so fetching a page costs the same however deep it is. The continuation of a
+    page is an opaque cursor, handed back to get the next page.
+
+    Args:
+        service (AccountService): An instance of AccountService providing business logic for account-related operations.
+
+    """
+
+    def __init__(self, service: AccountService) -> None:
+        """Initialize the ListUsersUseCase with the provided AccountService."""
+        self.__service = service
+
+    async def __call__(self, input_port: ListUsersInputPort) -> ListUsersOutputPort:
+        """Execute the list users use case.
+
+        Args:
+            input_port (ListUsersInputPort): The input port containing the page to list and the filters.
+
+        Returns:
+            ListUsersOutputPort: An output port containing the users of the page and the cursor of the next one,
+                None when there is no next page.
+
+        """
+        # One user more than the page tells whether there is a next page, without counting the users
+        users = await self.__service.list_users(input_port.model_copy(update={"limit": input_port.limit + 1}))
+        page = users[: input_port.limit]
+        next_cursor = encode_cursor(page[-1].uid) if len(users) > input_port.limit else None
+        return ListUsersOutputPort(users=page, next_cursor=next_cursor, msg="ok")
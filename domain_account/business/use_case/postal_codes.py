@@ -0,0 +1,36 @@
+from typing import Any, TypeVar, cast
+
+from domain_account.business.services import PostalCodeService
+from domain_account.models import Address, PartialAddress
+
+from .exceptions import UnknownCep
+
+T_address = TypeVar("T_address", bound=Address | PartialAddress)
+
+
+def locate_address(postal_codes: PostalCodeService | None, address: T_address) -> T_address:
+    """Validate the postal code (CEP) of an address and normalise the address to its locality.
+
+    The CEP is stored as its 8 digits, the city gets the spelling of the postal code index and the state is filled
+    in. A CEP of a single street also sets the street name. An address without a CEP, or without a postal code
+    service, is left as is.
+
+    Args:
+        postal_codes (PostalCodeService | None): The postal codes, None when they are not available.
+        address (T_address): The address, whole or partial.
+
+    Returns:
+        T_address: A copy of the address normalised to the locality of its CEP.
+
+    Raises:
+        UnknownCep: If the CEP does not exist.
+    """
+    if postal_codes is None or address.cep is None:
+        return address
+    location = postal_codes.locate(address.cep)
+    if location is None:
+        raise UnknownCep(address.cep)
+    update: dict[str, Any] = {"cep": location.cep, "city": location.city, "state": location.state}
+    if location.street_name is not None:
+        update["street_name"] = location.street_name
+    return cast(T_address, address.model_copy(update=update))
@@ -1,7 +1,12 @@
+from functools import partial
+
 from domain_account.business.ports import RegisterInputPort, RegisterOutputPort
-from domain_account.business.services import AccountService
+from domain_account.business.services import AccountService, EventService, PostalCodeService, UserCacheService
+from domain_account.models import AccountEvent, UserRegistered
 
+from .account_events import write_emitting
 from .interfaces import UseCase
+from .postal_codes import locate_address
 
 
 class RegisterUseCase(UseCase[RegisterInputPort, RegisterOutputPort, AccountService]):
@@ -11,14 +16,29 @@ class RegisterUseCase(UseCase[RegisterInputPort, RegisterOutputPort, AccountServ
     registers the user via the provided AccountService, and returns a RegisterOutputPort indicating
     the success of the registration process.
 
+    When postal codes are available, the CEP of the address is validated and the address normalised to its locality
+    before registering.
+
     Args:
         service (AccountService): An instance of AccountService providing business logic for account-related operations.
+        postal_codes (PostalCodeService | None): The postal codes validating the address, None to skip it.
+        cache (UserCacheService | None): The cache of the users, invalidated once the user is written, None without one.
+        events (EventService | None): The events of the account changes, emitted once the user is written, None not to.
 
     """
 
-    def __init__(self, service: AccountService) -> None:
-        """Initialize the RegisterUseCase with the provided AccountService."""
+    def __init__(
+        self,
+        service: AccountService,
+        postal_codes: PostalCodeService | None = None,
+        cache: UserCacheService | None = None,
+        events: EventService | None = None,
+    ) -> None:
+        """Initialize the RegisterUseCase with the provided services."""
         self.__account_repo = service
+        self.__postal_codes = postal_codes
+        self.__cache = cache
+        self.__events = events
 
     async def __call__(self, input_port: RegisterInputPort) -> RegisterOutputPort:
         """Execute the register use case.
@@ -31,6 +51,23 @@ class RegisterUseCase(UseCase[RegisterInputPort, RegisterOutputPort, AccountServ
         Returns:
             RegisterOutputPort: An output port containing a message indicating the success of the registration process.
 
+        Raises:
+            UnknownCep: If the CEP of the address does not exist.
+
         """
-        await self.__account_repo.register(input_port)
+        address = locate_address(self.__postal_codes, input_port.address)
+        if address is not input_port.address:
+            input_port = input_port.model_copy(update={"address": address})
+        await write_emitting(self.__events, partial(self.__register, input_port), partial(self.__changes, input_port))
+        if self.__cache is not None:
+            self.__cache.invalidate_user(input_port.uid)
         return RegisterOutputPort(msg="ok")
+
+    async def __register(self, input_port: RegisterInputPort) -> bool:
+        # Registering writes the user or raises
+        await self.__account_repo.register(input_port)
+        return True
+
+    @staticmethod
+    def __changes(input_port: RegisterInputPort) -> list[AccountEvent]:
+        return [UserRegistered(uid=input_port.uid, address=input_port.address)]
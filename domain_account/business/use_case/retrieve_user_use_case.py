@@ -31,4 +31,5 @@ class RetrieveUserUseCase(UseCase[RetrieveUserInputPort, RetrieveUserOutputPort,
 
         """
         user = await self.__service.get_user(input_port)
-        return RetrieveUserOutputPort(**user.model_dump(), msg="ok")
+        # Unset fields were not selected, dumping them would answer them as null
+        return RetrieveUserOutputPort(**user.model_dump(exclude_unset=True), msg="ok")
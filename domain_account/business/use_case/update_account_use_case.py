@@ -0,0 +1,75 @@
+from functools import partial
+
+from domain_account.business.ports import UpdateAccountInputPort, UpdateAccountOutputPort
+from domain_account.business.services import AccountService, EventService, PostalCodeService, UserCacheService
+from domain_account.models import AccountEvent, AddressUpdated, CpfUpdated
+
+from .account_events import write_emitting
+from .interfaces import UseCase
+from .postal_codes import locate_address
+
+
+class UpdateAccountUseCase(UseCase[UpdateAccountInputPort, UpdateAccountOutputPort, AccountService]):
+    """Use case for updating user address and CPF at once.
+
+    This use case handles the updating of the address and the CPF of a user in a single write. It receives input data
+    via an UpdateAccountInputPort, updates the provided fields via the AccountService, and returns an
+    UpdateAccountOutputPort indicating the success of the update process.
+
+    When postal codes are available and the CEP changes, it is validated and the address normalised to its locality.
+
+    Args:
+        service (AccountService): An instance of AccountService providing business logic for account-related operations.
+        postal_codes (PostalCodeService | None): The postal codes validating the address, None to skip it.
+        cache (UserCacheService | None): The cache of the users, invalidated once the user is written, None without one.
+        events (EventService | None): The events of the account changes, emitted once the user is written, None not to.
+
+    """
+
+    def __init__(
+        self,
+        service: AccountService,
+        postal_codes: PostalCodeService | None = None,
+        cache: UserCacheService | None = None,
+        events: EventService | None = None,
+    ) -> None:
+        """Initialize the UpdateAccountUseCase with the provided services."""
+        self.__account_repo = service
+        self.__postal_codes = postal_codes
+        self.__cache = cache
+        self.__events = events
+
+    async def __call__(self, input_port: UpdateAccountInputPort) -> UpdateAccountOutputPort:
+        """Execute the update account use case.
+
+        Updates the provided user fields via the AccountService, nothing is written when none is provided.
+
+        Args:
+            input_port (UpdateAccountInputPort): The input port containing user update data.
+
+        Returns:
+            UpdateAccountOutputPort: An output port containing a message indicating the success of the update process.
+
+        Raises:
+            UnknownCep: If the new CEP does not exist.
+
+        """
+        if input_port.address is not None:
+            address = locate_address(self.__postal_codes, input_port.address)
+            if address is not input_port.address:
+                input_port = input_port.model_copy(update={"address": address})
+        if input_port.address is not None or input_port.cpf is not None:
+            update = partial(self.__account_repo.update_account, input_port)
+            await write_emitting(self.__events, update, partial(self.__changes, input_port))
+            if self.__cache is not None:
+                self.__cache.invalidate_user(input_port.uid)
+        return UpdateAccountOutputPort(msg="ok")
+
+    @staticmethod
+    def __changes(input_port: UpdateAccountInputPort) -> list[AccountEvent]:
+        events: list[AccountEvent] = []
+        if input_port.address is not None:
+            events.append(AddressUpdated(uid=input_port.uid, address=input_port.address))
+        if input_port.cpf is not None:
+            events.append(CpfUpdated(uid=input_port.uid))
+        return events
@@ -1,7 +1,12 @@
+from functools import partial
+
 from domain_account.business.ports import UpdateAddressInputPort, UpdateAddressOutputPort
-from domain_account.business.services import AccountService
+from domain_account.business.services import AccountService, EventService, PostalCodeService, UserCacheService
+from domain_account.models import AccountEvent, AddressUpdated, PartialAddress
 
+from .account_events import write_emitting
 from .interfaces import UseCase
+from .postal_codes import locate_address
 
 
 class UpdateAddressUseCase(UseCase[UpdateAddressInputPort, UpdateAddressOutputPort, AccountService]):
@@ -11,14 +16,28 @@ class UpdateAddressUseCase(UseCase[UpdateAddressInputPort, UpdateAddressOutputPo
     updates the address via the provided AccountService, and returns an UpdateAddressOutputPort indicating
     the success of the address update process.
 
+    When postal codes are available and the CEP changes, it is validated and the address normalised to its locality.
+
     Args:
         service (AccountService): An instance of AccountService providing business logic for account-related operations.
+        postal_codes (PostalCodeService | None): The postal codes validating the address, None to skip it.
+        cache (UserCacheService | None): The cache of the users, invalidated once the user is written, None without one.
+        events (EventService | None): The events of the account changes, emitted once the user is written, None not to.
 
     """
 
-    def __init__(self, service: AccountService) -> None:
-        """Initialize the UpdateAddressUseCase with the provided AccountService."""
+    def __init__(
+        self,
+        service: AccountService,
+        postal_codes: PostalCodeService | None = None,
+        cache: UserCacheService | None = None,
+        events: EventService | None = None,
+    ) -> None:
+        """Initialize the UpdateAddressUseCase with the provided services."""
         self.__account_repo = service
+        self.__postal_codes = postal_codes
+        self.__cache = cache
+        self.__events = events
 
     async def __call__(self, input_port: UpdateAddressInputPort) -> UpdateAddressOutputPort:
         """Execute the update address use case.
@@ -31,6 +50,17 @@ class UpdateAddressUseCase(UseCase[UpdateAddressInputPort, UpdateAddressOutputPo
         Returns:
             UpdateAddressOutputPort: An output port containing a message indicating the success of the address update process.
 
+        Raises:
+            UnknownCep: If the new CEP does not exist.
+
         """  # noqa: E501
-        await self.__account_repo.update_address(input_port)
+        input_port = locate_address(self.__postal_codes, input_port)
+        update = partial(self.__account_repo.update_address, input_port)
+        await write_emitting(self.__events, update, partial(self.__changes, input_port))
+        if self.__cache is not None:
+            self.__cache.invalidate_user(input_port.uid)
         return UpdateAddressOutputPort(msg="ok")
+
+    @staticmethod
+    def __changes(input_port: UpdateAddressInputPort) -> list[AccountEvent]:
+        return [AddressUpdated(uid=input_port.uid, address=PartialAddress(**input_port.model_dump(exclude={"uid"})))]
@@ -1,6 +1,10 @@
+from functools import partial
+
 from domain_account.business.ports import UpdateCpfInputPort, UpdateCpfOutputPort
-from domain_account.business.services import AccountService
+from domain_account.business.services import AccountService, EventService, UserCacheService
+from domain_account.models import AccountEvent, CpfUpdated
 
+from .account_events import write_emitting
 from .interfaces import UseCase
 
 
@@ -13,12 +17,18 @@ class UpdateCpfUseCase(UseCase[UpdateCpfInputPort, UpdateCpfOutputPort, AccountS
 
     Args:
         service (AccountService): An instance of AccountService providing business logic for account-related operations.
+        cache (UserCacheService | None): The cache of the users, invalidated once the user is written, None without one.
+        events (EventService | None): The events of the account changes, emitted once the user is written, None not to.
 
     """
 
-    def __init__(self, service: AccountService) -> None:
-        """Initialize the UpdateCpfUseCase with the provided AccountService."""
+    def __init__(
+        self, service: AccountService, cache: UserCacheService | None = None, events: EventService | None = None
+    ) -> None:
+        """Initialize the UpdateCpfUseCase with the provided AccountService, UserCacheService and EventService."""
         self.__account_repo = service
+        self.__cache = cache
+        self.__events = events
 
     async def __call__(self, input_port: UpdateCpfInputPort) -> UpdateCpfOutputPort:
         """Execute the update CPF use case.
@@ -32,5 +42,12 @@ class UpdateCpfUseCase(UseCase[UpdateCpfInputPort, UpdateCpfOutputPort, AccountS
             UpdateCpfOutputPort: An output port containing a message indicating the success of the CPF update process.
 
         """  # noqa: E501
-        await self.__account_repo.update_cpf(input_port)
+        update = partial(self.__account_repo.update_cpf, input_port)
+        await write_emitting(self.__events, update, partial(self.__changes, input_port))
+        if self.__cache is not None:
+            self.__cache.invalidate_user(input_port.uid)
         return UpdateCpfOutputPort(msg="ok")
+
+    @staticmethod
+    def __changes(input_port: UpdateCpfInputPort) -> list[AccountEvent]:
+        return [CpfUpdated(uid=input_port.uid)]
@@ -0,0 +1,32 @@
+from domain_account.business.ports import UserStatsInputPort, UserStatsOutputPort
+from domain_account.business.services import UserStatsService
+
+from .interfaces import UseCase
+
+
+class UserStatsUseCase(UseCase[UserStatsInputPort, UserStatsOutputPort, UserStatsService]):
+    """Use case for counting the registered users of a city or of a CEP region.
+
+    The counts are maintained as the users register and move, so reading one does not go through the users.
+
+    Args:
+        service (UserStatsService): An instance of UserStatsService providing the user statistics.
+
+    """
+
+    def __init__(self, service: UserStatsService) -> None:
+        """Initialize the UserStatsUseCase with the provided UserStatsService."""
+        self.__service = service
+
+    async def __call__(self, input_port: UserStatsInputPort) -> UserStatsOutputPort:
+        """Execute the user stats use case.
+
+        Args:
+            input_port (UserStatsInputPort): The input port containing the city or the CEP region.
+
+        Returns:
+            UserStatsOutputPort: An output port containing the amount of registered users.
+
+        """
+        users = await self.__service.count_users(input_port)
+        return UserStatsOutputPort(by=input_port.by, key=input_port.key, users=users, msg="ok")
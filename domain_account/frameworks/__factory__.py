@@ -1,9 +1,36 @@
-from typing import TypedDict
+import asyncio
+from typing import TYPE_CHECKING, TypedDict, Union
 
 from domain_account.adapters.__factory__ import FrameworksFactoryInterface
+from domain_account.adapters.interfaces.rate_limit_service import RateLimit
 
+from .anonymisation import CpfHasher, UidHasher
+from .caching import NegativeCache, ResponseCache
+from .event_loop import LoopWatchdog
+from .events import Outbox, create_broker
 from .firebase import FirebaseManager
-from .mongodb import MotorManager
+from .metrics import MetricsRegistry, anyio_thread_pool_collector
+from .mongodb import MotorManager, WriteDurabilityPolicy, database_manager
+from .partitioning import PartitionedDatabaseService
+from .postal_codes import CepIndex
+from .profiling import Profiler
+from .rate_limiting import TokenBuckets
+from .structured_logging import LogPipeline
+from .traffic import TrafficRecorder
+
+if TYPE_CHECKING:
+    from .mongodb.pymongo_manager import PyMongoAsyncManager
+
+# The PyMongo manager is only imported when `DB_DRIVER` selects it
+DatabaseManager = Union[MotorManager, "PyMongoAsyncManager"]
+DatabaseService = DatabaseManager | PartitionedDatabaseService
+
+
+class DatabasePartition(TypedDict):
+    """The database of a partition: its MongoDB URI and its name."""
+
+    uri: str
+    name: str
 
 
 class FrameworksConfig(TypedDict):
@@ -11,20 +38,54 @@ class FrameworksConfig(TypedDict):
 
     database_name: str
     database_uri: str
+    database_driver: str
+    database_tls: bool
+    database_partitions: dict[str, DatabasePartition]
+    database_previous_partitions: list[str]
     service_name: str
     credentials: str | None
     auth_app_options: dict[str, str]
+    database_slow_command_ms: float
+    profile_slow_request_ms: float | None
+    profile_capture_interval: float
+    loop_blocked_ms: float
+    traffic_capture_path: str | None
+    traffic_capture_sample_rate: float
+    uid_hash_salt: str | None
+    cpf_hash_key: str
+    cep_index_path: str | None
+    unknown_uid_cache_size: int
+    unknown_uid_cache_ttl: float
+    user_response_cache_bytes: int
+    user_response_cache_ttl: float
+    rate_limit_rps: float
+    rate_limit_burst: float
+    rate_limit_route_rps: float
+    rate_limit_route_burst: float
+    rate_limit_max_keys: int
+    write_durability: dict[str, str]
+    event_broker: str | None
+    event_batch_size: int
+    event_publish_interval: float
+    log_level: str
+    log_queue_size: int
 
 
-class FrameworksFactory(FrameworksFactoryInterface[MotorManager]):
+class FrameworksFactory(FrameworksFactoryInterface[DatabaseService]):  # pylint: disable=R0902
     """Responsible for instantiating the Frameworks classes with their linked dependencies.
 
     This class is responsible for creating instances of framework classes with their required dependencies,
-    particularly for interacting with MongoDB using Motor.
+    particularly for interacting with MongoDB using Motor or the native asyncio client of PyMongo. With
+    `database_partitions`, the users are spread across the databases of the partitions. With `event_broker`, the
+    account events are published to the broker through the outbox.
 
     Args:
         config (FrameworksConfig): A dictionary containing configuration parameters for the framework.
 
+    Raises:
+        ValueError: If the configured database driver is neither `motor` nor `pymongo`, the partitions are invalid
+            or the event broker is unknown.
+
     """
 
     def __init__(self, config: FrameworksConfig) -> None:
@@ -35,28 +96,109 @@ class FrameworksFactory(FrameworksFactoryInterface[MotorManager]):
 
         """
         self.__config = config
-        self.__manager = MotorManager(
-            database_name=self.__config["database_name"],
-            database_uri=self.__config["database_uri"],
-            service_name=self.__config["service_name"],
+        manager_class = database_manager(self.__config["database_driver"])
+        partitions = self.__config["database_partitions"] or {
+            "default": DatabasePartition(uri=self.__config["database_uri"], name=self.__config["database_name"])
+        }
+        self.__managers: dict[str, DatabaseManager] = {
+            partition: manager_class(
+                database_name=database["name"],
+                database_uri=database["uri"],
+                service_name=self.__config["service_name"],
+                tls=self.__config["database_tls"],
+            )
+            for partition, database in partitions.items()
+        }
+        self.__database: DatabaseService = (
+            PartitionedDatabaseService(self.__managers, self.__config["database_previous_partitions"])
+            if self.__config["database_partitions"]
+            else self.__managers["default"]
+        )
+        self.__metrics = MetricsRegistry()
+        self.__metrics.add_collector(anyio_thread_pool_collector(self.__metrics))
+        self.__profiler = Profiler(
+            slow_request_ms=self.__config["profile_slow_request_ms"],
+            capture_interval=self.__config["profile_capture_interval"],
+        )
+        hasher = UidHasher(self.__config["uid_hash_salt"])
+        self.__recorder = TrafficRecorder(
+            path=self.__config["traffic_capture_path"],
+            hasher=hasher,
+            sample_rate=self.__config["traffic_capture_sample_rate"],
+        )
+        self.__logs = LogPipeline(
+            metrics=self.__metrics,
+            hasher=hasher,
+            level=self.__config["log_level"],
+            queue_size=self.__config["log_queue_size"],
+            project_id=self.__config["auth_app_options"].get("projectId"),
+        )
+        self.__cpf_hasher = CpfHasher(self.__config["cpf_hash_key"])
+        # Mapped now, before the workers fork, so they all share the pages of the index
+        cep_index_path = self.__config["cep_index_path"]
+        self.__cep_index = CepIndex(cep_index_path) if cep_index_path else None
+        self.__unknown_uids = NegativeCache(
+            self.__metrics,
+            "unknown_uids",
+            max_size=self.__config["unknown_uid_cache_size"],
+            ttl=self.__config["unknown_uid_cache_ttl"],
         )
+        self.__user_responses = ResponseCache(
+            self.__metrics,
+            "user_responses",
+            max_bytes=self.__config["user_response_cache_bytes"],
+            ttl=self.__config["user_response_cache_ttl"],
+        )
+        self.__rate_limiter = TokenBuckets(
+            self.__metrics,
+            client_limit=self.__limit(self.__config["rate_limit_rps"], self.__config["rate_limit_burst"]),
+            route_limit=self.__limit(self.__config["rate_limit_route_rps"], self.__config["rate_limit_route_burst"]),
+            max_keys=self.__config["rate_limit_max_keys"],
+        )
+        self.__write_durability = WriteDurabilityPolicy(self.__config["write_durability"])
+        self.__event_broker = create_broker(self.__config["event_broker"])
+        self.__outbox: Outbox | None = None
+        self.__watchdog = LoopWatchdog(self.__metrics, self.__config["loop_blocked_ms"])
+        for manager in self.__managers.values():
+            manager.instrument(self.__metrics, self.__config["database_slow_command_ms"])
 
     async def connect(self) -> None:
-        """Connect to the MongoDB database asynchronously."""
-        await self.__manager.connect()
+        """Start the worker logging, connect to the MongoDB databases, start publishing events, profiling, recording."""
+        self.__logs.start()
+        await asyncio.gather(*(manager.connect() for manager in self.__managers.values()))
+        await self.open_event_outbox()
+        self.__profiler.open()
+        self.__recorder.open()
+
+    async def disconnect(self) -> None:
+        """Stop publishing the events, wait for the MongoDB connections to close, then close the rest like `close`."""
+        if self.__outbox is not None:
+            await self.__outbox.close()
+        await asyncio.gather(*(manager.disconnect() for manager in self.__managers.values()))
+        self.close()
 
     def close(self) -> None:
-        """Close the connection to the MongoDB database."""
-        self.__manager.close()
+        """Close the connections to the MongoDB databases, stop the profiling and recording, then flush the logs."""
+        for manager in self.__managers.values():
+            manager.close()
+        self.__profiler.close()
+        self.__recorder.close()
+        self.__logs.stop()
 
-    def database_framework(self) -> MotorManager:
-        """Get the MotorManager instance representing the MongoDB database framework.
+    def after_fork(self) -> None:
+        """Reset the per process resources inherited from the parent process."""
+        for manager in self.__managers.values():
+            manager.after_fork()
+
+    def database_framework(self) -> DatabaseService:
+        """Get the instance representing the MongoDB database framework.
 
         Returns:
-            MotorManager: An instance of MotorManager representing the MongoDB database framework.
+            DatabaseService: The manager of the configured driver, or the PartitionedDatabaseService spreading the
+                users across the managers of the partitions when partitions are configured.
 
         """
-        return self.__manager
+        return self.__database
 
     def authentication_framework(self) -> FirebaseManager:
         """Get the FirebaseManager instance representing the Firebase authentication framework.
@@ -66,3 +208,134 @@ class FrameworksFactory(FrameworksFactoryInterface[MotorManager]):
 
         """
         return FirebaseManager(self.__config["credentials"], self.__config["auth_app_options"])
+
+    def metrics_framework(self) -> MetricsRegistry:
+        """Get the MetricsRegistry instance collecting the metrics of the current process.
+
+        Returns:
+            MetricsRegistry: The MetricsRegistry instance shared by every layer.
+
+        """
+        return self.__metrics
+
+    def profiling_framework(self) -> Profiler:
+        """Get the Profiler instance profiling the current process.
+
+        Returns:
+            Profiler: The Profiler instance of the current process.
+
+        """
+        return self.__profiler
+
+    def cpf_hash_framework(self) -> CpfHasher:
+        """Get the CpfHasher instance hashing the CPFs stored in the database.
+
+        Returns:
+            CpfHasher: The CpfHasher instance keyed with the configured CPF hash key.
+
+        """
+        return self.__cpf_hasher
+
+    def traffic_recording_framework(self) -> TrafficRecorder:
+        """Get the TrafficRecorder instance recording the traffic of the current process.
+
+        Returns:
+            TrafficRecorder: The TrafficRecorder instance of the current process.
+
+        """
+        return self.__recorder
+
+    def postal_code_framework(self) -> CepIndex | None:
+        """Get the CepIndex instance looking the postal codes up.
+
+        Returns:
+            CepIndex | None: The CepIndex instance mapping the configured index file, None when none is configured.
+
+        """
+        return self.__cep_index
+
+    def unknown_uid_cache_framework(self) -> NegativeCache:
+        """Get the NegativeCache instance remembering the UIDs of the users not registered.
+
+        Returns:
+            NegativeCache: The NegativeCache instance of the current process.
+
+        """
+        return self.__unknown_uids
+
+    def user_response_cache_framework(self) -> ResponseCache:
+        """Get the ResponseCache instance keeping the encoded responses read about the users.
+
+        Returns:
+            ResponseCache: The ResponseCache instance of the current process.
+
+        """
+        return self.__user_responses
+
+    def rate_limit_framework(self) -> TokenBuckets:
+        """Get the TokenBuckets instance rate limiting the clients and routes.
+
+        Returns:
+            TokenBuckets: The TokenBuckets instance of the current process.
+
+        """
+        return self.__rate_limiter
+
+    def write_durability_framework(self) -> WriteDurabilityPolicy:
+        """Get the WriteDurabilityPolicy instance telling how durable each database write must be.
+
+        Returns:
+            WriteDurabilityPolicy: The configured WriteDurabilityPolicy instance.
+
+        """
+        return self.__write_durability
+
+    def event_outbox_framework(self) -> Outbox | None:
+        """Get the Outbox instance storing the account events until the broker received them.
+
+        Returns:
+            Outbox | None: The Outbox instance publishing to the configured broker, in the database of the users or
+                their home partition, None when no broker is configured.
+
+        """
+        if self.__event_broker is None:
+            return None
+        if self.__outbox is None:
+            # Built on first use, from the database the factory provides
+            self.__outbox = Outbox(
+                self.database_framework(),
+                self.__event_broker,
+                self.__metrics,
+                batch_size=self.__config["event_batch_size"],
+                interval=self.__config["event_publish_interval"],
+            )
+        return self.__outbox
+
+    async def open_event_outbox(self) -> None:
+        """Start the publishing of the events in the worker, nothing is done when no broker is configured."""
+        outbox = self.event_outbox_framework()
+        if outbox is not None:
+            await outbox.open()
+
+    @staticmethod
+    def __limit(rate: float, burst: float) -> RateLimit | None:
+        # A rate of 0 disables the limit, and a burst below a single request would reject them all
+        return RateLimit(rate, max(burst, 1.0)) if rate > 0 else None
+
+    def log_pipeline(self) -> LogPipeline:
+        """Get the LogPipeline instance writing the logs of the current process.
+
+        Returns:
+            LogPipeline: The LogPipeline instance of the current process.
+
+        """
+        return self.__logs
+
+    def loop_watchdog(self) -> LoopWatchdog:
+        """Get the LoopWatchdog instance watching the event loop of the current process.
+
+        Returns:
+            LoopWatchdog: The LoopWatchdog instance of the current process.
+
+        """
+        return self.__watchdog
@@ -0,0 +1,4 @@
+from .cpf_hasher import CpfHasher
+from .uid_hasher import UidHasher
+
+__all__ = ["CpfHasher", "UidHasher"]
@@ -0,0 +1,30 @@
+import hashlib
+import hmac
+
+from domain_account.adapters.interfaces.keyed_hash_service import KeyedHashService
+
+
+class CpfHasher(KeyedHashService):
+    """Hash CPFs with HMAC-SHA256, so they are indexed and compared without storing them in an index.
+
+    The digests are stored in the database: unlike the UID hash of the logs, the key must be stable across processes
+    and deployments, changing it means hashing every stored CPF again.
+
+    Args:
+        key (str): The secret key of the hash.
+
+    Raises:
+        ValueError: If the key is empty.
+
+    """
+
+    __slots__ = ("__key",)
+
+    def __init__(self, key: str) -> None:
+        """Initialize the CpfHasher with its key."""
+        if not key:
+            raise ValueError("The CPF hash key must not be empty.")
+        self.__key = key.encode()
+
+    def digest(self, value: str) -> str:
+        return hmac.new(self.__key, value.encode(), hashlib.sha256).hexdigest()
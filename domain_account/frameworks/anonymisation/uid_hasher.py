@@ -0,0 +1,24 @@
+import hashlib
+import hmac
+import os
+
+UID_HASH_LENGTH = 16
+
+
+class UidHasher:
+    """Replace user UIDs by a keyed hash, stable for the key so the same user stays recognisable.
+
+    Args:
+        salt (str | None): The key of the hash, random per process tree when not provided: with `--preload` the
+            workers inherit the key of the gunicorn master, but another deployment hashes differently.
+
+    """
+
+    __slots__ = ("__key",)
+
+    def __init__(self, salt: str | None) -> None:
+        """Initialize the UidHasher with its key."""
+        self.__key = salt.encode() if salt else os.urandom(16)
+
+    def __call__(self, uid: str) -> str:
+        return hmac.new(self.__key, uid.encode(), hashlib.sha256).hexdigest()[:UID_HASH_LENGTH]
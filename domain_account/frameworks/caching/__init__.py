@@ -0,0 +1,4 @@
+from .negative_cache import NegativeCache
+from .response_cache import ResponseCache
+
+__all__ = ["NegativeCache", "ResponseCache"]
@@ -0,0 +1,65 @@
+import time
+from collections import OrderedDict
+
+from domain_account.adapters.interfaces.metrics_service import MetricsService
+from domain_account.adapters.interfaces.negative_cache_service import NegativeCacheService
+
+NEGATIVE_CACHE_HITS = "negative_cache_hits_total"
+NEGATIVE_CACHE_EVICTIONS = "negative_cache_evictions_total"
+
+
+class NegativeCache(NegativeCacheService):
+    """A bounded negative cache of the current process, its keys expire after a time to live.
+
+    The keys are kept in insertion order with their expiry: the oldest one is evicted once the cache is full, so
+    probing many distinct keys cannot grow the process. Every process has its own cache and only sees the
+    invalidations it makes, the time to live bounds how long a key created by another process reads as missing.
+
+    Args:
+        metrics (MetricsService): The metrics service receiving the hits and evictions.
+        name (str): The name of the cache, labelling its metrics.
+        max_size (int): The amount of keys kept, 0 disables the cache.
+        ttl (float): The time to live of a key, in seconds, 0 disables the cache.
+
+    """
+
+    def __init__(self, metrics: MetricsService, name: str, max_size: int, ttl: float) -> None:
+        """Initialize the NegativeCache empty and declare its metrics."""
+        self.__metrics = metrics
+        self.__name = name
+        self.__max_size = max_size if ttl > 0 else 0
+        self.__ttl = ttl
+        self.__expiries: OrderedDict[str, float] = OrderedDict()
+        self.__epoch = 0
+        metrics.counter(NEGATIVE_CACHE_HITS, "Lookups answered by a negative cache.", ("cache",))
+        metrics.counter(NEGATIVE_CACHE_EVICTIONS, "Keys evicted from a full negative cache.", ("cache",))
+
+    def __contains__(self, key: str) -> bool:
+        expiry = self.__expiries.get(key)
+        if expiry is None:
+            return False
+        if expiry <= time.monotonic():
+            del self.__expiries[key]
+            return False
+        self.__metrics.increment(NEGATIVE_CACHE_HITS, self.__name)
+        return True
+
+    def __len__(self) -> int:
+        """The amount of keys kept, the expired ones included until they are looked up or evicted."""
+        return len(self.__expiries)
+
+    def epoch(self) -> int:
+        return self.__epoch
+
+    def add(self, key: str, epoch: int) -> None:
+        if epoch != self.__epoch or not self.__max_size:
+            return
+        self.__expiries.pop(key, None)
+        self.__expiries[key] = time.monotonic() + self.__ttl
+        if len(self.__expiries) > self.__max_size:
+            self.__expiries.popitem(last=False)
+            self.__metrics.increment(NEGATIVE_CACHE_EVICTIONS, self.__name)
+
+    def discard(self, key: str) -> None:
+        self.__epoch += 1
+        self.__expiries.pop(key, None)
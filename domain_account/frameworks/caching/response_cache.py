@@ -0,0 +1,102 @@
+import hashlib
+import time
+from collections import OrderedDict
+
+from domain_account.adapters.interfaces.metrics_service import MetricsService
+from domain_account.adapters.interfaces.response_cache_service import CachedResponse, ResponseCacheService
+
+RESPONSE_CACHE_LOOKUPS = "response_cache_lookups_total"
+RESPONSE_CACHE_BYTES = "response_cache_bytes"
+
+_Entry = tuple[CachedResponse, float]
+
+
+# The entries, the variants of each key and their total size change together on every put and removal
+class ResponseCache(ResponseCacheService):  # pylint: disable=R0902
+    """A per process cache of encoded responses, bounded by the size of their bodies and tags, in bytes.
+
+    The least recently used responses are evicted once the budget is exceeded, and a response larger than the whole
+    budget is not kept. The entity tag of a body is a hash of it, so the same body always has the same tag. Every
+    process has its own cache and only sees the invalidations it makes, the time to live bounds how long a write
+    made in another process is not seen.
+
+    Args:
+        metrics (MetricsService): The metrics service receiving the lookups and the size of the cache.
+        name (str): The name of the cache, labelling its metrics.
+        max_bytes (int): The size of the cached bodies and tags, 0 disables the cache.
+        ttl (float): The time to live of a response, in seconds, 0 disables the cache.
+
+    """
+
+    def __init__(self, metrics: MetricsService, name: str, max_bytes: int, ttl: float) -> None:
+        """Initialize the ResponseCache empty and declare its metrics."""
+        self.__metrics = metrics
+        self.__name = name
+        self.__max_bytes = max_bytes if ttl > 0 else 0
+        self.__ttl = ttl
+        self.__entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self.__variants: dict[str, set[str]] = {}
+        self.__size = 0
+        self.__epoch = 0
+        metrics.counter(RESPONSE_CACHE_LOOKUPS, "Lookups of a response cache.", ("cache", "result"))
+        metrics.gauge(RESPONSE_CACHE_BYTES, "Size of the bodies and tags held by a response cache.", ("cache",))
+
+    def __len__(self) -> int:
+        """The amount of responses kept, the expired ones included until they are looked up or evicted."""
+        return len(self.__entries)
+
+    @property
+    def size(self) -> int:
+        """The size of the bodies and tags kept, in bytes."""
+        return self.__size
+
+    def get(self, key: str, variant: str) -> CachedResponse | None:
+        if not self.__max_bytes:
+            return None
+        entry = self.__entries.get((key, variant))
+        if entry is not None and entry[1] <= time.monotonic():
+            self.__remove(key, variant)
+            entry = None
+        if entry is None:
+            self.__metrics.increment(RESPONSE_CACHE_LOOKUPS, self.__name, "miss")
+            return None
+        self.__entries.move_to_end((key, variant))
+        self.__metrics.increment(RESPONSE_CACHE_LOOKUPS, self.__name, "hit")
+        return entry[0]
+
+    def epoch(self) -> int:
+        return self.__epoch
+
+    def put(self, key: str, variant: str, body: bytes, epoch: int) -> CachedResponse:
+        response = CachedResponse(body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"')
+        cost = self.__cost(response)
+        if epoch != self.__epoch or cost > self.__max_bytes:
+            return response
+        self.__remove(key, variant)
+        self.__entries[(key, variant)] = (response, time.monotonic() + self.__ttl)
+        self.__variants.setdefault(key, set()).add(variant)
+        self.__size += cost
+        while self.__size > self.__max_bytes:
+            self.__remove(*next(iter(self.__entries)))
+        self.__metrics.set_gauge(RESPONSE_CACHE_BYTES, self.__size, self.__name)
+        return response
+
+    def invalidate(self, key: str) -> None:
+        self.__epoch += 1
+        for variant in list(self.__variants.get(key, ())):
+            self.__remove(key, variant)
+        self.__metrics.set_gauge(RESPONSE_CACHE_BYTES, self.__size, self.__name)
+
+    def __remove(self, key: str, variant: str) -> None:
+        entry = self.__entries.pop((key, variant), None)
+        if entry is None:
+            return
+        self.__size -= self.__cost(entry[0])
+        variants = self.__variants[key]
+        variants.discard(variant)
+        if not variants:
+            del self.__variants[key]
+
+    @staticmethod
+    def __cost(response: CachedResponse) -> int:
+        return len(response.body) + len(response.etag)
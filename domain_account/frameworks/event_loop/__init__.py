@@ -0,0 +1,3 @@
+from .watchdog import LoopWatchdog
+
+__all__ = ["LoopWatchdog"]
@@ -0,0 +1,85 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+
+from domain_account.adapters.interfaces.metrics_service import MetricsService
+
+LOOP_LAG = "event_loop_lag_seconds"
+LOOP_BLOCKED = "event_loop_blocked_total"
+
+HEARTBEAT_INTERVAL = 0.05
+
+LAG_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class LoopWatchdog:
+    """Measure the scheduling lag of the event loop and report the calls blocking it.
+
+    A task wakes up every `HEARTBEAT_INTERVAL` seconds, records how late it woke up and leaves a heartbeat. A thread
+    checks the heartbeat and, when the loop missed it by more than the threshold, logs the stack of the event loop
+    thread while it is still blocked, which points at the offending call. Each blocking episode is reported once.
+
+    Args:
+        metrics (MetricsService): The metrics service receiving the lag histogram.
+        blocked_ms (float): Lag, in milliseconds, above which the event loop is considered blocked.
+
+    """
+
+    def __init__(self, metrics: MetricsService, blocked_ms: float) -> None:
+        """Initialize the LoopWatchdog and declare its metrics, it only watches once started."""
+        self._logger = logging.getLogger(f"{self.__class__.__name__}")
+        self.__metrics = metrics
+        self.__threshold = blocked_ms / 1000
+        self.__heartbeat = 0.0
+        self.__loop_thread = 0
+        self.__task: asyncio.Task[None] | None = None
+        self.__stopping = threading.Event()
+        metrics.histogram(LOOP_LAG, "Delay of the event loop in running a due callback.", buckets=LAG_BUCKETS)
+        metrics.counter(LOOP_BLOCKED, "Times the event loop was blocked for longer than the threshold.")
+
+    def start(self) -> None:
+        """Start watching the running event loop, it must be called from the event loop thread."""
+        if self.__task is not None:
+            return
+        self.__loop_thread = threading.get_ident()
+        self.__heartbeat = time.monotonic()
+        self.__task = asyncio.get_running_loop().create_task(self.__beat())
+        # Every run gets its own stop event, a thread still finishing its last wait cannot outlive a restart
+        self.__stopping = threading.Event()
+        threading.Thread(target=self.__watch, args=(self.__stopping,), name="loop-watchdog", daemon=True).start()
+
+    def stop(self) -> None:
+        """Stop watching the event loop."""
+        if self.__task is not None:
+            self.__task.cancel()
+            self.__task = None
+        self.__stopping.set()
+
+    async def __beat(self) -> None:
+        while True:
+            expected = time.monotonic() + HEARTBEAT_INTERVAL
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            now = time.monotonic()
+            self.__heartbeat = now
+            self.__metrics.observe(LOOP_LAG, max(now - expected, 0.0))
+
+    def __watch(self, stopping: threading.Event) -> None:
+        reported = 0.0
+        while not stopping.wait(self.__threshold / 2):
+            heartbeat = self.__heartbeat
+            late = time.monotonic() - heartbeat - HEARTBEAT_INTERVAL
+            if late < self.__threshold or heartbeat == reported:
+                continue
+            reported = heartbeat
+            frame = sys._current_frames().get(self.__loop_thread)  # pylint: disable=W0212
+            if frame is None:
+                continue
+            self.__metrics.increment(LOOP_BLOCKED)
+            self._logger.warning(
+                "Event loop blocked for %.0fms so far, event loop thread stack (most recent call last):\n%s",
+                late * 1000,
+                "".join(traceback.format_stack(frame)),
+            )
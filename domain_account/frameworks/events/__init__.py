@@ -0,0 +1,14 @@
+from .brokers import EventBatch, EventBroker, FileBroker, InMemoryBroker, create_broker, decode_batch, encode_batch
+from .outbox import OUTBOX_COLLECTION, Outbox
+
+__all__ = [
+    "OUTBOX_COLLECTION",
+    "EventBatch",
+    "EventBroker",
+    "FileBroker",
+    "InMemoryBroker",
+    "Outbox",
+    "create_broker",
+    "decode_batch",
+    "encode_batch",
+]
@@ -0,0 +1,129 @@
+import asyncio
+import gzip
+import json
+import os
+from abc import ABCMeta, abstractmethod
+from typing import Any, NamedTuple
+
+
+class EventBatch(NamedTuple):
+    """A batch of messages sent to a broker: their JSON bodies, one per line, compressed with `encoding`."""
+
+    body: bytes
+    encoding: str
+    messages: int
+
+
+def encode_batch(bodies: list[dict[str, Any]], level: int = 6) -> EventBatch:
+    """Encode messages as a batch, their JSON bodies one per line, compressed with gzip.
+
+    Args:
+        bodies (list[dict[str, Any]]): The JSON bodies of the messages, in order.
+        level (int): The gzip compression level.
+
+    Returns:
+        EventBatch: The batch of the messages.
+
+    """
+    lines = b"".join(json.dumps(body, separators=(",", ":")).encode() + b"\n" for body in bodies)
+    # Without a modification time, the same messages always compress to the same bytes
+    return EventBatch(gzip.compress(lines, compresslevel=level, mtime=0), "gzip", len(bodies))
+
+
+def decode_batch(batch: EventBatch) -> list[dict[str, Any]]:
+    """The JSON bodies of the messages of a batch, in order."""
+    lines = gzip.decompress(batch.body) if batch.encoding == "gzip" else batch.body
+    return [json.loads(line) for line in lines.splitlines()]
+
+
+class EventBroker(metaclass=ABCMeta):
+    """Abstract base class for the brokers the outbox publishes to, a client of Kafka or Pub/Sub would implement it.
+
+    A batch is sent by a single call, the broker receives its body as is: compressed, with its encoding, so it is
+    neither decoded nor compressed again on the way.
+
+    """
+
+    @abstractmethod
+    async def send(self, batch: EventBatch) -> None:
+        """Send a batch, and return once the broker received it.
+
+        Args:
+            batch (EventBatch): The batch of messages.
+
+        Raises:
+            OSError: If the broker could not receive the batch, it is sent again later.
+        """
+
+    async def close(self) -> None:
+        """Release what the broker holds, nothing by default."""
+
+
+class InMemoryBroker(EventBroker):
+    """A broker keeping the batches in the memory of the process, for the tests and the benchmarks.
+
+    Attributes:
+        batches (list[EventBatch]): The batches received, in order.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize the InMemoryBroker without any batch."""
+        self.batches: list[EventBatch] = []
+
+    async def send(self, batch: EventBatch) -> None:
+        self.batches.append(batch)
+
+    def messages(self) -> list[dict[str, Any]]:
+        """The JSON bodies of the messages received, in order."""
+        return [body for batch in self.batches for body in decode_batch(batch)]
+
+
+class FileBroker(EventBroker):
+    """A broker appending the batches to a local file, for the tests and the single box deployments.
+
+    Every batch is appended by a single write as a gzip member, and gzip members read as one stream: the whole
+    file reads as the JSON lines of every message, with `zcat` or `gzip.open`. The workers can share the file.
+
+    Args:
+        path (str): The file, created when missing.
+
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the FileBroker, the file is opened for every batch."""
+        self.__path = path
+
+    async def send(self, batch: EventBatch) -> None:
+        if batch.encoding != "gzip":
+            raise ValueError(f"The file broker only appends gzip batches, not [{batch.encoding}].")
+        await asyncio.to_thread(self.__append, batch.body)
+
+    def __append(self, body: bytes) -> None:
+        file = os.open(self.__path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        try:
+            os.write(file, body)
+        finally:
+            os.close(file)
+
+
+def create_broker(spec: str | None) -> EventBroker | None:
+    """The broker of a configuration.
+
+    Args:
+        spec (str | None): `memory`, `file:<path>`, or None and the empty string for none.
+
+    Returns:
+        EventBroker | None: The broker, None when the events are not published.
+
+    Raises:
+        ValueError: If the broker is unknown.
+
+    """
+    if not spec:
+        return None
+    if spec == "memory":
+        return InMemoryBroker()
+    if spec.startswith("file:") and len(spec) > len("file:"):
+        return FileBroker(spec[len("file:") :])
+    raise ValueError(f"Unknown event broker [{spec}], expected `memory` or `file:<path>`.")
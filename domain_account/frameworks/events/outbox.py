@@ -0,0 +1,178 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, TypeVar
+from uuid import uuid4
+
+from pymongo.errors import DuplicateKeyError
+
+from domain_account.adapters.interfaces.document_database_service import DocumentDatabaseService, session_options
+from domain_account.adapters.interfaces.event_outbox_service import EventOutboxService, OutboxMessage
+from domain_account.adapters.interfaces.metrics_service import MetricsService
+
+from .brokers import EventBroker, encode_batch
+
+OUTBOX_COLLECTION = "account_events"
+# How long the worker publishing holds the lease without renewing it, before another worker takes over
+PUBLISHER_LEASE = timedelta(seconds=30)
+
+EVENTS_PUBLISHED = "events_published_total"
+EVENT_PUBLISH_FAILURES = "event_publish_failures_total"
+EVENT_PUBLISH_LAG = "event_publish_lag_seconds"
+
+T = TypeVar("T")
+
+
+class Outbox(EventOutboxService):  # pylint: disable=R0902
+    """Store the messages to publish in the `account_events` collection, and publish them to a broker in the background.
+
+    `append` inserts the messages and returns, the broker is never on the path of the caller. Every worker runs a
+    publisher task, and the one holding the lease of the `account_events_publisher` collection publishes: it reads
+    the oldest messages, `batch_size` at most, encodes them as a gzip compressed batch in a thread, sends the batch
+    to the broker and deletes its messages. A full batch is followed by the next one at once, otherwise the publisher
+    waits `interval`, so the messages of a second are sent together. A batch the broker did not receive stays in the
+    outbox and is sent again after `interval`.
+
+    The transactions are the ones of the database: on a replica set, the write of a user and the insert of its
+    messages commit together, so no event is lost nor published for a write rolled back. A partitioned database
+    keeps the outbox on the home partition, apart from most users: the insert is a second write there.
+
+    The messages are published at least once: a worker dying between sending a batch and deleting it lets the next
+    one send it again, the consumers deduplicate the messages by their ID. The lease is renewed with every batch and
+    released when the worker stops, a worker dying holding it is replaced after `PUBLISHER_LEASE`.
+
+    Args:
+        database (DocumentDatabaseService): The database of the outbox, its home partition when partitioned.
+        broker (EventBroker): The broker the messages are published to.
+        metrics (MetricsService): The metrics service receiving the messages published and the failures.
+        batch_size (int): The amount of messages sent to the broker at once, at most.
+        interval (float): Seconds waited for messages once the outbox is drained, and before retrying a failure.
+
+    """
+
+    def __init__(
+        self,
+        database: DocumentDatabaseService,
+        broker: EventBroker,
+        metrics: MetricsService,
+        batch_size: int,
+        interval: float,
+    ) -> None:
+        """Initialize the Outbox and declare its metrics, the publisher only starts once the worker opens it."""
+        self._logger = logging.getLogger(f"{self.__class__.__name__}")
+        self.__database = database
+        self.__broker = broker
+        self.__metrics = metrics
+        self.__batch_size = batch_size
+        self.__interval = interval
+        self.__publisher: tuple[asyncio.Task[None], asyncio.Event] | None = None
+        self.__holder = ""
+        metrics.counter(EVENTS_PUBLISHED, "Events received by the broker.")
+        metrics.counter(EVENT_PUBLISH_FAILURES, "Batches of events the broker did not receive.")
+        metrics.gauge(EVENT_PUBLISH_LAG, "Seconds between the oldest event of the last batch and its publication.")
+
+    @property
+    def broker(self) -> EventBroker:
+        """The broker the messages are published to."""
+        return self.__broker
+
+    async def open(self) -> None:
+        """Create the index ordering the messages and start the publisher task of the worker."""
+        if self.__publisher is not None:
+            return
+        await self.__messages.create_index("occurred_at")
+        # Taken after the fork, so every worker has its own
+        self.__holder = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        stopping = asyncio.Event()
+        self.__publisher = (asyncio.create_task(self.__publish_forever(stopping)), stopping)
+
+    async def close(self) -> None:
+        """Stop the publisher task once its batch is sent, and release the lease for another worker to take it."""
+        if self.__publisher is None:
+            return
+        task, stopping = self.__publisher
+        self.__publisher = None
+        stopping.set()
+        await task
+        await self.__leases.delete_one({"_id": "publisher", "holder": self.__holder})
+        await self.__broker.close()
+
+    async def transaction(self, write: Callable[[], Awaitable[T]]) -> T:
+        return await self.__database.transaction(write)
+
+    async def append(self, messages: list[OutboxMessage]) -> None:
+        await self.__messages.insert_many(
+            [
+                {"_id": message.id, "key": message.key, "occurred_at": message.occurred_at, "body": message.body}
+                for message in messages
+            ],
+            **session_options(),
+        )
+
+    async def publish(self) -> int:
+        """Publish the oldest messages of the outbox, a batch at most, and delete them once the broker received them.
+
+        Returns:
+            int: The amount of messages published, 0 when the outbox is empty.
+
+        """
+        messages: list[dict[str, Any]] = (
+            await self.__messages.find({}, {"key": 0})
+            .sort("occurred_at", 1)
+            .limit(self.__batch_size)
+            .to_list(self.__batch_size)
+        )
+        if not messages:
+            return 0
+        batch = await asyncio.to_thread(encode_batch, [message["body"] for message in messages])
+        await self.__broker.send(batch)
+        await self.__messages.delete_many({"_id": {"$in": [message["_id"] for message in messages]}})
+        oldest = messages[0]["occurred_at"]
+        if oldest.tzinfo is None:
+            # The drivers decode the dates as naive UTC ones
+            oldest = oldest.replace(tzinfo=timezone.utc)
+        self.__metrics.increment(EVENTS_PUBLISHED, amount=len(messages))
+        self.__metrics.set_gauge(EVENT_PUBLISH_LAG, (datetime.now(timezone.utc) - oldest).total_seconds())
+        return len(messages)
+
+    async def __publish_forever(self, stopping: asyncio.Event) -> None:
+        while not stopping.is_set():
+            published = 0
+            started = time.monotonic()
+            try:
+                if await self.__lease():
+                    published = await self.publish()
+            except Exception:  # pylint: disable=W0718
+                self._logger.exception("Could not publish the events, retrying in %.1fs.", self.__interval)
+                self.__metrics.increment(EVENT_PUBLISH_FAILURES)
+            if published < self.__batch_size:
+                remaining = self.__interval - (time.monotonic() - started)
+                try:
+                    await asyncio.wait_for(stopping.wait(), max(remaining, 0))
+                except asyncio.TimeoutError:
+                    pass
+
+    async def __lease(self) -> bool:
+        now = datetime.now(timezone.utc)
+        lease = {"holder": self.__holder, "expires_at": now + PUBLISHER_LEASE}
+        renewed = await self.__leases.update_one(
+            {"_id": "publisher", "$or": [{"holder": self.__holder}, {"expires_at": {"$lt": now}}]}, {"$set": lease}
+        )
+        if renewed.matched_count:
+            return True
+        try:
+            await self.__leases.insert_one({"_id": "publisher", **lease})
+        except DuplicateKeyError:
+            return False
+        return True
+
+    @property
+    def __messages(self) -> Any:
+        return self.__database.database[OUTBOX_COLLECTION]
+
+    @property
+    def __leases(self) -> Any:
+        return self.__database.database[f"{OUTBOX_COLLECTION}_publisher"]
@@ -1,3 +1,5 @@
+from typing import Any
+
 import firebase_admin
 import firebase_admin.auth
 from fastapi import status
@@ -6,6 +8,8 @@ from firebase_admin import credentials
 
 from domain_account.adapters.interfaces.authentication_service import AuthenticationService, BearerToken, UserUid
 
+ADMIN_CLAIM = "admin"
+
 
 class FirebaseManager(AuthenticationService):
     """
@@ -42,14 +46,35 @@ class FirebaseManager(AuthenticationService):
         Raises:
             HTTPException: If the token is invalid or expired.
         """
+        decoded_token = self.__verify(token)
+        uid = decoded_token["uid"]
+        return UserUid(uid)
+
+    def authenticate_admin_by_token(self, token: BearerToken) -> UserUid:
+        """
+        Authenticate an administrator by bearer token, administrators hold the `admin` custom claim.
+
+        Args:
+            token (BearerToken): The bearer token for authentication.
+
+        Returns:
+            UserUid: The unique identifier of the authenticated administrator.
+
+        Raises:
+            HTTPException: If the token is invalid, expired or does not belong to an administrator.
+        """
+        decoded_token = self.__verify(token)
+        if decoded_token.get(ADMIN_CLAIM) is not True:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Administrator privileges are needed")
+        return UserUid(decoded_token["uid"])
+
+    def __verify(self, token: BearerToken) -> dict[str, Any]:
         try:
-            decoded_token = firebase_admin.auth.verify_id_token(token, self.__firebase_app)
+            decoded_token: dict[str, Any] = firebase_admin.auth.verify_id_token(token, self.__firebase_app)
         except Exception as error:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid authentication",
                 headers={"WWW-Authenticate": 'Bearer error="invalid_token"'},
             ) from error
-
-        uid = decoded_token["uid"]
-        return UserUid(uid)
+        return decoded_token
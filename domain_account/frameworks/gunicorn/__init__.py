@@ -0,0 +1,3 @@
+from .lifecycle import WorkerLifecycle, worker_lifecycle
+
+__all__ = ["WorkerLifecycle", "worker_lifecycle"]
@@ -0,0 +1,81 @@
+import gc
+import logging
+from typing import Callable
+
+LifecycleHook = Callable[[], None]
+
+
+class WorkerLifecycle:
+    """Explicit fork boundary for gunicorn deployments running with `--preload`.
+
+    With `--preload`, everything reachable from `create_app()` is built once in the master process and inherited
+    copy-on-write by every worker. Those resources must stay immutable after the fork: configuration, compiled
+    pydantic validators, the OpenAPI schema and read-only caches.
+
+    Anything owning a socket, a thread or a client (Motor, HTTP sessions, background tasks) belongs to a single
+    worker. It is created after the fork, from a post fork hook or the ASGI lifespan, and released by a worker exit
+    hook registered here.
+
+    Attributes:
+        _logger (Logger): An instance of the logger for logging messages.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize the WorkerLifecycle without any registered hook."""
+        self._logger = logging.getLogger(f"{self.__class__.__name__}")
+        self.__post_fork_hooks: list[LifecycleHook] = []
+        self.__worker_exit_hooks: list[LifecycleHook] = []
+
+    def on_post_fork(self, hook: LifecycleHook) -> LifecycleHook:
+        """Register a hook executed inside each worker right after the fork.
+
+        Args:
+            hook (LifecycleHook): Callable creating or resetting per worker resources.
+
+        Returns:
+            LifecycleHook: The registered hook, so the method can be used as a decorator.
+
+        """
+        self.__post_fork_hooks.append(hook)
+        return hook
+
+    def on_worker_exit(self, hook: LifecycleHook) -> LifecycleHook:
+        """Register a hook executed inside each worker when it exits.
+
+        Args:
+            hook (LifecycleHook): Callable releasing per worker resources.
+
+        Returns:
+            LifecycleHook: The registered hook, so the method can be used as a decorator.
+
+        """
+        self.__worker_exit_hooks.append(hook)
+        return hook
+
+    def freeze(self) -> None:
+        """Move every object allocated so far to the permanent GC generation.
+
+        Called in the master once the application is preloaded, so the garbage collector of the workers never
+        touches (and therefore never copies) the pages holding the pre fork objects.
+
+        """
+        gc.collect()
+        gc.freeze()
+        self._logger.info("Froze %d pre fork objects.", gc.get_freeze_count())
+
+    def post_fork(self) -> None:
+        """Run the post fork hooks in registration order."""
+        for hook in self.__post_fork_hooks:
+            hook()
+
+    def worker_exit(self) -> None:
+        """Run the worker exit hooks in reverse registration order."""
+        for hook in reversed(self.__worker_exit_hooks):
+            try:
+                hook()
+            except Exception:  # pylint: disable=W0718
+                self._logger.exception("Worker exit hook [%s] failed.", getattr(hook, "__qualname__", hook))
+
+
+worker_lifecycle = WorkerLifecycle()
@@ -0,0 +1,41 @@
+from typing import Any
+
+from uvicorn.workers import UvicornWorker
+
+
+class AsyncioUvicornWorker(UvicornWorker):
+    """Uvicorn worker pinned to the standard library asyncio loop and the pure Python h11 parser."""
+
+    CONFIG_KWARGS: dict[str, Any] = {"loop": "asyncio", "http": "h11"}
+
+
+class UvloopUvicornWorker(UvicornWorker):
+    """Uvicorn worker running on uvloop with the httptools (llhttp) HTTP parser."""
+
+    CONFIG_KWARGS: dict[str, Any] = {"loop": "uvloop", "http": "httptools"}
+
+
+EVENT_LOOP_WORKERS: dict[str, type[UvicornWorker]] = {
+    "asyncio": AsyncioUvicornWorker,
+    "uvloop": UvloopUvicornWorker,
+}
+
+
+def worker_class_for(event_loop: str) -> str:
+    """Return the gunicorn `worker_class` path of the worker running on the given event loop engine.
+
+    Args:
+        event_loop (str): The event loop engine, either "asyncio" or "uvloop".
+
+    Returns:
+        str: The dotted path of the worker class, as expected by gunicorn.
+
+    Raises:
+        ValueError: If the event loop engine is not supported.
+
+    """
+    try:
+        worker = EVENT_LOOP_WORKERS[event_loop]
+    except KeyError as error:
+        raise ValueError(f"Unsupported event loop [{event_loop}], use one of {sorted(EVENT_LOOP_WORKERS)}.") from error
+    return f"{worker.__module__}.{worker.__qualname__}"
@@ -0,0 +1,4 @@
+from .collectors import anyio_thread_pool_collector, declare_thread_pool_metrics, thread_pool_collector
+from .registry import MetricsRegistry
+
+__all__ = ["MetricsRegistry", "anyio_thread_pool_collector", "declare_thread_pool_metrics", "thread_pool_collector"]
@@ -0,0 +1,61 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import anyio.to_thread
+
+from domain_account.adapters.interfaces.metrics_service import Collector, MetricsService
+
+
+def declare_thread_pool_metrics(metrics: MetricsService) -> None:
+    """Declare the gauges shared by every thread pool collector."""
+    metrics.gauge("thread_pool_capacity", "Maximum amount of threads of the pool.", ("pool",))
+    metrics.gauge("thread_pool_busy", "Amount of threads of the pool running a task.", ("pool",))
+    metrics.gauge("thread_pool_queued", "Amount of tasks waiting for a thread of the pool.", ("pool",))
+
+
+def thread_pool_collector(metrics: MetricsService, pool: str, executor: ThreadPoolExecutor) -> Collector:
+    """Build a collector reporting the utilisation of a `ThreadPoolExecutor`.
+
+    Args:
+        metrics (MetricsService): The metrics service receiving the gauges.
+        pool (str): The value of the `pool` label.
+        executor (ThreadPoolExecutor): The executor to observe.
+
+    Returns:
+        Collector: The collector, to be registered with `MetricsService.add_collector`.
+
+    """
+    declare_thread_pool_metrics(metrics)
+
+    def collect() -> None:
+        # ThreadPoolExecutor has no public statistics, its bookkeeping attributes are stable since Python 3.8
+        threads = len(executor._threads)  # pylint: disable=W0212
+        idle = executor._idle_semaphore._value  # type: ignore[attr-defined]  # pylint: disable=W0212
+        metrics.set_gauge("thread_pool_capacity", executor._max_workers, pool)  # pylint: disable=W0212
+        metrics.set_gauge("thread_pool_busy", max(threads - idle, 0), pool)
+        metrics.set_gauge("thread_pool_queued", executor._work_queue.qsize(), pool)  # pylint: disable=W0212
+
+    return collect
+
+
+def anyio_thread_pool_collector(metrics: MetricsService) -> Collector:
+    """Build a collector reporting the utilisation of the anyio worker threads.
+
+    FastAPI runs the synchronous dependencies (such as the token verification) and endpoints on these threads,
+    bounded by the anyio default capacity limiter. The collector must run on the event loop thread.
+
+    Args:
+        metrics (MetricsService): The metrics service receiving the gauges.
+
+    Returns:
+        Collector: The collector, to be registered with `MetricsService.add_collector`.
+
+    """
+    declare_thread_pool_metrics(metrics)
+
+    def collect() -> None:
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        metrics.set_gauge("thread_pool_capacity", limiter.total_tokens, "anyio")
+        metrics.set_gauge("thread_pool_busy", limiter.borrowed_tokens, "anyio")
+        metrics.set_gauge("thread_pool_queued", limiter.statistics().tasks_waiting, "anyio")
+
+    return collect
@@ -0,0 +1,212 @@
+import logging
+import math
+from bisect import bisect_left
+from threading import Lock
+from typing import Any, Iterable
+
+from domain_account.adapters.interfaces.metrics_service import Collector, MetricsService
+
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class _Value:
+    """A single counter or gauge sample."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+
+class _Histogram:
+    """A single histogram sample, the counts are stored per bucket and accumulated on exposition."""
+
+    __slots__ = ("counts", "total")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+
+
+class _Family:
+    """All the samples of a metric, one per combination of label values, guarded by a single lock."""
+
+    __slots__ = ("name", "documentation", "kind", "label_names", "buckets", "children", "lock")
+
+    def __init__(
+        self, name: str, documentation: str, kind: str, label_names: tuple[str, ...], buckets: tuple[float, ...]
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.kind = kind
+        self.label_names = label_names
+        self.buckets = buckets
+        self.children: dict[tuple[str, ...], Any] = {}
+        self.lock = Lock()
+
+    def child(self, labels: tuple[str, ...]) -> Any:
+        """Return the sample of the label values, creating it on first use (must be called holding the lock)."""
+        child = self.children.get(labels)
+        if child is None:
+            if len(labels) != len(self.label_names):
+                raise ValueError(f"Metric [{self.name}] expects the labels {self.label_names}, got {labels}.")
+            child = self.children[labels] = _Histogram(self.buckets) if self.kind == "histogram" else _Value()
+        return child
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_float(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class MetricsRegistry(MetricsService):
+    """In-process metrics registry rendering the Prometheus text exposition format.
+
+    Updates are lock protected per metric, so they are safe from the event loop and from executor threads, and
+    cost a couple of dictionary lookups. `observe_many` records a batch of observations under a single lock.
+    With gunicorn, each worker owns its registry: the registry is created empty before the fork and every worker
+    fills its own copy.
+
+    Attributes:
+        _logger (Logger): An instance of the logger for logging messages.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._logger = logging.getLogger(f"{self.__class__.__name__}")
+        self.__families: dict[str, _Family] = {}
+        self.__collectors: list[Collector] = []
+
+    def __declare(
+        self,
+        name: str,
+        documentation: str,
+        kind: str,
+        label_names: tuple[str, ...],
+        buckets: tuple[float, ...] = (),
+    ) -> None:
+        family = self.__families.get(name)
+        if family is None:
+            self.__families[name] = _Family(name, documentation, kind, label_names, buckets)
+        elif family.kind != kind or family.label_names != label_names:
+            raise ValueError(f"Metric [{name}] is already declared as a {family.kind} of {family.label_names}.")
+
+    def counter(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> None:
+        """Declare a monotonic counter, declaring an existing metric again is a no-op."""
+        self.__declare(name, documentation, "counter", label_names)
+
+    def gauge(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> None:
+        """Declare a gauge, declaring an existing metric again is a no-op."""
+        self.__declare(name, documentation, "gauge", label_names)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] | None = None,
+    ) -> None:
+        """Declare a histogram, using `DEFAULT_BUCKETS` (100us to 10s) when no bucket is given."""
+        self.__declare(name, documentation, "histogram", label_names, tuple(sorted(buckets or DEFAULT_BUCKETS)))
+
+    def increment(self, name: str, *labels: str, amount: float = 1.0) -> None:
+        """Add an amount to a counter or a gauge."""
+        family = self.__families[name]
+        with family.lock:
+            family.child(labels).value += amount
+
+    def set_gauge(self, name: str, value: float, *labels: str) -> None:
+        """Set the value of a gauge."""
+        family = self.__families[name]
+        with family.lock:
+            family.child(labels).value = value
+
+    def observe(self, name: str, value: float, *labels: str) -> None:
+        """Record an observation in a histogram."""
+        family = self.__families[name]
+        index = bisect_left(family.buckets, value)
+        with family.lock:
+            child = family.children.get(labels) or family.child(labels)
+            child.counts[index] += 1
+            child.total += value
+
+    def observe_many(self, name: str, observations: Iterable[tuple[float, tuple[str, ...]]]) -> None:
+        """Record several observations in a histogram, taking its lock once."""
+        family = self.__families[name]
+        buckets = family.buckets
+        with family.lock:
+            for value, labels in observations:
+                child = family.children.get(labels) or family.child(labels)
+                child.counts[bisect_left(buckets, value)] += 1
+                child.total += value
+
+    def add_collector(self, collector: Collector) -> None:
+        """Register a callback refreshing metrics right before each exposition."""
+        self.__collectors.append(collector)
+
+    def exposition(self) -> str:
+        """Run the collectors and render every metric in the Prometheus text exposition format."""
+        for collector in self.__collectors:
+            try:
+                collector()
+            except Exception:  # pylint: disable=W0718
+                self._logger.exception("Metrics collector [%s] failed.", getattr(collector, "__qualname__", collector))
+        lines: list[str] = []
+        for family in self.__families.values():
+            lines.append(f"# HELP {family.name} {family.documentation}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            with family.lock:
+                samples = [
+                    (labels, (list(child.counts), child.total) if family.kind == "histogram" else child.value)
+                    for labels, child in family.children.items()
+                ]
+            for labels, sample in samples:
+                if family.kind == "histogram":
+                    lines.extend(self.__histogram_lines(family, labels, *sample))
+                else:
+                    lines.append(f"{family.name}{_format_labels(family.label_names, labels)} {sample!r}")
+        lines.append("")
+        return "\n".join(lines)
+
+    @staticmethod
+    def __histogram_lines(family: _Family, labels: tuple[str, ...], counts: list[int], total: float) -> list[str]:
+        lines = []
+        cumulative = 0
+        for upper_bound, count in zip((*family.buckets, math.inf), counts):
+            cumulative += count
+            bucket_labels = _format_labels(family.label_names, labels, f'le="{_format_float(upper_bound)}"')
+            lines.append(f"{family.name}_bucket{bucket_labels} {cumulative}")
+        sample_labels = _format_labels(family.label_names, labels)
+        lines.append(f"{family.name}_sum{sample_labels} {total!r}")
+        lines.append(f"{family.name}_count{sample_labels} {cumulative}")
+        return lines
@@ -1,3 +1,45 @@
+from typing import TYPE_CHECKING
+
+from .durability import DEFAULT_WRITE_DURABILITY, DURABILITY_TIERS, WriteDurabilityPolicy
 from .manager import MotorManager
 
-__all__ = ["MotorManager"]
+if TYPE_CHECKING:
+    from .pymongo_manager import PyMongoAsyncManager
+
+# The names of the database drivers, their managers are only imported once selected
+DATABASE_DRIVERS = ("motor", "pymongo")
+
+
+def database_manager(driver: str) -> "type[MotorManager] | type[PyMongoAsyncManager]":
+    """The database manager of a driver.
+
+    The PyMongo manager is only imported when selected, `AsyncMongoClient` is missing from the pymongo releases
+    before 4.9 that an install running Motor may still have.
+
+    Args:
+        driver (str): The name of the driver, one of `DATABASE_DRIVERS`.
+
+    Returns:
+        type[MotorManager] | type[PyMongoAsyncManager]: The database manager class of the driver.
+
+    Raises:
+        ValueError: If the driver is unknown.
+
+    """
+    if driver == "motor":
+        return MotorManager
+    if driver == "pymongo":
+        from . import pymongo_manager  # pylint: disable=C0415
+
+        return pymongo_manager.PyMongoAsyncManager
+    raise ValueError(f"Unknown database driver [{driver}], expected one of {sorted(DATABASE_DRIVERS)}.")
+
+
+__all__ = [
+    "DATABASE_DRIVERS",
+    "DEFAULT_WRITE_DURABILITY",
+    "DURABILITY_TIERS",
+    "MotorManager",
+    "WriteDurabilityPolicy",
+    "database_manager",
+]
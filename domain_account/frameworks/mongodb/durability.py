@@ -0,0 +1,48 @@
+from typing import Mapping
+
+from pymongo.write_concern import WriteConcern
+
+from domain_account.adapters.interfaces.write_durability_service import WRITE_OPERATIONS, WriteDurabilityService
+
+# The write concern of each durability tier, `default` leaving it to the client (w:majority since MongoDB 5.0)
+DURABILITY_TIERS: dict[str, WriteConcern | None] = {
+    "default": None,
+    "acknowledged": WriteConcern(w=1),
+    "majority": WriteConcern(w="majority"),
+    "majority_journaled": WriteConcern(w="majority", j=True),
+}
+
+# Registering creates the account and claims its CPF: it waits for the journal of a majority. Address updates are
+# resent by the client when lost, and the user counts are rebuilt from the users, so the primary acknowledges them.
+DEFAULT_WRITE_DURABILITY = {
+    "register": "majority_journaled",
+    "update_address": "acknowledged",
+    "update_cpf": "majority",
+    "update_account": "majority",
+    "user_stats": "acknowledged",
+}
+
+
+class WriteDurabilityPolicy(WriteDurabilityService):
+    """The durability tier of each write operation, as configured.
+
+    Args:
+        tiers (Mapping[str, str]): The tier of each operation, one of `DURABILITY_TIERS`. The operations missing
+            use the default write concern of the client.
+
+    Raises:
+        ValueError: If an operation or a tier is unknown.
+
+    """
+
+    def __init__(self, tiers: Mapping[str, str]) -> None:
+        """Initialize the WriteDurabilityPolicy, resolving the write concern of every operation."""
+        for operation, tier in tiers.items():
+            if operation not in WRITE_OPERATIONS:
+                raise ValueError(f"Unknown write operation [{operation}], expected one of {list(WRITE_OPERATIONS)}.")
+            if tier not in DURABILITY_TIERS:
+                raise ValueError(f"Unknown durability tier [{tier}], expected one of {list(DURABILITY_TIERS)}.")
+        self.__write_concerns = {operation: DURABILITY_TIERS[tier] for operation, tier in tiers.items()}
+
+    def write_concern(self, operation: str) -> WriteConcern | None:
+        return self.__write_concerns.get(operation)
@@ -1,13 +1,22 @@
 import logging
+import os
+from typing import Any, Awaitable, Callable
 
 import certifi
+import motor.frameworks.asyncio
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from pymongo.errors import ConnectionFailure
+from pymongo.monitoring import CommandListener, ConnectionPoolListener
 
 from domain_account.adapters.interfaces import DocumentDatabaseService
+from domain_account.adapters.interfaces.metrics_service import MetricsService
+from domain_account.frameworks.metrics import thread_pool_collector
 
+from .monitoring import CommandMetricsListener, PoolMetricsListener
+from .transactions import T, has_transactions, run_transaction
 
-class MotorManager(DocumentDatabaseService[AsyncIOMotorClient, AsyncIOMotorDatabase]):
+
+class MotorManager(DocumentDatabaseService[AsyncIOMotorClient, AsyncIOMotorDatabase]):  # pylint: disable=R0902
     """Manager for Motor (Async MongoDB Client).
 
     This class manages connections to a MongoDB database using the Motor asynchronous client.
@@ -16,23 +25,49 @@ class MotorManager(DocumentDatabaseService[AsyncIOMotorClient, AsyncIOMotorDatab
         service_name (str): The name of the service using the MotorManager.
         database_name (str): The name of the MongoDB database.
         database_uri (str): The URI of the MongoDB instance.
+        tls (bool): Whether to connect with TLS, verified against the certifi CA bundle.
 
     Attributes:
         _logger (Logger): An instance of the logger for logging messages.
         _service_name (str): The name of the service using the MotorManager.
         _database_name (str): The name of the MongoDB database.
         _database_uri (str): The URI of the MongoDB instance.
+        _tls (bool): Whether to connect with TLS.
         _client (AsyncIOMotorClient | None): The Motor asynchronous client instance.
+        _client_pid (int | None): The id of the process that created the client, clients are not fork safe.
+        _event_listeners (list): The driver listeners registered on every new client.
+        _transactions (bool): Whether the deployment connected to runs multi-document transactions.
 
     """
 
-    def __init__(self, service_name: str, database_name: str, database_uri: str) -> None:
+    def __init__(self, service_name: str, database_name: str, database_uri: str, tls: bool = True) -> None:
         """Initialize the MotorManager with the provided parameters."""
         self._logger = logging.getLogger(f"{self.__class__.__name__}")
         self._service_name = service_name
         self._database_name = database_name
         self._database_uri = database_uri
+        self._tls = tls
         self._client: AsyncIOMotorClient | None = None
+        self._client_pid: int | None = None
+        self._event_listeners: list[CommandListener | ConnectionPoolListener] = []
+        self._transactions = False
+
+    def instrument(self, metrics: MetricsService, slow_command_ms: float) -> None:
+        """Report the driver metrics through the provided metrics service.
+
+        Args:
+            metrics (MetricsService): The metrics service receiving the measurements.
+            slow_command_ms (float): Round trip duration, in milliseconds, above which a command is logged.
+
+        """
+        # Motor runs every blocking PyMongo call on its own module level thread pool
+        executor = motor.frameworks.asyncio._EXECUTOR  # pylint: disable=W0212
+        metrics.add_collector(thread_pool_collector(metrics, "motor", executor))
+        # Listeners are bound to a client when it is created, so they only apply to the clients connected from now on
+        self._event_listeners = [
+            CommandMetricsListener(metrics, slow_command_ms / 1000),
+            PoolMetricsListener(metrics),
+        ]
 
     async def connect(self) -> None:
         """Connect to a MongoDB cluster asynchronously.
@@ -43,21 +78,67 @@ class MotorManager(DocumentDatabaseService[AsyncIOMotorClient, AsyncIOMotorDatab
         """
         self.close()
         try:
-            ca = certifi.where()
-            self._client = AsyncIOMotorClient(self._database_uri, appname=self._service_name, tls=True, tlsCAFile=ca)
+            tls_options: dict[str, Any] = {"tls": True, "tlsCAFile": certifi.where()} if self._tls else {}
+            self._client = AsyncIOMotorClient(
+                self._database_uri,
+                appname=self._service_name,
+                event_listeners=self._event_listeners,
+                **tls_options,
+            )
+            self._client_pid = os.getpid()
             await self._client.admin.command("ping")
+            # A property, that the Motor stubs declare as a method
+            self._transactions = has_transactions(self._client.topology_description)  # type: ignore[arg-type]
         except ConnectionFailure:  # pragma: no cover
             self._logger.info("Server [%s] not available!", self._database_uri)
         else:
             self._logger.info("Connected to MongoDB [%s].", self._database_name)
 
+    async def transaction(self, write: Callable[[], Awaitable[T]]) -> T:
+        """Run writes in a single transaction, when the deployment is a replica set or a sharded cluster.
+
+        The transaction is committed with the write concern of the client, and retried from the start, for up to two
+        minutes, when it fails with a transient error such as a write conflict. The writes deferred with `after_commit`
+        run once it committed. A standalone server has no transactions, the writes run one after the other.
+
+        Args:
+            write (Callable[[], Awaitable[T]]): The writes, run again from the start when the transaction is retried.
+
+        Returns:
+            T: What the writes returned.
+
+        """
+        if not self._transactions:
+            return await write()
+        return await run_transaction(await self.client.start_session(), write)
+
+    async def disconnect(self) -> None:
+        """Close the current database connection, Motor closes its client synchronously."""
+        self.close()
+
     def close(self) -> None:
         """Close the current database connection."""
         if self._client is None:
             return
         self._client.close()
+        self._client = None
+        self._client_pid = None
+        self._transactions = False
         self._logger.info("Closed MongoDB connection.")
 
+    def after_fork(self) -> None:
+        """Drop a client inherited from the parent process.
+
+        The sockets and monitor threads of a client belong to the process that created it, so a forked worker must
+        never use (nor close) them. The worker creates its own client when `connect` is called from its lifespan.
+
+        """
+        if self._client is not None and self._client_pid != os.getpid():
+            self._logger.warning("Discarded a MongoDB client inherited from process [%s].", self._client_pid)
+            self._client = None
+            self._client_pid = None
+            self._transactions = False
+
     @property
     def client(self) -> AsyncIOMotorClient:
         """Return the instantiated MongoDB client.
@@ -66,11 +147,13 @@ class MotorManager(DocumentDatabaseService[AsyncIOMotorClient, AsyncIOMotorDatab
             AsyncIOMotorClient: The instantiated MongoDB client.
 
         Raises:
-            ValueError: If there is no MongoDB client instantiated.
+            ValueError: If there is no MongoDB client instantiated in the current process.
 
         """
         if self._client is None:
             raise ValueError("There is no MongoDB client.")
+        if self._client_pid != os.getpid():
+            raise ValueError("The MongoDB client was created before the fork, connect it inside the worker.")
         return self._client
 
     @property
@@ -0,0 +1,198 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Mapping
+
+import bson
+from pymongo import monitoring
+
+from domain_account.adapters.interfaces.metrics_service import MetricsService
+
+COMMAND_DURATION = "mongodb_command_duration_seconds"
+COMMAND_REPLY_SIZE = "mongodb_command_reply_bytes"
+COMMAND_FAILURES = "mongodb_command_failures_total"
+COMMAND_RETRIES = "mongodb_command_retries_total"
+POOL_WAIT = "mongodb_pool_wait_seconds"
+
+REPLY_SIZE_BUCKETS = (256.0, 512.0, 1024.0, 2048.0, 4096.0, 16384.0, 65536.0, 262144.0, 1048576.0, 16777216.0)
+
+_MAX_TRACKED_OPERATIONS = 1024
+
+
+def query_shape(value: Any) -> Any:
+    """Replace every value of a query by "?", keeping the field paths and operators.
+
+    Args:
+        value (Any): A filter, update document or pipeline.
+
+    Returns:
+        Any: The shape of the value, safe to be logged since it holds no user data.
+
+    """
+    if isinstance(value, Mapping):
+        return {key: query_shape(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        shapes = [query_shape(item) for item in value if isinstance(item, Mapping)]
+        return shapes or "?"
+    return "?"
+
+
+def command_shape(command_name: str, command: Mapping[str, Any]) -> dict[str, Any]:
+    """Extract the shape of the parts of a command describing which documents it touches.
+
+    Args:
+        command_name (str): The command name, such as "find" or "update".
+        command (Mapping[str, Any]): The command document sent to the server.
+
+    Returns:
+        dict[str, Any]: The shapes of the filter, update or pipeline of the command.
+
+    """
+    shape: dict[str, Any] = {}
+    for key in ("filter", "query", "update", "projection", "sort", "pipeline"):
+        if key in command and key != command_name:
+            shape[key] = query_shape(command[key])
+    if command_name in ("update", "delete") and command.get(f"{command_name}s"):
+        statement = command[f"{command_name}s"][0]
+        shape["statements"] = len(command[f"{command_name}s"])
+        shape["q"] = query_shape(statement.get("q", {}))
+        if "u" in statement:
+            shape["u"] = query_shape(statement["u"])
+    if command_name == "insert":
+        shape["documents"] = len(command.get("documents", ()))
+    return shape
+
+
+class CommandMetricsListener(monitoring.CommandListener):
+    """Record the client side view of every command: round trip latency, reply size, failures and retries.
+
+    Commands slower than the threshold are logged with the shape of their filter, never its values. The callbacks
+    run on the threads executing the commands, so they only do bookkeeping and lock protected metric updates.
+
+    Args:
+        metrics (MetricsService): The metrics service receiving the measurements.
+        slow_command_threshold (float): Duration, in seconds, above which a command is logged.
+
+    """
+
+    def __init__(self, metrics: MetricsService, slow_command_threshold: float) -> None:
+        """Initialize the CommandMetricsListener and declare its metrics."""
+        self._logger = logging.getLogger(f"{self.__class__.__name__}")
+        self.__metrics = metrics
+        self.__threshold = slow_command_threshold
+        self.__in_flight: dict[tuple[Any, int], tuple[str, Mapping[str, Any]]] = {}
+        self.__failed_operations: OrderedDict[int, None] = OrderedDict()
+        self.__lock = threading.Lock()
+        metrics.histogram(COMMAND_DURATION, "MongoDB command round trip latency.", ("command", "collection"))
+        metrics.histogram(
+            COMMAND_REPLY_SIZE, "MongoDB command reply size.", ("command", "collection"), REPLY_SIZE_BUCKETS
+        )
+        metrics.counter(COMMAND_FAILURES, "MongoDB commands that failed.", ("command", "collection"))
+        metrics.counter(COMMAND_RETRIES, "MongoDB commands retried by the driver.", ("command", "collection"))
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        """Remember the command until it finishes and count driver retries."""
+        collection = event.command.get(event.command_name)
+        collection = collection if isinstance(collection, str) else ""
+        self.__in_flight[(event.connection_id, event.request_id)] = (collection, event.command)
+        if event.operation_id is not None and self.__forget_failure(event.operation_id):
+            self.__metrics.increment(COMMAND_RETRIES, event.command_name, collection)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        """Record the latency and reply size of the command, logging it when slow."""
+        collection, command = self.__in_flight.pop((event.connection_id, event.request_id), ("", {}))
+        duration = event.duration_micros / 1_000_000
+        self.__metrics.observe(COMMAND_DURATION, duration, event.command_name, collection)
+        self.__metrics.observe(COMMAND_REPLY_SIZE, len(bson.encode(event.reply)), event.command_name, collection)
+        if duration >= self.__threshold:
+            self.__log_slow(event.command_name, collection, command, duration, "succeeded")
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        """Record the latency and the failure of the command, logging it when slow."""
+        collection, command = self.__in_flight.pop((event.connection_id, event.request_id), ("", {}))
+        duration = event.duration_micros / 1_000_000
+        self.__metrics.observe(COMMAND_DURATION, duration, event.command_name, collection)
+        self.__metrics.increment(COMMAND_FAILURES, event.command_name, collection)
+        if event.operation_id is not None:
+            self.__remember_failure(event.operation_id)
+        if duration >= self.__threshold:
+            self.__log_slow(event.command_name, collection, command, duration, "failed")
+
+    def __remember_failure(self, operation_id: int) -> None:
+        with self.__lock:
+            self.__failed_operations[operation_id] = None
+            if len(self.__failed_operations) > _MAX_TRACKED_OPERATIONS:
+                self.__failed_operations.popitem(last=False)
+
+    def __forget_failure(self, operation_id: int) -> bool:
+        with self.__lock:
+            return self.__failed_operations.pop(operation_id, False) is None
+
+    def __log_slow(
+        self, command_name: str, collection: str, command: Mapping[str, Any], duration: float, outcome: str
+    ) -> None:
+        self._logger.warning(
+            "Slow MongoDB command [%s] on [%s] %s in %.1fms, shape %s",
+            command_name,
+            collection,
+            outcome,
+            duration * 1000,
+            command_shape(command_name, command),
+        )
+
+
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    """Record how long commands wait to check a connection out of the pool.
+
+    The wait is the duration the driver measured for the check out, and carries on its event: with the asyncio client,
+    the check outs of concurrent commands interleave on the thread of the event loop, so they cannot be timed per
+    thread.
+
+    Args:
+        metrics (MetricsService): The metrics service receiving the measurements.
+
+    """
+
+    def __init__(self, metrics: MetricsService) -> None:
+        """Initialize the PoolMetricsListener and declare its metrics."""
+        self.__metrics = metrics
+        metrics.histogram(POOL_WAIT, "Time spent waiting for a pooled MongoDB connection.", ("outcome",))
+
+    def connection_check_out_started(self, event: monitoring.ConnectionCheckOutStartedEvent) -> None:
+        """Nothing to record, the check out is timed by the driver."""
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        """Record a successful check out."""
+        self.__record(event.duration, "checked_out")
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent) -> None:
+        """Record a failed check out."""
+        self.__record(event.duration, event.reason)
+
+    def __record(self, duration: float | None, outcome: str) -> None:
+        if duration is not None:
+            self.__metrics.observe(POOL_WAIT, duration, outcome)
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        """Nothing to record."""
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        """Nothing to record."""
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        """Nothing to record."""
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        """Nothing to record."""
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        """Nothing to record."""
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        """Nothing to record."""
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        """Nothing to record."""
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        """Nothing to record."""
@@ -0,0 +1,173 @@
+import logging
+import os
+from typing import Any, Awaitable, Callable
+
+import certifi
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.errors import ConnectionFailure
+from pymongo.monitoring import CommandListener, ConnectionPoolListener
+
+from domain_account.adapters.interfaces import DocumentDatabaseService
+from domain_account.adapters.interfaces.metrics_service import MetricsService
+
+from .monitoring import CommandMetricsListener, PoolMetricsListener
+from .transactions import T, has_transactions, run_transaction
+
+
+class PyMongoAsyncManager(DocumentDatabaseService[AsyncMongoClient, AsyncDatabase]):  # pylint: disable=R0902
+    """Manager for the native asyncio client of PyMongo.
+
+    Unlike Motor, which runs every blocking PyMongo call on a thread pool and hands the result back to the event loop,
+    `AsyncMongoClient` does its I/O on the event loop itself: an operation costs no thread hop, and the worker runs no
+    driver threads. Its collections expose the methods of the Motor ones the repositories use, so they run unchanged
+    on either manager.
+
+    Args:
+        service_name (str): The name of the service using the PyMongoAsyncManager.
+        database_name (str): The name of the MongoDB database.
+        database_uri (str): The URI of the MongoDB instance.
+        tls (bool): Whether to connect with TLS, verified against the certifi CA bundle.
+
+    Attributes:
+        _logger (Logger): An instance of the logger for logging messages.
+        _service_name (str): The name of the service using the PyMongoAsyncManager.
+        _database_name (str): The name of the MongoDB database.
+        _database_uri (str): The URI of the MongoDB instance.
+        _tls (bool): Whether to connect with TLS.
+        _client (AsyncMongoClient | None): The PyMongo asynchronous client instance.
+        _client_pid (int | None): The id of the process that created the client, clients are not fork safe.
+        _event_listeners (list): The driver listeners registered on every new client.
+        _transactions (bool): Whether the deployment connected to runs multi-document transactions.
+
+    """
+
+    def __init__(self, service_name: str, database_name: str, database_uri: str, tls: bool = True) -> None:
+        """Initialize the PyMongoAsyncManager with the provided parameters."""
+        self._logger = logging.getLogger(f"{self.__class__.__name__}")
+        self._service_name = service_name
+        self._database_name = database_name
+        self._database_uri = database_uri
+        self._tls = tls
+        self._client: AsyncMongoClient | None = None
+        self._client_pid: int | None = None
+        self._event_listeners: list[CommandListener | ConnectionPoolListener] = []
+        self._transactions = False
+
+    def instrument(self, metrics: MetricsService, slow_command_ms: float) -> None:
+        """Report the driver metrics through the provided metrics service.
+
+        Args:
+            metrics (MetricsService): The metrics service receiving the measurements.
+            slow_command_ms (float): Round trip duration, in milliseconds, above which a command is logged.
+
+        """
+        # Listeners are bound to a client when it is created, so they only apply to the clients connected from now on
+        self._event_listeners = [
+            CommandMetricsListener(metrics, slow_command_ms / 1000),
+            PoolMetricsListener(metrics),
+        ]
+
+    async def connect(self) -> None:
+        """Connect to a MongoDB cluster asynchronously.
+
+        Raises:
+            ConnectionFailure: If a connection to the MongoDB cluster cannot be established.
+
+        """
+        await self.disconnect()
+        try:
+            tls_options: dict[str, Any] = {"tls": True, "tlsCAFile": certifi.where()} if self._tls else {}
+            self._client = AsyncMongoClient(
+                self._database_uri,
+                appname=self._service_name,
+                event_listeners=self._event_listeners,
+                **tls_options,
+            )
+            self._client_pid = os.getpid()
+            await self._client.admin.command("ping")
+            self._transactions = has_transactions(self._client.topology_description)
+        except ConnectionFailure:  # pragma: no cover
+            self._logger.info("Server [%s] not available!", self._database_uri)
+        else:
+            self._logger.info("Connected to MongoDB [%s].", self._database_name)
+
+    async def transaction(self, write: Callable[[], Awaitable[T]]) -> T:
+        """Run writes in a single transaction, when the deployment is a replica set or a sharded cluster.
+
+        The transaction is committed with the write concern of the client, and retried from the start, for up to two
+        minutes, when it fails with a transient error such as a write conflict. The writes deferred with `after_commit`
+        run once it committed. A standalone server has no transactions, the writes run one after the other.
+
+        Args:
+            write (Callable[[], Awaitable[T]]): The writes, run again from the start when the transaction is retried.
+
+        Returns:
+            T: What the writes returned.
+
+        """
+        if not self._transactions:
+            return await write()
+        return await run_transaction(self.client.start_session(), write)
+
+    async def disconnect(self) -> None:
+        """Close the current database connection, waiting for the client to close its connections."""
+        client = self._client
+        if client is None:
+            return
+        self.close()
+        await client.close()
+
+    def close(self) -> None:
+        """Drop the current database connection without waiting for it, the process closes its sockets on exit.
+
+        The client closes asynchronously, on the event loop that is gone by the time a worker exits: the lifespan
+        closes it with `disconnect` before.
+
+        """
+        if self._client is None:
+            return
+        self._client = None
+        self._client_pid = None
+        self._transactions = False
+        self._logger.info("Closed MongoDB connection.")
+
+    def after_fork(self) -> None:
+        """Drop a client inherited from the parent process.
+
+        The sockets of a client belong to the process that created it, so a forked worker must never use (nor close)
+        them. The worker creates its own client when `connect` is called from its lifespan.
+
+        """
+        if self._client is not None and self._client_pid != os.getpid():
+            self._logger.warning("Discarded a MongoDB client inherited from process [%s].", self._client_pid)
+            self._client = None
+            self._client_pid = None
+            self._transactions = False
+
+    @property
+    def client(self) -> AsyncMongoClient:
+        """Return the instantiated MongoDB client.
+
+        Returns:
+            AsyncMongoClient: The instantiated MongoDB client.
+
+        Raises:
+            ValueError: If there is no MongoDB client instantiated in the current process.
+
+        """
+        if self._client is None:
+            raise ValueError("There is no MongoDB client.")
+        if self._client_pid != os.getpid():
+            raise ValueError("The MongoDB client was created before the fork, connect it inside the worker.")
+        return self._client
+
+    @property
+    def database(self) -> AsyncDatabase:
+        """Return the current instance of a Database client based on the provided database name.
+
+        Returns:
+            AsyncDatabase: The current instance of a Database client.
+
+        """
+        return self.client[self._database_name]
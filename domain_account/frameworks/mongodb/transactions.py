@@ -0,0 +1,58 @@
+from typing import Any, Awaitable, Callable, TypeVar
+
+from pymongo.server_type import SERVER_TYPE
+from pymongo.topology_description import TopologyDescription
+
+from domain_account.adapters.interfaces.document_database_service import current_deferred_writes, current_session
+
+T = TypeVar("T")
+
+# A standalone server has no transactions, the members of a replica set and the routers of a sharded cluster do
+_TRANSACTION_SERVERS = (SERVER_TYPE.RSPrimary, SERVER_TYPE.Mongos, SERVER_TYPE.LoadBalancer)
+
+
+def has_transactions(topology: TopologyDescription) -> bool:
+    """Whether a deployment runs multi-document transactions, from the servers its client discovered.
+
+    Args:
+        topology (TopologyDescription): The description of the deployment, by its client.
+
+    Returns:
+        bool: True for a replica set or a sharded cluster, False for a standalone server.
+
+    """
+    return any(server.server_type in _TRANSACTION_SERVERS for server in topology.server_descriptions().values())
+
+
+async def run_transaction(session: Any, write: Callable[[], Awaitable[T]]) -> T:
+    """Run writes in a transaction of a session, retried from the start on transient errors, then the writes they
+    deferred to its commit.
+
+    The session is bound to the context of the writes, they join it by passing `session_options()`. The writes
+    deferred by an attempt that failed are dropped with it.
+
+    Args:
+        session (Any): The session of the driver, ended once the transaction is done.
+        write (Callable[[], Awaitable[T]]): The writes of the transaction.
+
+    Returns:
+        T: What the writes returned.
+
+    """
+    deferred: list[Callable[[], Awaitable[Any]]] = []
+
+    async def callback(attempt: Any) -> T:
+        deferred.clear()
+        session_token = current_session.set(attempt)
+        deferred_token = current_deferred_writes.set(deferred)
+        try:
+            return await write()
+        finally:
+            current_deferred_writes.reset(deferred_token)
+            current_session.reset(session_token)
+
+    async with session:
+        result = await session.with_transaction(callback)
+    for deferred_write in deferred:
+        await deferred_write()
+    return result
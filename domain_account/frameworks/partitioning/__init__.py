@@ -0,0 +1,14 @@
+from .mover import PartitionMover
+from .placement import Placement
+from .ring import HashRing
+from .router import PARTITIONED_COLLECTIONS, PartitionedCollection, PartitionedDatabaseService, PartitionScheme
+
+__all__ = [
+    "PARTITIONED_COLLECTIONS",
+    "HashRing",
+    "PartitionedCollection",
+    "PartitionedDatabaseService",
+    "PartitionMover",
+    "PartitionScheme",
+    "Placement",
+]
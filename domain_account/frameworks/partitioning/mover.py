@@ -0,0 +1,103 @@
+import asyncio
+import logging
+from typing import Any
+
+from pymongo import WriteConcern
+from pymongo.errors import DuplicateKeyError
+
+from .router import PARTITIONED_COLLECTIONS, PartitionedDatabaseService, claim_id, claims_collection
+
+
+class PartitionMover:
+    """Move the documents of a partitioned collection to the partition owning them, while the service runs.
+
+    A document is copied to its new partition, then deleted from the partition it was on only if it did not change
+    since it was read: the service writes to that copy as long as it exists, so a write made during the move makes
+    the delete miss, and the document is copied again. Once deleted, the service writes to the new copy. The writes
+    of the mover wait for a majority of the replica set, so a move never loses the document on a failover.
+
+    Args:
+        service (PartitionedDatabaseService): The partitioned database.
+        collection (str): The name of the partitioned collection.
+        batch_size (int): The amount of documents moved between two pauses.
+        pause (float): Seconds paused between two batches, to spare the databases the service uses.
+
+    """
+
+    def __init__(
+        self, service: PartitionedDatabaseService, collection: str = "users", batch_size: int = 100, pause: float = 0.0
+    ) -> None:
+        """Initialize the PartitionMover of a partitioned collection."""
+        self._logger = logging.getLogger(f"{self.__class__.__name__}")
+        self.__service = service
+        self.__name = collection
+        self.__scheme = PARTITIONED_COLLECTIONS[collection]
+        self.__batch_size = batch_size
+        self.__pause = pause
+        majority = WriteConcern("majority")
+        self.__collections = {
+            partition: database.database[collection].with_options(write_concern=majority)
+            for partition, database in service.partitions.items()
+        }
+
+    async def claim_unique(self) -> int:
+        """Claim the unique values of the documents written before the collection was partitioned.
+
+        The claims are only written by the partitioned collection: run this once when the collection is partitioned,
+        before the documents of other partitions may take the values of the existing ones.
+
+        Returns:
+            int: The amount of values claimed.
+
+        """
+        home = next(iter(self.__service.partitions.values()))
+        claims = home.database[claims_collection(self.__name)]
+        projection = {"_id": 0, self.__scheme.key: 1, **{field: 1 for field in self.__scheme.unique}}
+        claimed = 0
+        for collection in self.__collections.values():
+            async for document in collection.find({}, projection):
+                for field in self.__scheme.unique:
+                    if document.get(field) is None:
+                        continue
+                    try:
+                        await claims.insert_one(
+                            {"_id": claim_id(field, document[field]), "key": document[self.__scheme.key]}
+                        )
+                        claimed += 1
+                    except DuplicateKeyError:
+                        pass
+        return claimed
+
+    async def rebalance(self) -> int:
+        """Move every document that is not on the partition owning it.
+
+        Returns:
+            int: The amount of documents moved.
+
+        """
+        placement = self.__service.placement
+        moved = 0
+        for partition, collection in self.__collections.items():
+            misplaced: list[tuple[Any, str]] = []
+            async for document in collection.find({}, {"_id": 1, self.__scheme.key: 1}):
+                owner = placement.owner(document[self.__scheme.key])
+                if owner != partition:
+                    misplaced.append((document["_id"], owner))
+            for count, (_id, owner) in enumerate(misplaced, start=1):
+                moved += await self.__move(_id, partition, owner)
+                if count % self.__batch_size == 0:
+                    self._logger.info("Moved %d documents of [%s].", moved, self.__name)
+                    await asyncio.sleep(self.__pause)
+        self._logger.info("Moved %d documents of [%s], every document is on its partition.", moved, self.__name)
+        return moved
+
+    async def __move(self, _id: Any, source: str, target: str) -> bool:
+        while True:
+            document = await self.__collections[source].find_one({"_id": _id})
+            if document is None:
+                # Deleted, or moved by another mover
+                return False
+            await self.__collections[target].replace_one({"_id": _id}, document, upsert=True)
+            deleted = await self.__collections[source].delete_one(document)
+            if deleted.deleted_count:
+                return True
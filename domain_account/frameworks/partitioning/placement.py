@@ -0,0 +1,75 @@
+from typing import Any
+
+from .ring import HashRing
+
+Document = dict[str, Any]
+
+
+class Placement:
+    """Where the documents of a partitioned collection are, from their key, including while they are moved.
+
+    The ring tells the partition owning each key. While a rebalance moves the documents from the previous ring to
+    the current one, a document is on its previous owner until the mover deleted it there, and on its current owner
+    afterwards: the previous owner holds the authoritative copy as long as it has one, so it comes first.
+
+    Args:
+        ring (HashRing): The ring of the partitions.
+        previous (HashRing | None): The ring the documents are moved from, None when no rebalance is running.
+
+    """
+
+    def __init__(self, ring: HashRing, previous: HashRing | None = None) -> None:
+        """Initialize the Placement with the current and the previous ring."""
+        self.__ring = ring
+        self.__previous = previous
+
+    @property
+    def moving(self) -> bool:
+        """Whether the documents are being moved from the previous ring."""
+        return self.__previous is not None
+
+    @property
+    def partitions(self) -> tuple[str, ...]:
+        """Every partition, the ones of the previous ring first, so their copies of the documents moved win."""
+        previous = self.__previous.partitions if self.__previous is not None else ()
+        return previous + tuple(partition for partition in self.__ring.partitions if partition not in previous)
+
+    def owner(self, key: str) -> str:
+        """The partition a document belongs to, where it is inserted and where the mover puts it."""
+        return self.__ring.owner(key)
+
+    def owners(self, key: str) -> list[str]:
+        """The partitions a document may be on, the one holding the authoritative copy while it has it first."""
+        owner = self.__ring.owner(key)
+        previous = self.__previous.owner(key) if self.__previous is not None else owner
+        return [owner] if previous == owner else [previous, owner]
+
+    def route(self, field: str, query: Document) -> list[tuple[str, Document]]:
+        """Split a query between the partitions holding the documents it may match.
+
+        A query testing the key for equality goes to the partitions of that key, and a query testing it for
+        membership of a list goes to the partitions of its keys, each one with its own keys only. Any other query
+        goes to every partition.
+
+        Args:
+            field (str): The field the documents are partitioned by.
+            query (Document): The query.
+
+        Returns:
+            list[tuple[str, Document]]: The partitions to query, with the query each one must run.
+
+        """
+        condition = query.get(field)
+        if isinstance(condition, str):
+            return [(partition, query) for partition in self.owners(condition)]
+        if isinstance(condition, dict) and list(condition) == ["$in"]:
+            keys: dict[str, list[Any]] = {}
+            for key in condition["$in"]:
+                for partition in self.owners(key):
+                    keys.setdefault(partition, []).append(key)
+            return [
+                (partition, {**query, field: {"$in": keys[partition]}})
+                for partition in self.partitions
+                if partition in keys
+            ]
+        return [(partition, query) for partition in self.partitions]
@@ -0,0 +1,55 @@
+import hashlib
+from bisect import bisect_right
+from typing import Sequence
+
+# Points of every partition on the ring, more points spread the keys more evenly between the partitions
+VIRTUAL_NODES = 128
+
+
+def _point(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """A consistent hash ring assigning keys to partitions.
+
+    Every partition is hashed to `VIRTUAL_NODES` points of a 64 bit ring, and a key belongs to the partition of the
+    first point after its own hash. Adding a partition to N others only moves the keys landing on its points,
+    about 1/(N+1) of them, and every moved key moves to the new partition: the other keys stay where they are.
+    The hashes are stable across processes and versions, so every worker agrees on the owner of a key.
+
+    Args:
+        partitions (Sequence[str]): The names of the partitions.
+
+    Raises:
+        ValueError: If there are no partitions, or a partition is named twice.
+
+    """
+
+    def __init__(self, partitions: Sequence[str]) -> None:
+        """Initialize the HashRing, placing the points of every partition."""
+        if not partitions or len(set(partitions)) != len(partitions):
+            raise ValueError(f"A hash ring needs distinct partitions, got {list(partitions)}.")
+        self.__partitions = tuple(partitions)
+        points = sorted(
+            (_point(f"{partition}#{node}"), partition) for partition in partitions for node in range(VIRTUAL_NODES)
+        )
+        self.__points = [point for point, _ in points]
+        self.__owners = [partition for _, partition in points]
+
+    @property
+    def partitions(self) -> tuple[str, ...]:
+        """The names of the partitions, in the order they were given."""
+        return self.__partitions
+
+    def owner(self, key: str) -> str:
+        """The partition a key belongs to.
+
+        Args:
+            key (str): The key, such as the UID of a user.
+
+        Returns:
+            str: The name of the partition.
+
+        """
+        return self.__owners[bisect_right(self.__points, _point(key)) % len(self.__points)]
@@ -0,0 +1,381 @@
+import asyncio
+import heapq
+import itertools
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Mapping, NamedTuple, Sequence, TypeVar
+
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from domain_account.adapters.interfaces import DocumentDatabaseService
+
+from .placement import Placement
+from .ring import HashRing
+
+Document = dict[str, Any]
+T = TypeVar("T")
+
+# How long the claim of a unique value holds it before it is considered abandoned by a write that died, and taken over
+CLAIM_LEASE = timedelta(seconds=30)
+
+
+class PartitionScheme(NamedTuple):
+    """How a collection is partitioned: the field routing its documents, and the fields unique across partitions."""
+
+    key: str
+    unique: tuple[str, ...] = ()
+
+
+# The collections spread across the partitions, the other ones are kept whole in the home partition
+PARTITIONED_COLLECTIONS = {"users": PartitionScheme(key="uid", unique=("cpf_hash",))}
+
+
+def claims_collection(name: str) -> str:
+    """The collection of the home partition claiming the unique values of a partitioned collection."""
+    return f"{name}_claims"
+
+
+def claim_id(field: str, value: Any) -> str:
+    """The `_id` of the claim of a unique value."""
+    return f"{field}:{value}"
+
+
+class PartitionedCursor:
+    """A cursor reading the documents a query matches on several partitions, as a single cursor would.
+
+    The partitions are read concurrently. Sorted results are merged in order, which only works on a field every
+    document has, and each partition is limited to the limit of the whole result. A document being moved may be on
+    two partitions at once, the copy of the first partition of the placement is kept.
+
+    Args:
+        cursors (Sequence[Any]): The cursors of the partitions, in the order of the placement.
+        key (str): The field the documents are partitioned by, identifying them.
+
+    """
+
+    def __init__(self, cursors: Sequence[Any], key: str) -> None:
+        """Initialize the PartitionedCursor with the cursors of the partitions."""
+        self.__cursors = list(cursors)
+        self.__key = key
+        self.__sort: tuple[str, int] | None = None
+        self.__limit = 0
+
+    def sort(self, key: str, direction: int = ASCENDING) -> "PartitionedCursor":
+        self.__cursors = [cursor.sort(key, direction) for cursor in self.__cursors]
+        self.__sort = (key, direction)
+        return self
+
+    def limit(self, limit: int) -> "PartitionedCursor":
+        self.__cursors = [cursor.limit(limit) for cursor in self.__cursors]
+        self.__limit = limit
+        return self
+
+    async def to_list(self, length: int | None = None) -> list[Document]:
+        batches: list[list[Document]] = await asyncio.gather(*(cursor.to_list(length) for cursor in self.__cursors))
+        if len(batches) == 1:
+            return batches[0]
+        merged: Iterable[Document]
+        if self.__sort is not None:
+            field, direction = self.__sort
+            merged = heapq.merge(*batches, key=lambda document: document[field], reverse=direction < 0)
+        else:
+            merged = itertools.chain.from_iterable(batches)
+        documents = list(self.__distinct(merged))
+        limit = min(filter(None, (self.__limit, length)), default=None)
+        return documents[:limit]
+
+    async def __aiter__(self) -> AsyncIterator[Document]:
+        if self.__sort is not None or self.__limit:
+            for document in await self.to_list():
+                yield document
+            return
+        # Without an order the partitions are read one after the other, and never held in memory
+        seen: set[Any] = set()
+        for cursor in self.__cursors:
+            async for document in cursor:
+                key = document.get(self.__key)
+                if key is None or key not in seen:
+                    seen.add(key)
+                    yield document
+
+    def __distinct(self, documents: Iterable[Document]) -> Iterator[Document]:
+        seen: set[Any] = set()
+        for document in documents:
+            key = document.get(self.__key)
+            if key is None or key not in seen:
+                seen.add(key)
+                yield document
+
+
+class PartitionedCollection:  # pylint: disable=R0913
+    """A collection spread across partitions by the key of its documents, offering the collection methods used by the
+    repositories.
+
+    Reads and writes selecting a single key go to the partition of that key. While a rebalance runs, a key may be on
+    its previous partition or its new one: reads query both concurrently and keep the previous copy, writes update
+    the previous copy and only fall back to the new partition when it is gone, and inserts go to the new partition.
+    A document moved between the two reads is missed by both, so a read finding nothing during a rebalance is run
+    again. Reads selecting keys from a list query each partition for its keys only, concurrently, and the other reads
+    query every partition concurrently.
+
+    The unique indexes only hold within a partition, so the unique fields of the scheme are also claimed in a
+    collection of the home partition, whose `_id` is the value: a write setting a value claimed by another key fails
+    with the `DuplicateKeyError` of a unique index. A claim left by a write that died is taken over after
+    `CLAIM_LEASE`, once its key is found not to hold the value.
+
+    Args:
+        name (str): The name of the collection.
+        scheme (PartitionScheme): How the collection is partitioned.
+        placement (Placement): Where the documents are.
+        collections (Mapping[str, Any]): The collection on each partition.
+        claims (Any): The collection of the home partition claiming the unique values.
+
+    """
+
+    def __init__(
+        self, name: str, scheme: PartitionScheme, placement: Placement, collections: Mapping[str, Any], claims: Any
+    ) -> None:
+        """Initialize the PartitionedCollection with the collection on each partition."""
+        self.__name = name
+        self.__scheme = scheme
+        self.__placement = placement
+        self.__collections = collections
+        self.__claims = claims
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    def with_options(self, **options: Any) -> "PartitionedCollection":
+        collections = {
+            partition: collection.with_options(**options) for partition, collection in self.__collections.items()
+        }
+        return PartitionedCollection(
+            self.__name, self.__scheme, self.__placement, collections, self.__claims.with_options(**options)
+        )
+
+    async def create_index(self, keys: Any, **options: Any) -> str:
+        names = await asyncio.gather(
+            *(collection.create_index(keys, **options) for collection in self.__collections.values())
+        )
+        return str(names[0])
+
+    def find(self, query: Document | None = None, projection: Any = None) -> PartitionedCursor:
+        routes = self.__placement.route(self.__scheme.key, query or {})
+        return PartitionedCursor(
+            [self.__collections[partition].find(routed, projection) for partition, routed in routes], self.__scheme.key
+        )
+
+    async def find_one(self, query: Document | None = None, projection: Any = None) -> Document | None:
+        routes = self.__placement.route(self.__scheme.key, query or {})
+        document = await self.__find_first(routes, projection)
+        if document is None and len(routes) > 1 and self.__placement.moving:
+            # A document moved while the partitions were read may be missed by both reads, the one of its new
+            # partition run before the copy, the one of its previous partition after the delete. It is copied
+            # before it is deleted, so once its previous partition missed it, reading again finds its new copy
+            document = await self.__find_first(routes, projection)
+        return document
+
+    async def __find_first(self, routes: Sequence[tuple[str, Document]], projection: Any) -> Document | None:
+        documents = await asyncio.gather(
+            *(self.__collections[partition].find_one(routed, projection) for partition, routed in routes)
+        )
+        return next((document for document in documents if document is not None), None)
+
+    async def insert_one(self, document: Document) -> Any:
+        key = document[self.__scheme.key]
+        values = {field: document[field] for field in self.__scheme.unique if field in document}
+        collection = self.__collections[self.__placement.owner(key)]
+        return await self.__claiming(key, values, None, lambda: collection.insert_one(document), lambda _: True)
+
+    async def update_one(self, query: Document, update: Document, upsert: bool = False) -> Any:
+        key = self.__key_of(query)
+
+        async def write() -> Any:
+            owners = self.__placement.owners(key)
+            for partition in owners:
+                last = partition == owners[-1]
+                result = await self.__collections[partition].update_one(query, update, upsert=upsert and last)
+                if result.matched_count or result.upserted_id is not None or last:
+                    return result
+            return None
+
+        return await self.__updating(
+            key, update, write, lambda result: bool(result.matched_count or result.upserted_id is not None)
+        )
+
+    async def find_one_and_update(
+        self,
+        query: Document,
+        update: Document,
+        projection: Any = None,
+        upsert: bool = False,
+        return_document: bool = ReturnDocument.BEFORE,
+    ) -> Document | None:
+        key = self.__key_of(query)
+
+        async def write() -> Document | None:
+            owners = self.__placement.owners(key)
+            for partition in owners:
+                last = partition == owners[-1]
+                document: Document | None = await self.__collections[partition].find_one_and_update(
+                    query, update, projection, upsert=upsert and last, return_document=return_document
+                )
+                if document is not None:
+                    return document
+            return None
+
+        return await self.__updating(key, update, write, lambda document: document is not None or upsert)
+
+    def __key_of(self, query: Document) -> str:
+        key = query.get(self.__scheme.key)
+        if not isinstance(key, str):
+            raise ValueError(f"A write to the partitioned [{self.__name}] must select a single {self.__scheme.key}.")
+        return key
+
+    async def __updating(
+        self, key: str, update: Document, write: Callable[[], Awaitable[T]], written: Callable[[T], bool]
+    ) -> T:
+        values = {field: value for field, value in update.get("$set", {}).items() if field in self.__scheme.unique}
+        if not values:
+            return await write()
+        previous = await self.find_one({self.__scheme.key: key}, {"_id": 0, **{field: 1 for field in values}})
+        if previous is None:
+            return await write()
+        values = {field: value for field, value in values.items() if previous.get(field) != value}
+        return await self.__claiming(key, values, previous, write, written)
+
+    async def __claiming(
+        self,
+        key: str,
+        values: Document,
+        previous: Document | None,
+        write: Callable[[], Awaitable[T]],
+        written: Callable[[T], bool],
+    ) -> T:
+        # The values are claimed before the write and released when it fails, the replaced values once it succeeded
+        claimed = [(field, value) for field, value in values.items() if await self.__claim(key, field, value)]
+        try:
+            result = await write()
+        except Exception:
+            await self.__release(key, claimed)
+            raise
+        if not written(result):
+            await self.__release(key, claimed)
+            return result
+        replaced = [(field, previous[field]) for field in values if previous and previous.get(field) is not None]
+        await self.__release(key, replaced)
+        return result
+
+    async def __claim(self, key: str, field: str, value: Any) -> bool:
+        """Claim a unique value for a key, False when the key held it already."""
+        _id = claim_id(field, value)
+        while True:
+            now = datetime.now(timezone.utc)
+            try:
+                await self.__claims.insert_one({"_id": _id, "key": key, "claimed_at": now})
+                return True
+            except DuplicateKeyError:
+                claim = await self.__claims.find_one({"_id": _id})
+            if claim is None:
+                # Released in between, claim it again
+                continue
+            if claim["key"] == key:
+                return False
+            holder = await self.find_one({self.__scheme.key: claim["key"], field: value}, {"_id": 1})
+            if holder is None:
+                taken = await self.__claims.update_one(
+                    {"_id": _id, "key": claim["key"], "claimed_at": {"$lt": now - CLAIM_LEASE}},
+                    {"$set": {"key": key, "claimed_at": now}},
+                )
+                if taken.matched_count:
+                    return True
+            raise DuplicateKeyError(
+                f"E11000 duplicate key error collection: {self.__name} claim: {field}",
+                11000,
+                {"keyPattern": {field: 1}, "keyValue": {field: value}},
+            )
+
+    async def __release(self, key: str, values: Sequence[tuple[str, Any]]) -> None:
+        for field, value in values:
+            await self.__claims.delete_one({"_id": claim_id(field, value), "key": key})
+
+
+class PartitionedDatabase:
+    """A database whose partitioned collections are spread across the partitions, the other ones being kept whole in
+    the home partition.
+
+    Args:
+        home (Any): The database of the home partition.
+        databases (Mapping[str, Any]): The database of each partition.
+        placement (Placement): Where the documents of the partitioned collections are.
+
+    """
+
+    def __init__(self, home: Any, databases: Mapping[str, Any], placement: Placement) -> None:
+        """Initialize the PartitionedDatabase with the database of each partition."""
+        self.__home = home
+        self.__databases = databases
+        self.__placement = placement
+
+    def __getitem__(self, name: str) -> Any:
+        scheme = PARTITIONED_COLLECTIONS.get(name)
+        if scheme is None:
+            return self.__home[name]
+        collections = {partition: database[name] for partition, database in self.__databases.items()}
+        return PartitionedCollection(name, scheme, self.__placement, collections, self.__home[claims_collection(name)])
+
+
+class PartitionedDatabaseService(DocumentDatabaseService[Any, PartitionedDatabase]):
+    """A `DocumentDatabaseService` spreading the partitioned collections across several databases, by a consistent
+    hash of the key of their documents.
+
+    The first partition is the home one, keeping the collections that are not partitioned: it must stay the first
+    one when partitions are added. To add partitions, list the partitions of the current ring as the previous ones:
+    the documents are read and written where they are meanwhile, and `PartitionMover` moves them to their new
+    partition while the service runs. The previous partitions are dropped from the configuration once it is done.
+
+    Args:
+        partitions (Mapping[str, DocumentDatabaseService]): The database service of each partition, by name.
+        previous (Sequence[str]): The partitions of the ring the documents are moved from, empty when no rebalance
+            runs.
+
+    Raises:
+        ValueError: If there are no partitions, a previous partition is not a partition, or the home partition changed.
+
+    """
+
+    def __init__(self, partitions: Mapping[str, DocumentDatabaseService], previous: Sequence[str] = ()) -> None:
+        """Initialize the PartitionedDatabaseService with the database service of each partition."""
+        if not partitions:
+            raise ValueError("A partitioned database needs partitions.")
+        self.__partitions = dict(partitions)
+        self.__home = next(iter(self.__partitions))
+        unknown = [partition for partition in previous if partition not in self.__partitions]
+        if unknown or (previous and previous[0] != self.__home):
+            raise ValueError(
+                f"The previous partitions {list(previous)} must be partitions, starting with the home [{self.__home}]."
+            )
+        ring = HashRing(list(self.__partitions))
+        self.__placement = Placement(ring, HashRing(previous) if previous else None)
+
+    @property
+    def partitions(self) -> dict[str, DocumentDatabaseService]:
+        """The database service of each partition, the home one first."""
+        return self.__partitions
+
+    @property
+    def placement(self) -> Placement:
+        """Where the documents of the partitioned collections are."""
+        return self.__placement
+
+    @property
+    def client(self) -> Any:
+        """Return the client of the home partition."""
+        return self.__partitions[self.__home].client
+
+    @property
+    def database(self) -> PartitionedDatabase:
+        """Return the database spread across the partitions, from the databases of their connected clients."""
+        databases = {partition: service.database for partition, service in self.__partitions.items()}
+        return PartitionedDatabase(databases[self.__home], databases, self.__placement)
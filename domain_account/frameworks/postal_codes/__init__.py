@@ -0,0 +1,3 @@
+from .index import CepIndex, write_index
+
+__all__ = ["CepIndex", "write_index"]
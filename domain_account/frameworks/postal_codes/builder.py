@@ -0,0 +1,113 @@
+"""Build the postal code index mapped by `CepIndex` from a CSV export of a public CEP dataset.
+
+Usage:
+    python -m domain_account.frameworks.postal_codes.builder source.csv cep.idx
+
+The CSV has a header row and the columns `city`, `state`, `street` (optional, empty for a whole city) and either
+`cep`, for a single postal code, or `cep_start` and `cep_end`, for a range of them. Postal codes may be formatted
+(`80010-000`). A range may hold narrower ones, the postal codes of a city holding the ones of its streets: the
+narrowest range wins, and the index stores the flattened ranges.
+
+"""
+
+import argparse
+import csv
+from typing import Iterable, Iterator
+
+from .index import PostalCodeRange, write_index
+
+_SEPARATORS = str.maketrans("", "", ".- ")
+_CEP_LENGTH = 8
+_MAX_CEP = 10**_CEP_LENGTH - 1
+
+
+def parse_cep(value: str) -> int:
+    """The postal code of a CSV cell, as a number.
+
+    Raises:
+        ValueError: If the value is not 8 digits.
+    """
+    cep = value.translate(_SEPARATORS)
+    if len(cep) != _CEP_LENGTH or not cep.isascii() or not cep.isdecimal():
+        raise ValueError(f"[{value}] is not a postal code.")
+    return int(cep)
+
+
+def read_ranges(rows: Iterable[dict[str, str]]) -> Iterator[PostalCodeRange]:
+    """The ranges of the rows of the CSV, as they come."""
+    for row in rows:
+        single = row.get("cep")
+        start = parse_cep(single or row["cep_start"])
+        end = parse_cep(single or row["cep_end"])
+        yield start, end, row["city"].strip(), row["state"].strip().upper(), (row.get("street") or "").strip()
+
+
+def flatten(ranges: Iterable[PostalCodeRange]) -> list[PostalCodeRange]:
+    """Turn nested ranges into sorted, disjoint ones, where every postal code keeps its narrowest range.
+
+    Consecutive ranges of the same locality are merged, so a city without streets is a single range.
+
+    Raises:
+        ValueError: If two ranges overlap without one holding the other.
+    """
+    flattened: list[PostalCodeRange] = []
+
+    def emit(start: int, end: int, locality: tuple[str, str, str]) -> None:
+        if flattened and flattened[-1][1] + 1 == start and flattened[-1][2:] == locality:
+            flattened[-1] = (flattened[-1][0], end, *locality)
+        else:
+            flattened.append((start, end, *locality))
+
+    # The ranges holding the current position, innermost last, and the first postal code not emitted yet
+    enclosing: list[PostalCodeRange] = []
+    cursor = 0
+
+    def close(until: int) -> None:
+        nonlocal cursor
+        while enclosing and enclosing[-1][1] < until:
+            closed = enclosing.pop()
+            if cursor <= closed[1]:
+                emit(cursor, closed[1], closed[2:])
+                cursor = closed[1] + 1
+
+    for current in sorted(ranges, key=lambda item: (item[0], -item[1])):
+        start, end = current[0], current[1]
+        close(start)
+        if enclosing:
+            if end > enclosing[-1][1]:
+                raise ValueError(
+                    f"The ranges [{enclosing[-1][0]:08d}-{enclosing[-1][1]:08d}] and "
+                    f"[{start:08d}-{end:08d}] overlap."
+                )
+            if cursor < start:
+                emit(cursor, start - 1, enclosing[-1][2:])
+        cursor = start
+        enclosing.append(current)
+    close(_MAX_CEP + 1)
+    return flattened
+
+
+def build_index(source: str, path: str) -> int:
+    """Build the index file of a CSV of postal codes.
+
+    Args:
+        source (str): The CSV file.
+        path (str): The index file.
+
+    Returns:
+        int: The amount of ranges in the index.
+    """
+    with open(source, encoding="utf-8", newline="") as file:
+        return write_index(path, flatten(read_ranges(csv.DictReader(file))))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", help="CSV of the postal codes")
+    parser.add_argument("index", help="index file to write")
+    args = parser.parse_args()
+    print(f"{build_index(args.source, args.index)} ranges written to {args.index}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+import mmap
+import os
+import struct
+import sys
+from bisect import bisect_right
+from typing import Iterable, Sequence
+
+from domain_account.adapters.interfaces.postal_code_index_service import PostalCodeIndexService, PostalCodeRecord
+
+MAGIC = b"CEPIDX01"
+# The magic and the amount of ranges, then three little endian uint32 columns of that many values: the first and
+# last postal code of every range, sorted, and the offset of its record. The records follow, each one the length of
+# its UTF-8 text as a little endian uint16 and the text, the city, state and street joined by SEPARATOR.
+HEADER = struct.Struct("<8sI")
+SEPARATOR = "\x1f"
+_COLUMN = struct.Struct("<I")
+_MAX_CEP = 99_999_999
+
+# (first postal code, last postal code, city, state, street) of a range
+PostalCodeRange = tuple[int, int, str, str, str]
+
+
+def write_index(path: str, ranges: Iterable[PostalCodeRange]) -> int:
+    """Write a postal code index file.
+
+    The file is written aside and moved in place, so the processes mapping the previous file keep reading it
+    unchanged until they map the new one.
+
+    Args:
+        path (str): The index file.
+        ranges (Iterable[PostalCodeRange]): The ranges, sorted and not overlapping.
+
+    Returns:
+        int: The amount of ranges written.
+
+    Raises:
+        ValueError: If the ranges are not sorted, overlap, or hold a postal code out of the 8 digits.
+    """
+    starts, ends, offsets = bytearray(), bytearray(), bytearray()
+    records = bytearray()
+    positions: dict[str, int] = {}
+    previous = -1
+    for start, end, *locality in ranges:
+        if not previous < start <= end <= _MAX_CEP:
+            raise ValueError(f"The range [{start:08d}-{end:08d}] is not sorted, overlaps or is not a postal code.")
+        if any(SEPARATOR in name for name in locality):
+            raise ValueError(f"The locality of the range [{start:08d}-{end:08d}] holds the record separator.")
+        text = SEPARATOR.join(locality)
+        if text not in positions:
+            encoded = text.encode()
+            positions[text] = len(records)
+            records += len(encoded).to_bytes(2, "little") + encoded
+        starts += _COLUMN.pack(start)
+        ends += _COLUMN.pack(end)
+        offsets += _COLUMN.pack(positions[text])
+        previous = end
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(HEADER.pack(MAGIC, len(starts) // _COLUMN.size))
+        file.write(starts + ends + offsets + records)
+    os.replace(temporary, path)
+    return len(starts) // _COLUMN.size
+
+
+class CepIndex(PostalCodeIndexService):
+    """Look postal codes (CEPs) up in an index file mapped in memory, built by `write_index`.
+
+    The file is mapped read only, when the index is created: created before the workers fork, the mapping is
+    inherited by all of them, and otherwise the workers mapping the same file still share its pages through the page
+    cache, so the index costs its size once per host rather than once per worker. A lookup is a binary search over
+    the sorted first postal codes of the ranges, reading the mapped pages in place, and decodes a single record.
+
+    Args:
+        path (str): The index file.
+
+    Raises:
+        ValueError: If the file is not a postal code index.
+
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the CepIndex, mapping its file in memory."""
+        with open(path, "rb") as file:
+            self.__map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count = HEADER.unpack_from(self.__map) if len(self.__map) >= HEADER.size else (b"", 0)
+        columns_end = HEADER.size + 3 * _COLUMN.size * count
+        if magic != MAGIC or len(self.__map) < columns_end:
+            raise ValueError(f"[{path}] is not a postal code index.")
+        view = memoryview(self.__map)
+        columns = [view[HEADER.size + index * _COLUMN.size * count :][: _COLUMN.size * count] for index in range(3)]
+        self.__starts, self.__ends, self.__offsets = (self.__column(column) for column in columns)
+        self.__records = view[columns_end:]
+
+    def __len__(self) -> int:
+        """The amount of ranges in the index."""
+        return len(self.__starts)
+
+    @staticmethod
+    def __column(column: memoryview) -> Sequence[int]:
+        if sys.byteorder == "little" and struct.calcsize("I") == _COLUMN.size:
+            return column.cast("I")
+        # The file is little endian, other hosts decode the columns once instead of reading them in place
+        return tuple(value for (value,) in _COLUMN.iter_unpack(column))
+
+    def lookup(self, cep: int) -> PostalCodeRecord | None:
+        position = bisect_right(self.__starts, cep) - 1
+        if position < 0 or cep > self.__ends[position]:
+            return None
+        offset = self.__offsets[position]
+        size = int.from_bytes(self.__records[offset : offset + 2], "little")
+        city, state, street = bytes(self.__records[offset + 2 : offset + 2 + size]).decode().split(SEPARATOR)
+        return city, state, street
@@ -0,0 +1,4 @@
+from .profiler import Profiler
+from .sampler import StackSampler
+
+__all__ = ["Profiler", "StackSampler"]
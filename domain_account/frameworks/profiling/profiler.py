@@ -0,0 +1,182 @@
+import cProfile
+import logging
+import marshal
+import os
+import time
+import tracemalloc
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+from domain_account.adapters.interfaces.profiling_service import (
+    COLLAPSED,
+    PROFILE_FORMATS,
+    PSTATS,
+    Profile,
+    ProfilerIsBusyException,
+    ProfilingService,
+    SlowRequestProfile,
+)
+
+from .sampler import Sample, StackSampler, count_stacks, render_collapsed
+
+SAMPLE_INTERVAL = 0.01
+SLOW_REQUEST_WINDOW = 30.0
+MAX_SLOW_REQUEST_PROFILES = 20
+ALLOCATION_FRAMES = 16
+ALLOCATION_TOP = 50
+
+
+class _Session:
+    """The state of an on demand profiling session."""
+
+    def __init__(self, profile_format: str, requests: int | None, seconds: float) -> None:
+        self.profile_format = profile_format
+        self.requests_left = requests
+        self.deadline = time.monotonic() + seconds
+        self.profile: cProfile.Profile | None = None
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.started_tracing = False
+
+
+class Profiler(ProfilingService):
+    """Profile the current worker on demand and, when enabled, capture the slow requests automatically.
+
+    On demand sessions run one at a time, in one of three formats:
+
+    - `collapsed`: stack samples of every thread, cheap enough for production traffic.
+    - `pstats`: deterministic cProfile statistics, of the event loop thread only, slows every call down.
+    - `allocations`: the tracemalloc allocation growth between the start and the end of the session.
+
+    Slow request capture keeps the stack samples of the last seconds and, when a request exceeds the latency
+    threshold, keeps the samples taken while it was served. Captures are rate limited to one per `capture_interval`
+    and only the most recent ones are kept, so a latency incident cannot turn profiling into a load of its own.
+
+    Args:
+        slow_request_ms (float | None): Latency, in milliseconds, above which a request is captured, None disables it.
+        capture_interval (float): Minimum amount of seconds between two captures.
+
+    """
+
+    def __init__(self, slow_request_ms: float | None, capture_interval: float) -> None:
+        """Initialize the Profiler, the sampling only starts when the worker is opened."""
+        self._logger = logging.getLogger(f"{self.__class__.__name__}")
+        self.__threshold = None if slow_request_ms is None else slow_request_ms / 1000
+        self.__capture_interval = capture_interval
+        self.__next_capture = 0.0
+        self.__sampler = StackSampler(SAMPLE_INTERVAL, SLOW_REQUEST_WINDOW)
+        self.__session: _Session | None = None
+        self.__captures: OrderedDict[str, tuple[SlowRequestProfile, list[Sample]]] = OrderedDict()
+
+    def open(self) -> None:
+        """Start the background sampling of the current process when slow request capture is enabled."""
+        if self.__threshold is not None:
+            self.__sampler.start()
+
+    def close(self) -> None:
+        """Stop every sampling of the current process."""
+        if self.__session is not None:
+            self.stop_session()
+        self.__sampler.stop()
+
+    def start_session(self, profile_format: str, requests: int | None, seconds: float) -> None:
+        """Start profiling the current worker, in one of `PROFILE_FORMATS`."""
+        if profile_format not in PROFILE_FORMATS:
+            raise ValueError(f"Unknown profile format [{profile_format}].")
+        if self.__session is not None:
+            raise ProfilerIsBusyException()
+        session = _Session(profile_format, requests, seconds)
+        if profile_format == COLLAPSED:
+            self.__sampler.start()
+            self.__sampler.begin()
+        elif profile_format == PSTATS:
+            session.profile = cProfile.Profile()
+            session.profile.enable()
+        else:
+            session.started_tracing = not tracemalloc.is_tracing()
+            if session.started_tracing:
+                tracemalloc.start(ALLOCATION_FRAMES)
+            session.snapshot = tracemalloc.take_snapshot()
+        self.__session = session
+        self._logger.info("Started a [%s] profiling session in process [%s].", profile_format, os.getpid())
+
+    def session_finished(self) -> bool:
+        """Tell whether the running session reached its request count or duration."""
+        session = self.__session
+        if session is None:
+            return True
+        return session.requests_left == 0 or time.monotonic() >= session.deadline
+
+    def stop_session(self) -> Profile:
+        """Stop the running session and render its profile."""
+        session = self.__session
+        if session is None:
+            raise ValueError("There is no profiling session running.")
+        self.__session = None
+        stamp = f"{os.getpid()}-{datetime.now(timezone.utc):%Y%m%dT%H%M%S}"
+        if session.profile_format == COLLAPSED:
+            counts = self.__sampler.end()
+            if self.__threshold is None:
+                self.__sampler.stop()
+            return Profile(render_collapsed(counts), "text/plain", f"profile-{stamp}.collapsed")
+        if session.profile is not None:
+            session.profile.disable()
+            session.profile.create_stats()
+            # The same payload `pstats.Stats` reads from the files written by `cProfile.Profile.dump_stats`
+            content = marshal.dumps(session.profile.stats)  # type: ignore[attr-defined]
+            return Profile(content, "application/octet-stream", f"profile-{stamp}.pstats")
+        return Profile(self.__allocations(session), "text/plain", f"allocations-{stamp}.txt")
+
+    def request_finished(self, route: str, method: str, started: float, elapsed: float) -> None:
+        """Count the request for the running session and capture it when slow."""
+        session = self.__session
+        if session is not None and session.requests_left:
+            session.requests_left -= 1
+        if self.__threshold is None or elapsed < self.__threshold:
+            return
+        now = time.monotonic()
+        if now < self.__next_capture or not self.__sampler.running:
+            return
+        self.__next_capture = now + self.__capture_interval
+        # Only keep the samples, rendering them is left to whoever downloads the profile
+        summary = SlowRequestProfile(uuid.uuid4().hex, route, method, elapsed, time.time())
+        self.__captures[summary.profile_id] = (summary, self.__sampler.between(started, started + elapsed))
+        if len(self.__captures) > MAX_SLOW_REQUEST_PROFILES:
+            self.__captures.popitem(last=False)
+        self._logger.warning(
+            "Captured profile [%s] of a [%s %s] request taking %.1fms.",
+            summary.profile_id,
+            method,
+            route,
+            elapsed * 1000,
+        )
+
+    def slow_request_profiles(self) -> list[SlowRequestProfile]:
+        """List the slow request profiles kept by the current worker, most recent last."""
+        return [summary for summary, _ in self.__captures.values()]
+
+    def slow_request_profile(self, profile_id: str) -> Profile | None:
+        """Render a slow request profile kept by the current worker."""
+        capture = self.__captures.get(profile_id)
+        if capture is None:
+            return None
+        return Profile(render_collapsed(count_stacks(capture[1])), "text/plain", f"slow-{profile_id}.collapsed")
+
+    @staticmethod
+    def __allocations(session: _Session) -> bytes:
+        snapshot = tracemalloc.take_snapshot()
+        if session.started_tracing:
+            tracemalloc.stop()
+        filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ]
+        snapshot = snapshot.filter_traces(filters)
+        baseline = session.snapshot.filter_traces(filters) if session.snapshot is not None else snapshot
+        lines = []
+        for stat in snapshot.compare_to(baseline, "traceback")[:ALLOCATION_TOP]:
+            lines.append(
+                f"{stat.size_diff / 1024:+.1f} KiB in {stat.count_diff:+d} blocks ({stat.size / 1024:.1f} KiB)"
+            )
+            lines.extend(f"    {line}" for line in stat.traceback.format(most_recent_first=True))
+        return "\n".join(lines).encode()
@@ -0,0 +1,165 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from types import CodeType, FrameType
+from typing import Iterable
+
+Stack = tuple[CodeType, ...]
+ThreadStack = tuple[int, Stack]
+Sample = tuple[float, tuple[ThreadStack, ...]]
+
+# Leaves of the stacks of waiting threads: the event loop polling, the pool threads and watchdogs blocked on a lock
+_IDLE_LEAVES = {("selectors.py", "select"), ("threading.py", "wait"), ("thread.py", "_worker")}
+_MAX_INTERNED_STACKS = 10_000
+
+
+def _is_idle(stack: Stack) -> bool:
+    leaf = stack[-1]
+    return (os.path.basename(leaf.co_filename), leaf.co_name) in _IDLE_LEAVES
+
+
+def _stack(frame: FrameType | None) -> Stack:
+    codes = []
+    while frame is not None:
+        codes.append(frame.f_code)
+        frame = frame.f_back
+    codes.reverse()
+    return tuple(codes)
+
+
+def _label(code: CodeType) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def render_collapsed(counts: Counter[ThreadStack]) -> bytes:
+    """Render stack counts in the collapsed format read by flamegraph.pl, speedscope and friends.
+
+    Args:
+        counts (Counter[ThreadStack]): How many times each thread stack was sampled.
+
+    Returns:
+        bytes: One `thread;root;...;leaf count` line per distinct stack.
+
+    """
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    lines = []
+    for (ident, stack), count in counts.most_common():
+        frames = ";".join(_label(code) for code in stack)
+        lines.append(f"{names.get(ident, ident)};{frames} {count}")
+    return "\n".join(lines).encode()
+
+
+def count_stacks(samples: Iterable[Sample]) -> Counter[ThreadStack]:
+    """Count the thread stacks of a sequence of samples.
+
+    Args:
+        samples (Iterable[Sample]): The samples to aggregate.
+
+    Returns:
+        Counter[ThreadStack]: How many times each thread stack was sampled.
+
+    """
+    counts: Counter[ThreadStack] = Counter()
+    for _, stacks in samples:
+        counts.update(stacks)
+    return counts
+
+
+class StackSampler:
+    """Statistical profiler sampling the Python stack of every thread of the process at a fixed interval.
+
+    Unlike cProfile it sees the thread pools as well as the event loop and its cost does not depend on the amount of
+    function calls. Idle threads are left out, so the samples show where the worker spends its time when busy.
+    Samples are only taken when the sampling thread gets the GIL, so short bursts of work between two blocking calls
+    are under-represented, `cProfile` is the better tool for those.
+
+    Samples are kept in a ring buffer covering the last `window` seconds, and aggregated in a counter while
+    `begin` and `end` delimit a session.
+
+    Args:
+        interval (float): Seconds between two samples.
+        window (float): Seconds of samples kept in the ring buffer.
+
+    """
+
+    def __init__(self, interval: float, window: float) -> None:
+        """Initialize the StackSampler, it only samples once started."""
+        self.__interval = interval
+        self.__samples: deque[Sample] = deque(maxlen=max(int(window / interval), 1))
+        self.__interned: dict[ThreadStack, ThreadStack] = {}
+        self.__session: Counter[ThreadStack] | None = None
+        self.__thread: threading.Thread | None = None
+        self.__stopping = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        """Tell whether the sampling thread is alive in the current process."""
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def start(self) -> None:
+        """Start the sampling thread, a no-op if it is running."""
+        if self.running:
+            return
+        self.__stopping.clear()
+        self.__thread = threading.Thread(target=self.__run, name="stack-sampler", daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread and drop the samples kept."""
+        if self.__thread is not None and self.__thread.is_alive():
+            self.__stopping.set()
+            self.__thread.join()
+        self.__thread = None
+        self.__samples.clear()
+        self.__interned.clear()
+
+    def begin(self) -> None:
+        """Start aggregating the samples taken from now on."""
+        self.__session = Counter()
+
+    def end(self) -> Counter[ThreadStack]:
+        """Stop aggregating the samples.
+
+        Returns:
+            Counter[ThreadStack]: How many times each thread stack was sampled since `begin`.
+
+        """
+        session, self.__session = self.__session, None
+        return session if session is not None else Counter()
+
+    def between(self, start: float, end: float) -> list[Sample]:
+        """Return the samples kept that were taken in a time range.
+
+        Args:
+            start (float): The start of the range, as a `time.perf_counter` value.
+            end (float): The end of the range, as a `time.perf_counter` value.
+
+        Returns:
+            list[Sample]: The samples taken in the range, older samples may have left the ring buffer already.
+
+        """
+        return [sample for sample in list(self.__samples) if start <= sample[0] <= end]
+
+    def __run(self) -> None:
+        own = threading.get_ident()
+        while not self.__stopping.wait(self.__interval):
+            taken_at = time.perf_counter()
+            stacks = []
+            for ident, frame in sys._current_frames().items():  # pylint: disable=W0212
+                if ident == own:
+                    continue
+                stack = _stack(frame)
+                if stack and not _is_idle(stack):
+                    stacks.append(self.__intern((ident, stack)))
+            self.__samples.append((taken_at, tuple(stacks)))
+            session = self.__session
+            if session is not None:
+                session.update(stacks)
+
+    def __intern(self, thread_stack: ThreadStack) -> ThreadStack:
+        # The same few stacks are sampled over and over, sharing them keeps the ring buffer small
+        if len(self.__interned) >= _MAX_INTERNED_STACKS:
+            self.__interned.clear()
+        return self.__interned.setdefault(thread_stack, thread_stack)
@@ -0,0 +1,3 @@
+from .token_buckets import TokenBuckets
+
+__all__ = ["TokenBuckets"]
@@ -0,0 +1,81 @@
+import time
+from collections import OrderedDict
+
+from domain_account.adapters.interfaces.metrics_service import MetricsService
+from domain_account.adapters.interfaces.rate_limit_service import RateLimit, RateLimitService
+
+RATE_LIMIT_BUCKETS = "rate_limit_buckets"
+RATE_LIMIT_EVICTIONS = "rate_limit_evictions_total"
+
+# The tokens left in a bucket, when they were counted, and when the bucket is full again
+_Bucket = tuple[float, float, float]
+
+
+class TokenBuckets(RateLimitService):
+    """The token buckets of the current process, a fixed amount of memory per key being limited.
+
+    A bucket stores its tokens and when they were counted, the tokens refilled since are added when it is used, so
+    nothing runs between requests. A bucket left alone until it is full again is no different from a missing one:
+    the buckets are kept in the order they were last used, and the least recently used ones are dropped from the
+    front once full. The amount of buckets is bounded too, a bucket evicted before being full gives its key a full
+    one next time.
+
+    Each process has its own buckets, so with N workers a client gets up to N times the limits.
+
+    Args:
+        metrics (MetricsService): The metrics service receiving the amount of buckets and the evictions.
+        client_limit (RateLimit | None): The limit of each client on each route, None to not limit the clients.
+        route_limit (RateLimit | None): The limit of each route over all its clients, None to not limit the routes.
+        max_keys (int): The amount of buckets kept.
+
+    """
+
+    def __init__(
+        self, metrics: MetricsService, client_limit: RateLimit | None, route_limit: RateLimit | None, max_keys: int
+    ) -> None:
+        """Initialize the TokenBuckets without any bucket and declare their metrics."""
+        self.__metrics = metrics
+        self.__client_limit = client_limit
+        self.__route_limit = route_limit
+        self.__max_keys = max_keys
+        self.__buckets: OrderedDict[str, _Bucket] = OrderedDict()
+        metrics.gauge(RATE_LIMIT_BUCKETS, "Token buckets kept by the rate limiter.")
+        metrics.counter(RATE_LIMIT_EVICTIONS, "Token buckets evicted by a full rate limiter before being full.")
+        metrics.add_collector(self.__collect)
+
+    @property
+    def client_limit(self) -> RateLimit | None:
+        return self.__client_limit
+
+    @property
+    def route_limit(self) -> RateLimit | None:
+        return self.__route_limit
+
+    def __len__(self) -> int:
+        """The amount of buckets kept."""
+        return len(self.__buckets)
+
+    async def acquire(self, key: str, limit: RateLimit) -> float:
+        now = time.monotonic()
+        bucket = self.__buckets.pop(key, None)
+        tokens = limit.burst if bucket is None else min(limit.burst, bucket[0] + (now - bucket[1]) * limit.rate)
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / limit.rate
+        self.__buckets[key] = (tokens, now, now + (limit.burst - tokens) / limit.rate)
+        self.__evict(now)
+        return wait
+
+    def __evict(self, now: float) -> None:
+        while self.__buckets:
+            key, (_, _, full_at) = next(iter(self.__buckets.items()))
+            if full_at > now and len(self.__buckets) <= self.__max_keys:
+                return
+            del self.__buckets[key]
+            if full_at > now:
+                self.__metrics.increment(RATE_LIMIT_EVICTIONS)
+
+    def __collect(self) -> None:
+        self.__metrics.set_gauge(RATE_LIMIT_BUCKETS, len(self.__buckets))
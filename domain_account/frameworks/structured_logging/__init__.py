@@ -0,0 +1,4 @@
+from .handlers import CorrelationFilter, JsonFormatter, SheddingQueueHandler
+from .pipeline import LogPipeline
+
+__all__ = ["CorrelationFilter", "JsonFormatter", "LogPipeline", "SheddingQueueHandler"]
@@ -0,0 +1,100 @@
+import json
+import logging
+import queue
+import random
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler
+from typing import Any, Callable
+
+from domain_account.adapters.instrumentation import current_correlation_id
+from domain_account.frameworks.anonymisation import UidHasher
+
+SHED_SAMPLE_RATE = 0.1
+
+# Read by Cloud Logging to group the records of a request under its trace
+TRACE_FIELD = "logging.googleapis.com/trace"
+
+
+class CorrelationFilter(logging.Filter):
+    """Stamp every record with the correlation ID of the request being served, when there is one."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.correlation_id = current_correlation_id.get()
+        return True
+
+
+class SheddingQueueHandler(QueueHandler):
+    """A `QueueHandler` on a bounded queue, shedding records instead of blocking the thread logging them.
+
+    Once the queue is half full, only a sample of the records below WARNING is kept. Once it is full, every new
+    record is dropped. `on_drop` is told about each dropped record, with the reason, `sampled` or `full`.
+
+    Unlike `QueueHandler`, the records are queued as they are, without being prepared: their message is only
+    formatted by the handlers of the listener thread, so a shed record costs neither a format nor a copy. The
+    arguments of a record must not be mutated once it is logged.
+
+    Args:
+        size (int): Capacity of the queue.
+        on_drop (Callable[[str], None]): Called for each dropped record.
+
+    """
+
+    def __init__(self, size: int, on_drop: Callable[[str], None]) -> None:
+        """Initialize the SheddingQueueHandler on a new bounded queue."""
+        self.__queue: queue.Queue[logging.LogRecord] = queue.Queue(size)
+        super().__init__(self.__queue)
+        self.__shed_above = size // 2
+        self.__on_drop = on_drop
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if (
+            record.levelno < logging.WARNING
+            and self.__queue.qsize() >= self.__shed_above
+            and random.random() >= SHED_SAMPLE_RATE
+        ):
+            self.__on_drop("sampled")
+            return
+        try:
+            self.__queue.put_nowait(record)
+        except queue.Full:
+            self.__on_drop("full")
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as the JSON lines Cloud Logging parses into structured entries.
+
+    The `request` extra of the request records is merged into the entry, its user UID replaced by its hash.
+
+    Args:
+        hasher (UidHasher): Anonymises the user UIDs.
+        project_id (str | None): The Google Cloud project, to link the records to the request trace.
+
+    """
+
+    def __init__(self, hasher: UidHasher, project_id: str | None) -> None:
+        """Initialize the JsonFormatter."""
+        super().__init__()
+        self.__hasher = hasher
+        self.__project_id = project_id
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "severity": record.levelname,
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["message"] = f"{entry['message']}\n{record.exc_text}"
+        correlation_id = getattr(record, "correlation_id", None)
+        if correlation_id is not None:
+            entry["correlation_id"] = correlation_id
+            if self.__project_id:
+                entry[TRACE_FIELD] = f"projects/{self.__project_id}/traces/{correlation_id}"
+        request = getattr(record, "request", None)
+        if request is not None:
+            entry.update({key: value for key, value in request.items() if key != "uid"})
+            entry["uid_hash"] = None if request.get("uid") is None else self.__hasher(request["uid"])
+        return json.dumps(entry, default=str, separators=(",", ":"))
@@ -0,0 +1,76 @@
+import logging
+import sys
+from logging.handlers import QueueListener
+
+from domain_account.adapters.interfaces.metrics_service import MetricsService
+from domain_account.frameworks.anonymisation import UidHasher
+
+from .handlers import CorrelationFilter, JsonFormatter, SheddingQueueHandler
+
+LOG_RECORDS_DROPPED = "log_records_dropped_total"
+
+
+class LogPipeline:
+    """Route every record of the process through a queue to a thread writing them as JSON lines on stdout.
+
+    The threads logging only pay for putting the record on a bounded queue, the formatting of the message, the UID
+    hashing and the write happen in the `QueueListener` thread. When the listener falls behind, records are shed
+    rather than slowing the event loop down, and counted in `log_records_dropped_total{reason}`.
+
+    Args:
+        metrics (MetricsService): The metrics service counting the dropped records.
+        hasher (UidHasher): Anonymises the user UIDs of the request records.
+        level (str): The level of the root logger, INFO logs one record per request.
+        queue_size (int): Capacity of the queue between the logging threads and the writing thread.
+        project_id (str | None): The Google Cloud project, to link the records to the request trace.
+
+    """
+
+    def __init__(
+        self,
+        metrics: MetricsService,
+        hasher: UidHasher,
+        level: str,
+        queue_size: int,
+        project_id: str | None,
+    ) -> None:
+        """Initialize the LogPipeline and declare its metrics, the records are only rerouted once started."""
+        self.__metrics = metrics
+        self.__formatter = JsonFormatter(hasher, project_id)
+        self.__level = level
+        self.__queue_size = queue_size
+        self.__running: tuple[QueueListener, SheddingQueueHandler, list[logging.Handler], int] | None = None
+        metrics.counter(LOG_RECORDS_DROPPED, "Log records dropped to keep up with the load.", ("reason",))
+
+    def start(self) -> None:
+        """Replace the handlers of the root logger by the queue and start the writing thread of this process."""
+        if self.__running is not None:
+            return
+        output = logging.StreamHandler(sys.stdout)
+        output.setFormatter(self.__formatter)
+        handler = SheddingQueueHandler(self.__queue_size, self.__dropped)
+        handler.addFilter(CorrelationFilter())
+        listener = QueueListener(handler.queue, output)  # type: ignore[arg-type]
+        root = logging.getLogger()
+        self.__running = (listener, handler, root.handlers[:], root.level)
+        for previous in root.handlers[:]:
+            root.removeHandler(previous)
+        root.addHandler(handler)
+        root.setLevel(self.__level)
+        listener.start()
+
+    def stop(self) -> None:
+        """Write the queued records, stop the writing thread and give the root logger its handlers back."""
+        if self.__running is None:
+            return
+        listener, handler, previous, level = self.__running
+        self.__running = None
+        root = logging.getLogger()
+        root.removeHandler(handler)
+        for restored in previous:
+            root.addHandler(restored)
+        root.setLevel(level)
+        listener.stop()
+
+    def __dropped(self, reason: str) -> None:
+        self.__metrics.increment(LOG_RECORDS_DROPPED, reason)
@@ -0,0 +1,3 @@
+from .recorder import TrafficRecorder, body_shape
+
+__all__ = ["TrafficRecorder", "body_shape"]
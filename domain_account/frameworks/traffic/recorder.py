@@ -0,0 +1,148 @@
+import json
+import logging
+import os
+import random
+import threading
+from collections import deque
+from typing import Any
+
+from domain_account.adapters.interfaces.traffic_recording_service import TrafficRecordingService
+from domain_account.frameworks.anonymisation import UidHasher
+
+FLUSH_INTERVAL = 1.0
+MAX_PENDING = 100_000
+
+Shape = str | list[Any] | dict[str, Any]
+
+
+def body_shape(value: Any) -> Shape:
+    """Describe a JSON value by its structure only: the keys, the types, and the lengths of strings and arrays.
+
+    Args:
+        value (Any): A decoded JSON value.
+
+    Returns:
+        Shape: `"str:<length>"`, `"int"`, `"float"`, `"bool"` or `"null"` for scalars, `[<length>, <item shape>]`
+            for arrays (the first item stands for every item) and the shape of every value for objects.
+
+    """
+    if isinstance(value, dict):
+        return {key: body_shape(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [len(value), body_shape(value[0])] if value else [0]
+    if isinstance(value, str):
+        return f"str:{len(value)}"
+    if isinstance(value, bool):
+        return "bool"
+    if value is None:
+        return "null"
+    return type(value).__name__
+
+
+class TrafficRecorder(TrafficRecordingService):
+    """Append an anonymised trace of the served requests to a file shared by the workers.
+
+    `record` only queues the raw request, a thread anonymises the queued requests and appends them to the file once
+    per `FLUSH_INTERVAL`, so neither the hashing nor the disk is on the request path. Every line is a JSON object:
+
+    - `t`: when the request started, as a Unix timestamp.
+    - `m`, `r`, `s`: the method, the route template and the response status.
+    - `d`: the latency, in milliseconds.
+    - `u`: the `UidHasher` hash of the user UID, or null. It is stable for the key, so hot users stay recognisable.
+    - `b`: the `body_shape` of the JSON body, `"bytes:<length>"` for other bodies, or null without a body.
+
+    Args:
+        path (str | None): The trace file, None disables the recording.
+        hasher (UidHasher): Anonymises the user UIDs.
+        sample_rate (float): Fraction of the requests recorded, between 0 and 1.
+
+    """
+
+    def __init__(self, path: str | None, hasher: UidHasher, sample_rate: float) -> None:
+        """Initialize the TrafficRecorder, the trace file is only opened when the worker is opened."""
+        self._logger = logging.getLogger(f"{self.__class__.__name__}")
+        self.__path = path
+        self.__hasher = hasher
+        self.__sample_rate = sample_rate
+        self.__pending: deque[tuple[Any, ...]] = deque(maxlen=MAX_PENDING)
+        self.__writer: tuple[threading.Thread, threading.Event] | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a trace file is configured."""
+        return self.__path is not None
+
+    def open(self) -> None:
+        """Open the trace file for appending and start the thread writing to it."""
+        if self.__path is None or self.__writer is not None:
+            return
+        # Every write is a whole batch of lines appended at once, the workers can share the file
+        file = os.open(self.__path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        stopping = threading.Event()
+        thread = threading.Thread(target=self.__write, args=(file, stopping), name="traffic-recorder", daemon=True)
+        thread.start()
+        self.__writer = (thread, stopping)
+        self._logger.info("Recording %.0f%% of the traffic to [%s].", self.__sample_rate * 100, self.__path)
+
+    def close(self) -> None:
+        """Write the pending requests and close the trace file."""
+        if self.__writer is None:
+            return
+        thread, stopping = self.__writer
+        self.__writer = None
+        stopping.set()
+        thread.join()
+
+    def record(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        started: float,
+        elapsed: float,
+        uid: str | None,
+        body: bytes,
+    ) -> None:
+        """Queue a finished request, when it is sampled, for the writing thread to anonymise."""
+        if self.__writer is None or (self.__sample_rate < 1 and random.random() >= self.__sample_rate):
+            return
+        self.__pending.append((started, method, route, status, elapsed, uid, body))
+
+    def __write(self, file: int, stopping: threading.Event) -> None:
+        # The thread owns the file: it writes the last batch and closes it once stopped
+        try:
+            while not stopping.wait(FLUSH_INTERVAL):
+                self.__flush(file)
+            self.__flush(file)
+        except OSError:
+            self._logger.exception("Could not append to the traffic trace [%s].", self.__path)
+        finally:
+            os.close(file)
+
+    def __flush(self, file: int) -> None:
+        if len(self.__pending) == MAX_PENDING:
+            self._logger.warning("The traffic recorder could not keep up, the oldest requests were dropped.")
+        lines = []
+        while self.__pending:
+            started, method, route, status, elapsed, uid, body = self.__pending.popleft()
+            entry = {
+                "t": round(started, 3),
+                "m": method,
+                "r": route,
+                "s": status,
+                "d": round(elapsed * 1000, 3),
+                "u": None if uid is None else self.__hasher(uid),
+                "b": self.__shape(body),
+            }
+            lines.append(json.dumps(entry, separators=(",", ":")))
+        if lines:
+            os.write(file, ("\n".join(lines) + "\n").encode())
+
+    @staticmethod
+    def __shape(body: bytes) -> Shape | None:
+        if not body:
+            return None
+        try:
+            return body_shape(json.loads(body))
+        except ValueError:
+            return f"bytes:{len(body)}"
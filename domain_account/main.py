@@ -7,30 +7,74 @@ from fastapi import FastAPI
 from domain_account.adapters.__factory__ import AdaptersFactory
 from domain_account.adapters.controllers.__dependencies__ import bind_controller_dependencies
 from domain_account.business.__factory__ import BusinessFactory
-from domain_account.frameworks.__factory__ import FrameworksConfig, FrameworksFactory
+from domain_account.frameworks.__factory__ import DatabasePartition, FrameworksConfig, FrameworksFactory
+from domain_account.frameworks.gunicorn import worker_lifecycle
+from domain_account.frameworks.mongodb import DEFAULT_WRITE_DURABILITY
 
 LifespanType = Callable[[FastAPI], _AsyncGeneratorContextManager[None]]
 
 
-def lifespan_dependencies(factory: FrameworksFactory) -> LifespanType:
+def lifespan_dependencies(factory: FrameworksFactory, adapters: AdaptersFactory) -> LifespanType:
     @asynccontextmanager
     async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
         await factory.connect()
+        await adapters.create_indexes()
+        factory.loop_watchdog().start()
         yield
-        factory.close()
+        factory.loop_watchdog().stop()
+        await factory.disconnect()
 
     return lifespan
 
 
+def database_partitions(env: Env) -> dict[str, DatabasePartition]:
+    # Each partition has its own DB_URI_<NAME> and DB_NAME_<NAME>, and defaults to DB_URI and DB_NAME
+    return {
+        name: DatabasePartition(
+            uri=env.str(f"DB_URI_{name.upper()}", env.str("DB_URI")),
+            name=env.str(f"DB_NAME_{name.upper()}", env.str("DB_NAME")),
+        )
+        for name in env.list("DB_PARTITIONS", [])
+    }
+
+
 def configs() -> FrameworksConfig:
     env = Env(eager=True)
     env.read_env()
     return FrameworksConfig(
         database_name=env.str("DB_NAME"),
         database_uri=env.str("DB_URI"),
+        database_driver=env.str("DB_DRIVER", "motor"),
+        database_tls=env.bool("DB_TLS", True),
+        database_partitions=database_partitions(env),
+        database_previous_partitions=env.list("DB_PREVIOUS_PARTITIONS", []),
         service_name=env.str("SERVICE_NAME"),
         credentials=env.str("GOOGLE_APPLICATION_CREDENTIALS", None),
         auth_app_options={"projectId": env.str("PROJECT_ID")},
+        database_slow_command_ms=env.float("DB_SLOW_COMMAND_MS", 100),
+        profile_slow_request_ms=env.float("PROFILE_SLOW_REQUEST_MS", None),
+        profile_capture_interval=env.float("PROFILE_CAPTURE_INTERVAL_S", 60),
+        loop_blocked_ms=env.float("LOOP_BLOCKED_MS", 100),
+        traffic_capture_path=env.str("TRAFFIC_CAPTURE_PATH", None),
+        traffic_capture_sample_rate=env.float("TRAFFIC_CAPTURE_SAMPLE_RATE", 1.0),
+        uid_hash_salt=env.str("UID_HASH_SALT", None),
+        cpf_hash_key=env.str("CPF_HASH_KEY"),
+        cep_index_path=env.str("CEP_INDEX_PATH", None),
+        unknown_uid_cache_size=env.int("UNKNOWN_UID_CACHE_SIZE", 10_000),
+        unknown_uid_cache_ttl=env.float("UNKNOWN_UID_CACHE_TTL_S", 5),
+        user_response_cache_bytes=env.int("USER_RESPONSE_CACHE_BYTES", 0),
+        user_response_cache_ttl=env.float("USER_RESPONSE_CACHE_TTL_S", 5),
+        rate_limit_rps=env.float("RATE_LIMIT_RPS", 0),
+        rate_limit_burst=env.float("RATE_LIMIT_BURST", 20),
+        rate_limit_route_rps=env.float("RATE_LIMIT_ROUTE_RPS", 0),
+        rate_limit_route_burst=env.float("RATE_LIMIT_ROUTE_BURST", 200),
+        rate_limit_max_keys=env.int("RATE_LIMIT_MAX_KEYS", 100_000),
+        write_durability={**DEFAULT_WRITE_DURABILITY, **env.dict("WRITE_DURABILITY", {})},
+        event_broker=env.str("EVENT_BROKER", None),
+        event_batch_size=env.int("EVENT_BATCH_SIZE", 500),
+        event_publish_interval=env.float("EVENT_PUBLISH_INTERVAL_S", 1.0),
+        log_level=env.str("LOG_LEVEL", "INFO"),
+        log_queue_size=env.int("LOG_QUEUE_SIZE", 10_000),
     )
 
 
@@ -54,17 +98,33 @@ class AppBinding:
 
     def bind_controllers(self) -> None:
         authentication_framework = self.frameworks.authentication_framework()
-        bind_controller_dependencies(self.business, authentication_framework)
+        metrics_framework = self.frameworks.metrics_framework()
+        profiling_framework = self.frameworks.profiling_framework()
+        user_response_cache = self.frameworks.user_response_cache_framework()
+        idempotency_service = self.adapters.idempotency_service()
+        bind_controller_dependencies(
+            self.business,
+            authentication_framework,
+            metrics_framework,
+            profiling_framework,
+            user_response_cache,
+            idempotency_service,
+        )
+
+    def bind_worker_lifecycle(self) -> None:
+        worker_lifecycle.on_post_fork(self.frameworks.after_fork)
+        worker_lifecycle.on_worker_exit(self.frameworks.close)
 
     def facade(self) -> None:
         self.bind_frameworks()
         self.bind_adapters()
         self.bind_business()
         self.bind_controllers()
+        self.bind_worker_lifecycle()
 
 
 def simple_app(app_binding: AppBinding) -> FastAPI:
-    lifespan = lifespan_dependencies(factory=app_binding.frameworks)
+    lifespan = lifespan_dependencies(factory=app_binding.frameworks, adapters=app_binding.adapters)
     return FastAPI(lifespan=lifespan)
 
 
@@ -72,13 +132,35 @@ def register_routes(base_app: FastAPI, app_binding: AppBinding) -> None:
     app_binding.adapters.register_routes(base_app)
 
 
-def create_app() -> FastAPI:
-    config = configs()
-    app_binding = AppBinding(config)
+def register_exception_handlers(base_app: FastAPI, app_binding: AppBinding) -> None:
+    app_binding.adapters.register_exception_handlers(base_app)
+
+
+def register_middlewares(base_app: FastAPI, app_binding: AppBinding) -> None:
+    app_binding.adapters.register_middlewares(base_app)
+
+
+def warm_up(base_app: FastAPI) -> None:
+    # Build the immutable, lazily computed state before the fork so workers share it instead of rebuilding it
+    base_app.openapi()
+
+
+def create_app(app_binding: AppBinding | None = None) -> FastAPI:
+    if app_binding is None:
+        app_binding = AppBinding(configs())
     app_binding.facade()
     base_app = simple_app(app_binding)
     register_routes(base_app, app_binding)
+    register_exception_handlers(base_app, app_binding)
+    register_middlewares(base_app, app_binding)
+    warm_up(base_app)
     return base_app
 
 
-app = create_app()
+def __getattr__(name: str) -> FastAPI:
+    # `main:app` is built on first access: in the gunicorn master when preloading, in the worker otherwise,
+    # and never when tooling only imports the composition root
+    if name == "app":
+        globals()["app"] = create_app()
+        return globals()["app"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,16 @@
-from .address import Address
-from .user import User
+from .address import Address, PartialAddress, PostalCodeLocation
+from .events import AccountEvent, AddressUpdated, CpfUpdated, UserRegistered
+from .user import PartialUser, RegisteredUser, User
 
 __all__ = [
+    "AccountEvent",
     "Address",
+    "AddressUpdated",
+    "CpfUpdated",
+    "PartialAddress",
+    "PartialUser",
+    "PostalCodeLocation",
+    "RegisteredUser",
     "User",
+    "UserRegistered",
 ]
@@ -10,3 +10,24 @@ class Address(BaseModel):
     street_name: str = Field(examples=["Rua Beltrano do Ciclano"])
     number: str = Field(examples=["777"])
     complement: str = Field(examples=["Apto 7"])
+    state: str | None = Field(default=None, examples=["PR"])
+
+
+class PartialAddress(BaseModel):
+    """Model that defines an address change, only the provided fields change"""
+
+    city: str | None = Field(default=None, examples=["Curitiba"])
+    cep: str | None = Field(default=None, examples=["77777777"])
+    street_name: str | None = Field(default=None, examples=["Rua Beltrano do Ciclano"])
+    number: str | None = Field(default=None, examples=["777"])
+    complement: str | None = Field(default=None, examples=["Apto 7"])
+    state: str | None = Field(default=None, examples=["PR"])
+
+
+class PostalCodeLocation(BaseModel):
+    """Model that defines the locality of a postal code (CEP), the street is None for the CEP of a whole city"""
+
+    cep: str = Field(examples=["80010000"])
+    city: str = Field(examples=["Curitiba"])
+    state: str = Field(examples=["PR"])
+    street_name: str | None = Field(default=None, examples=["Rua Beltrano do Ciclano"])
@@ -0,0 +1,44 @@
+from datetime import datetime, timezone
+from typing import Literal
+from uuid import uuid4
+
+from pydantic import BaseModel
+from pydantic.fields import Field
+
+from .address import Address, PartialAddress
+
+
+def _event_id() -> str:
+    return uuid4().hex
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class AccountEvent(BaseModel):
+    """Model that defines a change of an account, the ID is unique to the event so its consumers can deduplicate it"""
+
+    event_id: str = Field(default_factory=_event_id, examples=["3f1c2a9e8b7d4c6f9a0b1c2d3e4f5a6b"])
+    uid: str = Field(examples=["JkdDbgtDJtZ8xFdbyO7pQ1uPtJq2"])
+    occurred_at: datetime = Field(default_factory=_now)
+
+
+class UserRegistered(AccountEvent):
+    """Model that defines the registration of a user, with the address registered"""
+
+    type: Literal["UserRegistered"] = "UserRegistered"
+    address: Address
+
+
+class AddressUpdated(AccountEvent):
+    """Model that defines an address change, only the fields changed are provided"""
+
+    type: Literal["AddressUpdated"] = "AddressUpdated"
+    address: PartialAddress
+
+
+class CpfUpdated(AccountEvent):
+    """Model that defines a CPF change, the CPF itself is left out and read from the account by who may see it"""
+
+    type: Literal["CpfUpdated"] = "CpfUpdated"
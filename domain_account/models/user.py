@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 
-from .address import Address
+from .address import Address, PartialAddress
 
 
 class User(BaseModel):
@@ -8,3 +8,16 @@ class User(BaseModel):
 
     cpf: str = Field(examples=["77777777777"])
     address: Address
+
+
+class PartialUser(BaseModel):
+    """Model that defines a selection of the user fields, the ones not selected are left unset"""
+
+    cpf: str | None = Field(default=None, examples=["77777777777"])
+    address: PartialAddress | None = None
+
+
+class RegisteredUser(User):
+    """Model that defines a registered user, along with its UID"""
+
+    uid: str = Field(examples=["2xTzYt1pHXbWrrKSHpYp4gJ7bm33"])
@@ -0,0 +1,58 @@
+"""Move the users to the partition owning them, after partitions were added.
+
+Usage:
+    python -m domain_account.rebalance_users [--batch 100] [--pause-ms 10]
+
+Run it while the service runs with `DB_PARTITIONS` listing every partition and `DB_PREVIOUS_PARTITIONS` the ones
+the users are moved from: the service reads and writes each user where it is meanwhile. It first claims the CPFs of
+the users registered before the collection was partitioned, so no user of another partition can take them, then
+moves the users, `--batch` at a time with a pause of `--pause-ms` in between. Once it is done, drop
+`DB_PREVIOUS_PARTITIONS` from the environment of the service. The database is configured by the environment of the
+service.
+
+"""
+
+import argparse
+import asyncio
+
+from domain_account.frameworks.partitioning import PartitionedDatabaseService, PartitionMover
+from domain_account.main import AppBinding, configs
+
+
+async def rebalance_users(app_binding: AppBinding, batch_size: int, pause: float) -> tuple[int, int]:
+    """Claim the CPFs of the users and move the users to their partition.
+
+    Args:
+        app_binding (AppBinding): The binding of the service, its frameworks are bound.
+        batch_size (int): The amount of users moved between two pauses.
+        pause (float): Seconds paused between two batches.
+
+    Returns:
+        tuple[int, int]: The amount of CPFs claimed and of users moved.
+
+    Raises:
+        ValueError: If the users are not partitioned.
+    """
+    app_binding.bind_frameworks()
+    database = app_binding.frameworks.database_framework()
+    if not isinstance(database, PartitionedDatabaseService):
+        raise ValueError("The users are not partitioned, set DB_PARTITIONS.")
+    await app_binding.frameworks.connect()
+    try:
+        mover = PartitionMover(database, "users", batch_size=batch_size, pause=pause)
+        return await mover.claim_unique(), await mover.rebalance()
+    finally:
+        await app_binding.frameworks.disconnect()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch", type=int, default=100)
+    parser.add_argument("--pause-ms", type=float, default=10.0)
+    args = parser.parse_args()
+    claimed, moved = asyncio.run(rebalance_users(AppBinding(configs()), args.batch, args.pause_ms / 1000))
+    print(f"{claimed} CPFs claimed, {moved} users moved")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Recompute the user counts per city and CEP region from the registered users.
+
+Usage:
+    python -m domain_account.rebuild_user_stats
+
+The counts are kept up to date by the account writes, a write dying between the user update and the counts update
+leaves them off by one: the rebuild reconciles them, and fills them the first time. It reads the users from a
+secondary when the replica set has one, and is best run when the service is quiet. The database is configured by
+the environment of the service.
+
+"""
+
+import asyncio
+
+from domain_account.main import AppBinding, configs
+
+
+async def rebuild_user_stats(app_binding: AppBinding) -> int:
+    """Recompute the user counts of the bound database.
+
+    Args:
+        app_binding (AppBinding): The binding of the service, its frameworks and adapters are bound.
+
+    Returns:
+        int: The amount of cities and CEP regions counted.
+    """
+    app_binding.bind_frameworks()
+    app_binding.bind_adapters()
+    await app_binding.frameworks.connect()
+    try:
+        return await app_binding.adapters.user_stats_service().rebuild()
+    finally:
+        await app_binding.frameworks.disconnect()
+
+
+def main() -> None:
+    counted = asyncio.run(rebuild_user_stats(AppBinding(configs())))
+    print(f"{counted} cities and CEP regions counted")
+
+
+if __name__ == "__main__":
+    main()
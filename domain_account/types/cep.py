@@ -0,0 +1,25 @@
+"""CEP regions, the leading digits of a postal code shared by the addresses of a region.
+
+A CEP is 8 digits, bare (`80010000`) or formatted (`80010-000`): the first 5 are the region, sector and subsector
+of the address, and the last 3 tell the streets of a subsector apart.
+
+"""
+
+import re
+
+CEP_REGION_LENGTH = 5
+
+_NOT_DIGIT = re.compile(r"[^0-9]")
+
+
+def cep_region(cep: str) -> str | None:
+    """The region of a CEP, its first 5 digits.
+
+    Args:
+        cep (str): The CEP, bare, formatted or already cut to its region.
+
+    Returns:
+        str | None: The first 5 digits of the CEP, None when it has fewer digits.
+    """
+    digits = _NOT_DIGIT.sub("", cep)
+    return digits[:CEP_REGION_LENGTH] if len(digits) >= CEP_REGION_LENGTH else None
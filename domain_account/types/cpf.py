@@ -0,0 +1,159 @@
+"""CPF normalisation and check digit validation, for a single value or a whole column of them.
+
+A CPF is 11 digits, the last two being check digits of the ones before, and is written bare (`12345678909`) or
+formatted (`123.456.789-09`). Normalising removes the formatting, and a CPF is valid when it is 11 ASCII digits,
+not all the same, whose check digits match.
+
+"""
+
+import sys
+from array import array
+from operator import mul
+from typing import Annotated, Sequence
+
+from pydantic import AfterValidator
+
+CPF_LENGTH = 11
+# Below this many values, the fixed cost of the column-wise validation outweighs validating them one by one
+COLUMN_WISE_MIN = 16
+
+_SEPARATORS = str.maketrans("", "", ".- ")
+_FIRST_WEIGHTS = range(10, 1, -1)
+_SECOND_WEIGHTS = range(11, 1, -1)
+# Byte value of a character once encoded, its digit for "0" to "9", _NOT_A_DIGIT for anything else
+_NOT_A_DIGIT = 0xFF
+_DIGIT_VALUES = bytes(byte - 48 if 48 <= byte <= 57 else _NOT_A_DIGIT for byte in range(256))
+_IS_NOT_A_DIGIT = bytes(int(byte == _NOT_A_DIGIT) for byte in range(256))
+_IS_NOT_ZERO = bytes(int(byte != 0) for byte in range(256))
+_IS_ZERO = bytes(int(byte == 0) for byte in range(256))
+
+
+def _check_digit(total: int) -> int:
+    return total * 10 % 11 % 10
+
+
+# Check digit of every weighted sum a column can reach, non digits included
+_CHECK_DIGITS = bytes(_check_digit(total) for total in range(_NOT_A_DIGIT * sum(_SECOND_WEIGHTS) + 1))
+
+
+def _check_digits(digits: Sequence[int]) -> tuple[int, int]:
+    first = _check_digit(sum(map(mul, digits, _FIRST_WEIGHTS)))
+    second = _check_digit(sum(map(mul, digits, _SECOND_WEIGHTS)) - 2 * digits[9] + 2 * first)
+    return first, second
+
+
+def normalise_cpf(value: str) -> str | None:
+    """Normalise a CPF to its 11 digits.
+
+    Args:
+        value (str): The CPF, bare or formatted.
+
+    Returns:
+        str | None: The 11 digits of the CPF, None when it is not a valid CPF.
+    """
+    cpf = value.translate(_SEPARATORS)
+    if len(cpf) != CPF_LENGTH or not cpf.isascii() or not cpf.isdecimal() or cpf == cpf[0] * CPF_LENGTH:
+        return None
+    digits = cpf.encode().translate(_DIGIT_VALUES)
+    return cpf if _check_digits(digits) == (digits[9], digits[10]) else None
+
+
+def complete_cpf(base: str) -> str:
+    """Append the check digits to the first 9 digits of a CPF.
+
+    Args:
+        base (str): The first 9 digits.
+
+    Returns:
+        str: The 11 digits of the CPF.
+
+    Raises:
+        ValueError: If the base is not 9 digits.
+    """
+    if len(base) != CPF_LENGTH - 2 or not base.isascii() or not base.isdecimal():
+        raise ValueError("The base of a CPF is 9 digits.")
+    digits = [*base.encode().translate(_DIGIT_VALUES), 0]
+    first = _check_digit(sum(map(mul, digits, _FIRST_WEIGHTS)))
+    digits[9] = first
+    return f"{base}{first}{_check_digit(sum(map(mul, digits, _SECOND_WEIGHTS)))}"
+
+
+def _lanes(column: bytes) -> int:
+    """Pack a column of bytes into an integer holding one 16 bit lane per value, wide enough for the weighted sums."""
+    wide = bytearray(2 * len(column))
+    wide[::2] = column
+    return int.from_bytes(wide, "little")
+
+
+def _unpack_check_digits(lanes: int, count: int) -> bytes:
+    """The check digit of the weighted sum held by every 16 bit lane."""
+    sums = array("H")
+    sums.frombytes(lanes.to_bytes(2 * count, "little"))
+    if sys.byteorder == "big":
+        sums.byteswap()
+    return bytes(map(_CHECK_DIGITS.__getitem__, sums))
+
+
+def _differ(left: bytes, right: bytes) -> int:
+    """One byte lane per value, non zero where the columns differ."""
+    return int.from_bytes(left, "little") ^ int.from_bytes(right, "little")
+
+
+def normalise_cpfs(values: Sequence[str]) -> list[str | None]:
+    """Normalise a column of CPFs, such as a bulk import, at once.
+
+    Gives the same results as `normalise_cpf` on every value, but the check digits are computed column-wise: the
+    CPFs are laid out as fixed width records in one buffer, each digit position is sliced out as a column, and
+    the weighted sums run on columns packed into integers with one 16 bit lane per CPF, so the per CPF work is
+    done by C loops instead of the interpreter.
+
+    Args:
+        values (Sequence[str]): The CPFs, bare or formatted.
+
+    Returns:
+        list[str | None]: The 11 digits of every CPF, None for the ones that are not valid CPFs.
+    """
+    count = len(values)
+    if count < COLUMN_WISE_MIN:
+        return [normalise_cpf(value) for value in values]
+    records = "".join(values)
+    if "." in records or "-" in records or " " in records:
+        cpfs = [value.translate(_SEPARATORS) for value in values]
+        records = "".join(cpfs)
+    else:
+        cpfs = list(values)
+    if set(map(len, cpfs)) != {CPF_LENGTH}:
+        # A record of another length is not a CPF, it is replaced so every record keeps the same width. The total
+        # length is not enough: a short record followed by a long one would shift the records in between
+        records = "".join(cpf if len(cpf) == CPF_LENGTH else "x" * CPF_LENGTH for cpf in cpfs)
+    digits = records.encode("ascii", "replace").translate(_DIGIT_VALUES)
+    columns = [digits[position::CPF_LENGTH] for position in range(CPF_LENGTH)]
+
+    invalid = 0
+    for column in columns:
+        invalid |= int.from_bytes(column.translate(_IS_NOT_A_DIGIT), "little")
+    repeated = 0
+    for column in columns[1:]:
+        repeated |= _differ(column, columns[0])
+    invalid |= int.from_bytes(repeated.to_bytes(count, "little").translate(_IS_ZERO), "little")
+
+    lanes = [_lanes(column) for column in columns[:10]]
+    first = _unpack_check_digits(sum(map(mul, lanes, _FIRST_WEIGHTS)), count)
+    # The second sum weights the received first check digit, when it is wrong the first comparison fails anyway
+    second = _unpack_check_digits(sum(map(mul, lanes, _SECOND_WEIGHTS)), count)
+    mismatches = _differ(first, columns[9]) | _differ(second, columns[10])
+    invalid |= int.from_bytes(mismatches.to_bytes(count, "little").translate(_IS_NOT_ZERO), "little")
+
+    flags = invalid.to_bytes(count, "little")
+    return [None if flag else cpf for cpf, flag in zip(cpfs, flags)]
+
+
+def _validate_cpf(value: str) -> str:
+    cpf = normalise_cpf(value)
+    if cpf is None:
+        raise ValueError("Invalid CPF.")
+    return cpf
+
+
+Cpf = Annotated[str, AfterValidator(_validate_cpf)]
+"""A CPF, validated and normalised to its 11 digits."""
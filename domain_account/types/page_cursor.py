@@ -0,0 +1,52 @@
+"""Opaque continuation tokens of keyset paginated listings.
+
+A listing sorted on a unique key continues after the last key of the previous page, which an index seeks to
+directly however deep the page is. The key is handed to clients as a token they send back unchanged, so its format
+can change without breaking them.
+
+"""
+
+import base64
+from typing import Annotated
+
+from pydantic import AfterValidator
+
+_VERSION = b"1:"
+
+
+def encode_cursor(key: str) -> str:
+    """Encode the last key of a page as the continuation token of the next one.
+
+    Args:
+        key (str): The sort key of the last item of the page.
+
+    Returns:
+        str: The continuation token, URL safe.
+    """
+    return base64.urlsafe_b64encode(_VERSION + key.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(token: str) -> str:
+    """Decode a continuation token back to the key the next page starts after.
+
+    Args:
+        token (str): The continuation token.
+
+    Returns:
+        str: The sort key of the last item of the previous page.
+
+    Raises:
+        ValueError: If the token was not made by `encode_cursor`.
+    """
+    try:
+        decoded = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        if decoded.startswith(_VERSION):
+            return decoded[len(_VERSION) :].decode()
+    except ValueError:
+        # Not base64, or not UTF-8 once decoded
+        pass
+    raise ValueError("Invalid page cursor.")
+
+
+PageCursor = Annotated[str, AfterValidator(decode_cursor)]
+"""A continuation token, validated and decoded to the key the page starts after."""
@@ -0,0 +1,29 @@
+"""Gunicorn settings and server hooks.
+
+The entrypoint runs with `--preload`: the application is imported once in the master and the workers are forked
+from it. `domain_account.frameworks.gunicorn.lifecycle` documents which resources live on each side of the fork.
+
+"""
+
+import os
+from typing import Any
+
+from domain_account.frameworks.gunicorn.lifecycle import worker_lifecycle
+from domain_account.frameworks.gunicorn.workers import worker_class_for
+
+worker_class = worker_class_for(os.environ.get("EVENT_LOOP", "asyncio"))
+
+
+def when_ready(_: Any) -> None:
+    """Freeze the preloaded heap in the master, right before the workers are spawned."""
+    worker_lifecycle.freeze()
+
+
+def post_fork(_: Any, __: Any) -> None:
+    """Create the per worker resources inside the freshly forked worker."""
+    worker_lifecycle.post_fork()
+
+
+def worker_exit(_: Any, __: Any) -> None:
+    """Release the per worker resources when the worker exits."""
+    worker_lifecycle.worker_exit()
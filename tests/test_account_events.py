@@ -0,0 +1,53 @@
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+from domain_account.business.services import EventService
+from domain_account.business.use_case.account_events import write_emitting
+from domain_account.models import AccountEvent, CpfUpdated
+
+T = TypeVar("T")
+
+
+class Events(EventService):
+    """Events noting what was emitted, and in which transaction."""
+
+    def __init__(self) -> None:
+        self.transactions = 0
+        self.emitted: list[tuple[int, list[AccountEvent]]] = []
+
+    async def emit(self, events: list[AccountEvent]) -> None:
+        self.emitted.append((self.transactions, events))
+
+    async def transaction(self, write: Callable[[], Awaitable[T]]) -> T:
+        self.transactions += 1
+        return await write()
+
+
+def changes() -> list[AccountEvent]:
+    return [CpfUpdated(uid="uid")]
+
+
+async def matching(matched: bool) -> bool:
+    await asyncio.sleep(0)
+    return matched
+
+
+def test_emits_the_events_of_a_write_in_its_transaction() -> None:
+    events = Events()
+
+    assert asyncio.run(write_emitting(events, lambda: matching(True), changes)) is True
+    assert [(transaction, [event.uid for event in emitted]) for transaction, emitted in events.emitted] == [
+        (1, ["uid"])
+    ]
+
+
+def test_emits_nothing_when_no_user_matched() -> None:
+    events = Events()
+
+    assert asyncio.run(write_emitting(events, lambda: matching(False), changes)) is False
+    assert events.transactions == 1
+    assert not events.emitted
+
+
+def test_writes_without_events() -> None:
+    assert asyncio.run(write_emitting(None, lambda: matching(True), changes)) is True
@@ -0,0 +1,61 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from benchmarks.standins import STANDIN_CONFIG, InMemoryDatabaseService
+from domain_account.adapters.repositories import AccountRepository, UserStatsRepository
+from domain_account.adapters.repositories.exceptions import CpfAlreadyRegistered, UserAlreadyRegistered
+from domain_account.business.ports import ListUsersInputPort, RegisterInputPort
+from domain_account.frameworks.anonymisation import CpfHasher
+from domain_account.frameworks.caching import NegativeCache
+from domain_account.frameworks.metrics import MetricsRegistry
+from domain_account.frameworks.mongodb import WriteDurabilityPolicy
+from domain_account.models import Address
+from domain_account.types.cpf import complete_cpf
+
+ADDRESS = Address(city="Curitiba", cep="80010000", street_name="Rua XV", number="1", complement="")
+
+
+async def register_twice(first: RegisterInputPort, second: RegisterInputPort) -> list[str]:
+    """Register two users on an empty stand-in database, and list the UIDs registered."""
+    # The stand-in offers the collection methods of the drivers the repositories use
+    service: Any = InMemoryDatabaseService()
+    policy = WriteDurabilityPolicy(STANDIN_CONFIG["write_durability"])
+    accounts = AccountRepository(
+        service,
+        CpfHasher(STANDIN_CONFIG["cpf_hash_key"]),
+        UserStatsRepository(service, policy),
+        NegativeCache(MetricsRegistry(), "unknown_uids", max_size=0, ttl=0),
+        policy,
+    )
+    await accounts.create_indexes()
+    await accounts.register(first)
+    try:
+        await accounts.register(second)
+    finally:
+        users = await accounts.list_users(ListUsersInputPort(limit=10))
+    return [user.uid for user in users]
+
+
+def test_registers_a_uid_once() -> None:
+    first = RegisterInputPort(uid="uid", cpf=complete_cpf("123456789"), address=ADDRESS)
+    second = RegisterInputPort(uid="uid", cpf=complete_cpf("223456789"), address=ADDRESS)
+
+    with pytest.raises(UserAlreadyRegistered):
+        asyncio.run(register_twice(first, second))
+
+
+def test_registers_a_cpf_once() -> None:
+    first = RegisterInputPort(uid="first", cpf=complete_cpf("123456789"), address=ADDRESS)
+    second = RegisterInputPort(uid="second", cpf=complete_cpf("123456789"), address=ADDRESS)
+
+    with pytest.raises(CpfAlreadyRegistered):
+        asyncio.run(register_twice(first, second))
+
+
+def test_registers_other_users() -> None:
+    first = RegisterInputPort(uid="first", cpf=complete_cpf("123456789"), address=ADDRESS)
+    second = RegisterInputPort(uid="second", cpf=complete_cpf("223456789"), address=ADDRESS)
+
+    assert asyncio.run(register_twice(first, second)) == ["first", "second"]
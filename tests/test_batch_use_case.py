@@ -0,0 +1,168 @@
+import asyncio
+
+from benchmarks.standins import standin_user
+from domain_account.adapters.repositories.exceptions import CpfAlreadyRegistered, UserNotFound
+from domain_account.business.interfaces import InputPort
+from domain_account.business.ports import (
+    BatchInputPort,
+    BatchResult,
+    FindUsersByCpfInputPort,
+    ListUsersInputPort,
+    RegisterInputPort,
+    RetrieveUserInputPort,
+    RetrieveUserOutputPort,
+    UpdateAccountInputPort,
+    UpdateAddressInputPort,
+    UpdateAddressOutputPort,
+    UpdateCpfInputPort,
+    UpdateCpfOutputPort,
+)
+from domain_account.business.services import AccountService
+from domain_account.business.use_case import BatchUseCase
+from domain_account.models import PartialAddress, RegisteredUser, User
+from domain_account.types.cpf import complete_cpf
+
+CPF = complete_cpf("123456789")
+
+
+class FakeAccountService(AccountService):
+    """An `AccountService` recording the reads and writes of the use cases, and failing for the unknown UIDs."""
+
+    def __init__(self, *uids: str, taken_cpf: str | None = None) -> None:
+        self.users = {uid: User(**{**standin_user(index), "uid": uid}) for index, uid in enumerate(uids)}
+        self.taken_cpf = taken_cpf
+        self.writes: list[UpdateAccountInputPort] = []
+        self.reads: list[str] = []
+
+    async def register(self, port: RegisterInputPort) -> None:
+        raise NotImplementedError
+
+    async def get_user(self, port: RetrieveUserInputPort) -> User:
+        self.reads.append(port.uid)
+        return self.__user(port.uid)
+
+    async def update_address(self, port: UpdateAddressInputPort) -> bool:
+        raise NotImplementedError
+
+    async def update_cpf(self, port: UpdateCpfInputPort) -> bool:
+        raise NotImplementedError
+
+    async def update_account(self, port: UpdateAccountInputPort) -> bool:
+        self.writes.append(port)
+        user = self.__user(port.uid)
+        if port.cpf is not None and port.cpf == self.taken_cpf:
+            raise CpfAlreadyRegistered()
+        changes: dict[str, object] = {}
+        if port.address is not None:
+            changes["address"] = user.address.model_copy(update=port.address.model_dump(exclude_none=True))
+        if port.cpf is not None:
+            changes["cpf"] = port.cpf
+        self.users[port.uid] = user.model_copy(update=changes)
+        return True
+
+    async def find_users_by_cpf(self, port: FindUsersByCpfInputPort) -> list[RegisteredUser]:
+        raise NotImplementedError
+
+    async def list_users(self, port: ListUsersInputPort) -> list[RegisteredUser]:
+        raise NotImplementedError
+
+    def __user(self, uid: str) -> User:
+        if uid not in self.users:
+            raise UserNotFound()
+        return self.users[uid]
+
+
+def run_batch(service: FakeAccountService, *operations: InputPort) -> list[BatchResult]:
+    """Run the operations as one batch of the user `uid` and return their results."""
+    output = asyncio.run(BatchUseCase(service)(BatchInputPort(uid="uid", operations=list(operations))))
+    return output.results
+
+
+def test_merges_the_consecutive_writes_of_a_user() -> None:
+    service = FakeAccountService("uid")
+
+    results = run_batch(
+        service,
+        UpdateAddressInputPort(uid="uid", city="Curitiba", number="1"),
+        UpdateCpfInputPort(uid="uid", cpf=CPF),
+        UpdateAddressInputPort(uid="uid", number="2"),
+    )
+
+    assert service.writes == [
+        UpdateAccountInputPort(uid="uid", address=PartialAddress(city="Curitiba", number="2"), cpf=CPF)
+    ]
+    assert [result.output for result in results] == [
+        UpdateAddressOutputPort(msg="ok"),
+        UpdateCpfOutputPort(msg="ok"),
+        UpdateAddressOutputPort(msg="ok"),
+    ]
+
+
+def test_reads_after_the_writes_before_them() -> None:
+    service = FakeAccountService("uid")
+
+    results = run_batch(
+        service,
+        UpdateAddressInputPort(uid="uid", city="Curitiba"),
+        UpdateCpfInputPort(uid="uid", cpf=CPF),
+        RetrieveUserInputPort(uid="uid"),
+    )
+
+    assert service.writes == [UpdateAccountInputPort(uid="uid", address=PartialAddress(city="Curitiba"), cpf=CPF)]
+    retrieved = results[2].output
+    assert isinstance(retrieved, RetrieveUserOutputPort)
+    assert retrieved.address is not None and retrieved.address.city == "Curitiba"
+    assert retrieved.cpf == CPF
+
+
+def test_a_read_splits_the_writes() -> None:
+    service = FakeAccountService("uid")
+
+    run_batch(
+        service,
+        UpdateCpfInputPort(uid="uid", cpf=CPF),
+        RetrieveUserInputPort(uid="uid"),
+        RetrieveUserInputPort(uid="uid"),
+        UpdateAddressInputPort(uid="uid", city="Curitiba"),
+    )
+
+    assert service.writes == [
+        UpdateAccountInputPort(uid="uid", cpf=CPF),
+        UpdateAccountInputPort(uid="uid", address=PartialAddress(city="Curitiba")),
+    ]
+    assert service.reads == ["uid"]
+
+
+def test_a_failing_operation_leaves_the_others_results() -> None:
+    operations = (
+        UpdateAddressInputPort(uid="uid", city="Curitiba"),
+        UpdateCpfInputPort(uid="unknown", cpf=CPF),
+        RetrieveUserInputPort(uid="unknown"),
+        RetrieveUserInputPort(uid="uid"),
+    )
+    alone = [run_batch(FakeAccountService("uid"), operation)[0] for operation in operations[::3]]
+
+    results = run_batch(FakeAccountService("uid"), *operations)
+
+    assert [results[0], results[3]] == alone
+    not_found = BatchResult(error_type="UserNotFound", error_msg=UserNotFound().msg)
+    assert results[1:3] == [not_found, not_found]
+
+
+def test_a_failing_write_fails_the_operations_merged_with_it() -> None:
+    service = FakeAccountService("uid", "other", taken_cpf=CPF)
+
+    results = run_batch(
+        service,
+        UpdateAddressInputPort(uid="uid", city="Curitiba"),
+        UpdateCpfInputPort(uid="uid", cpf=CPF),
+        UpdateAddressInputPort(uid="other", city="Curitiba"),
+        RetrieveUserInputPort(uid="uid"),
+    )
+
+    error = BatchResult(error_type="CpfAlreadyRegistered", error_msg=CpfAlreadyRegistered().msg)
+    assert results[:3] == [error, error, BatchResult(output=UpdateAddressOutputPort(msg="ok"))]
+    retrieved = results[3].output
+    assert isinstance(retrieved, RetrieveUserOutputPort)
+    assert retrieved.cpf != CPF
+    assert len(service.writes) == 2
@@ -0,0 +1,52 @@
+import random
+import string
+
+import pytest
+
+from domain_account.types.cpf import COLUMN_WISE_MIN, CPF_LENGTH, complete_cpf, normalise_cpf, normalise_cpfs
+
+VALID = "52998224725"
+
+
+def variant(cpf: str, generator: random.Random) -> str:
+    """A CPF as a column may hold it: valid, formatted, or broken without changing its length."""
+    return generator.choice(
+        [
+            cpf,
+            f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}",
+            cpf[:10] + str((int(cpf[10]) + 1) % 10),
+            cpf[0] * CPF_LENGTH,
+            cpf[:4] + generator.choice("A?٣") + cpf[5:],
+        ]
+    )
+
+
+def shifted(first: str, second: str, generator: random.Random) -> list[str]:
+    """Two CPFs, one cut short and the other made as much longer, so their lengths still add up to two CPFs."""
+    cut = generator.randrange(1, CPF_LENGTH + 1)
+    pair = [first[: CPF_LENGTH - cut], second + "".join(generator.choices(string.digits, k=cut))]
+    generator.shuffle(pair)
+    return pair
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_column_wise_matches_one_by_one_on_mixed_lengths(seed: int) -> None:
+    generator = random.Random(seed)
+    cpfs = [complete_cpf(f"{generator.randrange(10**9):09d}") for _ in range(2 * generator.randrange(8, 100))]
+    values = []
+    for first, second in zip(cpfs[::2], cpfs[1::2]):
+        if generator.random() < 0.1:
+            values.extend(shifted(first, second, generator))
+        else:
+            values.extend((variant(first, generator), variant(second, generator)))
+    if seed % 2:
+        # Lengths that do not add up to whole CPFs either
+        values.insert(generator.randrange(len(values)), VALID[: generator.randrange(CPF_LENGTH)])
+
+    assert normalise_cpfs(values) == [normalise_cpf(value) for value in values]
+
+
+def test_lengths_adding_up_to_whole_cpfs_are_not_cpfs() -> None:
+    values = [VALID[:10], VALID + "5"] + [VALID] * (COLUMN_WISE_MIN - 2)
+
+    assert normalise_cpfs(values) == [None, None] + [VALID] * (COLUMN_WISE_MIN - 2)
@@ -0,0 +1,59 @@
+import asyncio
+from typing import Any
+
+from benchmarks.standins import STANDIN_CONFIG, InMemoryDatabaseService, standin_document, standin_user
+from domain_account.adapters.repositories import AccountRepository, CpfCollision, UserStatsRepository
+from domain_account.business.ports import FindUsersByCpfInputPort
+from domain_account.frameworks.anonymisation import CpfHasher
+from domain_account.frameworks.caching import NegativeCache
+from domain_account.frameworks.metrics import MetricsRegistry
+from domain_account.frameworks.mongodb import WriteDurabilityPolicy
+
+
+def formatted(cpf: str) -> str:
+    return f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}"
+
+
+async def backfill(
+    documents: list[dict[str, Any]], cpfs: list[str]
+) -> tuple[tuple[int, list[CpfCollision]], list[str], int]:
+    """Backfill the CPF hashes of the stored users, 2 at a time, then find users by CPF and backfill again."""
+    # The stand-in offers the collection methods of the drivers the repositories use
+    service: Any = InMemoryDatabaseService()
+    policy = WriteDurabilityPolicy(STANDIN_CONFIG["write_durability"])
+    accounts = AccountRepository(
+        service,
+        CpfHasher(STANDIN_CONFIG["cpf_hash_key"]),
+        UserStatsRepository(service, policy),
+        NegativeCache(MetricsRegistry(), "unknown_uids", max_size=0, ttl=0),
+        policy,
+    )
+    await accounts.create_indexes()
+    service.database["users"].seed(documents)
+    result = await accounts.backfill_cpf_hashes(batch_size=2)
+    found = await accounts.find_users_by_cpf(FindUsersByCpfInputPort(cpfs=cpfs))
+    hashed_again, _ = await accounts.backfill_cpf_hashes(batch_size=2)
+    return result, sorted(user.uid for user in found), hashed_again
+
+
+def test_hashes_the_cpfs_of_the_users_registered_before_the_hash() -> None:
+    legacy = [standin_user(index) for index in range(5)]
+    legacy[1]["cpf"] = formatted(legacy[1]["cpf"])
+    documents = [*legacy, standin_document(5)]
+
+    result, found, hashed_again = asyncio.run(backfill(documents, [standin_user(1)["cpf"], standin_user(4)["cpf"]]))
+
+    assert result == (5, [])
+    assert found == [legacy[1]["uid"], legacy[4]["uid"]]
+    assert hashed_again == 0
+
+
+def test_reports_the_users_whose_cpf_another_one_holds() -> None:
+    holder, duplicate = standin_user(0), standin_user(1)
+    duplicate["cpf"] = formatted(holder["cpf"])
+
+    result, found, hashed_again = asyncio.run(backfill([holder, duplicate, standin_user(2)], [holder["cpf"]]))
+
+    assert result == (2, [CpfCollision(duplicate["uid"], holder["uid"])])
+    assert found == [holder["uid"]]
+    assert hashed_again == 0
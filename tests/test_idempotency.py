@@ -0,0 +1,169 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable
+
+import pytest
+from fastapi import status
+from fastapi.responses import JSONResponse, Response
+
+from benchmarks.standins import InMemoryDatabaseService
+from domain_account.adapters.controllers.idempotency import REPLAYED_HEADER, idempotent
+from domain_account.adapters.repositories import IdempotencyRepository, idempotency_repository
+from domain_account.adapters.repositories.exceptions import (
+    CpfAlreadyRegistered,
+    IdempotencyKeyInProgress,
+    IdempotencyKeyReused,
+)
+
+KEY = "register:uid:key"
+
+
+class Request:
+    """A request answered `status_code` by `respond`, after yielding to the loop, counting how often it ran."""
+
+    def __init__(self, status_code: int = status.HTTP_201_CREATED, error: BaseException | None = None) -> None:
+        self.status_code = status_code
+        self.error = error
+        self.runs = 0
+
+    async def respond(self) -> Response:
+        self.runs += 1
+        await asyncio.sleep(0.01)
+        if self.error is not None:
+            raise self.error
+        return JSONResponse({"msg": "ok"}, status_code=self.status_code)
+
+
+def repository(service: Any = None) -> IdempotencyRepository:
+    # The stand-in offers the collection methods of the drivers the repositories use
+    provider: Any = service or InMemoryDatabaseService()
+    return IdempotencyRepository(provider)
+
+
+def answer(store: IdempotencyRepository, request: Request, fingerprint: str = "body") -> Awaitable[Response]:
+    return idempotent(store, "/register-account", KEY, fingerprint, request.respond)
+
+
+def run(*calls: Callable[[], Awaitable[Any]]) -> list[Any]:
+    async def main() -> list[Any]:
+        return [await call() for call in calls]
+
+    return asyncio.run(main())
+
+
+def test_replays_the_stored_response() -> None:
+    store, request = repository(), Request()
+
+    first, retry = run(lambda: answer(store, request), lambda: answer(store, request))
+
+    assert request.runs == 1
+    assert (retry.status_code, retry.body) == (first.status_code, first.body)
+    assert REPLAYED_HEADER not in first.headers
+    assert retry.headers[REPLAYED_HEADER] == "true"
+
+
+def test_runs_concurrent_claims_of_a_worker_once() -> None:
+    store, request = repository(), Request()
+
+    async def concurrently() -> list[Response]:
+        return list(await asyncio.gather(*(answer(store, request) for _ in range(5))))
+
+    (responses,) = run(concurrently)
+
+    assert request.runs == 1
+    assert {response.status_code for response in responses} == {status.HTTP_201_CREATED}
+    assert sum(REPLAYED_HEADER in response.headers for response in responses) == 4
+
+
+def test_rejects_a_key_reused_for_another_request() -> None:
+    store = repository()
+
+    with pytest.raises(IdempotencyKeyReused):
+        run(lambda: answer(store, Request()), lambda: answer(store, Request(), fingerprint="other body"))
+
+
+def test_rejects_a_key_reused_while_its_request_runs() -> None:
+    store = repository()
+
+    async def concurrently() -> list[Any]:
+        return list(
+            await asyncio.gather(
+                answer(store, Request()),
+                answer(store, Request(), fingerprint="other body"),
+                return_exceptions=True,
+            )
+        )
+
+    ((first, reused),) = run(concurrently)
+
+    assert first.status_code == status.HTTP_201_CREATED
+    assert isinstance(reused, IdempotencyKeyReused)
+
+
+@pytest.mark.parametrize(
+    "failed",
+    [Request(error=RuntimeError("database down")), Request(status.HTTP_500_INTERNAL_SERVER_ERROR)],
+    ids=["exception", "internal_error"],
+)
+def test_releases_the_key_of_a_failed_request(failed: Request) -> None:
+    store, retry = repository(), Request()
+
+    async def fail_then_retry() -> Response:
+        try:
+            await answer(store, failed)
+        except RuntimeError:
+            pass
+        return await answer(store, retry)
+
+    (response,) = run(fail_then_retry)
+
+    assert retry.runs == 1
+    assert response.status_code == status.HTTP_201_CREATED
+    assert REPLAYED_HEADER not in response.headers
+
+
+def test_stores_the_business_errors_like_any_response() -> None:
+    store, request = repository(), Request(error=CpfAlreadyRegistered())
+
+    first, retry = run(lambda: answer(store, request), lambda: answer(store, request))
+
+    assert request.runs == 1
+    assert first.status_code == retry.status_code == status.HTTP_409_CONFLICT
+    assert retry.headers[REPLAYED_HEADER] == "true"
+
+
+def test_waits_for_the_response_of_another_worker() -> None:
+    service = InMemoryDatabaseService()
+    worker, other_worker, request = repository(service), repository(service), Request()
+
+    async def concurrently() -> list[Response]:
+        return list(await asyncio.gather(answer(worker, request), answer(other_worker, request)))
+
+    ((first, retry),) = run(concurrently)
+
+    assert request.runs == 1
+    assert retry.status_code == first.status_code
+    assert retry.headers[REPLAYED_HEADER] == "true"
+
+
+def test_gives_up_on_a_request_of_another_worker_still_running(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(idempotency_repository, "WAIT_S", 0.1)
+    service = InMemoryDatabaseService()
+    worker, other_worker = repository(service), repository(service)
+
+    with pytest.raises(IdempotencyKeyInProgress):
+        run(lambda: worker.claim(KEY, "body"), lambda: other_worker.claim(KEY, "body"))
+
+
+def test_takes_over_the_claim_of_a_worker_that_died() -> None:
+    service = InMemoryDatabaseService()
+    abandoned = datetime.now(timezone.utc) - idempotency_repository.LEASE - timedelta(seconds=1)
+    service.database["idempotency_keys"].seed(
+        [{"_id": KEY, "fingerprint": "body", "state": "pending", "claimed_at": abandoned, "created_at": abandoned}]
+    )
+    request = Request()
+
+    (response,) = run(lambda: answer(repository(service), request))
+
+    assert request.runs == 1
+    assert response.status_code == status.HTTP_201_CREATED
@@ -0,0 +1,60 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable
+
+import pytest
+
+from domain_account.frameworks.event_loop import LoopWatchdog
+from domain_account.frameworks.event_loop.watchdog import LOOP_BLOCKED
+from domain_account.frameworks.metrics import MetricsRegistry
+
+BLOCKED_MS = 100.0
+BLOCK = 0.3
+
+
+async def blocking_handler() -> None:
+    time.sleep(BLOCK)  # the call the watchdog must point at
+
+
+async def awaiting_handler() -> None:
+    await asyncio.sleep(BLOCK)
+
+
+async def watch(handler: Callable[[], Awaitable[None]]) -> str:
+    """Run a handler on the event loop under a started watchdog, and return the exposition of its metrics."""
+    metrics = MetricsRegistry()
+    watchdog = LoopWatchdog(metrics, BLOCKED_MS)
+    watchdog.start()
+    try:
+        await asyncio.sleep(0.1)
+        await handler()
+        await asyncio.sleep(0.1)
+    finally:
+        watchdog.stop()
+    return metrics.exposition()
+
+
+def blocked_samples(exposition: str) -> list[str]:
+    """The samples of the blocking episodes counter, none until the watchdog counted one."""
+    return [line for line in exposition.splitlines() if line.startswith(LOOP_BLOCKED)]
+
+
+def test_reports_a_handler_blocking_the_event_loop(caplog: pytest.LogCaptureFixture) -> None:
+    with caplog.at_level(logging.WARNING, logger=LoopWatchdog.__name__):
+        exposition = asyncio.run(watch(blocking_handler))
+
+    assert blocked_samples(exposition) == [f"{LOOP_BLOCKED} 1.0"]
+    assert len(caplog.records) == 1
+    stack = caplog.records[0].getMessage()
+    assert "Event loop blocked" in stack
+    assert "in blocking_handler" in stack
+    assert "time.sleep(BLOCK)" in stack
+
+
+def test_does_not_report_a_handler_awaiting(caplog: pytest.LogCaptureFixture) -> None:
+    with caplog.at_level(logging.WARNING, logger=LoopWatchdog.__name__):
+        exposition = asyncio.run(watch(awaiting_handler))
+
+    assert not blocked_samples(exposition)
+    assert not caplog.records
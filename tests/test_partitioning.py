@@ -0,0 +1,60 @@
+import asyncio
+from typing import Any, Callable
+
+from domain_account.frameworks.partitioning import HashRing, PartitionedCollection, PartitionScheme, Placement
+
+SCHEME = PartitionScheme(key="uid")
+PLACEMENT = Placement(HashRing(["home", "added"]), HashRing(["home"]))
+MOVED_UID = next(uid for uid in (f"uid-{index}" for index in range(1000)) if PLACEMENT.owner(uid) == "added")
+
+
+class Collection:
+    """A collection answering `find_one` from a list, reading its documents before or after yielding to the loop."""
+
+    def __init__(self, documents: list[dict[str, Any]], read_first: bool) -> None:
+        self.documents = documents
+        self.read_first = read_first
+        self.before_read: Callable[[], None] | None = None
+        self.reads = 0
+
+    async def find_one(self, query: dict[str, Any], _: Any = None) -> dict[str, Any] | None:
+        self.reads += 1
+        if self.read_first:
+            document = self.__match(query)
+            await asyncio.sleep(0)
+            return document
+        await asyncio.sleep(0)
+        if self.before_read is not None:
+            self.before_read()
+            self.before_read = None
+        return self.__match(query)
+
+    def __match(self, query: dict[str, Any]) -> dict[str, Any] | None:
+        return next(
+            (document for document in self.documents if all(document.get(k) == v for k, v in query.items())), None
+        )
+
+
+def test_finds_a_document_moved_between_the_reads_of_its_partitions() -> None:
+    previous = Collection([{"uid": MOVED_UID}], read_first=False)
+    new = Collection([], read_first=True)
+
+    def move() -> None:
+        # The mover copies the document to its new partition, then deletes it from its previous one
+        new.documents.append(previous.documents[0])
+        previous.documents.clear()
+
+    # The new partition is read before the copy, the previous one after the delete
+    previous.before_read = move
+    users = PartitionedCollection("users", SCHEME, PLACEMENT, {"home": previous, "added": new}, claims=None)
+
+    assert asyncio.run(users.find_one({"uid": MOVED_UID})) == {"uid": MOVED_UID}
+    assert new.reads == 2
+
+
+def test_reads_the_partitions_once_without_a_rebalance() -> None:
+    collections = {partition: Collection([], read_first=True) for partition in ("home", "added")}
+    users = PartitionedCollection("users", SCHEME, Placement(HashRing(["home", "added"])), collections, claims=None)
+
+    assert asyncio.run(users.find_one({"cpf_hash": "missing"})) is None
+    assert [collection.reads for collection in collections.values()] == [1, 1]
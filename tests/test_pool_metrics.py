@@ -0,0 +1,33 @@
+from pymongo.monitoring import ConnectionCheckedOutEvent, ConnectionCheckOutFailedEvent, ConnectionCheckOutStartedEvent
+
+from domain_account.frameworks.metrics import MetricsRegistry
+from domain_account.frameworks.mongodb.monitoring import POOL_WAIT, PoolMetricsListener
+
+ADDRESS = ("127.0.0.1", 27017)
+
+
+def totals(metrics: MetricsRegistry) -> list[str]:
+    """The sum and count samples of the pool wait histogram."""
+    return [
+        line
+        for line in metrics.exposition().splitlines()
+        if line.startswith((f"{POOL_WAIT}_sum", f"{POOL_WAIT}_count"))
+    ]
+
+
+def test_records_the_waits_of_interleaved_check_outs() -> None:
+    metrics = MetricsRegistry()
+    listener = PoolMetricsListener(metrics)
+
+    # Two commands of the event loop start checking a connection out before either got one
+    listener.connection_check_out_started(ConnectionCheckOutStartedEvent(ADDRESS))
+    listener.connection_check_out_started(ConnectionCheckOutStartedEvent(ADDRESS))
+    listener.connection_checked_out(ConnectionCheckedOutEvent(ADDRESS, 1, 0.25))
+    listener.connection_check_out_failed(ConnectionCheckOutFailedEvent(ADDRESS, "timeout", 0.5))
+
+    assert totals(metrics) == [
+        f'{POOL_WAIT}_sum{{outcome="checked_out"}} 0.25',
+        f'{POOL_WAIT}_count{{outcome="checked_out"}} 1',
+        f'{POOL_WAIT}_sum{{outcome="timeout"}} 0.5',
+        f'{POOL_WAIT}_count{{outcome="timeout"}} 1',
+    ]
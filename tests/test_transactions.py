@@ -0,0 +1,70 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+import pytest
+
+from domain_account.adapters.interfaces.document_database_service import after_commit, session_options
+from domain_account.frameworks.mongodb.transactions import run_transaction
+
+
+class Session:
+    """A driver session running the callback of a transaction `attempts` times, as retries after transient errors."""
+
+    def __init__(self, attempts: int, commits: bool = True) -> None:
+        self.attempts = attempts
+        self.commits = commits
+        self.ended = False
+
+    async def __aenter__(self) -> "Session":
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        self.ended = True
+
+    async def with_transaction(self, callback: Callable[["Session"], Awaitable[Any]]) -> Any:
+        for _ in range(self.attempts):
+            result = await callback(self)
+        if not self.commits:
+            raise RuntimeError("commit failed")
+        return result
+
+
+async def transaction(session: Session, writes: list[str]) -> str:
+    async def write() -> str:
+        writes.append("in session" if session_options() == {"session": session} else "outside")
+        await after_commit(counts)
+        return "written"
+
+    async def counts() -> None:
+        writes.append("deferred" if not session_options() else "deferred in session")
+
+    return await run_transaction(session, write)
+
+
+def test_runs_the_deferred_writes_once_after_the_retried_transaction() -> None:
+    session = Session(attempts=3)
+    writes: list[str] = []
+
+    assert asyncio.run(transaction(session, writes)) == "written"
+    assert writes == ["in session"] * 3 + ["deferred"]
+    assert session.ended
+
+
+def test_drops_the_deferred_writes_of_a_failed_transaction() -> None:
+    session = Session(attempts=1, commits=False)
+    writes: list[str] = []
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(transaction(session, writes))
+    assert writes == ["in session"]
+    assert session.ended
+
+
+def test_runs_a_deferred_write_at_once_outside_of_a_transaction() -> None:
+    writes: list[str] = []
+
+    async def counts() -> None:
+        writes.append("counted")
+
+    asyncio.run(after_commit(counts))
+    assert writes == ["counted"]